@@ -173,11 +173,9 @@ class AzureSTTAdapter(STTPort):
             self.speech_config.set_property(speechsdk.PropertyId.SpeechServiceConnection_InitialSilenceTimeoutMs, str(config.initial_silence_ms))
             self.speech_config.set_property(speechsdk.PropertyId.Speech_SegmentationSilenceTimeoutMs, str(config.segmentation_silence_ms))
 
-            if config.audio_mode == "browser":
-                 format = speechsdk.audio.AudioStreamFormat(samples_per_second=16000, bits_per_sample=16, channels=1)
-            else:
-                 # Manual Decode Mode (Twilio/Telnyx) -> 8000Hz
-                 format = speechsdk.audio.AudioStreamFormat(samples_per_second=8000, bits_per_sample=16, channels=1)
+            # PCM16 mono at the pipeline's canonical ingress rate (legacy: by audio mode)
+            sample_rate = config.sample_rate or (16000 if config.audio_mode == "browser" else 8000)
+            format = speechsdk.audio.AudioStreamFormat(samples_per_second=sample_rate, bits_per_sample=16, channels=1)
 
             push_stream = speechsdk.audio.PushAudioInputStream(stream_format=format)
             audio_config = speechsdk.audio.AudioConfig(stream=push_stream)
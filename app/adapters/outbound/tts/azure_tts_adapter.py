@@ -148,9 +148,11 @@ class AzureTTSAdapter(TTSPort):
             ssml = self._build_ssml(request)
             audio_data = await self.synthesize_ssml(ssml)
 
+            # Views over the synthesized buffer: chunks reach the transport without copies
+            audio_view = memoryview(audio_data)
             chunk_size = 4096
-            for i in range(0, len(audio_data), chunk_size):
-                chunk = audio_data[i:i+chunk_size]
+            for i in range(0, len(audio_view), chunk_size):
+                chunk = audio_view[i:i+chunk_size]
                 if first_byte_time is None:
                     first_byte_time = time.time()
                     ttfb = (first_byte_time - start_time) * 1000
@@ -0,0 +1,56 @@
+"""
+Binary audio framing for browser WebSocket sessions.
+
+Browser clients that negotiate it (``"binary_audio": true`` in the start
+event, acknowledged with a ``binary_audio`` event) exchange raw PCM16 in
+binary WebSocket messages instead of base64 inside JSON. Control,
+transcript and debug messages stay text JSON.
+
+Frame layout (little-endian, 12-byte header keeps the PCM 4-byte aligned
+so the browser can view it as an Int16Array without copying):
+
+    u8  version     BINARY_PROTOCOL_VERSION
+    u8  kind        KIND_AUDIO
+    u16 reserved
+    u32 sequence    per-direction frame counter (wraps)
+    u32 timestamp   stream position of the first sample, in milliseconds
+    ... PCM16 mono samples
+"""
+import struct
+
+BINARY_PROTOCOL_VERSION = 1
+KIND_AUDIO = 1
+
+HEADER = struct.Struct("<BBHII")
+HEADER_SIZE = HEADER.size
+
+_U32 = 0xFFFFFFFF
+
+
+class BinaryFrameError(ValueError):
+    """Malformed or unsupported binary frame."""
+
+
+def pack_audio(sequence: int, timestamp_ms: int, pcm: bytes) -> bytes:
+    """Header + PCM as one binary message."""
+    return HEADER.pack(BINARY_PROTOCOL_VERSION, KIND_AUDIO, 0, sequence & _U32, timestamp_ms & _U32) + pcm
+
+
+def unpack_audio(data: bytes) -> tuple[int, int, bytes]:
+    """
+    Split a binary audio message.
+
+    Returns:
+        (sequence, timestamp_ms, pcm)
+
+    Raises:
+        BinaryFrameError: Short frame, unknown version/kind or odd PCM length
+    """
+    if len(data) < HEADER_SIZE:
+        raise BinaryFrameError(f"Frame too short ({len(data)} bytes)")
+    version, kind, _, sequence, timestamp_ms = HEADER.unpack_from(data)
+    if version != BINARY_PROTOCOL_VERSION or kind != KIND_AUDIO:
+        raise BinaryFrameError(f"Unsupported frame (version={version}, kind={kind})")
+    if (len(data) - HEADER_SIZE) % 2:
+        raise BinaryFrameError("PCM16 payload has an odd length")
+    return sequence, timestamp_ms, data[HEADER_SIZE:]
@@ -1,33 +1,54 @@
 import base64
 import contextlib
 import json
+import logging
 from typing import Any
 
 from fastapi import WebSocket
 
+from app.adapters.simulator.binary_protocol import pack_audio
 from app.domain.ports import AudioTransport
 
+logger = logging.getLogger(__name__)
+
 
 class SimulatorTransport(AudioTransport):
     """
     Adapter for the Browser Simulator using FastAPI WebSocket.
+
+    Audio goes out as base64 JSON ({"type": "audio"}) until the client
+    negotiates binary frames (see binary_protocol), then as raw PCM16.
     """
-    def __init__(self, websocket: WebSocket):
+    def __init__(self, websocket: WebSocket, sample_rate: int = 16000):
         self.websocket = websocket
+        self.sample_rate = sample_rate
+        self.binary_audio = False
+
+        # Binary framing state (outbound direction)
+        self._sequence = 0
+        self._samples_sent = 0
+
+    def enable_binary_audio(self) -> None:
+        """Switch outbound audio to binary frames (after client negotiation)."""
+        self.binary_audio = True
 
     async def send_audio(self, audio_data: bytes, sample_rate: int = 8000) -> None:
         # Simulator expects base64 audio in a specific JSON format
         # It handles 16khz usually, but orchestrator decides logic.
         # Here we just transport.
         try:
+            if self.binary_audio:
+                timestamp_ms = self._samples_sent * 1000 // self.sample_rate
+                await self.websocket.send_bytes(pack_audio(self._sequence, timestamp_ms, audio_data))
+                self._sequence += 1
+                self._samples_sent += len(audio_data) // 2
+                return
+
             b64 = base64.b64encode(audio_data).decode("utf-8")
-            import logging
-            logging.getLogger(__name__).debug(f"📤 [TRANS] Sending Audio: {len(b64)} chars")
+            logger.debug(f"📤 [TRANS] Sending Audio: {len(b64)} chars")
             await self.websocket.send_text(json.dumps({"type": "audio", "data": b64}))
         except Exception as e:
-            import logging
-            logging.getLogger(__name__).error(f"SimulatorTransport Send Error: {e}")
-            pass
+            logger.error(f"SimulatorTransport Send Error: {e}")
 
     async def send_json(self, data: dict[str, Any]) -> None:
         with contextlib.suppress(Exception):
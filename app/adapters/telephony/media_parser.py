@@ -0,0 +1,97 @@
+"""
+Fast inbound media message parser for Twilio / Telnyx / browser streams.
+
+Media events arrive 50 times per second per call and only three fields
+matter: the base64 payload, the sequence number and the media timestamp.
+`parse_media_message` pulls them out with string scans and decodes the
+payload in C, without building the JSON object graph. Anything that is
+not a plain media event (control events, marks, escaped payloads) returns
+None and goes through json.loads as before.
+
+Providers number every inbound event, not just media, so SequenceTracker
+must see the sequence of slow-path events too (see `event_sequence`), or
+each mark echo would count as a lost packet.
+"""
+import binascii
+import re
+from dataclasses import dataclass
+
+_MEDIA_PREFIX = '{"event":"media"'  # Compact form sent by Twilio / Telnyx
+_EVENT_RE = re.compile(r'"event"\s*:\s*"([a-z_]+)"')
+_SEQUENCE_RE = re.compile(r'"sequence(?:Number|_number)"\s*:\s*"?(\d+)')
+_TIMESTAMP_RE = re.compile(r'"timestamp"\s*:\s*"?(\d+)')
+
+
+@dataclass(slots=True)
+class MediaPacket:
+    """Decoded inbound media event."""
+    audio: bytes
+    sequence: int | None = None
+    timestamp: int | None = None
+
+
+@dataclass(slots=True)
+class SequenceTracker:
+    """Gaps in the inbound event numbering (lost packets)."""
+    next_sequence: int | None = None
+    lost: int = 0
+
+    def observe(self, sequence: int | None):
+        if sequence is None:
+            return
+        if self.next_sequence is not None and sequence > self.next_sequence:
+            self.lost += sequence - self.next_sequence
+        self.next_sequence = sequence + 1
+
+
+def event_sequence(msg: dict) -> int | None:
+    """Sequence number of a parsed event (Twilio `sequenceNumber`, Telnyx `sequence_number`)."""
+    value = msg.get("sequenceNumber", msg.get("sequence_number"))
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_media_message(text: str) -> MediaPacket | None:
+    """
+    Fast path for `media` events.
+
+    Returns:
+        MediaPacket, or None when the message needs the full JSON parser
+        (not a media event, carries a mark, or has an unexpected payload).
+    """
+    if not text.startswith(_MEDIA_PREFIX):
+        event = _EVENT_RE.search(text)
+        if event is None or event.group(1) != "media":
+            return None
+    if '"mark"' in text:
+        return None
+
+    # Payload string: base64 alphabet only, so no JSON escapes are expected
+    key = text.find('"payload"')
+    if key < 0:
+        return None
+    colon = text.find(":", key + 9)
+    start = text.find('"', colon) + 1
+    end = text.find('"', start)
+    if colon < 0 or start <= 0 or end < 0 or text[colon + 1:start - 1].strip():
+        return None  # Missing or non-string payload
+    payload = text[start:end]
+    if "\\" in payload:
+        return None
+
+    try:
+        audio = binascii.a2b_base64(payload, strict_mode=True)
+    except binascii.Error:
+        return None
+
+    sequence = _SEQUENCE_RE.search(text)
+    timestamp = _TIMESTAMP_RE.search(text)
+    return MediaPacket(
+        audio=audio,
+        sequence=int(sequence.group(1)) if sequence else None,
+        timestamp=int(timestamp.group(1)) if timestamp else None,
+    )
@@ -1,9 +1,10 @@
-import base64
+import contextlib
 import json
 from typing import Any
 
 from fastapi import WebSocket
 
+from app.adapters.telephony.media_serializer import MediaMessageSerializer
 from app.domain.ports import AudioTransport
 
 
@@ -11,11 +12,16 @@ class TelephonyTransport(AudioTransport):
     """
     Adapter for Telnyx/Twilio WebSockets.
     Wraps raw audio in protocol-specific JSON events.
+
+    Media events are spliced into a pre-rendered template built once per
+    stream id (see MediaMessageSerializer); a chunk may carry several 20ms
+    frames, which the carrier plays back-to-back.
     """
     def __init__(self, websocket: WebSocket, protocol: str = "twilio"):
         self.websocket = websocket
         self.protocol = protocol # 'twilio' or 'telnyx'
         self.stream_id: str | None = None
+        self._serializer: MediaMessageSerializer | None = None
 
     def set_stream_id(self, stream_id: str) -> None:
         self.stream_id = stream_id
@@ -24,29 +30,12 @@ class TelephonyTransport(AudioTransport):
         if not self.stream_id:
             return
 
-        try:
-            b64 = base64.b64encode(chunk).decode('utf-8')
-
-            # Protocol Specific Handling
-            if self.protocol == "twilio":
-                msg = {
-                    "event": "media",
-                    "streamSid": self.stream_id,
-                    "media": {"payload": b64}
-                }
-            elif self.protocol == "telnyx":
-                 msg = {
-                    "event": "media",
-                    "stream_id": self.stream_id,
-                    "media": {
-                        "payload": b64,
-                        "track": "inbound_track"  # Send audio TO Telnyx (so user hears it)
-                    }
-                }
+        serializer = self._serializer
+        if serializer is None or serializer.stream_id != self.stream_id:
+            serializer = self._serializer = MediaMessageSerializer(self.protocol, self.stream_id)
 
-            await self.websocket.send_text(json.dumps(msg))
-        except Exception:
-            pass
+        with contextlib.suppress(Exception):
+            await self.websocket.send_text(serializer.render(chunk))
 
     async def send_json(self, data: dict[str, Any]) -> None:
         try:
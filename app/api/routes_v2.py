@@ -14,7 +14,13 @@ from slowapi import Limiter
 from slowapi.util import get_remote_address
 from starlette.websockets import WebSocketDisconnect
 
+from app.adapters.simulator.binary_protocol import (
+    BINARY_PROTOCOL_VERSION,
+    BinaryFrameError,
+    unpack_audio,
+)
 from app.adapters.simulator.transport import SimulatorTransport
+from app.adapters.telephony.media_parser import SequenceTracker, event_sequence, parse_media_message
 from app.adapters.telephony.transport import TelephonyTransport
 from app.api.connection_manager import manager
 from app.core.auth_simple import verify_api_key
@@ -38,6 +44,9 @@ limiter = Limiter(key_func=get_remote_address)
 # Call state tracking for Telnyx (event-driven flow)
 active_calls: dict[str, dict[str, Any]] = {}
 
+# Media packets between sampled debug logs (250 = every 5s per call)
+MEDIA_LOG_SAMPLE_EVERY = 250
+
 
 @router.api_route("/twilio/incoming-call", methods=["GET", "POST"])
 @limiter.limit("30/minute")  # Rate limit: Max 30 calls/minute per IP
@@ -464,24 +473,57 @@ async def media_stream(websocket: WebSocket, client: str = "twilio", id: str | N
         await websocket.close()
         return
 
+    media_packets = 0
+    sequences = SequenceTracker()
+
     try:
         while True:
-            data = await websocket.receive_text()
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+
+            # Binary audio frames (negotiated browser sessions): raw PCM16, no base64
+            if message.get("bytes") is not None:
+                try:
+                    sequence, _, pcm = unpack_audio(message["bytes"])
+                except BinaryFrameError as e:
+                    logging.warning(f"⚠️ Dropped binary frame: {e}")
+                    continue
+                media_packets += 1
+                sequences.observe(sequence)
+                await orchestrator.push_audio(pcm)
+                continue
+
+            data = message.get("text")
+            if data is None:
+                continue
+
+            # Fast path: plain media events skip json.loads (50 packets/s per call)
+            packet = parse_media_message(data)
+            if packet is not None:
+                media_packets += 1
+                sequences.observe(packet.sequence)
+                # Sampled debug log for media to confirm flow
+                if media_packets % MEDIA_LOG_SAMPLE_EVERY == 1:
+                    logging.debug(f"📥 WS Media: packet #{media_packets} | {len(packet.audio)} bytes | Lost: {sequences.lost}")
+                await orchestrator.push_audio(packet.audio)
+                continue
+
             msg = json.loads(data)
+            sequences.observe(event_sequence(msg))  # Marks and control events are numbered too
 
             event_type = msg.get("event")
 
-            # Log received events (mask payload for readability)
-            import copy
-            log_msg = copy.deepcopy(msg)
-            if "media" in log_msg and "payload" in log_msg["media"]:
-                log_msg["media"]["payload"] = f"<BASE64 DATA len={len(msg['media']['payload'])}>"
+            # Log received events (mask payload for readability, shallow copy only)
+            log_msg = msg
+            if isinstance(msg.get("media"), dict) and "payload" in msg["media"]:
+                media = msg["media"]
+                log_msg = {**msg, "media": {**media, "payload": f"<BASE64 DATA len={len(media['payload'])}>"}}
             # Only log non-media events to reduce spam (media events happen every 20ms)
             if event_type != "media":
                 logging.info(f"📥 WS Event: {event_type} | Data: {json.dumps(log_msg)}")
             else:
-                 # Debug log for media to confirm flow (User requested "Everything")
-                 logging.debug(f"📥 WS Media: {len(msg['media']['payload'])} chars")
+                 logging.debug(f"📥 WS Media (slow path): {json.dumps(log_msg)}")
 
             if msg["event"] == "connected":
                 logging.info("🔗 WebSocket Connected")
@@ -504,17 +546,24 @@ async def media_stream(websocket: WebSocket, client: str = "twilio", id: str | N
 
                 # Extract media format (Telnyx provides this)
                 media_format = start_data.get('media_format', {})
-                encoding = media_format.get('encoding', 'PCMU')
-                sample_rate = media_format.get('sample_rate', 8000)
+                encoding = media_format.get('encoding', orchestrator.audio_encoding)
+                sample_rate = int(media_format.get('sample_rate', orchestrator.audio_sample_rate))
                 channels = media_format.get('channels', 1)
 
                 orchestrator.audio_encoding = encoding
+                orchestrator.audio_sample_rate = sample_rate
                 logging.info(f"🎧 Media Format: {encoding} @ {sample_rate}Hz, {channels}ch")
 
                 # Validate format for Telnyx
                 if client == "telnyx" and (encoding != "PCMA" or sample_rate != 8000):
                     logging.warning(f"⚠️ Unexpected Telnyx format: {encoding} @ {sample_rate}Hz")
 
+                # Binary audio negotiation (browser): ack, then both directions send raw PCM16 frames
+                if start_data.get('binary_audio') and hasattr(transport, 'enable_binary_audio'):
+                    transport.enable_binary_audio()
+                    await transport.send_json({"event": "binary_audio", "version": BINARY_PROTOCOL_VERSION})
+                    logging.info("🧱 Binary audio frames negotiated")
+
                 # Orchestrator handles DB creation now
                 if orchestrator.call_db_id is None:
                      logging.warning("⚠️ [Routes] Call DB ID is None after start (should be set by Orchestrator)")
@@ -527,6 +576,12 @@ async def media_stream(websocket: WebSocket, client: str = "twilio", id: str | N
                     logging.info("🔊 Client Playback Finished")
                     orchestrator.is_bot_speaking = False
 
+            elif msg["event"] == "mark":
+                # Playback reached a sentence mark (Twilio / Telnyx echo, browser worklet)
+                mark_name = (msg.get("mark") or {}).get("name")
+                if mark_name:
+                    orchestrator.on_playback_mark(mark_name)
+
             elif msg["event"] == "stop":
                 logging.info("🛑 Stream Stopped")
                 break
@@ -555,7 +610,7 @@ async def media_stream(websocket: WebSocket, client: str = "twilio", id: str | N
                 orchestrator.update_vad_stats(rms)
 
     except WebSocketDisconnect:
-        logging.info(f"WebSocket disconnected: {client} (ID: {client_id})")
+        logging.info(f"WebSocket disconnected: {client} (ID: {client_id}) | Media packets: {media_packets}, lost: {sequences.lost}")
     except Exception as e:
         logging.error(f"WebSocket error: {e}")
         import traceback
@@ -604,6 +659,31 @@ async def update_call_context(call_id: str, payload: dict):
             media_type="application/json"
         )
 
+@router.get("/calls/{call_id}/pipeline-stats")
+async def get_call_pipeline_stats(call_id: str, _: None = Depends(verify_api_key)):
+    """
+    Pipeline profiler snapshot for an active call.
+    Per-processor service time, queue wait per frame type, throughput and drops.
+    Requires PIPELINE_PROFILING_ENABLED.
+    """
+    target_orchestrator = manager.get_orchestrator(call_id)
+
+    if not target_orchestrator:
+        return Response(
+            content=json.dumps({"status": "error", "message": "Call not found or not active"}),
+            status_code=404,
+            media_type="application/json"
+        )
+
+    stats = target_orchestrator.get_pipeline_stats()
+    if stats is None:
+        return Response(
+            content=json.dumps({"status": "error", "message": "Pipeline profiling is not enabled"}),
+            status_code=404,
+            media_type="application/json"
+        )
+    return stats
+
 @router.post("/calls/test-outbound")
 @limiter.limit("5/minute")
 async def test_outbound_call(request: Request, _: None = Depends(verify_api_key)):
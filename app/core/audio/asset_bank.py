@@ -0,0 +1,335 @@
+"""
+Audio Asset Bank.
+
+Every static clip we play (background loops, hold audio, comfort noise,
+silence) is rendered once into each outbound wire format (mu-law 8k, A-law
+8k, PCM16 16k) and written to a cache directory as a raw file. The files
+are memory-mapped read-only, so every call in every worker process plays
+from the same page-cache copy: a call holds an AudioAsset (a memoryview
+over the mapping) plus its own loop offset, and never decodes, reads or
+copies the clip itself.
+
+Ambience is usually played attenuated; the gain is baked in at render time
+(one variant per gain), so the pre-encoded frames can be sent as they are.
+
+Rendering happens at startup (preload) or on the first request for a clip;
+files are published with an atomic rename, so workers racing to render the
+same clip are harmless.
+
+Clips are keyed by name when they are built in or live in the sounds
+directory, and by absolute path for any other .wav file, so a custom
+"office.wav" never shadows (or is shadowed by) the bundled "office".
+"""
+import hashlib
+import logging
+import mmap
+import os
+import re
+import struct
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from app.core.audio import g711
+from app.core.audio.resampler import PolyphaseResampler
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+RENDER_VERSION = 1  # Bump when rendering changes so stale cache files are ignored
+
+SOUNDS_DIR = Path(__file__).resolve().parents[2] / "static" / "sounds"
+
+# Wire format -> (sample rate, bytes per 20ms frame)
+WIRE_FORMATS = {
+    "PCMU": (8000, 160),
+    "PCMA": (8000, 160),
+    "PCM16": (16000, 640),
+}
+
+# Built-in synthetic clips: name -> duration in seconds
+SILENCE = "silence"
+COMFORT_NOISE = "comfort_noise"
+_SYNTHETIC_CLIPS = {SILENCE: 1.0, COMFORT_NOISE: 2.0}
+_COMFORT_NOISE_LEVEL = 24  # Sample std-dev (about -63 dBFS): audible hiss is not the goal
+
+_WAV_PCM, _WAV_ALAW, _WAV_ULAW = 1, 6, 7
+_CLIP_NAME = re.compile(r"^[A-Za-z0-9_\-]+$")
+
+
+def wire_format_for_client(client_type: str | None) -> str:
+    """Outbound wire format of a client type (browser PCM16, Telnyx A-law, else mu-law)."""
+    if client_type == "browser":
+        return "PCM16"
+    if client_type == "telnyx":
+        return "PCMA"
+    return "PCMU"
+
+
+@dataclass(frozen=True, slots=True)
+class AudioAsset:
+    """One clip in one wire format: a read-only view shared by every call."""
+    name: str
+    encoding: str
+    data: memoryview
+    frame_size: int
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @property
+    def frames(self) -> int:
+        return len(self.data) // self.frame_size
+
+    def frame(self, index: int) -> memoryview:
+        """The index-th 20ms frame, wrapping around the clip (zero-copy)."""
+        start = (index % self.frames) * self.frame_size
+        return self.data[start:start + self.frame_size]
+
+
+class AudioAssetBank:
+    """
+    Pre-rendered, memory-mapped static audio.
+
+    Example:
+        >>> bank = get_audio_asset_bank()
+        >>> office = bank.get("office", "PCMU")    # mmap-backed, shared
+        >>> office.frame(0)                          # 160-byte memoryview
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None, sounds_dir: str | Path = SOUNDS_DIR):
+        """
+        Args:
+            cache_dir: Where rendered files live (default: <tmp>/voice-audio-assets)
+            sounds_dir: Directory of source .wav clips addressable by name
+        """
+        self.cache_dir = Path(cache_dir or Path(tempfile.gettempdir()) / "voice-audio-assets")
+        self.sounds_dir = Path(sounds_dir)
+        self._sounds_root = self.sounds_dir.absolute()
+        self._assets: dict[tuple[str, str, float], AudioAsset] = {}  # (clip key, encoding, gain)
+        self._lock = threading.Lock()  # get() may run in executor threads
+
+        # Stats
+        self.rendered = 0
+        self.mapped = 0
+
+    def lookup(self, source: str, encoding: str, gain: float = 1.0) -> AudioAsset | None:
+        """Already-mapped asset, or None (never touches the disk)."""
+        return self._assets.get((self._clip_key(source), encoding, gain))
+
+    def get(self, source: str, encoding: str, gain: float = 1.0) -> AudioAsset:
+        """
+        Asset for a clip in a wire format, rendering and mapping it on first use.
+
+        Args:
+            source: Built-in clip name, sound name (app/static/sounds/<name>.wav) or .wav path
+            encoding: "PCMU", "PCMA" or "PCM16"
+            gain: Level applied before encoding (e.g. settings.BACKGROUND_AUDIO_GAIN)
+
+        Raises:
+            ValueError: Unknown encoding or unsupported WAV format
+            FileNotFoundError: No such clip
+        """
+        if encoding not in WIRE_FORMATS:
+            raise ValueError(f"Unsupported wire format: {encoding}")
+
+        key = (self._clip_key(source), encoding, gain)
+        asset = self._assets.get(key)
+        if asset is not None:
+            return asset
+
+        with self._lock:
+            asset = self._assets.get(key)
+            if asset is None:
+                asset = self._load(key[0], self._source_path(key[0]), encoding, gain)
+                self._assets[key] = asset
+        return asset
+
+    def preload(self, gains: tuple[float, ...] = (1.0,)) -> int:
+        """Render and map every known clip in every wire format and gain (startup). Returns the count."""
+        sources = list(_SYNTHETIC_CLIPS)
+        if self.sounds_dir.is_dir():
+            sources += sorted(path.stem for path in self.sounds_dir.glob("*.wav") if _CLIP_NAME.match(path.stem))
+
+        count = 0
+        for source in sources:
+            for encoding in WIRE_FORMATS:
+                for gain in gains:
+                    try:
+                        self.get(source, encoding, gain)
+                        count += 1
+                    except Exception as e:
+                        logger.warning(f"⚠️ [AssetBank] Could not prepare {source} ({encoding}): {e}")
+        logger.info(f"🎵 [AssetBank] {count} assets ready in {self.cache_dir}")
+        return count
+
+    # -------------------------------------------------------------------------
+    # Resolution
+    # -------------------------------------------------------------------------
+
+    def _clip_key(self, source: str) -> str:
+        """
+        Clip name for built-in and sounds-directory clips, absolute path for
+        any other .wav file (no disk access).
+        """
+        if not source.lower().endswith(".wav"):
+            return source
+        path = Path(source).absolute()
+        if path.parent == self._sounds_root and _CLIP_NAME.match(path.stem):
+            return path.stem
+        return str(path)
+
+    def _source_path(self, key: str) -> Path | None:
+        """Source file of a clip (None for built-in synthetic clips)."""
+        if key in _SYNTHETIC_CLIPS:
+            return None
+        if Path(key).is_absolute():
+            path = Path(key)
+        elif _CLIP_NAME.match(key):
+            path = self.sounds_dir / f"{key}.wav"
+        else:
+            raise FileNotFoundError(f"Invalid clip name: {key!r}")
+        if not path.is_file():
+            raise FileNotFoundError(f"Audio clip not found: {key}")
+        return path
+
+    # -------------------------------------------------------------------------
+    # Render + map
+    # -------------------------------------------------------------------------
+
+    def _load(self, key: str, path: Path | None, encoding: str, gain: float) -> AudioAsset:
+        name = key
+        file_stem = key
+        if Path(key).is_absolute():
+            # Same file name in another directory: keep the rendered files apart
+            name = path.stem
+            file_stem = f"{name}-{hashlib.sha1(key.encode(), usedforsecurity=False).hexdigest()[:10]}"
+
+        if path is None:
+            fingerprint = f"v{RENDER_VERSION}"
+        else:
+            stat = path.stat()
+            fingerprint = f"v{RENDER_VERSION}-{stat.st_size:x}-{stat.st_mtime_ns:x}"
+        if gain != 1.0:
+            fingerprint += f"-g{round(gain * 1000)}"
+        target = self.cache_dir / f"{file_stem}.{fingerprint}.{encoding.lower()}.raw"
+
+        if not target.exists():
+            self._publish(target, self._render(name, path, encoding, gain))
+            self.rendered += 1
+
+        with open(target, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.mapped += 1
+        return AudioAsset(name, encoding, memoryview(mapping), WIRE_FORMATS[encoding][1])
+
+    def _publish(self, target: Path, payload: bytes):
+        """Write atomically: readers see either no file or the complete one."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{target.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            Path(tmp_path).replace(target)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def _render(self, name: str, path: Path | None, encoding: str, gain: float) -> bytes:
+        """Clip -> wire format bytes, trimmed to whole 20ms frames so loops never straddle."""
+        rate, frame_size = WIRE_FORMATS[encoding]
+        if path is None:
+            pcm, source_rate = _synthesize(name, rate)
+        else:
+            pcm, source_rate = read_wav(path.read_bytes())
+
+        if source_rate != rate:
+            pcm = PolyphaseResampler(source_rate, rate).process(pcm).copy()
+        if gain != 1.0:
+            pcm = g711.gain(pcm, gain)
+
+        if encoding == "PCMU":
+            payload = g711.ulaw_encode(pcm).tobytes()
+        elif encoding == "PCMA":
+            payload = g711.alaw_encode(pcm).tobytes()
+        else:
+            payload = pcm.astype("<i2").tobytes()
+
+        usable = len(payload) - len(payload) % frame_size
+        if not usable:
+            raise ValueError(f"Clip '{name}' is shorter than one frame")
+        return payload[:usable]
+
+    def stats(self) -> dict:
+        return {
+            "assets": len(self._assets),
+            "mapped_bytes": sum(len(asset) for asset in self._assets.values()),
+            "rendered": self.rendered,
+            "mapped": self.mapped,
+        }
+
+
+def _synthesize(name: str, rate: int) -> tuple[np.ndarray, int]:
+    """Built-in clips, generated directly at the target rate."""
+    samples = int(_SYNTHETIC_CLIPS[name] * rate)
+    if name == COMFORT_NOISE:
+        noise = np.random.default_rng(seed=0).normal(0, _COMFORT_NOISE_LEVEL, samples)
+        return np.clip(np.rint(noise), -32768, 32767).astype(np.int16), rate
+    return np.zeros(samples, dtype=np.int16), rate
+
+
+def read_wav(raw: bytes) -> tuple[np.ndarray, int]:
+    """
+    Decode a WAV file (PCM16, A-law or mu-law) to mono int16 samples.
+
+    Returns:
+        (samples, sample_rate)
+
+    Raises:
+        ValueError: Not a WAV file, or an unsupported sample format
+    """
+    if raw[:4] != b"RIFF" or raw[8:12] != b"WAVE":
+        raise ValueError("Not a RIFF/WAVE file")
+
+    fmt = data = None
+    offset = 12
+    while offset + 8 <= len(raw):
+        chunk_id = raw[offset:offset + 4]
+        size = struct.unpack_from("<I", raw, offset + 4)[0]
+        body = raw[offset + 8:offset + 8 + size]
+        if chunk_id == b"fmt ":
+            fmt = struct.unpack_from("<HHIIHH", body)
+        elif chunk_id == b"data":
+            data = body
+        offset += 8 + size + (size & 1)  # Chunks are word-aligned
+
+    if fmt is None or data is None:
+        raise ValueError("WAV file without fmt/data chunk")
+
+    tag, channels, rate, _, _, bits = fmt
+    if tag == _WAV_PCM and bits == 16:
+        pcm = np.frombuffer(data, dtype="<i2", count=len(data) // 2).astype(np.int16)
+    elif tag == _WAV_ALAW and bits == 8:
+        pcm = g711.alaw_decode(data)
+    elif tag == _WAV_ULAW and bits == 8:
+        pcm = g711.ulaw_decode(data)
+    else:
+        raise ValueError(f"Unsupported WAV format (tag={tag}, bits={bits})")
+
+    if channels > 1:
+        pcm = pcm[:len(pcm) - len(pcm) % channels].reshape(-1, channels).mean(axis=1).astype(np.int16)
+    return pcm, rate
+
+
+_bank: AudioAssetBank | None = None
+
+
+def get_audio_asset_bank() -> AudioAssetBank:
+    """Get or create the process-wide audio asset bank (Singleton)."""
+    global _bank  # noqa: PLW0603 - One bank per process
+    if _bank is None:
+        _bank = AudioAssetBank(cache_dir=settings.AUDIO_ASSET_CACHE_DIR or None)
+    return _bank
@@ -0,0 +1,84 @@
+"""
+Audio Buffer Pool.
+
+Outbound audio travels from the TTS adapter to the transport as memoryviews
+over the adapter's own buffer: AudioFrame, the sink queue and the playout
+buffer hand the view on instead of slicing copies. Only a frame that
+straddles two TTS chunks has to be assembled, and that happens in a pooled
+bytearray, so steady-state streaming allocates nothing per frame.
+"""
+
+
+class AudioBufferPool:
+    """
+    Free lists of fixed-size bytearrays, with byte accounting.
+
+    Buffers are never resized, so memoryviews over a buffer stay valid while
+    it is reused; the owner decides when its contents may be overwritten.
+
+    Example:
+        >>> pool = get_audio_buffer_pool()
+        >>> buffer = pool.acquire(640)
+        >>> ...
+        >>> pool.release(buffer)
+    """
+
+    def __init__(self, max_free_per_size: int = 64):
+        """
+        Args:
+            max_free_per_size: Idle buffers kept per size (the rest are freed)
+        """
+        self.max_free_per_size = max_free_per_size
+        self._free: dict[int, list[bytearray]] = {}
+
+        # Accounting
+        self.allocated_bytes = 0  # Owned by the pool: in use + idle
+        self.in_use_bytes = 0
+        self.peak_in_use_bytes = 0
+        self.acquired = 0
+        self.reused = 0
+
+    def acquire(self, size: int) -> bytearray:
+        """A bytearray of exactly `size` bytes (contents undefined)."""
+        free = self._free.get(size)
+        if free:
+            buffer = free.pop()
+            self.reused += 1
+        else:
+            buffer = bytearray(size)
+            self.allocated_bytes += size
+
+        self.acquired += 1
+        self.in_use_bytes += size
+        self.peak_in_use_bytes = max(self.in_use_bytes, self.peak_in_use_bytes)
+        return buffer
+
+    def release(self, buffer: bytearray):
+        """Return a buffer obtained from acquire()."""
+        size = len(buffer)
+        self.in_use_bytes -= size
+        free = self._free.setdefault(size, [])
+        if len(free) < self.max_free_per_size:
+            free.append(buffer)
+        else:
+            self.allocated_bytes -= size
+
+    def stats(self) -> dict:
+        return {
+            "allocated_bytes": self.allocated_bytes,
+            "in_use_bytes": self.in_use_bytes,
+            "peak_in_use_bytes": self.peak_in_use_bytes,
+            "acquired": self.acquired,
+            "reused": self.reused,
+        }
+
+
+_pool: AudioBufferPool | None = None
+
+
+def get_audio_buffer_pool() -> AudioBufferPool:
+    """Get or create the process-wide audio buffer pool (Singleton)."""
+    global _pool  # noqa: PLW0603 - One pool per process
+    if _pool is None:
+        _pool = AudioBufferPool()
+    return _pool
@@ -0,0 +1,144 @@
+"""
+Egress Clock.
+
+One process-wide 20ms tick drives outbound audio for every call. Each tick
+asks every registered call for exactly one frame, so carriers receive
+audio at real-time pace, only a couple of frames are ever queued past us
+(barge-in cuts audio off immediately) and N calls cost one timer instead
+of N polling loops.
+"""
+import asyncio
+import contextlib
+import logging
+from typing import Protocol
+
+logger = logging.getLogger(__name__)
+
+TICK_INTERVAL_SECONDS = 0.02  # 20ms = one telephony frame
+
+
+class EgressSubscriber(Protocol):
+    """Anything that sends one outbound frame per tick."""
+
+    def on_tick(self) -> None: ...
+
+
+class EgressClock:
+    """
+    Drift-free shared tick for paced outbound audio.
+
+    Ticks are scheduled against absolute deadlines on the event loop clock.
+    After a stall the clock catches up a bounded number of ticks (so a short
+    hiccup does not lose audio time) and then re-anchors, rather than
+    bursting every missed frame at once.
+
+    Example:
+        >>> clock = get_egress_clock()
+        >>> clock.register(audio_manager)    # audio_manager.on_tick() every 20ms
+        >>> clock.unregister(audio_manager)
+    """
+
+    def __init__(self, interval: float = TICK_INTERVAL_SECONDS, max_catchup_ticks: int = 2):
+        """
+        Args:
+            interval: Tick period in seconds
+            max_catchup_ticks: Extra ticks run after a stall before re-anchoring
+        """
+        self.interval = interval
+        self.max_catchup_ticks = max_catchup_ticks
+
+        self._subscribers: dict[int, EgressSubscriber] = {}  # Insertion-ordered, O(1) removal
+        self._task: asyncio.Task | None = None
+
+        # Stats
+        self.ticks = 0
+        self.late_ticks = 0
+        self.resyncs = 0
+        self.max_lag = 0.0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def register(self, subscriber: EgressSubscriber):
+        """Start receiving on_tick() calls (must be called from the event loop)."""
+        loop = asyncio.get_running_loop()
+        if self._task is not None and (self._task.done() or self._task.get_loop() is not loop):
+            # Previous loop is gone (tests, reload): its subscribers went with it
+            self._subscribers.clear()
+            self._task = None
+        self._subscribers[id(subscriber)] = subscriber
+        if self._task is None:
+            self._task = loop.create_task(self._run(), name="egress-clock")
+
+    def unregister(self, subscriber: EgressSubscriber):
+        """Stop ticking a subscriber; the clock idles out when none are left."""
+        self._subscribers.pop(id(subscriber), None)
+
+    async def stop(self):
+        """Stop the clock task (shutdown)."""
+        self._subscribers.clear()
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        try:
+            while self._subscribers:
+                deadline += self.interval
+                delay = deadline - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    delay = deadline - loop.time()
+                lag = -delay
+                if lag < self.interval:
+                    self._tick()
+                    continue
+
+                # Late by whole ticks: run the missed ones (bounded), then re-anchor
+                self.late_ticks += 1
+                self.max_lag = max(self.max_lag, lag)
+                missed = int(lag / self.interval)
+                for _ in range(min(missed, self.max_catchup_ticks) + 1):
+                    self._tick()
+                if missed > self.max_catchup_ticks:
+                    self.resyncs += 1
+                    deadline = loop.time()
+                else:
+                    deadline += missed * self.interval
+                await asyncio.sleep(0)  # Never starve the loop while catching up
+        finally:
+            if self._task is asyncio.current_task():
+                self._task = None
+
+    def _tick(self):
+        self.ticks += 1
+        for subscriber in list(self._subscribers.values()):
+            try:
+                subscriber.on_tick()
+            except Exception as e:
+                logger.error(f"❌ [EgressClock] Subscriber tick failed: {e}", exc_info=True)
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": len(self._subscribers),
+            "ticks": self.ticks,
+            "late_ticks": self.late_ticks,
+            "resyncs": self.resyncs,
+            "max_lag_ms": round(self.max_lag * 1000, 2),
+        }
+
+
+_clock: EgressClock | None = None
+
+
+def get_egress_clock() -> EgressClock:
+    """Get or create the process-wide egress clock (Singleton)."""
+    global _clock  # noqa: PLW0603 - One clock per process
+    if _clock is None:
+        _clock = EgressClock()
+    return _clock
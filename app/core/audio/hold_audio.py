@@ -11,6 +11,7 @@ import logging
 # To avoid circular imports, use TYPE_CHECKING for type hints if needed,
 # or just type as 'Any' if the manager is passed dynamically.
 # Ideally, we import the class if possible.
+from app.core.audio.asset_bank import SILENCE, get_audio_asset_bank
 from app.core.managers.audio_manager import AudioManager
 
 logger = logging.getLogger(__name__)
@@ -36,12 +37,9 @@ class HoldAudioPlayer:
         self._task: asyncio.Task | None = None
         self._sound_interval = 2.0  # 2 seconds between pulses
 
-        # Pre-synthesize a short "tick" or "comfort pulse" (20ms)
-        # 8000Hz, PCMU (u-law) approximation or silence + tick
-        # Note: Proper PCMU synthesis requires a lookup table or math.
-        # For safety/simplicity, we generate 20ms of simple silence/low-noise.
-        # 0xFF is silence in u-law.
-        self._pulse_audio = b'\xff' * 160  # 20ms silence (keep line active)
+        # 20ms keep-alive pulse, taken from the shared asset bank on start
+        # (already encoded for the call's wire format, never re-encoded here)
+        self._pulse_audio: memoryview | None = None
 
     async def start(self):
         """
@@ -53,6 +51,9 @@ class HoldAudioPlayer:
             return
 
         logger.debug("[HoldAudio] Starting keep-alive loop")
+        if self._pulse_audio is None:
+            encoding = getattr(self.audio_manager, "audio_encoding", "PCMU")
+            self._pulse_audio = get_audio_asset_bank().get(SILENCE, encoding).frame(0)
         self._playing = True
         self._task = asyncio.create_task(self._play_loop())
 
@@ -0,0 +1,137 @@
+"""
+Background Audio Mixer.
+
+Blends the ambience loop under outbound speech once per egress tick. The
+ambience comes from the AudioAssetBank already attenuated and encoded in
+the call's wire format, which gives two paths:
+
+- Silence (no speech this tick): the next ambience frame is sent as is, a
+  view into the shared mapping. No decode, mix or encode.
+- Speech: one vectorized pass. For G.711 that is a single gather through a
+  64 KiB table indexed by (speech code, ambience code) whose entries are the
+  encoded saturating sum; for PCM16 one widened add and clip.
+
+Work buffers are allocated once per call and reused on every tick.
+"""
+from functools import cache
+
+import numpy as np
+
+from app.core.audio import g711
+from app.core.audio.asset_bank import AudioAsset
+
+
+@cache
+def _mix_table(encoding: str) -> np.ndarray:
+    """
+    65536-entry G.711 mix table: index (speech << 8) | ambience -> encoded sum.
+
+    Built vectorized on first use per encoding (about a millisecond).
+    """
+    if encoding == "PCMA":
+        decoded, encode = g711.alaw_decode(np.arange(256, dtype=np.uint8)), g711.alaw_encode
+    else:
+        decoded, encode = g711.ulaw_decode(np.arange(256, dtype=np.uint8)), g711.ulaw_encode
+    total = decoded.astype(np.int32)[:, None] + decoded.astype(np.int32)[None, :]
+    np.clip(total, -32768, 32767, out=total)
+    return encode(total.astype(np.int16).reshape(-1))
+
+
+class BackgroundMixer:
+    """
+    Per-call ambience loop with a zero-work silence path.
+
+    Example:
+        >>> mixer = BackgroundMixer(bank.get("office", "PCMU", gain=0.15))
+        >>> mixer.ambience_frame()       # silence: pre-encoded view, no DSP
+        >>> mixer.mix(speech_chunk)      # speech: ambience blended in one pass
+    """
+
+    def __init__(self, ambience: AudioAsset | bytes | memoryview, encoding: str | None = None, frame_size: int | None = None):
+        """
+        Args:
+            ambience: Loop in the call's wire format (gain already applied)
+            encoding: "PCMU", "PCMA" or "PCM16" (taken from an AudioAsset)
+            frame_size: Bytes per 20ms frame (taken from an AudioAsset)
+        """
+        if isinstance(ambience, AudioAsset):
+            encoding = encoding or ambience.encoding
+            frame_size = frame_size or ambience.frame_size
+            ambience = ambience.data
+        self.encoding = encoding or "PCMU"
+        self.frame_size = frame_size or (640 if self.encoding == "PCM16" else 160)
+        self.ambience = memoryview(ambience).cast("B")
+        if not len(self.ambience):
+            raise ValueError("Empty ambience loop")
+        self.position = 0  # Byte offset into the shared loop (the only per-call state)
+
+        self._table = None if self.encoding == "PCM16" else _mix_table(self.encoding)
+        self._out = bytearray(self.frame_size)
+        self._wrap = bytearray(self.frame_size)
+
+        # Stats
+        self.passthrough_frames = 0
+        self.mixed_frames = 0
+
+    def ambience_frame(self) -> memoryview:
+        """Next ambience frame, pre-encoded (silence path: no decode/mix/encode)."""
+        self.passthrough_frames += 1
+        return self._next_ambience(self.frame_size)
+
+    def mix(self, speech: bytes | memoryview) -> memoryview:
+        """
+        Speech with the ambience loop blended in (saturating, one pass).
+
+        The result lives in a buffer reused by the next call to mix(), so it
+        must be sent before mixing again (the egress tick never overlaps sends).
+        """
+        size = len(speech)
+        if not size:
+            return memoryview(speech)
+        ambience = self._next_ambience(size)
+        if len(self._out) < size:
+            self._out = bytearray(size)
+        out = memoryview(self._out)[:size]
+        self.mixed_frames += max(1, size // self.frame_size)
+
+        if self._table is not None:
+            index = np.frombuffer(speech, dtype=np.uint8).astype(np.uint16)
+            index <<= 8
+            index |= np.frombuffer(ambience, dtype=np.uint8)
+            np.take(self._table, index, out=np.frombuffer(out, dtype=np.uint8))
+            return out
+
+        samples = size // 2
+        total = np.frombuffer(speech, dtype=np.int16, count=samples).astype(np.int32)
+        total += np.frombuffer(ambience, dtype=np.int16, count=samples)
+        np.clip(total, -32768, 32767, out=total)
+        np.frombuffer(out, dtype=np.int16, count=samples)[:] = total
+        if size % 2:
+            out[-1] = speech[-1]
+        return out
+
+    def _next_ambience(self, size: int) -> memoryview:
+        """`size` bytes of the loop: a view, or a copy into scratch when it wraps."""
+        start = self.position
+        end = start + size
+        total = len(self.ambience)
+        if end <= total:
+            self.position = end % total
+            return self.ambience[start:end]
+
+        if len(self._wrap) < size:
+            self._wrap = bytearray(size)
+        scratch = memoryview(self._wrap)[:size]
+        filled = 0
+        while filled < size:
+            n = min(total - self.position, size - filled)
+            scratch[filled:filled + n] = self.ambience[self.position:self.position + n]
+            self.position = (self.position + n) % total
+            filled += n
+        return scratch
+
+    def stats(self) -> dict:
+        return {
+            "ambience_passthrough_frames": self.passthrough_frames,
+            "ambience_mixed_frames": self.mixed_frames,
+        }
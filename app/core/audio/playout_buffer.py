@@ -0,0 +1,172 @@
+"""
+Playout Buffer.
+
+Per-call jitter buffer between TTS (bursty, faster than real time) and the
+egress clock (one frame per 20ms tick). A talkspurt only starts once a few
+frames are buffered, so a slow TTS chunk does not cause an audible gap
+right after the first frame; the tail of an utterance is flushed once the
+producer goes quiet.
+
+Written audio is kept as memoryviews over the producer's buffers and frames
+are handed out as views into them; only a frame that straddles two chunks
+is copied, into a pooled bytearray (see buffer_pool).
+"""
+from collections import deque
+
+from app.core.audio.buffer_pool import AudioBufferPool, get_audio_buffer_pool
+
+
+class PlayoutBuffer:
+    """
+    Byte FIFO that yields fixed-size frames at the egress clock's pace.
+
+    Example:
+        >>> buffer = PlayoutBuffer(frame_size=160)
+        >>> buffer.write(tts_audio)       # Takes ownership: do not modify tts_audio afterwards
+        >>> frame = buffer.next_frame()   # Once per tick: memoryview or None
+    """
+
+    def __init__(self, frame_size: int, prebuffer_frames: int = 2, pool: AudioBufferPool | None = None):
+        """
+        Args:
+            frame_size: Bytes per tick (160 = 20ms @ 8kHz G.711, 640 = 20ms @ 16kHz PCM16)
+            prebuffer_frames: Frames buffered before a talkspurt starts (jitter tolerance)
+            pool: Buffers for frames assembled across chunks (defaults to the process-wide pool)
+        """
+        self.frame_size = frame_size
+        self.prebuffer_frames = prebuffer_frames
+        self.pool = pool or get_audio_buffer_pool()
+
+        self._chunks: deque[memoryview] = deque()
+        self._size = 0
+        self._frame_buffer: bytearray | None = None  # Pooled buffer behind the last frame
+        self._ticks_since_write = 0
+        self.playing = False
+
+        # Stream positions (monotonic byte offsets, used for playout marks)
+        self.total_written = 0
+        self.total_read = 0
+
+        # Stats
+        self.frames_out = 0
+        self.underruns = 0
+        self.cleared_bytes = 0
+        self.zero_copy_frames = 0
+        self.copied_bytes = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def buffered_ms(self) -> float:
+        """Buffered audio in milliseconds (20ms per frame)."""
+        return len(self) / self.frame_size * 20
+
+    @property
+    def retained_bytes(self) -> int:
+        """Memory kept alive by buffered audio (whole producer buffers, not just unread bytes)."""
+        owners = {id(chunk.obj): chunk.obj for chunk in self._chunks}
+        return sum(memoryview(owner).nbytes for owner in owners.values())
+
+    def write(self, data: bytes | memoryview):
+        """Queue audio without copying it; the caller must not modify `data` afterwards."""
+        view = memoryview(data).cast("B")
+        if view.nbytes:
+            self._chunks.append(view)
+            self._size += view.nbytes
+        self.total_written += view.nbytes
+        self._ticks_since_write = 0
+
+    def next_frame(self, max_frames: int = 1) -> memoryview | None:
+        """
+        The audio to send on this tick, or None (prebuffering or idle).
+
+        The returned view is valid until the next call to next_frame.
+
+        Args:
+            max_frames: Whole frames that may be coalesced when the sender is behind
+        """
+        self._release_frame_buffer()
+        self._ticks_since_write += 1
+        available = len(self)
+        producer_idle = self._ticks_since_write > self.prebuffer_frames
+
+        if not self.playing:
+            if available >= self.prebuffer_frames * self.frame_size or (available and producer_idle):
+                self.playing = True
+            else:
+                return None
+
+        if available >= self.frame_size or (available and producer_idle):
+            whole = min(available // self.frame_size, max_frames) * self.frame_size
+            size = whole or available  # Short tail of an utterance
+            frame = self._take(size)
+            self.total_read += size
+            self.frames_out += max(1, whole // self.frame_size)
+            return frame
+
+        if available:
+            # Partial frame while TTS is still producing: wait a tick for the rest
+            self.underruns += 1
+            return None
+
+        # Drained: the next talkspurt prebuffers again
+        self.playing = False
+        return None
+
+    def _take(self, size: int) -> memoryview:
+        """Pop `size` bytes: a view into the head chunk, or a pooled copy across chunks."""
+        self._size -= size
+        head = self._chunks[0]
+        if len(head) >= size:
+            if len(head) == size:
+                self._chunks.popleft()
+            else:
+                self._chunks[0] = head[size:]
+            self.zero_copy_frames += 1
+            return head[:size]
+
+        buffer = self._frame_buffer = self.pool.acquire(size)
+        filled = 0
+        while filled < size:
+            head = self._chunks[0]
+            n = min(len(head), size - filled)
+            buffer[filled:filled + n] = head[:n]
+            if n == len(head):
+                self._chunks.popleft()
+            else:
+                self._chunks[0] = head[n:]
+            filled += n
+        self.copied_bytes += size
+        return memoryview(buffer)
+
+    def _release_frame_buffer(self):
+        if self._frame_buffer is not None:
+            self.pool.release(self._frame_buffer)
+            self._frame_buffer = None
+
+    def clear(self) -> int:
+        """Drop everything not yet sent (barge-in). Returns bytes dropped."""
+        dropped = len(self)
+        self.cleared_bytes += dropped
+        self.total_written = self.total_read
+        self._chunks.clear()
+        self._size = 0
+        self.playing = False
+        return dropped
+
+    def close(self):
+        """Drop buffered audio and return pooled memory (end of call)."""
+        self.clear()
+        self._release_frame_buffer()
+
+    def stats(self) -> dict:
+        return {
+            "buffered_ms": round(self.buffered_ms, 1),
+            "retained_bytes": self.retained_bytes,
+            "frames_out": self.frames_out,
+            "zero_copy_frames": self.zero_copy_frames,
+            "copied_bytes": self.copied_bytes,
+            "underruns": self.underruns,
+            "cleared_bytes": self.cleared_bytes,
+        }
@@ -0,0 +1,185 @@
+"""
+Playout Tracker.
+
+Knows which assistant text the caller has actually heard. Every outbound
+sentence is a segment with byte offsets in the call's outbound stream; when
+the egress side has sent a segment's last byte, a named mark goes out right
+behind it and the client (Twilio / Telnyx natively, the browser worklet
+when it renders that sample) echoes the mark back once it has been played.
+
+On barge-in, acknowledged segments were heard in full; the segment in
+flight is estimated from the time since playback reached it and cut at a
+word boundary. That lets the conversation history hold only what the
+caller really heard.
+"""
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class PlayoutSegment:
+    """One outbound sentence and its byte range in the outbound stream."""
+    mark: str
+    text: str
+    response_id: str | None
+    start: int
+    end: int | None = None          # None while TTS is still producing it
+    started_at: float | None = None  # First byte handed to the transport
+    mark_sent: bool = False
+    played: bool = False
+
+
+@dataclass(slots=True)
+class HeardAudio:
+    """What the caller heard of the latest response when playback stopped."""
+    response_id: str | None
+    text: str
+    complete: bool
+
+
+def truncate_at_word(text: str, fraction: float) -> str:
+    """Leading `fraction` of `text`, cut back to the last whole word."""
+    if fraction >= 1.0:
+        return text
+    cut = int(len(text) * max(fraction, 0.0))
+    if cut >= len(text):
+        return text
+    if cut and not text[cut].isspace():
+        space = text.rfind(" ", 0, cut)
+        cut = space if space > 0 else 0
+    return text[:cut].rstrip()
+
+
+class PlayoutTracker:
+    """
+    Segment / mark bookkeeping for one call's outbound audio.
+
+    Example:
+        >>> tracker = PlayoutTracker(bytes_per_second=8000)
+        >>> tracker.begin("Hola, ¿en qué le ayudo?", "trace-1", position=0)
+        >>> tracker.close(position=12000)
+        >>> tracker.advance(sent_position=12000, now=t)  # -> ["seg-1"] marks to send
+        >>> tracker.acknowledge("seg-1")                  # client echoed the mark
+    """
+
+    def __init__(self, bytes_per_second: int, playback_latency: float = 0.1):
+        """
+        Args:
+            bytes_per_second: Outbound stream rate (8000 = 8kHz G.711, 32000 = 16kHz PCM16)
+            playback_latency: Carrier/client buffering subtracted from the time estimate (seconds)
+        """
+        self.bytes_per_second = bytes_per_second
+        self.playback_latency = playback_latency
+
+        self._segments: list[PlayoutSegment] = []
+        self._counter = 0
+        self._last_ack_at: float | None = None
+
+        # Stats
+        self.marks_sent = 0
+        self.marks_acked = 0
+
+    @property
+    def open_segment(self) -> PlayoutSegment | None:
+        if self._segments and self._segments[-1].end is None:
+            return self._segments[-1]
+        return None
+
+    @property
+    def pending(self) -> bool:
+        """Audio is still being produced or awaiting its playback mark."""
+        return any(not s.played for s in self._segments)
+
+    def begin(self, text: str, response_id: str | None, position: int) -> PlayoutSegment:
+        """Start a segment at the current write position (closes any open one)."""
+        self.close(position)
+        self._prune(response_id)
+        self._counter += 1
+        segment = PlayoutSegment(mark=f"seg-{self._counter}", text=text, response_id=response_id, start=position)
+        self._segments.append(segment)
+        return segment
+
+    def close(self, position: int):
+        """End the open segment at the current write position."""
+        segment = self.open_segment
+        if segment is not None:
+            segment.end = position
+
+    def advance(self, sent_position: int, now: float) -> list[str]:
+        """
+        Record egress progress.
+
+        Returns:
+            Mark names to send right after the audio up to `sent_position`
+        """
+        due = []
+        for segment in self._segments:
+            if segment.started_at is None and sent_position > segment.start:
+                segment.started_at = now
+            if not segment.mark_sent and segment.end is not None and sent_position >= segment.end:
+                segment.mark_sent = True
+                due.append(segment.mark)
+        self.marks_sent += len(due)
+        return due
+
+    def acknowledge(self, mark: str, now: float | None = None) -> bool:
+        """The client played everything up to `mark`. Returns False for unknown marks."""
+        for index, segment in enumerate(self._segments):
+            if segment.mark == mark:
+                for played in self._segments[:index + 1]:
+                    played.played = True
+                self.marks_acked += 1
+                self._last_ack_at = now
+                self._prune(self._segments[-1].response_id)
+                return True
+        return False
+
+    def _prune(self, latest: str | None):
+        """Drop acknowledged segments of responses older than `latest`."""
+        self._segments = [s for s in self._segments if not s.played or s.response_id == latest]
+
+    def heard(self, now: float, sent_position: int) -> HeardAudio | None:
+        """
+        What the caller heard of the latest response, as of `now`.
+
+        Returns None when nothing has been tracked yet.
+        """
+        if not self._segments:
+            return None
+
+        response_id = self._segments[-1].response_id
+        segments = [s for s in self._segments if s.response_id == response_id]
+        parts: list[str] = []
+        for segment in segments:
+            if segment.played:
+                parts.append(segment.text)
+                continue
+
+            # First unacknowledged segment: estimate from playback time
+            if segment.started_at is not None:
+                reference = segment.started_at
+                if self._last_ack_at is not None:
+                    reference = max(reference, self._last_ack_at)
+                elapsed = max(now - reference - self.playback_latency, 0.0)
+                end = segment.end if segment.end is not None else sent_position
+                sent = min(sent_position, end) - segment.start
+                heard_bytes = min(elapsed * self.bytes_per_second, sent)
+                total = max(end - segment.start, 1)
+                partial = truncate_at_word(segment.text, heard_bytes / total)
+                if partial:
+                    parts.append(partial)
+            break
+
+        complete = all(s.played for s in segments)
+        return HeardAudio(response_id=response_id, text=" ".join(p.strip() for p in parts).strip(), complete=complete)
+
+    def reset(self):
+        """Forget all segments (after a barge-in cleared the outbound audio)."""
+        self._segments.clear()
+        self._last_ack_at = None
+
+    def stats(self) -> dict:
+        return {
+            "segments": len(self._segments),
+            "marks_sent": self.marks_sent,
+            "marks_acked": self.marks_acked,
+        }
@@ -0,0 +1,141 @@
+"""
+Streaming Polyphase Resampler.
+
+Rational-ratio (out/in = L/M) resampling of 16-bit mono PCM with a Kaiser
+windowed-sinc filter split into L polyphase branches. Only the taps that
+land on real input samples are ever multiplied, history is carried across
+chunks so 20ms packets resample exactly like one continuous signal, and all
+work buffers are reused so the per-chunk path allocates nothing but its
+output view.
+"""
+from math import ceil, gcd
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+class PolyphaseResampler:
+    """
+    Stateful rational resampler for int16 PCM.
+
+    Example:
+        >>> resampler = PolyphaseResampler(8000, 16000)
+        >>> pcm16k = resampler.process(pcm8k)   # int16 ndarray, twice as long
+    """
+
+    def __init__(
+        self,
+        in_rate: int,
+        out_rate: int,
+        taps_per_phase: int = 16,
+        rolloff: float = 0.9,
+        beta: float = 6.0,
+    ):
+        """
+        Args:
+            in_rate: Input sample rate (Hz)
+            out_rate: Output sample rate (Hz)
+            taps_per_phase: Filter taps per polyphase branch (scaled up when decimating)
+            rolloff: Cutoff as a fraction of the lower Nyquist (0.9 = 3.6kHz for 8kHz audio)
+            beta: Kaiser window shape (higher = more stopband attenuation, wider transition)
+        """
+        if in_rate <= 0 or out_rate <= 0:
+            raise ValueError(f"Invalid sample rates: {in_rate} -> {out_rate}")
+
+        common = gcd(in_rate, out_rate)
+        self.in_rate = in_rate
+        self.out_rate = out_rate
+        self.up = out_rate // common
+        self.down = in_rate // common
+        self.passthrough = self.up == self.down == 1
+
+        # Taps per branch: widen the filter when decimating so the cutoff stays sharp
+        self.taps = taps_per_phase * max(1, ceil(self.down / self.up))
+        self.bank = self._design_bank(rolloff, beta)
+
+        # Streaming state
+        self._history = self.taps - 1
+        self._buffer = np.zeros(self._history + 1024, dtype=np.float32)
+        self._output = np.empty(0, dtype=np.int16)
+        self._position = 0  # Next output position (upsampled units) relative to the chunk start
+
+    def _design_bank(self, rolloff: float, beta: float) -> np.ndarray:
+        """Prototype low-pass (gain L) split into L branches, taps in buffer order."""
+        length = self.taps * self.up
+        cutoff = 0.5 * rolloff / max(self.up, self.down)  # Cycles per upsampled sample
+        n = np.arange(length) - (length - 1) / 2
+        prototype = 2 * cutoff * np.sinc(2 * cutoff * n) * np.kaiser(length, beta)
+        prototype *= self.up / prototype.sum()
+
+        # bank[p, j] multiplies buffer row sample j for phase p (newest sample last)
+        return np.ascontiguousarray(prototype.reshape(self.taps, self.up)[::-1].T, dtype=np.float32)
+
+    @property
+    def delay(self) -> float:
+        """Group delay of the filter in output samples."""
+        return (self.taps * self.up - 1) / 2 / self.down
+
+    def output_length(self, samples: int) -> int:
+        """Number of samples the next `process` call returns for `samples` input."""
+        if self.passthrough:
+            return samples
+        end = samples * self.up
+        if self._position >= end:
+            return 0
+        return (end - 1 - self._position) // self.down + 1
+
+    def process(self, pcm) -> np.ndarray:
+        """
+        Resample the next chunk of the stream.
+
+        Args:
+            pcm: int16 samples (ndarray or PCM bytes)
+
+        Returns:
+            int16 samples at out_rate. The array is a view of an internal
+            buffer and is only valid until the next call.
+        """
+        samples = pcm if isinstance(pcm, np.ndarray) else np.frombuffer(pcm, dtype=np.int16)
+        count = len(samples)
+        out_count = self.output_length(count)
+        if len(self._output) < out_count:
+            self._output = np.empty(max(out_count, 2 * len(self._output)), dtype=np.int16)
+        out = self._output[:out_count]
+
+        if self.passthrough:
+            out[:] = samples
+            return out
+
+        # Append the chunk after the carried history
+        needed = self._history + count
+        if len(self._buffer) < needed:
+            grown = np.zeros(max(needed, 2 * len(self._buffer)), dtype=np.float32)
+            grown[:self._history] = self._buffer[:self._history]
+            self._buffer = grown
+        buffer = self._buffer[:needed]
+        buffer[self._history:] = samples
+
+        if out_count:
+            rows = sliding_window_view(buffer, self.taps)  # Row i ends at input sample i
+            if self.down == 1 and self._position == 0:
+                # Pure upsampling: every row feeds all L phases, output is interleaved
+                filtered = (rows @ self.bank.T).reshape(-1)
+            else:
+                positions = self._position + self.down * np.arange(out_count)
+                phases = positions % self.up
+                filtered = np.einsum("ij,ij->i", rows[positions // self.up], self.bank[phases])
+            np.rint(filtered, out=filtered)
+            np.clip(filtered, -32768, 32767, out=filtered)
+            out[:] = filtered
+            self._position += out_count * self.down
+        self._position -= count * self.up
+
+        # Keep the last taps - 1 samples as history for the next chunk
+        if self._history:
+            self._buffer[:self._history] = buffer[count:]
+        return out
+
+    def reset(self):
+        """Forget the stream history (new call or discontinuity)."""
+        self._buffer[:self._history] = 0
+        self._position = 0
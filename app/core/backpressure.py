@@ -0,0 +1,199 @@
+"""
+Backpressure Policies.
+
+Frame-type-aware admission rules for the Pipeline queue. Each policy owns a
+capacity budget and decides, when that budget is exhausted, whether to evict
+its oldest queued frame, coalesce with it, drop the incoming frame, or admit
+anyway (turn-critical frames are never dropped).
+"""
+import asyncio
+import heapq
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.frames import AudioFrame, ControlFrame, Frame, RMSFrame, SystemFrame, TextFrame
+
+# Queue entry layout shared with Pipeline: (priority, counter, frame, direction)
+QueueEntry = tuple[int, int, Frame, int]
+
+
+class FrameQueue(asyncio.PriorityQueue):
+    """
+    PriorityQueue that supports removing queued entries and admitting
+    never-drop entries past `maxsize`.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        super().__init__(maxsize=maxsize)
+        self._bypass_limit = False
+
+    def full(self) -> bool:
+        return not self._bypass_limit and super().full()
+
+    def put_unbounded(self, entry: QueueEntry) -> None:
+        """Insert even if the queue is at capacity."""
+        self._bypass_limit = True
+        try:
+            self.put_nowait(entry)
+        finally:
+            self._bypass_limit = False
+
+    def discard(self, entry: QueueEntry) -> bool:
+        """Remove a queued entry. Returns False if it was already consumed."""
+        try:
+            self._queue.remove(entry)
+        except ValueError:
+            return False
+        heapq.heapify(self._queue)
+        self.task_done()
+        return True
+
+
+@dataclass
+class AdmissionDecision:
+    """Outcome of BackpressurePolicy.admit()."""
+    accept: bool
+    evict: list[QueueEntry]
+    reason: str = ""
+
+
+class BackpressurePolicy:
+    """
+    Base policy: bounded FIFO budget that drops the NEWEST frame when full
+    (the historical Pipeline behavior).
+    """
+    name = "drop_newest"
+    drop_reason = "drop_newest"
+    evictable = False  # May Pipeline evict this policy's frames to make room?
+
+    def __init__(self, capacity: int | None = None):
+        """
+        Args:
+            capacity: Maximum queued frames under this policy (None = unbounded)
+        """
+        self.capacity = capacity
+        self.pending: dict[int, QueueEntry] = {}  # counter -> entry, insertion ordered
+
+    def admit(self, entry: QueueEntry) -> AdmissionDecision:
+        if self.capacity is not None and len(self.pending) >= self.capacity:
+            return AdmissionDecision(accept=False, evict=[], reason=self.drop_reason)
+        return AdmissionDecision(accept=True, evict=[])
+
+    def oldest(self) -> QueueEntry | None:
+        return next(iter(self.pending.values()), None)
+
+    def track(self, entry: QueueEntry) -> None:
+        self.pending[entry[1]] = entry
+
+    def untrack(self, counter: int) -> None:
+        self.pending.pop(counter, None)
+
+    def stats(self) -> dict[str, Any]:
+        return {"policy": self.name, "capacity": self.capacity, "queued": len(self.pending)}
+
+
+class DropOldestPolicy(BackpressurePolicy):
+    """Keeps the freshest frames: evicts the oldest queued frame when full (AudioFrame)."""
+    name = "drop_oldest"
+    drop_reason = "drop_oldest"
+    evictable = True
+
+    def admit(self, entry: QueueEntry) -> AdmissionDecision:
+        evict = []
+        if self.capacity is not None:
+            overflow = len(self.pending) - self.capacity + 1
+            if overflow > 0:
+                evict = list(self.pending.values())[:overflow]
+        return AdmissionDecision(accept=True, evict=evict, reason=self.drop_reason)
+
+
+class CoalescePolicy(DropOldestPolicy):
+    """
+    Only the latest value matters: a new frame replaces the queued frame of
+    the same type and direction (RMSFrame, interim TextFrame).
+    """
+    name = "coalesce"
+    drop_reason = "coalesced"
+
+    def __init__(self, capacity: int = 1):
+        """
+        Args:
+            capacity: Queued frames kept per frame type and direction
+        """
+        super().__init__(capacity=capacity)
+
+    def admit(self, entry: QueueEntry) -> AdmissionDecision:
+        _, _, frame, direction = entry
+        same_key = [
+            queued for queued in self.pending.values()
+            if type(queued[2]) is type(frame) and queued[3] == direction
+        ]
+        overflow = len(same_key) - self.capacity + 1
+        evict = same_key[:overflow] if overflow > 0 else []
+        return AdmissionDecision(accept=True, evict=evict, reason=self.drop_reason)
+
+
+class NeverDropPolicy(BackpressurePolicy):
+    """Turn-critical frames (System/Control) are always admitted, even past queue capacity."""
+    name = "never_drop"
+    drop_reason = ""
+
+    def admit(self, entry: QueueEntry) -> AdmissionDecision:
+        return AdmissionDecision(accept=True, evict=[])
+
+
+class BackpressurePolicySet:
+    """
+    Maps frames to policies and keeps drop counters per (frame type, reason).
+
+    Example:
+        >>> policies = BackpressurePolicySet.for_queue_size(100)
+        >>> policies.policy_for(AudioFrame(data=b"", sample_rate=8000)).name
+        'drop_oldest'
+    """
+
+    def __init__(
+        self,
+        audio: BackpressurePolicy,
+        coalesce: BackpressurePolicy,
+        critical: BackpressurePolicy,
+        default: BackpressurePolicy,
+    ):
+        self.audio = audio
+        self.coalesce = coalesce
+        self.critical = critical
+        self.default = default
+        self.dropped: Counter[tuple[str, str]] = Counter()
+
+    @classmethod
+    def for_queue_size(cls, max_queue_size: int = 100) -> "BackpressurePolicySet":
+        """Budgets derived from the pipeline queue size."""
+        return cls(
+            audio=DropOldestPolicy(capacity=max(1, max_queue_size // 2)),
+            coalesce=CoalescePolicy(capacity=1),
+            critical=NeverDropPolicy(),
+            default=BackpressurePolicy(capacity=None),
+        )
+
+    @property
+    def policies(self) -> list[BackpressurePolicy]:
+        return [self.audio, self.coalesce, self.critical, self.default]
+
+    def policy_for(self, frame: Frame) -> BackpressurePolicy:
+        if isinstance(frame, AudioFrame):
+            return self.audio
+        if isinstance(frame, RMSFrame) or (isinstance(frame, TextFrame) and not frame.is_final):
+            return self.coalesce
+        if isinstance(frame, SystemFrame | ControlFrame):
+            return self.critical
+        return self.default
+
+    def record_drop(self, frame: Frame, reason: str) -> None:
+        self.dropped[(frame.name, reason)] += 1
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "dropped": {f"{name}:{reason}": count for (name, reason), count in self.dropped.items()},
+            "policies": {policy.name: policy.stats() for policy in self.policies},
+        }
@@ -43,6 +43,53 @@ class Settings(BaseSettings):
     # --- VAD Stability ---
     VAD_CONFIRMATION_WINDOW_MS: int = 200
     VAD_ENABLE_CONFIRMATION: bool = True
+    # Skip model inference on windows that are clearly silence (energy pre-gate)
+    VAD_ENERGY_GATE_ENABLED: bool = True
+
+    # --- Pipeline Profiling ---
+    # Per-processor service time / queue wait histograms (low overhead, opt-in)
+    PIPELINE_PROFILING_ENABLED: bool = False
+
+    # --- Pipeline Execution ---
+    # "inline" runs processors in one chain; "staged" decouples ingestion (STT/VAD)
+    # from generation (LLM/TTS) with bounded queues between stage groups
+    PIPELINE_EXECUTION_MODE: str = "inline"
+    PIPELINE_STAGE_QUEUE_SIZE: int = 50
+
+    # --- Speculative Generation ---
+    # LLM starts during the end-of-turn silence; output is held until the turn commits
+    SPECULATIVE_GENERATION_ENABLED: bool = False
+    # Also synthesize the first speculative sentence ahead (audio held until confirmed)
+    SPECULATIVE_TTS_ENABLED: bool = False
+
+    # --- Adaptive Endpointing ---
+    # Per-caller end-of-turn silence learned from pauses and speech rate (starts at silence_timeout_ms)
+    ADAPTIVE_ENDPOINTING_ENABLED: bool = False
+    ENDPOINTING_MIN_SILENCE_MS: int = 250
+    ENDPOINTING_MAX_SILENCE_MS: int = 1200
+
+    # --- Audio Ingress ---
+    # Canonical PCM rate delivered to VAD/STT (telephony G.711 is decoded and upsampled)
+    AUDIO_INGRESS_SAMPLE_RATE: int = 16000
+
+    # --- STT I/O ---
+    # Cadence at which the STT I/O worker coalesces a call's audio into one recognizer write
+    STT_WRITE_INTERVAL_MS: int = 60
+    # Writer threads shared by all calls (a slow recognizer write only delays its own thread's calls)
+    STT_IO_WORKER_THREADS: int = 4
+
+    # --- Outbound Audio Budget ---
+    # Per-call playout depth: TTS pauses above the high watermark and resumes
+    # below the low one; the byte cap applies when it is lower than the duration
+    OUTBOUND_AUDIO_HIGH_WATERMARK_MS: int = 3000
+    OUTBOUND_AUDIO_LOW_WATERMARK_MS: int = 1000
+    OUTBOUND_AUDIO_MAX_BYTES: int = 256 * 1024
+
+    # --- Audio Assets ---
+    # Pre-rendered, memory-mapped static clips shared by all workers (empty = system temp dir)
+    AUDIO_ASSET_CACHE_DIR: str = ""
+    # Ambience level under speech (baked into the rendered background assets)
+    BACKGROUND_AUDIO_GAIN: float = 0.15
 
     # --- Azure OpenAI ---
     AZURE_OPENAI_API_KEY: str = ""
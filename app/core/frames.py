@@ -1,40 +1,61 @@
 import time
 import uuid
-from dataclasses import asdict, dataclass, field
-from typing import Any
+from dataclasses import dataclass, field, fields
+from typing import Any, Generic, TypeVar
 
 
-@dataclass(kw_only=True)
+def _new_id() -> str:
+    return str(uuid.uuid4())
+
+
+@dataclass(kw_only=True, slots=True, eq=False)
 class Frame:
     """
     Base class for all frames in the pipeline.
 
+    Frames are slotted and compare by identity. Identifiers are allocated
+    lazily: `id`, `span_id` and an auto-generated `trace_id` only cost a
+    UUID when something actually reads them, which keeps the 20ms audio
+    path free of per-frame UUID generation.
+
     Attributes:
-        id (str): Unique identifier for the frame instance.
+        id (str): Unique identifier for the frame instance (lazy).
         name (str): Class name of the frame.
         timestamp (float): Creation time (Unix timestamp).
         trace_id (str): Distributed tracing ID (Conversational turn ID).
-        span_id (str): Span ID for this specific frame processing unit.
+        span_id (str): Span ID for this specific frame processing unit (lazy).
+        generation (int): Assistant turn that produced the frame (0 = untracked, see app.core.turns).
         metadata (Dict[str, Any]): Arbitrary metadata.
     """
-    id: str = field(init=False)
-    name: str = field(init=False)
     timestamp: float = field(default_factory=time.time)
 
-    # Distributed Tracing Support
+    # Distributed Tracing Support (generated on first read if not provided)
     trace_id: str = field(default="")
-    span_id: str = field(init=False)
+
+    # Turn generation (frames of cancelled turns are dropped by every buffer)
+    generation: int = 0
 
     metadata: dict[str, Any] = field(default_factory=dict)
 
-    def __post_init__(self):
-        self.id = str(uuid.uuid4())
-        self.span_id = str(uuid.uuid4())
-        self.name = self.__class__.__name__
+    # Lazily allocated identifiers (see `id` / `span_id` properties)
+    _id: str | None = field(default=None, init=False, repr=False)
+    _span_id: str | None = field(default=None, init=False, repr=False)
+
+    @property
+    def id(self) -> str:
+        if self._id is None:
+            self._id = _new_id()
+        return self._id
+
+    @property
+    def span_id(self) -> str:
+        if self._span_id is None:
+            self._span_id = _new_id()
+        return self._span_id
 
-        # Generate trace_id if not provided
-        if not self.trace_id:
-            self.trace_id = str(uuid.uuid4())
+    @property
+    def name(self) -> str:
+        return type(self).__name__
 
     def to_dict(self, include_binary: bool = False) -> dict[str, Any]:
         """
@@ -43,73 +64,98 @@ class Frame:
         Args:
             include_binary: If False, truncates/omits large binary fields for logging/JSON safety.
         """
-        data = asdict(self)
+        # Shallow: asdict() would deep-copy payloads (and cannot copy memoryviews)
+        fields_data = {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+        fields_data['metadata'] = dict(self.metadata)
+
+        data = {"id": self.id, "name": self.name, "span_id": self.span_id, **fields_data}
 
         # Helper to clean non-serializable data
-        if not include_binary and 'data' in data and isinstance(data['data'], bytes):
-            data['data'] = f"<bytes len={len(data['data'])}>"
+        payload = data.get('data')
+        if isinstance(payload, bytes | memoryview):
+            if not include_binary:
+                data['data'] = f"<bytes len={payload.nbytes if isinstance(payload, memoryview) else len(payload)}>"
+            elif isinstance(payload, memoryview):
+                data['data'] = bytes(payload)
 
         return data
 
     def __str__(self):
         return f"<{self.name} id={self.id[:8]}>"
 
-@dataclass(kw_only=True)
+
+def _lazy_trace_id(slot: Any) -> property:
+    """Wrap the `trace_id` slot so an empty value is filled on first read."""
+    def _get(self: Frame) -> str:
+        value = slot.__get__(self, Frame)
+        if not value:
+            value = _new_id()
+            slot.__set__(self, value)
+        return value
+
+    return property(_get, slot.__set__, doc="Distributed tracing ID (generated on first read).")
+
+
+# The generated __init__ assigns through this property, so explicit trace_ids
+# are stored untouched and missing ones cost nothing until someone asks.
+Frame.trace_id = _lazy_trace_id(Frame.__dict__["trace_id"])
+
+@dataclass(kw_only=True, slots=True, eq=False)
 class SystemFrame(Frame):
     """Frames that have high priority (Level 1) and control the pipeline flow."""
     pass
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, eq=False)
 class DataFrame(Frame):
     """Frames that carry content (audio, text, etc.) with normal priority (Level 2)."""
     pass
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, eq=False)
 class ControlFrame(Frame):
     """Frames that modify the behavior of processors with normal priority (Level 2)."""
     pass
 
 # --- System Frames (High Priority) ---
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, eq=False)
 class StartFrame(SystemFrame):
     """Signal to start processing or a new interaction."""
     metadata: dict[str, Any] = field(default_factory=dict)
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, eq=False)
 class EndFrame(SystemFrame):
     """Signal to end processing or interaction."""
     reason: str = "normal"
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, eq=False)
 class CancelFrame(SystemFrame):
     """Signal to cancel current operation immediately."""
     reason: str = "cancelled"
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, eq=False)
 class EndTaskFrame(SystemFrame):
     """Signal to end a specific task/tool execution."""
     task_id: str = ""
     result: dict[str, Any] = field(default_factory=dict)
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, eq=False)
 class ErrorFrame(SystemFrame):
     """Signal that an error has occurred."""
     error: str
     fatal: bool = False
     context: dict[str, Any] = field(default_factory=dict)
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, eq=False)
 class UserStartedSpeakingFrame(SystemFrame):
     """Signal detected by VAD that user has started speaking."""
     pass
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, eq=False)
 class UserStoppedSpeakingFrame(SystemFrame):
     """Signal detected by VAD that user has stopped speaking."""
     pass
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, eq=False)
 class BackpressureFrame(SystemFrame):
     """
     Backpressure signal emitted when pipeline queue is full or approaching capacity.
@@ -128,34 +174,90 @@ class BackpressureFrame(SystemFrame):
 
 # --- Data Frames (Normal Priority) ---
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, eq=False)
 class AudioFrame(DataFrame):
-    """Frame containing raw audio data."""
-    data: bytes
+    """Frame containing raw audio data (outbound TTS audio may be a memoryview; see buffer_pool)."""
+    data: bytes | memoryview
     sample_rate: int
     channels: int = 1
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, eq=False)
 class TextFrame(DataFrame):
     """Frame containing text data (transcript or response)."""
     text: str
     is_final: bool = True
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, eq=False)
 class ImageFrame(DataFrame):
     """Frame containing image data."""
     data: bytes
     format: str
     size: tuple[int, int]
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, eq=False)
 class RMSFrame(DataFrame):
     """Frame containing Root Mean Square audio levels (for visualization)."""
     rms: float
 
 # --- Control Frames (Normal Priority) ---
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, eq=False)
 class UpdateSettingsFrame(ControlFrame):
     """Frame to update processor settings dynamically."""
     settings: dict[str, Any]
+
+# --- Frame Pooling (Optional) ---
+
+FrameT = TypeVar("FrameT", bound=Frame)
+
+
+class FramePool(Generic[FrameT]):
+    """
+    Bounded free-list of reusable frames for high-rate types (AudioFrame, RMSFrame).
+
+    Pooling is opt-in: a component that owns a frame's whole lifetime creates
+    its own pool. Only the final consumer of a frame may release it:
+    `acquire()` re-initializes a released instance in place, so any reference
+    still held elsewhere would observe the new contents. Release a frame once.
+
+    Example:
+        >>> pool = FramePool(AudioFrame, max_size=8)
+        >>> frame = pool.acquire(data=chunk, sample_rate=8000)
+        >>> ...  # frame travels the pipeline
+        >>> pool.release(frame)  # by the last processor only
+    """
+
+    def __init__(self, frame_cls: type[FrameT], max_size: int = 256):
+        """
+        Args:
+            frame_cls: Concrete frame class served by this pool
+            max_size: Maximum number of idle frames kept for reuse
+        """
+        self.frame_cls = frame_cls
+        self.max_size = max_size
+        self._free: list[FrameT] = []
+
+        # Stats
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, **kwargs: Any) -> FrameT:
+        """Return a frame initialized with `kwargs`, reusing an idle one if available."""
+        if self._free:
+            frame = self._free.pop()
+            # Re-running the dataclass __init__ resets every field, lazy ids included
+            frame.__init__(**kwargs)  # type: ignore[misc]
+            self.reused += 1
+            return frame
+
+        self.created += 1
+        return self.frame_cls(**kwargs)
+
+    def release(self, frame: FrameT) -> None:
+        """Return a frame to the pool. Frames of other types or beyond capacity are discarded."""
+        if type(frame) is self.frame_cls and len(self._free) < self.max_size:
+            self._free.append(frame)
+
+    def __len__(self) -> int:
+        return len(self._free)
+
@@ -3,19 +3,41 @@ Audio Manager.
 
 Handles audio streaming, queuing, and chunking strategies for different client types.
 Encapsulates low-level audio transport logic avoiding blocking operations.
+
+Outbound audio is paced by the process-wide EgressClock: each call keeps a
+small PlayoutBuffer and sends exactly one 20ms frame per tick. Each TTS
+sentence is tracked as a playout segment whose mark follows its last byte,
+so a barge-in knows what the caller actually heard.
+
+The playout depth is budgeted: TTS output waits (wait_for_room) above the
+high watermark until playback drains it below the low watermark, so memory
+per call and the audio a barge-in discards do not grow with answer length.
+
+Background audio comes from the AudioAssetBank already attenuated and
+encoded for this client's wire format; the call only keeps an offset into
+the shared mapping. The BackgroundMixer blends it under speech in one
+vectorized pass and sends it untouched whenever no speech is playing.
 """
 import asyncio
 import contextlib
 import logging
-from pathlib import Path
-
+import time
+
+from app.core.audio.asset_bank import AudioAsset, get_audio_asset_bank, wire_format_for_client
+from app.core.audio.egress_clock import EgressClock, get_egress_clock
+from app.core.audio.mixer import BackgroundMixer
+from app.core.audio.playout_buffer import PlayoutBuffer
+from app.core.audio.playout_tracker import HeardAudio, PlayoutTracker
+from app.core.config import settings
+from app.core.metrics import outbound_audio_buffered_ms, outbound_backpressure_waits_total
 from app.domain.ports import AudioTransport
 
 logger = logging.getLogger(__name__)
 
 # Constants
 CHUNK_SIZE_TELEPHONY = 160  # 160 bytes = 20ms @ 8kHz PCMU
-STREAM_INTERVAL_SECONDS = 0.02  # 20ms transmission interval
+CHUNK_SIZE_BROWSER = 640  # 640 bytes = 20ms @ 16kHz PCM16
+MAX_COALESCED_FRAMES = 5  # Frames merged into one message when sends fall behind
 CLIENT_TYPE_BROWSER = "browser"
 CLIENT_TYPE_TWILIO = "twilio"
 CLIENT_TYPE_TELNYX = "telnyx"
@@ -26,63 +48,105 @@ class AudioManager:
     Manages audio output streaming and background audio.
 
     Responsibilities:
-    - Audio queue management (async)
+    - Playout buffering (jitter-tolerant, one frame per clock tick)
     - Chunked audio transmission (adapted to client type)
-    - Background audio looping (comfort noise)
+    - Background audio looping (ambience mixed under speech)
+    - Outbound budget (watermark backpressure towards TTS)
     - Stream lifecycle management
     """
 
-    def __init__(self, transport: AudioTransport, client_type: str = CLIENT_TYPE_TWILIO):
+    def __init__(
+        self,
+        transport: AudioTransport,
+        client_type: str = CLIENT_TYPE_TWILIO,
+        clock: EgressClock | None = None,
+        high_watermark_ms: int | None = None,
+        low_watermark_ms: int | None = None,
+        max_buffered_bytes: int | None = None
+    ):
         """
         Initialize AudioManager.
 
         Args:
             transport: Audio transport interface (WebSocket wrapper)
             client_type: Client identifier (browser/twilio/telnyx)
+            clock: Egress clock (defaults to the process-wide clock)
+            high_watermark_ms: Playout depth that pauses TTS (default: settings)
+            low_watermark_ms: Playout depth that resumes TTS (default: settings)
+            max_buffered_bytes: Byte cap on playout depth (default: settings)
         """
         self.transport = transport
         self.client_type = client_type
-
-        # Audio Queue (unbounded by default, implicit backpressure via pipeline)
-        self.audio_queue: asyncio.Queue = asyncio.Queue()
-
-        # Background Audio State
-        self.bg_loop_buffer: bytes | None = None
-        self.bg_loop_index: int = 0
-
-        # Stream Task
-        self.stream_task: asyncio.Task | None = None
-
-        # Encoding (Default for telephony)
-        self.audio_encoding = "PCMU"
+        self.clock = clock or get_egress_clock()
+
+        # Playout Buffer (frames leave at real-time pace, so little is ever queued downstream)
+        self.chunk_size = CHUNK_SIZE_BROWSER if client_type == CLIENT_TYPE_BROWSER else CHUNK_SIZE_TELEPHONY
+        self.playout = PlayoutBuffer(frame_size=self.chunk_size)
+        self.tracker = PlayoutTracker(bytes_per_second=self.chunk_size * 50)
+
+        # Outbound Budget (bytes; the duration budget converted at this client's rate)
+        bytes_per_ms = self.chunk_size / 20
+        if high_watermark_ms is None:
+            high_watermark_ms = settings.OUTBOUND_AUDIO_HIGH_WATERMARK_MS
+        if low_watermark_ms is None:
+            low_watermark_ms = settings.OUTBOUND_AUDIO_LOW_WATERMARK_MS
+        if max_buffered_bytes is None:
+            max_buffered_bytes = settings.OUTBOUND_AUDIO_MAX_BYTES
+        self.high_watermark_bytes = int(min(high_watermark_ms * bytes_per_ms, max_buffered_bytes))
+        self.low_watermark_bytes = int(min(low_watermark_ms * bytes_per_ms, self.high_watermark_bytes))
+        self._room = asyncio.Event()
+        self._room.set()
+        self.backpressure_waits = 0
+        self._buffered_ms_metric = outbound_audio_buffered_ms.labels(client_type=client_type)
+        self._waits_metric = outbound_backpressure_waits_total.labels(client_type=client_type)
+
+        # Background Audio State (a view into the shared asset bank + this call's offset)
+        self.background: BackgroundMixer | None = None
+
+        # Stream State
+        self.streaming = False
+        self._send_task: asyncio.Task | None = None
+        self._owed_frames = 0  # Ticks skipped while a send was in flight
+        self.late_sends = 0
+
+        # Outbound wire format (mu-law / A-law 8k for telephony, PCM16 16k for browser)
+        self.audio_encoding = wire_format_for_client(client_type)
 
         # Bot speaking state
         self.is_bot_speaking = False
 
     async def start(self):
-        """Start audio streaming loop."""
-        if not self.stream_task:
-            self.stream_task = asyncio.create_task(self._audio_stream_loop())
-            logger.info("🔊 [AudioManager] Stream loop started")
+        """Start paced streaming (subscribe to the egress clock)."""
+        if not self.streaming:
+            self.clock.register(self)
+            self.streaming = True
+            logger.info("🔊 [AudioManager] Stream started (egress clock)")
 
     async def stop(self):
         """Stop audio streaming and cleanup."""
-        if self.stream_task:
-            self.stream_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self.stream_task
-            self.stream_task = None
-            logger.info("🔇 [AudioManager] Stream loop stopped")
-
-    async def send_audio_chunked(self, audio_data: bytes) -> None:
+        if self.streaming:
+            self.clock.unregister(self)
+            self.streaming = False
+            if self._send_task and not self._send_task.done():
+                self._send_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._send_task
+            self._send_task = None
+            self.playout.close()
+            self._room.set()  # Release a paused TTS
+            logger.info("🔇 [AudioManager] Stream stopped")
+
+    async def send_audio_chunked(self, audio_data: bytes | memoryview) -> None:
         """
         Queue audio for chunked transmission.
 
         For telephony: chunks to CHUNK_SIZE_TELEPHONY
-        For browser: sends full blob
+        For browser: chunks to CHUNK_SIZE_BROWSER
+
+        The buffer is referenced, not copied: frames go out as views into it.
 
         Args:
-            audio_data: Raw audio bytes to transmit
+            audio_data: Raw audio bytes to transmit (ownership passes to the playout buffer)
         """
         if not audio_data:
             logger.warning("⚠️ [AudioManager] Empty audio_data received")
@@ -92,148 +156,150 @@ class AudioManager:
         self.is_bot_speaking = True
 
         logger.debug(f"📤 [AudioManager] Queuing {len(audio_data)} bytes for transmission")
-        await self.audio_queue.put(audio_data)
-
-    async def clear_queue(self):
-        """Clear all pending audio from queue."""
-        count = 0
-        while not self.audio_queue.empty():
-            try:
-                self.audio_queue.get_nowait()
-                self.audio_queue.task_done()
-                count += 1
-            except asyncio.QueueEmpty:
-                break
-
-        if count > 0:
-            logger.info(f"🗑️ [AudioManager] Cleared {count} audio chunks from queue")
-
-    async def interrupt_speaking(self):
-        """Interrupt current speech and clear queue."""
-        logger.info("🛑 [AudioManager] Interrupting speech")
-        await self.clear_queue()
-        self.is_bot_speaking = False
+        self.playout.write(audio_data)
+        self._buffered_ms_metric.observe(self.playout.buffered_ms)
 
-    def set_background_audio(self, audio_buffer: bytes):
+    async def wait_for_room(self) -> None:
         """
-        Set background audio loop buffer.
+        Backpressure for TTS: wait while the playout depth is over budget.
 
-        Args:
-            audio_buffer: Audio to loop during silence
+        Pauses once the depth reaches the high watermark and resumes when
+        playback has drained it to the low watermark (or on barge-in).
         """
-        self.bg_loop_buffer = audio_buffer
-        self.bg_loop_index = 0
-        logger.info(f"🎵 [AudioManager] Background audio set ({len(audio_buffer)} bytes)")
+        if self._room.is_set():
+            if len(self.playout) < self.high_watermark_bytes or not self.streaming:
+                return
+            self._room.clear()
+            self.backpressure_waits += 1
+            self._waits_metric.inc()
+            logger.debug(f"⏸️ [AudioManager] Outbound budget full ({self.playout.buffered_ms:.0f}ms), pausing TTS")
+        await self._room.wait()
 
-    async def load_background_audio(self, file_path: str):
+    async def clear_queue(self):
+        """Clear all pending audio from the playout buffer."""
+        dropped = self.playout.clear()
+        self._room.set()
+
+        if dropped > 0:
+            logger.info(f"🗑️ [AudioManager] Cleared {dropped} bytes ({dropped // self.chunk_size} frames) from playout buffer")
+
+    async def interrupt_speaking(self) -> HeardAudio | None:
         """
-        Load background audio from file path (Non-blocking).
-        Uses a thread executor to avoid blocking the asyncio loop during disk IO.
+        Interrupt current speech: drop buffered audio here and on the client.
 
-        Args:
-            file_path: Path to .wav file
+        Returns:
+            What the caller heard of the interrupted response (None if untracked)
         """
-        if not Path(file_path).exists():
-            logger.warning(f"⚠️ [AudioManager] Background audio file not found: {file_path}")
-            return
+        logger.info("🛑 [AudioManager] Interrupting speech")
+        heard = self.tracker.heard(time.monotonic(), self.playout.total_read)
+        await self.clear_queue()
+        self.tracker.reset()
+        self.is_bot_speaking = False
 
         try:
-            loop = asyncio.get_running_loop()
-            # Offload blocking IO to thread pool
-            audio_data = await loop.run_in_executor(None, self._read_file_sync, file_path)
-            self.set_background_audio(audio_data)
+            await self.transport.clear_audio()
         except Exception as e:
-            logger.error(f"❌ [AudioManager] Failed to load background audio: {e}")
+            logger.warning(f"⚠️ [AudioManager] Client clear failed: {e}")
+        return heard
 
-    @staticmethod
-    def _read_file_sync(path: str) -> bytes:
-        """Sync helper for file reading (runs in thread)."""
-        with open(path, 'rb') as f:
-            return f.read()
+    def begin_segment(self, text: str, response_id: str | None = None):
+        """Start a playout segment (one TTS sentence) at the current write position."""
+        self.tracker.begin(text, response_id, self.playout.total_written)
 
-    async def _audio_stream_loop(self):
-        """
-        Main audio streaming loop.
+    def end_segment(self):
+        """Close the open playout segment; its mark is sent behind its last byte."""
+        self.tracker.close(self.playout.total_written)
 
-        Continuously transmits audio chunks from queue or background audio.
+    def on_mark(self, name: str) -> bool:
         """
-        while True:
-            try:
-                # Try to get audio from queue (non-blocking with timeout)
-                try:
-                    audio_blob = await asyncio.wait_for(
-                        self.audio_queue.get(),
-                        timeout=0.1
-                    )
-
-                    # Transmit queued audio
-                    await self._transmit_audio(audio_blob)
-                    self.audio_queue.task_done()
-
-                except TimeoutError:
-                    # No queued audio - send background audio if available
-                    # Only play background noise if we are SURE bot is not talking
-                    if self.bg_loop_buffer and not self.is_bot_speaking:
-                        await self._transmit_background_audio()
-                    else:
-                        # Small sleep to prevent busy loop
-                        await asyncio.sleep(STREAM_INTERVAL_SECONDS)
+        The client echoed a playout mark (that sentence was played).
 
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"❌ [AudioManager] Stream loop error: {e}", exc_info=True)
-                await asyncio.sleep(0.1)
+        Returns:
+            False for unknown marks (e.g. sent before a barge-in)
+        """
+        if not self.tracker.acknowledge(name, time.monotonic()):
+            return False
+        if not self.tracker.pending and not len(self.playout):
+            self.is_bot_speaking = False
+        return True
 
-    async def _transmit_audio(self, audio_blob: bytes):
+    def set_background_audio(self, audio_buffer: bytes | memoryview | AudioAsset):
         """
-        Transmit audio blob with chunking based on client type.
+        Set background audio loop buffer.
 
         Args:
-            audio_blob: Audio data to transmit
-        """
-        if self.client_type == CLIENT_TYPE_BROWSER:
-            # Browser: send full blob
-            await self.transport.send_audio(audio_blob)
-            logger.debug(f"📤 [AudioManager] Sent {len(audio_blob)} bytes (browser)")
-        else:
-            # Telephony: chunking
-            chunk_size = CHUNK_SIZE_TELEPHONY
-            for i in range(0, len(audio_blob), chunk_size):
-                chunk = audio_blob[i:i + chunk_size]
-                await self.transport.send_audio(chunk)
+            audio_buffer: Ambience loop in this client's wire format, at the
+                level it should play (an AudioAsset is referenced, not copied)
+        """
+        self.background = BackgroundMixer(audio_buffer, self.audio_encoding, self.chunk_size)
+        logger.info(f"🎵 [AudioManager] Background audio set ({len(audio_buffer)} bytes)")
+
+    async def load_background_audio(self, source: str):
+        """
+        Attach a background clip from the asset bank (Non-blocking).
 
-            logger.debug(f"📤 [AudioManager] Sent {len(audio_blob)} bytes in chunks")
+        Preloaded clips are a dictionary hit; a clip not rendered yet is
+        rendered in a thread executor so the event loop never does disk IO.
 
-        # Note: We do NOT auto-reset is_bot_speaking to False here anymore.
-        # It's safer to let the Orchestrator/Pipeline signal explicit "End of Turn".
-        # However, if queue is empty for a long time, we might reset?
-        # For strict audit: Removing the "auto-off" logic is safer to prevent flickering.
-        # The Orchestrator calls `interrupt_speaking` or `stop` which handles logic.
-        # Or, we assume "speaking" is strictly "has items in queue".
+        Args:
+            source: Sound name (app/static/sounds/<name>.wav), built-in clip or .wav path
+        """
+        bank = get_audio_asset_bank()
+        try:
+            gain = settings.BACKGROUND_AUDIO_GAIN
+            asset = bank.lookup(source, self.audio_encoding, gain)
+            if asset is None:
+                loop = asyncio.get_running_loop()
+                asset = await loop.run_in_executor(None, bank.get, source, self.audio_encoding, gain)
+            self.set_background_audio(asset)
+        except FileNotFoundError:
+            logger.warning(f"⚠️ [AudioManager] Background audio not found: {source}")
+        except Exception as e:
+            logger.error(f"❌ [AudioManager] Failed to load background audio: {e}")
 
-        if self.audio_queue.empty():
-             # Graceful state update: Only reset if we truly have nothing left.
-             # In a real pipeline, "EndFrame" should trigger this.
-             # For now, we keep it simple but logged.
-             pass
+    def on_tick(self):
+        """
+        Egress clock tick: send exactly one frame (speech over ambience, else ambience).
 
-    async def _transmit_background_audio(self):
-        """Transmit background audio chunk."""
-        if not self.bg_loop_buffer:
+        If the previous send is still in flight (slow socket) the frame stays
+        buffered, so backpressure never piles audio up past this point; the
+        frames owed for skipped ticks go out coalesced in the next message.
+        """
+        if self._send_task is not None and not self._send_task.done():
+            self.late_sends += 1
+            self._owed_frames = min(self._owed_frames + 1, MAX_COALESCED_FRAMES - 1)
             return
 
-        chunk_size = CHUNK_SIZE_TELEPHONY
-        chunk = self.bg_loop_buffer[
-            self.bg_loop_index : self.bg_loop_index + chunk_size
-        ]
+        chunk = self.playout.next_frame(max_frames=1 + self._owed_frames)
+        self._owed_frames = 0
+        if not self._room.is_set() and len(self.playout) <= self.low_watermark_bytes:
+            self._room.set()
+        marks = self.tracker.advance(self.playout.total_read, time.monotonic())
+        if chunk is not None:
+            if self.background is not None:
+                chunk = self.background.mix(chunk)
+        elif self.background is not None:
+            chunk = self.background.ambience_frame()  # Pre-encoded, no DSP
+        elif not marks:
+            return
 
-        if len(chunk) < chunk_size:
-            # Loop back to start
-            self.bg_loop_index = 0
-            chunk = self.bg_loop_buffer[0:chunk_size]
-        else:
-            self.bg_loop_index += chunk_size
+        self._send_task = asyncio.get_running_loop().create_task(self._send(chunk, marks))
 
-        await self.transport.send_audio(chunk)
-        await asyncio.sleep(STREAM_INTERVAL_SECONDS)
+    async def _send(self, chunk: bytes | memoryview | None, marks: list[str] | None = None):
+        try:
+            if chunk is not None:
+                await self.transport.send_audio(chunk)
+            for name in marks or ():
+                await self.transport.send_mark(name)
+        except Exception as e:
+            logger.error(f"❌ [AudioManager] Send failed: {e}")
+
+    def stats(self) -> dict:
+        """Playout and pacing stats for this call."""
+        return {
+            **self.playout.stats(),
+            **self.tracker.stats(),
+            "late_sends": self.late_sends,
+            "backpressure_waits": self.backpressure_waits,
+            **(self.background.stats() if self.background else {}),
+        }
@@ -98,6 +98,66 @@ tts_latency_seconds = Histogram(
     buckets=[0.1, 0.25, 0.5, 1.0, 2.0, 5.0]
 )
 
+# ============================================================================
+# Pipeline Metrics
+# ============================================================================
+
+pipeline_frames_dropped_total = Counter(
+    'pipeline_frames_dropped_total',
+    'Frames dropped by pipeline backpressure',
+    ['frame_type', 'reason']  # reason: drop_oldest, coalesced, drop_newest, queue_full, ...
+)
+
+# Pipeline profiler (opt-in, see app/core/profiler.py)
+# Also used by the profiler's per-call snapshots so they match the dashboards
+PIPELINE_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+pipeline_processor_service_seconds = Histogram(
+    'pipeline_processor_service_seconds',
+    'Exclusive time a pipeline processor spends per frame',
+    ['processor'],
+    buckets=PIPELINE_LATENCY_BUCKETS
+)
+
+pipeline_queue_wait_seconds = Histogram(
+    'pipeline_queue_wait_seconds',
+    'Time a frame waits in the pipeline queue before processing',
+    ['frame_type'],
+    buckets=PIPELINE_LATENCY_BUCKETS
+)
+
+# Outbound audio budget (see AudioManager)
+outbound_audio_buffered_ms = Histogram(
+    'voice_outbound_audio_buffered_ms',
+    'Outbound audio queued per call for playout, in milliseconds (sampled on write)',
+    ['client_type'],
+    buckets=[20, 60, 120, 250, 500, 1000, 2000, 3000, 5000, 10000]
+)
+
+outbound_backpressure_waits_total = Counter(
+    'voice_outbound_backpressure_waits_total',
+    'Times TTS output paused because the outbound audio budget was full',
+    ['client_type']
+)
+
+# Speculative generation during end-of-turn silence (see LLMProcessor)
+llm_speculation_total = Counter(
+    'voice_llm_speculation_total',
+    'Speculative LLM generations by outcome',
+    ['outcome']  # hit: turn confirmed as speculated, miss: discarded
+)
+
+llm_speculation_wasted_chunks_total = Counter(
+    'voice_llm_speculation_wasted_chunks_total',
+    'Streamed LLM text chunks discarded with missed speculations'
+)
+
+pipeline_frames_processed_total = Counter(
+    'pipeline_frames_processed_total',
+    'Frames dequeued and processed by the pipeline',
+    ['frame_type']
+)
+
 # ============================================================================
 # Error Metrics
 # ============================================================================
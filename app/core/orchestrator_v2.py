@@ -13,6 +13,7 @@ import logging
 import time
 import uuid
 
+from app.core.audio.playout_tracker import HeardAudio
 from app.core.control_channel import ControlChannel, ControlSignal
 from app.core.frames import (
     AudioFrame,
@@ -21,6 +22,7 @@ from app.core.frames import (
 from app.core.managers import AudioManager, CRMManager
 from app.core.pipeline import Pipeline
 from app.core.pipeline_factory import PipelineFactory
+from app.core.turns import TurnManager
 from app.domain.config_logic import apply_client_overlay
 from app.domain.ports import (
     AudioTransport,
@@ -84,6 +86,10 @@ class VoiceOrchestratorV2:
         self.stream_id: str | None = None
         self.call_db_id: int | None = None
 
+        # Inbound media format (updated from the transport 'start' event)
+        self.audio_encoding = "PCM16" if client_type == "browser" else "PCMU"
+        self.audio_sample_rate = 16000 if client_type == "browser" else 8000
+
         # Configuration & State
         self.config = None
         self.conversation_history = []
@@ -109,6 +115,9 @@ class VoiceOrchestratorV2:
         self.control_channel = ControlChannel()
         self._control_task: asyncio.Task | None = None
 
+        # Turn generations: cancels the assistant turn's work and fences its frames
+        self.turns = TurnManager()
+
         # Domain Use Cases
         self.barge_in_use_case = HandleBargeInUseCase()
 
@@ -335,17 +344,30 @@ class VoiceOrchestratorV2:
         try:
             # Decode audio
             audio_bytes = base64.b64decode(payload)
-            if not audio_bytes:
-                return
+        except Exception as e:
+            logger.error(f"Error processing audio: {e}")
+            return
+
+        await self.push_audio(audio_bytes)
+
+    async def push_audio(self, audio_bytes: bytes) -> None:
+        """
+        Queue already-decoded caller audio (media fast path).
+
+        Args:
+            audio_bytes: Raw audio in the stream's media encoding
+        """
+        if not self.pipeline or not audio_bytes:
+            return
 
-            # Push to pipeline
-            sample_rate = 16000 if self.client_type == "browser" else 8000
+        try:
+            # Push to pipeline (tagged with the negotiated format; ingress resamples from it)
             await self.pipeline.queue_frame(
                 AudioFrame(
-                    data=audio_bytes, 
-                    sample_rate=sample_rate, 
+                    data=audio_bytes,
+                    sample_rate=self.audio_sample_rate,
                     channels=1,
-                    metadata={'source': 'user_input'}
+                    metadata={'source': 'user_input', 'encoding': self.audio_encoding}
                 )
             )
 
@@ -381,12 +403,17 @@ class VoiceOrchestratorV2:
             f"user_spoke: {text[:30]}" if text else "vad_detected"
         )
 
-        # Execute domain Use Case
+        # Cancel the assistant turn first: LLM/TTS stop and its frames become stale
         reason = f"user_spoke: {text[:30]}" if text else "vad_detected"
+        self.turns.cancel(reason)
+
+        # Execute domain Use Case
         command = self.barge_in_use_case.execute(reason)
 
         if command.interrupt_audio:
-            await self.audio_manager.interrupt_speaking()
+            heard = await self.audio_manager.interrupt_speaking()
+            if isinstance(heard, HeardAudio):
+                self._truncate_history_to_heard(heard)
 
         if command.clear_pipeline:
             await self._clear_pipeline_output()
@@ -397,10 +424,57 @@ class VoiceOrchestratorV2:
         # Update last interaction time
         self.last_interaction_time = time.time()
 
+    async def interrupt_speaking(self) -> None:
+        """Barge-in from the output sink (UserStartedSpeakingFrame)."""
+        await self.handle_interruption()
+
+    def _truncate_history_to_heard(self, heard: HeardAudio) -> None:
+        """
+        Make the assistant turn in the context match what the caller heard.
+
+        The interrupted response is replaced by its heard prefix ("..." marks
+        the cut), dropped if nothing was heard, or added if the LLM was
+        cancelled before it could record it.
+        """
+        if heard.complete:
+            return
+        text = f"{heard.text.rstrip('.')}..." if heard.text else ""
+
+        index = None
+        for i in range(len(self.conversation_history) - 1, -1, -1):
+            message = self.conversation_history[i]
+            if message.get("role") == "user":
+                break
+            if message.get("role") == "assistant" and not str(message.get("content", "")).startswith("[TOOL_CALL"):
+                index = i
+                break
+
+        if index is None:
+            if text:
+                self.conversation_history.append({"role": "assistant", "content": text})
+        elif text:
+            self.conversation_history[index] = {"role": "assistant", "content": text}
+        else:
+            del self.conversation_history[index]
+        logger.info(f"✂️ Context truncated to heard text: '{heard.text[-60:]}'")
+
     # -------------------------------------------------------------------------
     # AUDIO & OUTPUT HANDLING
     # -------------------------------------------------------------------------
 
+    def begin_audio_segment(self, text: str, response_id: str | None = None) -> None:
+        """Tag the audio that follows as one spoken sentence (playout tracking)."""
+        self.audio_manager.begin_segment(text, response_id)
+
+    def end_audio_segment(self) -> None:
+        """Close the current spoken sentence; its playback mark follows its audio."""
+        self.audio_manager.end_segment()
+
+    def on_playback_mark(self, name: str) -> None:
+        """Client reports that playback reached mark `name`."""
+        if self.audio_manager.on_mark(name):
+            self.last_interaction_time = time.time()
+
     async def send_audio_chunked(self, audio_data: bytes) -> None:
         """
         Queue audio for transmission via AudioManager.
@@ -451,6 +525,12 @@ class VoiceOrchestratorV2:
     # CONFIGURATION & FACTORY
     # -------------------------------------------------------------------------
 
+    def get_pipeline_stats(self) -> dict | None:
+        """Per-call profiler snapshot (None if the pipeline is not profiled)."""
+        if not self.pipeline:
+            return None
+        return self.pipeline.get_profile_snapshot()
+
     async def _load_config(self) -> None:
         """Load agent configuration from repository."""
         # Extract stream_id
@@ -483,16 +563,16 @@ class VoiceOrchestratorV2:
         apply_client_overlay(self.config, self.client_type)
 
         # Load background audio
-        self._load_background_audio()
+        await self._load_background_audio()
 
-    def _load_background_audio(self) -> None:
+    async def _load_background_audio(self) -> None:
         """Load background audio if configured."""
         bg_audio_enabled = getattr(self.config, 'bg_audio_enabled', False)
         if not bg_audio_enabled:
             return
 
         bg_path = getattr(self.config, 'bg_audio_path', 'assets/silence.wav')
-        self.audio_manager.load_background_audio(bg_path)
+        await self.audio_manager.load_background_audio(bg_path)
 
     async def _build_pipeline(self) -> None:
         """Build processing pipeline using Factory."""
@@ -513,7 +593,8 @@ class VoiceOrchestratorV2:
             stream_id=self.stream_id,
             transcript_callback=self._handle_transcript,
             orchestrator_ref=self,
-            loop=self.loop
+            loop=self.loop,
+            turns=self.turns
         )
         logger.info("Pipeline built via PipelineFactory")
 
@@ -535,15 +616,14 @@ class VoiceOrchestratorV2:
                 logger.error(f"Failed to send transcript: {e}")
 
     async def _clear_pipeline_output(self) -> None:
-        """Clear pending output from pipeline processors."""
-        if not self.pipeline:
-            return
+        """
+        Drop pending assistant output.
 
-        # Iterate processors and clear queues safely
-        if hasattr(self.pipeline, '_processors'):
-            for processor in self.pipeline._processors:
-                if hasattr(processor, 'clear_queue'):
-                    await processor.clear_queue()
+        Cancelling the turn stops its LLM/TTS work and makes its queued frames
+        stale, so every buffer drops them as they surface; only the playout
+        buffer (already-encoded audio) is flushed explicitly.
+        """
+        self.turns.cancel("clear_pipeline")
 
         # Clear audio manager queue
         await self.audio_manager.clear_queue()
@@ -1,14 +1,30 @@
 import asyncio
 import contextlib
 import logging
+import time
 from collections.abc import Callable, Coroutine
 
-from app.core.frames import BackpressureFrame, Frame, SystemFrame
+from app.core.backpressure import BackpressurePolicy, BackpressurePolicySet, FrameQueue, QueueEntry
+from app.core.frames import BackpressureFrame, ControlFrame, Frame, SystemFrame
+from app.core.metrics import pipeline_frames_dropped_total
 from app.core.processor import FrameDirection, FrameProcessor
+from app.core.profiler import PipelineProfiler
+from app.core.turns import TurnManager
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+def _frame_types() -> list[type[Frame]]:
+    """All Frame subclasses currently defined (including Frame itself)."""
+    found: list[type[Frame]] = []
+    pending = [Frame]
+    while pending:
+        frame_type = pending.pop()
+        found.append(frame_type)
+        pending.extend(frame_type.__subclasses__())
+    return found
+
+
 class PipelineSource(FrameProcessor):
     """
     Entry point of the pipeline.
@@ -43,6 +59,102 @@ class PipelineSink(FrameProcessor):
             # Frame coming from outside going up the pipeline
             await self.push_frame(frame, direction)
 
+class PipelineStage(FrameProcessor):
+    """
+    Asynchronous hand-off point between two groups of processors.
+
+    Frames handed to a stage are queued in an inbox and forwarded by a
+    dedicated task, so the producing group never awaits the consuming group.
+    One inbox (and task) exists per direction, which keeps FIFO ordering per
+    direction while SystemFrames still jump ahead of queued data.
+
+    Only downstream data frames wait for room in a full inbox. Upstream and
+    control/system frames are always admitted: a forwarding task that pushes
+    against the flow would otherwise wait on an inbox whose own forwarder is
+    waiting on it (adjacent stages full in both directions deadlock).
+
+    With a TurnManager attached, frames of a cancelled turn are skipped when
+    they reach the head of the inbox (no walk over the queue on barge-in).
+    """
+    def __init__(self, name: str = "PipelineStage", max_queue_size: int = 50, turns: TurnManager | None = None):
+        """
+        Args:
+            name: Stage label (for logging)
+            max_queue_size: Pending frames per direction above which downstream
+                data frames wait; upstream, control and system frames never wait.
+            turns: Turn generations used to skip stale frames (optional)
+        """
+        super().__init__(name=name)
+        self.max_queue_size = max_queue_size
+        self.turns = turns
+        self.stale_dropped = 0
+        self._queues: dict[int, FrameQueue] = {
+            FrameDirection.DOWNSTREAM: FrameQueue(maxsize=max_queue_size),
+            FrameDirection.UPSTREAM: FrameQueue(maxsize=max_queue_size),
+        }
+        self._tasks: list[asyncio.Task] = []
+        self._counter = 0  # Ensures stable ordering for equal priorities
+
+    async def start(self):
+        """Start one forwarding task per direction."""
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._forward(direction)) for direction in self._queues]
+
+    async def process_frame(self, frame: Frame, direction: int):
+        is_system = isinstance(frame, SystemFrame)
+        self._counter += 1
+        entry = (1 if is_system else 2, self._counter, frame, direction)
+        queue = self._queues[direction]
+        if direction == FrameDirection.DOWNSTREAM and not is_system and not isinstance(frame, ControlFrame):
+            await queue.put(entry)  # Bounded: wait for the next group to catch up
+        else:
+            queue.put_unbounded(entry)
+
+    async def _forward(self, direction: int):
+        """Drain one direction's inbox into the next group of processors."""
+        queue = self._queues[direction]
+        while True:
+            try:
+                _, _, frame, _ = await queue.get()
+                if self.turns is not None and self.turns.is_stale(frame.generation):
+                    self.stale_dropped += 1
+                    continue
+                await self.push_frame(frame, direction)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"[{self.name}] Stage forward error: {e}", exc_info=True)
+
+    async def clear_queue(self):
+        """Drop pending data/control frames (e.g. on barge-in). SystemFrames are kept."""
+        dropped = 0
+        for queue in self._queues.values():
+            kept = []
+            while not queue.empty():
+                entry = queue.get_nowait()
+                if entry[0] == 1:
+                    kept.append(entry)
+                else:
+                    dropped += 1
+            for entry in kept:
+                queue.put_unbounded(entry)
+
+        if dropped:
+            logger.debug(f"[{self.name}] Cleared {dropped} pending frames")
+
+    def qsize(self, direction: int = FrameDirection.DOWNSTREAM) -> int:
+        return self._queues[direction].qsize()
+
+    async def cleanup(self):
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+
+
 class Pipeline(FrameProcessor):
     """
     Frame processing pipeline with backpressure management.
@@ -50,29 +162,68 @@ class Pipeline(FrameProcessor):
     Features:
     - Backpressure Management: Monitors queue size to prevent OOM.
     - Priority Queue: Ensures SystemFrames bypass traffic congestion.
-    - Dropped Frame Tracking: Monitors system health under load.
+    - Backpressure Policies: Per-frame-type budgets (drop-oldest audio,
+      coalesced RMS/interim text, never-drop system/control frames).
+    - Dropped Frame Tracking: Counters per frame type and drop reason.
+    - Staged Execution (optional): Groups of processors run in their own task
+      behind a bounded PipelineStage, so slow generation never stalls ingestion.
+    - Profiling (optional): Per-processor service time, per-frame-type queue
+      wait and throughput via a PipelineProfiler.
+    - Turn Fencing (optional): Frames of a cancelled assistant turn are
+      dropped at the queue head and at every stage (see app.core.turns).
     """
 
-    def __init__(self, processors: list[FrameProcessor] | None = None, max_queue_size: int = 100):
+    def __init__(
+        self,
+        processors: list[FrameProcessor] | None = None,
+        max_queue_size: int = 100,
+        stages: list[list[FrameProcessor]] | None = None,
+        stage_queue_size: int = 50,
+        backpressure: BackpressurePolicySet | None = None,
+        profiler: PipelineProfiler | None = None,
+        turns: TurnManager | None = None,
+    ):
         """
         Initialize pipeline.
 
         Args:
-            processors: List of frame processors
+            processors: List of frame processors (inline execution)
             max_queue_size: Maximum queue size (default 100)
+            stages: Groups of processors, each group running in its own task.
+                Mutually exclusive with `processors`.
+            stage_queue_size: Inbox bound of each stage hand-off (default 50)
+            backpressure: Admission policies per frame type
+                (default: BackpressurePolicySet.for_queue_size(max_queue_size))
+            profiler: Enables profiling (default: disabled)
+            turns: Turn generations of the call, enables stale-frame fencing
         """
         super().__init__(name="Pipeline")
+        if processors and stages:
+            raise ValueError("Pipeline accepts either 'processors' or 'stages', not both")
+
         self._source = PipelineSource(self._handle_upstream)
         self._sink = PipelineSink(self._handle_downstream)
-
-        self.processors = processors or []
-
-        # Build the chain: Source -> [Processors] -> Sink
-        self._processors = [self._source, *self.processors, self._sink]
+        self.turns = turns
+
+        # Staged execution: insert a PipelineStage between consecutive groups
+        groups = [group for group in (stages or []) if group]
+        self._stages: list[PipelineStage] = []
+        chain: list[FrameProcessor] = []
+        for index, group in enumerate(groups):
+            if index > 0:
+                stage = PipelineStage(name=f"PipelineStage-{index}", max_queue_size=stage_queue_size, turns=turns)
+                self._stages.append(stage)
+                chain.append(stage)
+            chain.extend(group)
+
+        self.processors = [p for group in groups for p in group] if groups else (processors or [])
+
+        # Build the chain: Source -> [Processors | Stages] -> Sink
+        self._processors = [self._source, *(chain or self.processors), self._sink]
         self._link_processors()
 
         # Priority Queue with max size (prevents buffer overflow)
-        self._queue: asyncio.PriorityQueue[tuple[int, int, Frame, int]] = asyncio.PriorityQueue(maxsize=max_queue_size)
+        self._queue: FrameQueue = FrameQueue(maxsize=max_queue_size)
         self.max_queue_size = max_queue_size
         self._running = False
         self._task = None
@@ -81,12 +232,39 @@ class Pipeline(FrameProcessor):
         # Backpressure tracking
         self._backpressure_warning_sent = False
         self._dropped_frames_count = 0
+        self._backpressure = backpressure or BackpressurePolicySet.for_queue_size(max_queue_size)
+        self._entry_policies: dict[int, BackpressurePolicy] = {}  # counter -> policy of queued entry
+        self._critical_signal_pending = False
+
+        # Profiling (enqueue times are only tracked while a profiler is attached)
+        self.profiler: PipelineProfiler | None = None
+        self._enqueued_at: dict[int, float] = {}
+        if profiler:
+            self.enable_profiling(profiler)
 
     def _link_processors(self):
         prev = self._processors[0]
         for curr in self._processors[1:]:
             prev.link(curr)
             prev = curr
+        self._compile_routes()
+
+    def _compile_routes(self):
+        """
+        Precompute, for every processor, the next interested processor per
+        (frame type, direction). Frame types defined later are resolved lazily.
+        """
+        frame_types = _frame_types()
+        for processor in self._processors:
+            for frame_type in frame_types:
+                for direction in FrameDirection:
+                    processor.resolve_route(frame_type, direction)
+
+    def enable_profiling(self, profiler: PipelineProfiler):
+        """Attach a profiler to the pipeline and every processor in it."""
+        self.profiler = profiler
+        for processor in self._processors:
+            processor._profiler = profiler
 
     async def start(self):
         """Start the pipeline processing loop."""
@@ -94,8 +272,11 @@ class Pipeline(FrameProcessor):
             return
 
         self._running = True
+        for stage in self._stages:
+            await stage.start()
         self._task = asyncio.create_task(self._process_queue())
-        logger.info("Pipeline started.")
+        mode = f"staged ({len(self._stages) + 1} groups)" if self._stages else "inline"
+        logger.info(f"Pipeline started ({mode}).")
 
     async def stop(self):
         """Stop the pipeline and cleanup processors."""
@@ -116,10 +297,14 @@ class Pipeline(FrameProcessor):
         Handles backpressure by checking queue capacity:
         - Emits WARNING signal at 80% capacity.
         - Emits CRITICAL signal when full.
+        - Applies the frame's backpressure policy (evict oldest, coalesce,
+          drop newest or never drop) before touching the shared queue.
         - SystemFrames have higher priority (1) than DataFrame/ControlFrame (2).
         """
         priority = 1 if isinstance(frame, SystemFrame) else 2
         self._counter += 1
+        counter = self._counter
+        entry = (priority, counter, frame, direction)
 
         # Check queue capacity
         queue_size = self._queue.qsize()
@@ -147,38 +332,112 @@ class Pipeline(FrameProcessor):
         if capacity_percent < 50:
             self._backpressure_warning_sent = False
 
+        # Admission: per-frame-type policy with its own capacity budget
+        policy = self._backpressure.policy_for(frame)
+        decision = policy.admit(entry)
+        for queued in decision.evict:
+            self._evict(queued, policy, decision.reason)
+
+        if not decision.accept:
+            self._record_drop(frame, decision.reason)
+            return
+
+        if self._queue.full():
+            if policy is self._backpressure.critical:
+                # Never drop turn-critical frames: make room from droppable traffic if possible
+                victim_policy = next(
+                    (p for p in self._backpressure.policies if p.evictable and p.pending), None
+                )
+                if victim_policy:
+                    self._evict(victim_policy.oldest(), victim_policy, "evicted_for_critical")
+            elif policy.evictable and policy.pending:
+                self._evict(policy.oldest(), policy, policy.drop_reason)
+
         # Try to add frame to queue (Non-blocking)
         try:
-            self._queue.put_nowait((priority, self._counter, frame, direction))
+            if policy is self._backpressure.critical:
+                self._queue.put_unbounded(entry)
+            else:
+                self._queue.put_nowait(entry)
+            policy.track(entry)
+            self._entry_policies[counter] = policy
+            if self.profiler:
+                self._enqueued_at[counter] = time.perf_counter()
         except asyncio.QueueFull:
             # Queue full - emit critical backpressure
             logger.error(
                 f"[Pipeline] Backpressure CRITICAL: Queue FULL "
                 f"({self.max_queue_size}/{self.max_queue_size}). Dropping frame: {frame.name}"
             )
-            self._dropped_frames_count += 1
-
-            # Emit critical BackpressureFrame (Attempt injection)
-            await self._inject_critical_frame(
-                BackpressureFrame(
-                    queue_size=self.max_queue_size,
-                    max_size=self.max_queue_size,
-                    severity="critical"
-                ),
-                direction
-            )
+            self._record_drop(frame, "queue_full")
+
+            # Emit critical BackpressureFrame (one pending at a time, never dropped)
+            if not self._critical_signal_pending:
+                self._critical_signal_pending = True
+                await self._inject_critical_frame(
+                    BackpressureFrame(
+                        queue_size=self.max_queue_size,
+                        max_size=self.max_queue_size,
+                        severity="critical"
+                    ),
+                    direction,
+                    force=True
+                )
+
+    def _evict(self, entry: QueueEntry, policy: BackpressurePolicy, reason: str):
+        """Remove an already queued entry (drop-oldest / coalescing)."""
+        counter, frame = entry[1], entry[2]
+        policy.untrack(counter)
+        self._entry_policies.pop(counter, None)
+        self._enqueued_at.pop(counter, None)
+        if self._queue.discard(entry):
+            self._record_drop(frame, reason)
+
+    def _record_drop(self, frame: Frame, reason: str):
+        self._dropped_frames_count += 1
+        self._backpressure.record_drop(frame, reason)
+        pipeline_frames_dropped_total.labels(frame_type=frame.name, reason=reason).inc()
+        logger.debug(f"[Pipeline] Dropped {frame.name} ({reason})")
+
+    def get_backpressure_stats(self) -> dict:
+        """Queue depth, per-policy budgets and drop counters by frame type and reason."""
+        return {
+            "queue_size": self._queue.qsize(),
+            "max_queue_size": self.max_queue_size,
+            "dropped_total": self._dropped_frames_count,
+            **self._backpressure.stats(),
+        }
+
+    def get_profile_snapshot(self) -> dict | None:
+        """Profiler aggregates plus drop counters (None when profiling is disabled)."""
+        if not self.profiler:
+            return None
+        return {
+            **self.profiler.snapshot(),
+            "queue_size": self._queue.qsize(),
+            "dropped_total": self._dropped_frames_count,
+            "dropped": self._backpressure.stats()["dropped"],
+        }
 
     async def _inject_critical_frame(self, frame: Frame, direction: int, force: bool = False):
-        """Helper to inject high-priority system frames."""
+        """
+        Helper to inject high-priority system frames.
+
+        Args:
+            force: Insert even if the queue is at capacity. Used for the
+                'critical' signal, at most one of which is queued at a time.
+        """
         # Critical frames always get highest priority (0)
         priority = 0
         self._counter += 1
+        entry = (priority, self._counter, frame, direction)
+
+        if force:
+            self._queue.put_unbounded(entry)
+            return
 
         try:
-            # Always attempt valid insertion.
-            # Note: Even critical frames can fail if queue is absolutely 100% full
-            # and locked, but priority queue usually allows insertion unless hard limit.
-            self._queue.put_nowait((priority, self._counter, frame, direction))
+            self._queue.put_nowait(entry)
         except asyncio.QueueFull:
             logger.critical("[Pipeline] CRITICAL FAILURE: Cannot inject critical frame. Queue totally blocked.")
 
@@ -186,7 +445,22 @@ class Pipeline(FrameProcessor):
         """Main loop consuming frames from the queue."""
         while self._running:
             try:
-                priority, _, frame, direction = await self._queue.get()
+                priority, counter, frame, direction = await self._queue.get()
+                policy = self._entry_policies.pop(counter, None)
+                if policy:
+                    policy.untrack(counter)
+                elif priority == 0 and isinstance(frame, BackpressureFrame) and frame.severity == "critical":
+                    self._critical_signal_pending = False
+
+                if self.profiler:
+                    enqueued_at = self._enqueued_at.pop(counter, None)
+                    waited = time.perf_counter() - enqueued_at if enqueued_at is not None else None
+                    self.profiler.record_dequeue(frame.name, waited)
+
+                if self.turns is not None and self.turns.is_stale(frame.generation):
+                    self._record_drop(frame, "stale_turn")
+                    self._queue.task_done()
+                    continue
 
                 # Route the frame to the appropriate entry point
                 if direction == FrameDirection.DOWNSTREAM:
@@ -8,6 +8,7 @@ from collections.abc import Callable
 from typing import Any
 
 from app.core.audio.hold_audio import HoldAudioPlayer
+from app.core.config import settings
 
 # Managers & Utils
 from app.core.control_channel import ControlChannel
@@ -15,12 +16,15 @@ from app.core.managers import CRMManager
 
 # Processors
 from app.core.pipeline import Pipeline
+from app.core.profiler import PipelineProfiler
+from app.core.turns import TurnManager
 
 # Ports
 from app.domain.ports import LLMPort, STTPort, TTSPort
 
 # Domain Logic (Use Cases)
 from app.domain.use_cases import DetectTurnEndUseCase, ExecuteToolUseCase
+from app.processors.input.audio_ingress import AudioIngressProcessor
 from app.processors.logic.aggregator import ContextAggregator
 from app.processors.logic.llm import LLMProcessor
 from app.processors.logic.metrics import MetricsProcessor
@@ -51,7 +55,8 @@ class PipelineFactory:
         stream_id: str,
         transcript_callback: Callable[[str, str], Any],
         orchestrator_ref: Any,  # Interface compliant with PipelineOutputSink expectation
-        loop: asyncio.AbstractEventLoop
+        loop: asyncio.AbstractEventLoop,
+        turns: TurnManager | None = None
     ) -> Pipeline:
         """
         Builds and initializes the processing pipeline.
@@ -70,37 +75,56 @@ class PipelineFactory:
             transcript_callback: Callback for reporter events
             orchestrator_ref: Reference to orchestrator (for sink)
             loop: Asyncio loop
+            turns: Turn generations shared by LLM, TTS, sink and stages (default: new)
 
         Returns:
             Pipeline: Initialized pipeline instance
         """
 
+        turns = turns or TurnManager()
+
+        # 0. Audio Ingress
+        # Decodes G.711 / resamples once so VAD and STT share canonical PCM16
+        ingress_rate = settings.AUDIO_INGRESS_SAMPLE_RATE
+        ingress = AudioIngressProcessor(
+            output_rate=ingress_rate,
+            default_encoding=getattr(orchestrator_ref, 'audio_encoding', 'PCMU')
+        )
+
         # 1. STT Processor
         # Injects control channel for out-of-band signaling
         stt = STTProcessor(
             provider=stt_port,
             config=config,
             loop=loop,
-            control_channel=control_channel
+            control_channel=control_channel,
+            sample_rate=ingress_rate,
+            write_interval_ms=settings.STT_WRITE_INTERVAL_MS
         )
         await stt.initialize()
 
         # 2. VAD Processor
         # Injects strict domain use case for turn detection
         detect_turn_end = DetectTurnEndUseCase(
-            silence_threshold_ms=getattr(config, 'silence_timeout_ms', 500)
+            silence_threshold_ms=getattr(config, 'silence_timeout_ms', 500),
+            adaptive=settings.ADAPTIVE_ENDPOINTING_ENABLED,
+            min_silence_ms=settings.ENDPOINTING_MIN_SILENCE_MS,
+            max_silence_ms=settings.ENDPOINTING_MAX_SILENCE_MS
         )
         vad = VADProcessor(
             config=config,
             detect_turn_end=detect_turn_end,
-            control_channel=control_channel
+            control_channel=control_channel,
+            sample_rate=ingress_rate,
+            energy_gate=settings.VAD_ENERGY_GATE_ENABLED
         )
 
         # 3. Context Aggregator
         agg = ContextAggregator(
             config=config,
             conversation_history=conversation_history,
-            llm_provider=llm_port  # Needed for semantic context analysis
+            detect_turn_end=detect_turn_end,  # Local semantic turn-completion check
+            speculative=settings.SPECULATIVE_GENERATION_ENABLED
         )
 
         # 4. LLM Processor
@@ -122,11 +146,13 @@ class PipelineFactory:
             context=context_data,
             execute_tool_use_case=execute_tool_use_case,
             trace_id=stream_id,
-            hold_audio_player=hold_audio_player
+            hold_audio_player=hold_audio_player,
+            turns=turns,
+            speculative_tts=settings.SPECULATIVE_TTS_ENABLED
         )
 
         # 5. TTS Processor
-        tts = TTSProcessor(tts_port, config)
+        tts = TTSProcessor(tts_port, config, output_budget=orchestrator_ref.audio_manager, turns=turns)
 
         # 6. Metrics Processor
         metrics = MetricsProcessor(config)
@@ -135,10 +161,23 @@ class PipelineFactory:
         reporter = TranscriptReporter(transcript_callback, role_label="assistant")
 
         # 8. Output Sink
-        output_sink = PipelineOutputSink(orchestrator_ref)
+        output_sink = PipelineOutputSink(orchestrator_ref, turns=turns)
 
         # Assemble Pipeline
-        processors = [stt, vad, agg, llm, tts, metrics, reporter, output_sink]
+        processors = [ingress, stt, vad, agg, llm, tts, metrics, reporter, output_sink]
+        profiler = PipelineProfiler(call_id=stream_id) if settings.PIPELINE_PROFILING_ENABLED else None
+
+        # Staged mode: ingestion (STT/VAD) never waits on generation (LLM/TTS)
+        if settings.PIPELINE_EXECUTION_MODE == 'staged':
+            stages = [[ingress, stt, vad], [agg], [llm], [tts], [metrics, reporter, output_sink]]
+            logger.info(f"🏭 [Factory] Pipeline assembled with {len(processors)} processors in {len(stages)} stages")
+            return Pipeline(
+                stages=stages,
+                stage_queue_size=settings.PIPELINE_STAGE_QUEUE_SIZE,
+                profiler=profiler,
+                turns=turns
+            )
+
         logger.info(f"🏭 [Factory] Pipeline assembled with {len(processors)} processors")
 
-        return Pipeline(processors)
+        return Pipeline(processors, profiler=profiler, turns=turns)
@@ -1,4 +1,5 @@
 import logging
+import time
 from abc import ABC, abstractmethod
 from enum import IntEnum
 
@@ -11,19 +12,65 @@ class FrameDirection(IntEnum):
     DOWNSTREAM = 1
     UPSTREAM = 2
 
+_UNRESOLVED = object()
+
+
 class FrameProcessor(ABC):
     """
     Base class for any element in the pipeline processing chain.
+
+    Interest-based routing:
+        Processors may declare which frame types (`consumed_frames`) and
+        directions (`consumed_directions`) they act on. Frames outside that
+        interest skip the processor entirely and are delivered to the next
+        interested processor in the chain. The default (None / both
+        directions) receives every frame, so undeclared processors behave
+        exactly as before. Only declare interest if the processor passes
+        every other frame through unchanged and without side effects.
+
+    Profiling:
+        Pipeline sets `_profiler` (a PipelineProfiler) on every processor when
+        profiling is enabled; push_frame then records the receiving
+        processor's exclusive service time.
     """
+    consumed_frames: tuple[type[Frame], ...] | None = None
+    consumed_directions: tuple[FrameDirection, ...] = (FrameDirection.DOWNSTREAM, FrameDirection.UPSTREAM)
+    _profiler = None  # PipelineProfiler | None
+
     def __init__(self, name: str | None = None):
         self.name = name or self.__class__.__name__
         self._next: FrameProcessor | None = None
         self._prev: FrameProcessor | None = None
 
+        # Routing table: (frame type, direction) -> next interested processor
+        self._routes: dict[tuple[type[Frame], int], FrameProcessor | None] = {}
+
     def link(self, processor: 'FrameProcessor'):
         """Connect this processor to the next one."""
         self._next = processor
         processor._prev = self
+        self.reset_routes()
+        processor.reset_routes()
+
+    def wants(self, frame_type: type[Frame], direction: int) -> bool:
+        """Whether this processor consumes frames of `frame_type` travelling in `direction`."""
+        if direction not in self.consumed_directions:
+            return False
+        return self.consumed_frames is None or issubclass(frame_type, self.consumed_frames)
+
+    def reset_routes(self):
+        """Invalidate the routing table (after relinking)."""
+        self._routes.clear()
+
+    def resolve_route(self, frame_type: type[Frame], direction: int) -> 'FrameProcessor | None':
+        """Find (and cache) the next processor interested in `frame_type` in `direction`."""
+        downstream = direction == FrameDirection.DOWNSTREAM
+        target = self._next if downstream else self._prev
+        while target is not None and not target.wants(frame_type, direction):
+            target = target._next if downstream else target._prev
+
+        self._routes[(frame_type, direction)] = target
+        return target
 
     async def start(self):  # noqa: B027 - Optional hook for subclasses
         """
@@ -41,17 +88,30 @@ class FrameProcessor(ABC):
         pass
 
     async def push_frame(self, frame: Frame, direction: FrameDirection = FrameDirection.DOWNSTREAM):
-        """Send a frame to the next processor in the chain."""
-        if direction == FrameDirection.DOWNSTREAM:
-            if self._next:
-                await self._next.process_frame(frame, direction)
+        """Send a frame to the next interested processor in the chain."""
+        target = self._routes.get((type(frame), direction), _UNRESOLVED)
+        if target is _UNRESOLVED:
+            target = self.resolve_route(type(frame), direction)
+
+        if target is not None:
+            if self._profiler is None:
+                await target.process_frame(frame, direction)
             else:
-                logger.debug(f"[{self.name}] Dropped DOWNSTREAM frame (End of Chain): {frame}")
+                await self._profiled_process(target, frame, direction)
+        elif direction == FrameDirection.DOWNSTREAM:
+            logger.debug(f"[{self.name}] Dropped DOWNSTREAM frame (End of Chain): {frame}")
         elif direction == FrameDirection.UPSTREAM:
-            if self._prev:
-                await self._prev.process_frame(frame, direction)
-            else:
-                logger.debug(f"[{self.name}] Dropped UPSTREAM frame (Start of Chain): {frame}")
+            logger.debug(f"[{self.name}] Dropped UPSTREAM frame (Start of Chain): {frame}")
+
+    async def _profiled_process(self, target: 'FrameProcessor', frame: Frame, direction: FrameDirection):
+        """Deliver a frame to `target`, recording its exclusive service time."""
+        profiler = self._profiler
+        scope = profiler.begin_service()
+        start = time.perf_counter()
+        try:
+            await target.process_frame(frame, direction)
+        finally:
+            profiler.end_service(scope, target.name, time.perf_counter() - start)
 
     async def cleanup(self):  # noqa: B027 - Optional hook for subclasses
         """Release resources."""
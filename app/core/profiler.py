@@ -0,0 +1,167 @@
+"""
+Pipeline Profiler.
+
+Opt-in instrumentation for a running Pipeline: per-processor service time,
+per-frame-type queue wait, throughput and drop counts. Samples feed both the
+process-wide Prometheus histograms (app/core/metrics.py) and small per-call
+aggregates that back the snapshot API.
+
+Service time is exclusive: time a processor spends forwarding a frame to the
+next processor (push_frame awaits downstream work) is subtracted, so each
+stage is charged only for its own latency.
+"""
+import bisect
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any
+
+from app.core.metrics import (
+    PIPELINE_LATENCY_BUCKETS,
+    pipeline_frames_processed_total,
+    pipeline_processor_service_seconds,
+    pipeline_queue_wait_seconds,
+)
+
+# Time spent in nested push_frame calls of the frame currently being serviced
+_nested_time: ContextVar[list[float] | None] = ContextVar("pipeline_nested_time", default=None)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency aggregate (seconds) with approximate percentiles."""
+    __slots__ = ("count", "counts", "max", "total")
+
+    def __init__(self):
+        self.counts = [0] * (len(PIPELINE_LATENCY_BUCKETS) + 1)  # Last bucket = +Inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(PIPELINE_LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(seconds, self.max)
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (max for +Inf)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                if index < len(PIPELINE_LATENCY_BUCKETS):
+                    return min(PIPELINE_LATENCY_BUCKETS[index], self.max)
+                break
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(0.50) * 1000, 3),
+            "p95_ms": round(self.percentile(0.95) * 1000, 3),
+            "p99_ms": round(self.percentile(0.99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class PipelineProfiler:
+    """
+    Per-call pipeline profiler.
+
+    Attach with `Pipeline(profiler=PipelineProfiler(call_id))`. When no
+    profiler is attached the hot path pays a single attribute check.
+
+    Example:
+        >>> profiler = PipelineProfiler("call-123")
+        >>> profiler.record_service("VADProcessor", 0.0012)
+        >>> profiler.snapshot()["processors"]["VADProcessor"]["count"]
+        1
+    """
+
+    def __init__(self, call_id: str = "", export_prometheus: bool = True):
+        """
+        Args:
+            call_id: Call identifier reported in snapshots
+            export_prometheus: Also feed the process-wide Prometheus histograms
+        """
+        self.call_id = call_id
+        self.export_prometheus = export_prometheus
+        self.started_at = time.monotonic()
+        self.service: dict[str, LatencyHistogram] = {}
+        self.queue_wait: dict[str, LatencyHistogram] = {}
+        self.processed: Counter[str] = Counter()
+
+        # Cached Prometheus children (labels() takes a lock and hashes every call)
+        self._service_metrics: dict[str, Any] = {}
+        self._wait_metrics: dict[str, Any] = {}
+        self._processed_metrics: dict[str, Any] = {}
+
+    # --- Service time (exclusive) ---
+
+    def begin_service(self) -> tuple[list[float] | None, list[float], Any]:
+        """Open a service-time scope; nested scopes report their time to it."""
+        nested: list[float] = [0.0]
+        return _nested_time.get(), nested, _nested_time.set(nested)
+
+    def end_service(self, scope: tuple[list[float] | None, list[float], Any], processor: str, elapsed: float) -> None:
+        """Close a scope opened by begin_service() and record exclusive time."""
+        parent, nested, token = scope
+        _nested_time.reset(token)
+        if parent is not None:
+            parent[0] += elapsed
+        self.record_service(processor, max(0.0, elapsed - nested[0]))
+
+    def record_service(self, processor: str, seconds: float) -> None:
+        histogram = self.service.get(processor)
+        if histogram is None:
+            histogram = self.service[processor] = LatencyHistogram()
+        histogram.observe(seconds)
+
+        if self.export_prometheus:
+            metric = self._service_metrics.get(processor)
+            if metric is None:
+                metric = self._service_metrics[processor] = pipeline_processor_service_seconds.labels(processor=processor)
+            metric.observe(seconds)
+
+    # --- Queue wait / throughput ---
+
+    def record_dequeue(self, frame_type: str, waited: float | None) -> None:
+        """A frame left the pipeline queue (waited=None when enqueue time is unknown)."""
+        self.processed[frame_type] += 1
+        if self.export_prometheus:
+            metric = self._processed_metrics.get(frame_type)
+            if metric is None:
+                metric = self._processed_metrics[frame_type] = pipeline_frames_processed_total.labels(frame_type=frame_type)
+            metric.inc()
+
+        if waited is None:
+            return
+
+        histogram = self.queue_wait.get(frame_type)
+        if histogram is None:
+            histogram = self.queue_wait[frame_type] = LatencyHistogram()
+        histogram.observe(waited)
+
+        if self.export_prometheus:
+            metric = self._wait_metrics.get(frame_type)
+            if metric is None:
+                metric = self._wait_metrics[frame_type] = pipeline_queue_wait_seconds.labels(frame_type=frame_type)
+            metric.observe(waited)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Per-call aggregates (latencies in milliseconds)."""
+        elapsed = max(time.monotonic() - self.started_at, 1e-9)
+        total = sum(self.processed.values())
+        return {
+            "call_id": self.call_id,
+            "uptime_s": round(elapsed, 3),
+            "frames_processed": total,
+            "frames_per_second": round(total / elapsed, 2),
+            "throughput": dict(self.processed),
+            "processors": {name: h.to_dict() for name, h in self.service.items()},
+            "queue_wait": {name: h.to_dict() for name, h in self.queue_wait.items()},
+        }
@@ -0,0 +1,268 @@
+"""
+Shared STT I/O worker.
+
+Recognizer SDK calls (push-stream writes) block in native code; made on the
+event loop, any stall delays every call sharing it. A small pool of writer
+threads per process owns all recognizer writes instead:
+
+- The event loop hands audio over by appending to the call's STTStream
+  (a deque: append/popleft are atomic, no lock on the hot path).
+- Every `write_interval_ms` the stream's writer thread coalesces its pending
+  frames into a single write (one 100ms write instead of five 20ms ones).
+- Streams are spread over the writer threads (least loaded first, skipping
+  a thread stuck in a slow write), so one stalled SDK write only delays the
+  calls sharing its thread, not every call in the process.
+- Recognition events from SDK threads are queued on the stream and
+  delivered to the loop in batches: one wake-up per burst, in order.
+"""
+import asyncio
+import contextlib
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from typing import Any
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WRITE_INTERVAL_MS = 60
+DEFAULT_WRITER_THREADS = 4
+TICK_MS = 10  # Worker resolution; streams flush on their own cadence
+STALL_MS = 200  # A write running longer than this marks its thread as stalled
+
+
+class STTStream:
+    """
+    One call's handoff to the worker: audio out, recognition events back.
+
+    `write` is called on the event loop, `on_event` on SDK threads; neither
+    blocks.
+    """
+
+    def __init__(
+        self,
+        writer: "_WriterThread",
+        recognizer: Any,
+        loop: asyncio.AbstractEventLoop,
+        on_events: Callable[[list], Awaitable[None]],
+        write_interval_ms: int = DEFAULT_WRITE_INTERVAL_MS
+    ):
+        self.writer = writer
+        self.recognizer = recognizer
+        self.loop = loop
+        self.on_events = on_events
+        self.write_interval = write_interval_ms / 1000
+        self._audio: deque[bytes] = deque()
+        self._events: deque = deque()
+        self._next_flush = time.monotonic() + self.write_interval
+        self._dispatch_scheduled = False
+        self._delivery: asyncio.Task | None = None
+        self._closed: Future | None = None
+
+        # Stats
+        self.frames = 0
+        self.writes = 0
+        self.bytes_written = 0
+        self.events = 0
+        self.event_batches = 0
+
+    # --- Event loop side ---
+
+    def write(self, data: bytes):
+        """Queue audio for the next coalesced write."""
+        if self._closed is None:
+            self._audio.append(data if isinstance(data, bytes) else bytes(data))
+
+    async def close(self, timeout: float = 1.0):
+        """Flush pending audio, then detach from the worker."""
+        if self._closed is None:
+            self._closed = Future()
+            self.writer.wake()
+        with contextlib.suppress(asyncio.TimeoutError, TimeoutError):
+            await asyncio.wait_for(asyncio.wrap_future(self._closed), timeout)
+
+    def _dispatch(self):
+        self._dispatch_scheduled = False
+        if self._delivery is None or self._delivery.done():
+            self._delivery = self.loop.create_task(self._deliver())
+
+    async def _deliver(self):
+        """Hand queued events to the consumer, a batch at a time, in arrival order."""
+        while self._events:
+            batch = []
+            with contextlib.suppress(IndexError):
+                while True:
+                    batch.append(self._events.popleft())
+            self.events += len(batch)
+            self.event_batches += 1
+            try:
+                await self.on_events(batch)
+            except Exception as e:
+                logger.error(f"[STT_IO] Event delivery error: {e}")
+
+    # --- SDK thread side ---
+
+    def on_event(self, event: Any):
+        """Recognizer callback: queue the event, wake the loop once per batch."""
+        self._events.append(event)
+        if not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            with contextlib.suppress(RuntimeError):  # Loop already closed
+                self.loop.call_soon_threadsafe(self._dispatch)
+
+    # --- Worker thread side ---
+
+    def _flush(self, now: float, force: bool = False):
+        if not force and now < self._next_flush:
+            return
+        self._next_flush = now + self.write_interval
+
+        chunks = []
+        with contextlib.suppress(IndexError):
+            while True:
+                chunks.append(self._audio.popleft())
+        if not chunks:
+            return
+
+        data = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+        self.recognizer.write(data)
+        self.frames += len(chunks)
+        self.writes += 1
+        self.bytes_written += len(data)
+
+    def stats(self) -> dict:
+        return {
+            "frames": self.frames,
+            "writes": self.writes,
+            "bytes_written": self.bytes_written,
+            "frames_per_write": round(self.frames / self.writes, 2) if self.writes else 0.0,
+            "events": self.events,
+            "event_batches": self.event_batches,
+        }
+
+
+class _WriterThread:
+    """One writer thread and the streams it flushes."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.streams: list[STTStream] = []
+        self.write_started: float | None = None  # Monotonic start of the write in progress
+        self.write_errors = 0
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()  # Stream registration only, never per frame
+
+    def add(self, stream: STTStream):
+        with self._lock:
+            self.streams = [*self.streams, stream]
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+
+    def wake(self):
+        self._wakeup.set()
+
+    def stalled(self, now: float) -> bool:
+        started = self.write_started
+        return started is not None and now - started > STALL_MS / 1000
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(TICK_MS / 1000)
+            self._wakeup.clear()
+            now = time.monotonic()
+
+            closed = []
+            for stream in self.streams:
+                closing = stream._closed is not None
+                self.write_started = time.monotonic()
+                try:
+                    stream._flush(now, force=closing)
+                except Exception as e:
+                    self.write_errors += 1
+                    logger.error(f"[STT_IO] Recognizer write error: {e}")
+                finally:
+                    self.write_started = None
+                if closing:
+                    closed.append(stream)
+
+            if closed:
+                with self._lock:
+                    self.streams = [s for s in self.streams if s not in closed]
+                for stream in closed:
+                    if not stream._closed.done():
+                        stream._closed.set_result(None)
+
+
+class STTIOWorker:
+    """
+    Process-wide pool of threads that perform all recognizer writes.
+
+    Each stream is pinned to one writer thread for its lifetime (writes of a
+    call stay in order); a slow write holds up only that thread's streams.
+
+    Example:
+        >>> stream = get_stt_io_worker().open_stream(recognizer, loop, on_events)
+        >>> recognizer.subscribe(stream.on_event)
+        >>> stream.write(pcm)          # On the event loop, never blocks
+        >>> await stream.close()       # Final flush
+    """
+
+    def __init__(self, threads: int = DEFAULT_WRITER_THREADS):
+        """
+        Args:
+            threads: Writer threads; streams are spread across them
+        """
+        self._writers = [_WriterThread(f"stt-io-{index}") for index in range(max(1, threads))]
+        self._lock = threading.Lock()  # Writer selection
+
+    @property
+    def write_errors(self) -> int:
+        return sum(w.write_errors for w in self._writers)
+
+    def open_stream(
+        self,
+        recognizer: Any,
+        loop: asyncio.AbstractEventLoop,
+        on_events: Callable[[list], Awaitable[None]],
+        write_interval_ms: int = DEFAULT_WRITE_INTERVAL_MS
+    ) -> STTStream:
+        with self._lock:
+            writer = self._pick_writer()
+            stream = STTStream(writer, recognizer, loop, on_events, write_interval_ms)
+            writer.add(stream)
+        return stream
+
+    def _pick_writer(self) -> _WriterThread:
+        """Least loaded writer, avoiding threads stuck in a slow write when possible."""
+        now = time.monotonic()
+        healthy = [w for w in self._writers if not w.stalled(now)] or self._writers
+        return min(healthy, key=lambda w: len(w.streams))
+
+    def stats(self) -> dict:
+        streams = [s for w in self._writers for s in w.streams]
+        now = time.monotonic()
+        return {
+            "threads": len(self._writers),
+            "stalled_threads": sum(w.stalled(now) for w in self._writers),
+            "streams": len(streams),
+            "writes": sum(s.writes for s in streams),
+            "frames": sum(s.frames for s in streams),
+            "write_errors": self.write_errors,
+        }
+
+
+_worker: STTIOWorker | None = None
+
+
+def get_stt_io_worker() -> STTIOWorker:
+    """Get or create the process-wide STT I/O worker (Singleton)."""
+    global _worker  # noqa: PLW0603 - One writer pool per process
+    if _worker is None:
+        _worker = STTIOWorker(threads=settings.STT_IO_WORKER_THREADS)
+    return _worker
@@ -0,0 +1,149 @@
+"""
+Transcript Filters.
+
+STT results are checked against two phrase lists from the agent config:
+the hallucination blacklist (results to ignore) and the interruption
+phrases (results that force the bot to stop). Both are compiled once per
+config version into an Aho-Corasick automaton over normalized text (case
+folded, accents stripped), so checking a result is a single pass over the
+transcript no matter how many phrases are configured.
+
+Compiled filters are cached by their raw config values: calls sharing an
+agent config share the automata, and a changed config compiles a new set
+that replaces the old one in a single assignment.
+"""
+import json
+import logging
+import unicodedata
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(text: str) -> str:
+    """Case-fold and strip accents ("Sí, ESPERA" -> "si, espera")."""
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+class PhraseMatcher:
+    """
+    Multi-pattern substring matcher (Aho-Corasick) on normalized text.
+
+    Example:
+        >>> matcher = PhraseMatcher(["espera", "un momento"])
+        >>> matcher.search("Oye, ESPÉRA por favor")
+        'espera'
+    """
+    __slots__ = ("_fail", "_goto", "_output", "phrases")
+
+    def __init__(self, phrases: list[str]):
+        """
+        Args:
+            phrases: Patterns as configured (matching ignores case and accents)
+        """
+        self.phrases = tuple(dict.fromkeys(p for p in phrases if p and p.strip()))
+
+        # Trie: one transition dict per state; output = index of the phrase ending there
+        self._goto: list[dict[str, int]] = [{}]
+        self._output: list[int] = [-1]
+        for index, phrase in enumerate(self.phrases):
+            state = 0
+            for ch in normalize_text(phrase.strip()):
+                next_state = self._goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][ch] = next_state
+                    self._goto.append({})
+                    self._output.append(-1)
+                state = next_state
+            if state and self._output[state] == -1:
+                self._output[state] = index
+
+        # Failure links (BFS); outputs are inherited so a match is seen at its end state
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(ch, 0)
+                if self._output[next_state] == -1:
+                    self._output[next_state] = self._output[self._fail[next_state]]
+
+    def __bool__(self) -> bool:
+        return bool(self.phrases)
+
+    def search(self, text: str) -> str | None:
+        """First configured phrase found in `text` (in reading order), or None."""
+        if not self.phrases:
+            return None
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for ch in normalize_text(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state] != -1:
+                return self.phrases[output[state]]
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class TranscriptFilters:
+    """Compiled filters of one config version."""
+    blacklist: PhraseMatcher
+    interruption_phrases: PhraseMatcher
+    min_characters: int
+
+    @classmethod
+    def from_config(cls, config: Any) -> "TranscriptFilters":
+        """Compile (or reuse) the filters of an agent config for its client profile."""
+        client_type = getattr(config, 'client_type', 'twilio')
+        profile = config.get_profile(client_type)
+        min_chars = getattr(config, 'input_min_characters', 2)
+        return compile_transcript_filters(
+            getattr(config, 'hallucination_blacklist', '') or '',
+            _phrase_key(profile.interruption_phrases),
+            min_chars if min_chars is not None else 2,
+        )
+
+
+def _phrase_key(phrases: Any) -> tuple[str, ...]:
+    """Interruption phrases (JSON string or list) as a hashable tuple."""
+    if not phrases:
+        return ()
+    if isinstance(phrases, str):
+        try:
+            phrases = json.loads(phrases)
+        except ValueError as e:
+            logger.warning(f"Failed to parse interruption_phrases: {e}")
+            return ()
+    if not isinstance(phrases, list):
+        return ()
+    return tuple(str(phrase) for phrase in phrases)
+
+
+@lru_cache(maxsize=64)
+def compile_transcript_filters(blacklist: str, phrases: tuple[str, ...], min_characters: int) -> TranscriptFilters:
+    """
+    Build the matchers of one config version (cached by value).
+
+    Args:
+        blacklist: Comma-separated hallucination patterns
+        phrases: Interruption trigger phrases
+        min_characters: Shortest accepted transcript
+    """
+    return TranscriptFilters(
+        blacklist=PhraseMatcher([x.strip() for x in blacklist.split(',')]),
+        interruption_phrases=PhraseMatcher(list(phrases)),
+        min_characters=min_characters,
+    )
@@ -0,0 +1,163 @@
+"""
+Turn Generations.
+
+Every assistant turn gets a generation number and a CancellationToken.
+Frames generated for the turn (LLM text, TTS audio, end-of-call signals)
+carry the generation, and the tasks doing the work (LLM stream, tool call,
+TTS synthesis) are bound to the token.
+
+A barge-in cancels the token, which cancels the bound tasks on the spot,
+and advances the generation. Every buffer between the LLM and the wire
+then drops older-generation frames with one integer comparison, so nothing
+from the interrupted turn can leak out after the interruption and no queue
+has to be walked or restarted.
+
+Frames with generation 0 are untracked (caller audio, signals, greetings)
+and are never considered stale.
+
+A turn can start speculatively (before the user's turn is confirmed): its
+work runs, but output is held until the token is confirmed. A speculative
+turn that is never confirmed is cancelled like any other.
+"""
+import asyncio
+import logging
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class CancellationToken:
+    """
+    Cancellation handle of one turn generation.
+
+    Example:
+        >>> token = turns.begin()
+        >>> token.bind(asyncio.current_task())  # cancelled on barge-in
+        >>> if token.cancelled: return
+        >>> await token.wait_confirmed()        # speculative turns: hold output
+    """
+    __slots__ = ("_callbacks", "_confirmed", "cancelled", "generation", "reason", "speculative")
+
+    def __init__(self, generation: int, speculative: bool = False):
+        self.generation = generation
+        self.speculative = speculative
+        self.cancelled = False
+        self.reason = ""
+        self._callbacks: list[Callable[[], object]] = []
+        self._confirmed = asyncio.Event() if speculative else None
+
+    @property
+    def confirmed(self) -> bool:
+        """Whether output may be released (always True for non-speculative turns)."""
+        return self._confirmed is None or self._confirmed.is_set()
+
+    def confirm(self):
+        """The user's turn ended as speculated: release held output."""
+        if self._confirmed is not None and not self.cancelled:
+            self._confirmed.set()
+
+    async def wait_confirmed(self):
+        """Wait until the turn is confirmed (cancellation cancels the waiting task)."""
+        if self._confirmed is not None:
+            await self._confirmed.wait()
+
+    def cancel(self, reason: str = "cancelled") -> bool:
+        """Cancel the turn and everything bound to it. Returns False if already cancelled."""
+        if self.cancelled:
+            return False
+        self.cancelled = True
+        self.reason = reason
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"❌ [Turn] Cancel callback failed: {e}", exc_info=True)
+        return True
+
+    def add_callback(self, callback: Callable[[], object]):
+        """Run `callback` on cancellation (immediately if already cancelled)."""
+        if self.cancelled:
+            callback()
+        else:
+            self._callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable[[], object]):
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    def bind(self, task: asyncio.Task) -> asyncio.Task:
+        """Cancel `task` when the turn is cancelled (unbound once the task finishes)."""
+        callback = task.cancel
+        self.add_callback(callback)
+        task.add_done_callback(lambda _: self.remove_callback(callback))
+        return task
+
+
+class TurnManager:
+    """
+    Per-call generation counter with a stale-frame fence.
+
+    Example:
+        >>> turns = TurnManager()
+        >>> token = turns.begin()                       # new assistant turn
+        >>> frame.generation = token.generation
+        >>> turns.cancel("barge-in")                    # cancels the turn's work
+        >>> turns.is_stale(frame.generation)
+        True
+    """
+
+    def __init__(self):
+        self.generation = 0
+        self.token = CancellationToken(0)
+
+        # Stats
+        self.turns_started = 0
+        self.turns_cancelled = 0
+
+    def begin(self, speculative: bool = False) -> CancellationToken:
+        """
+        Start a new assistant turn; it supersedes (and cancels) the previous one.
+
+        Args:
+            speculative: Hold the turn's output until its token is confirmed
+        """
+        self.token.cancel("superseded")
+        self.generation += 1
+        self.token = CancellationToken(self.generation, speculative=speculative)
+        self.turns_started += 1
+        return self.token
+
+    def cancel(self, reason: str = "cancelled") -> bool:
+        """
+        Cancel the current turn and fence off its frames (barge-in).
+
+        Returns:
+            False if the current turn was already cancelled
+        """
+        if not self.token.cancel(reason):
+            return False
+        self.generation += 1
+        self.token = CancellationToken(self.generation)
+        self.turns_cancelled += 1
+        logger.debug(f"🛑 [Turn] Generation {self.generation - 1} cancelled ({reason})")
+        return True
+
+    def token_for(self, generation: int) -> CancellationToken:
+        """Token governing work on frames of `generation` (untracked frames follow the current turn)."""
+        if generation in (0, self.token.generation):
+            return self.token
+        token = CancellationToken(generation)
+        token.cancel("stale")
+        return token
+
+    def is_stale(self, generation: int) -> bool:
+        """Whether a frame belongs to a cancelled or superseded turn (O(1))."""
+        return 0 < generation < self.generation
+
+    def stats(self) -> dict:
+        return {
+            "generation": self.generation,
+            "turns_started": self.turns_started,
+            "turns_cancelled": self.turns_cancelled,
+        }
@@ -0,0 +1,140 @@
+"""
+Energy pre-gate for Silero VAD.
+
+Cheap per-window RMS and zero-crossing checks decide which windows are clear
+silence, so the neural model only runs where speech is possible. The noise
+floor adapts to the line; a hangover keeps the gate open after loud windows
+(and after the model hears speech) so word endings are never cut. Skipping
+only starts after a hangover of silence the model did see, so its recurrent
+state is already settled on silence; the window right before a gate opening
+is replayed to the model as warm-up so the onset itself is never clipped.
+"""
+import numpy as np
+
+from app.core.audio_processor import AudioProcessor
+
+
+class EnergyGate:
+    """
+    Adaptive energy / zero-crossing gate in front of the VAD model.
+
+    Levels are RMS of normalized samples (1.0 = full scale).
+
+    Example:
+        >>> gate = EnergyGate(context_size=32)
+        >>> rows, targets = gate.plan(frames)   # frames: (n, context + window)
+        >>> # infer `rows`; targets[i] is the window index or None for warm-up rows
+    """
+
+    def __init__(
+        self,
+        context_size: int,
+        margin: float = 2.0,
+        hangover_windows: int = 8,
+        zcr_threshold: float = 0.3,
+        initial_floor: float = 0.001,
+        min_threshold: float = 0.0005,
+        max_threshold: float = 0.02,
+        floor_rise: float = 0.01,
+        floor_fall: float = 0.2,
+    ):
+        """
+        Args:
+            context_size: Context samples at the start of each framed row
+            margin: Gate threshold relative to the noise floor (2.0 = +6 dB)
+            hangover_windows: Windows kept open after the last loud/speech window (8 = 256ms)
+            zcr_threshold: Zero-crossing rate that marks quiet unvoiced sounds (fricatives)
+            initial_floor: Starting noise floor estimate (~ -60 dBFS)
+            min_threshold: Lower bound of the gate threshold
+            max_threshold: Upper bound, so a noisy line never gates out speech (~ -34 dBFS)
+            floor_rise: Smoothing when the floor estimate rises (slow, ~3s to track line noise)
+            floor_fall: Smoothing when the floor estimate falls (fast, pauses between words)
+        """
+        self.context_size = context_size
+        self.margin = margin
+        self.hangover_windows = hangover_windows
+        self.zcr_threshold = zcr_threshold
+        self.min_threshold = min_threshold
+        self.max_threshold = max_threshold
+        self.floor_rise = floor_rise
+        self.floor_fall = floor_fall
+        self.noise_floor = initial_floor
+
+        self._hangover = hangover_windows  # Start open: the model sees the first windows
+        self._preroll: np.ndarray | None = None  # Copy of the last skipped row
+        self._preroll_valid = False
+
+        # Stats
+        self.inferred = 0
+        self.skipped = 0
+
+    @property
+    def threshold(self) -> float:
+        return min(max(self.noise_floor * self.margin, self.min_threshold), self.max_threshold)
+
+    def hold(self):
+        """The model heard speech: keep the gate open for a full hangover."""
+        self._hangover = self.hangover_windows
+
+    def plan(self, frames: np.ndarray) -> tuple[list[np.ndarray], list[int | None]]:
+        """
+        Decide which framed windows need inference.
+
+        Returns:
+            rows: Framed rows to infer, in order
+            targets: Window index of each row, or None for a warm-up row whose
+                result is discarded
+        """
+        windows = frames[:, self.context_size:]
+        levels = AudioProcessor.rms_frames(windows)
+        crossings = AudioProcessor.zero_crossing_rate(windows)
+
+        rows: list[np.ndarray] = []
+        targets: list[int | None] = []
+        for index in range(len(frames)):
+            level = levels[index]
+            loud = level >= self.threshold or (
+                crossings[index] >= self.zcr_threshold and level >= self.noise_floor * 1.41
+            )
+            self._adapt_floor(level)
+            if loud:
+                self._hangover = self.hangover_windows
+            elif self._hangover > 0:
+                self._hangover -= 1
+            else:
+                self.skipped += 1
+                self._preroll_valid = True
+                continue
+
+            if index > 0 and self._preroll_valid:
+                rows.append(frames[index - 1])
+                targets.append(None)
+            elif self._preroll_valid:
+                rows.append(self._preroll)
+                targets.append(None)
+            self._preroll_valid = False
+            rows.append(frames[index])
+            targets.append(index)
+
+        self.inferred += len(rows)
+        if self._preroll_valid:
+            # Gate closed at the end of this batch: keep the last row for warm-up
+            if self._preroll is None:
+                self._preroll = np.empty(frames.shape[1], dtype=np.float32)
+            self._preroll[:] = frames[-1]
+        return rows, targets
+
+    def _adapt_floor(self, level: float):
+        """Minimum-tracking floor: falls fast in pauses, rises slowly on steady noise."""
+        rate = self.floor_fall if level < self.noise_floor else self.floor_rise
+        self.noise_floor += (level - self.noise_floor) * rate
+
+    def stats(self) -> dict:
+        total = self.inferred + self.skipped
+        return {
+            "inferred": self.inferred,
+            "skipped": self.skipped,
+            "skip_ratio": round(self.skipped / total, 3) if total else 0.0,
+            "noise_floor": round(float(self.noise_floor), 6),
+            "threshold": round(float(self.threshold), 6),
+        }
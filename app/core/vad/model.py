@@ -55,7 +55,7 @@ class SileroOnnxModel:
 
     def reset_states(self, batch_size=1):
         self._state = np.zeros((2, batch_size, 128), dtype="float32")
-        self._context = np.zeros((batch_size, 0), dtype="float32")
+        self._input = None  # Reused (batch, context + window) input; context kept in place
         self._last_sr = 0
         self._last_batch_size = 0
 
@@ -84,10 +84,13 @@ class SileroOnnxModel:
         if (self._last_batch_size) and (self._last_batch_size != batch_size):
             self.reset_states(batch_size)
 
-        if not np.shape(self._context)[1]:
-            self._context = np.zeros((batch_size, context_size), dtype="float32")
+        if self._input is None:
+            self._input = np.zeros((batch_size, context_size + num_samples), dtype="float32")
 
-        x = np.concatenate((self._context, x), axis=1)
+        # Previous window's tail becomes the context, then the new window follows
+        self._input[:, :context_size] = self._input[:, -context_size:]
+        self._input[:, context_size:] = x
+        x = self._input
 
         if sr in [8000, 16000]:
             ort_inputs = {"input": x, "state": self._state, "sr": np.array(sr, dtype="int64")}
@@ -97,7 +100,6 @@ class SileroOnnxModel:
         else:
             raise ValueError("Unsupported sample rate")
 
-        self._context = x[..., -context_size:]
         self._last_sr = sr
         self._last_batch_size = batch_size
 
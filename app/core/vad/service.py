@@ -0,0 +1,226 @@
+"""
+Shared Silero VAD inference service.
+
+One ONNX session per process instead of one per call. Each call owns a
+VADStream (its recurrent state and audio context); windows submitted by all
+active calls are batched into a single inference that runs in a dedicated
+worker thread, so the event loop never blocks on the model.
+
+Batching is adaptive: a batch is dispatched as soon as the worker is idle,
+and everything submitted while an inference is running joins the next one.
+Results are identical to running SileroOnnxModel per call.
+"""
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from app.core.vad.model import SileroOnnxModel
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_PATH = Path(__file__).parent / "data" / "silero_vad.onnx"
+
+# Silero V5 window / context sizes per sample rate
+WINDOW_SAMPLES = {8000: 256, 16000: 512}
+CONTEXT_SAMPLES = {8000: 32, 16000: 64}
+
+
+class VADStream:
+    """
+    Per-call recurrent state for the shared model.
+    Mirrors SileroOnnxModel's state handling for a batch of one.
+    """
+    __slots__ = ("context", "sample_rate", "service", "state")
+
+    def __init__(self, service: "VADInferenceService"):
+        self.service = service
+        self.reset_states()
+
+    def reset_states(self):
+        self.state = np.zeros((2, 128), dtype="float32")
+        self.context: np.ndarray | None = None
+        self.sample_rate = 0
+
+    async def infer(self, x: np.ndarray, sr: int) -> float:
+        """Voice confidence for one float32 window (256 samples @ 8kHz, 512 @ 16kHz)."""
+        return await self.service.infer(self, x, sr)
+
+    async def infer_frames(self, frames: np.ndarray | list[np.ndarray], sr: int) -> list[float]:
+        """
+        Confidences for consecutive windows that already carry their context,
+        as rows of (context + window) samples (see VADWindowBuffer). Rows are
+        only read until the call returns, so they may be views.
+        """
+        return list(await asyncio.gather(*(self.service.infer(self, row, sr, framed=True) for row in frames)))
+
+
+class VADInferenceService:
+    """
+    Process-wide batched Silero VAD inference.
+
+    Example:
+        >>> service = get_vad_service()
+        >>> stream = service.create_stream()
+        >>> confidence = await stream.infer(window, 8000)
+    """
+
+    def __init__(self, model_path: str | Path = DEFAULT_MODEL_PATH, max_batch_size: int = 512):
+        """
+        Args:
+            model_path: Silero ONNX model
+            max_batch_size: Maximum windows per inference
+        """
+        self._model = SileroOnnxModel(str(model_path))
+        self.max_batch_size = max_batch_size
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vad-inference")
+        self._pending: list[tuple[VADStream, np.ndarray, int, asyncio.Future]] = []
+        self._worker: asyncio.Task | None = None
+        self._inputs: dict[int, np.ndarray] = {}  # sample rate -> reusable batch input
+
+        # Stats
+        self.batches = 0
+        self.windows = 0
+        self.max_batch_seen = 0
+
+    def create_stream(self) -> VADStream:
+        return VADStream(self)
+
+    async def infer(self, stream: VADStream, x: np.ndarray, sr: int, framed: bool = False) -> float:
+        """
+        Queue one window for the next batch and wait for its confidence.
+
+        Args:
+            framed: `x` already starts with the context samples (no copy is made)
+        """
+        if sr not in WINDOW_SAMPLES:
+            raise ValueError(f"Supported sampling rates: {list(WINDOW_SAMPLES)}")
+        if x.dtype != np.float32:
+            x = x.astype(np.float32)
+        context_size = CONTEXT_SAMPLES[sr]
+        expected = WINDOW_SAMPLES[sr] + (context_size if framed else 0)
+        if np.shape(x)[-1] != expected or np.ndim(x) != 1:
+            raise ValueError(
+                f"Provided number of samples is {np.shape(x)[-1]} (Required: 256 for 8khz, 512 for 16khz)"
+            )
+
+        if stream.sample_rate != sr:
+            stream.reset_states()
+            stream.sample_rate = sr
+
+        if not framed:
+            # Context is input audio, so it can be attached at submission time
+            if stream.context is None:
+                stream.context = np.zeros(context_size, dtype="float32")
+            x = np.concatenate((stream.context, x))
+            stream.context = x[-context_size:]
+
+        loop = asyncio.get_running_loop()
+        if self._worker is not None and not self._worker.done() and self._worker.get_loop() is not loop:
+            # Previous loop is gone (tests, reload): its drain task will never run again
+            self._abandon_pending(loop)
+            self._worker = None
+
+        future = loop.create_future()
+        self._pending.append((stream, x, sr, future))
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._drain())
+        return await future
+
+    def _abandon_pending(self, loop: asyncio.AbstractEventLoop):
+        """Drop windows queued from another loop (failing them if that loop still runs)."""
+        error = RuntimeError("VAD inference worker moved to another event loop")
+        for *_, future in self._pending:
+            owner = future.get_loop()
+            if owner is not loop and not future.done() and not owner.is_closed():
+                owner.call_soon_threadsafe(lambda f=future: f.done() or f.set_exception(error))
+        self._pending = [request for request in self._pending if request[3].get_loop() is loop]
+
+    async def _drain(self):
+        """Dispatch pending windows in batches until none are left."""
+        loop = asyncio.get_running_loop()
+        await asyncio.sleep(0)  # Let windows submitted in the same tick join the batch
+
+        while self._pending:
+            batch, deferred, seen = [], [], set()
+            for request in self._pending:
+                stream = request[0]
+                # One window per stream per batch: later windows need the updated state
+                if id(stream) in seen or len(batch) >= self.max_batch_size:
+                    deferred.append(request)
+                else:
+                    seen.add(id(stream))
+                    batch.append(request)
+            self._pending = deferred
+
+            try:
+                results = await loop.run_in_executor(self._executor, self._run_batch, batch)
+            except Exception as e:
+                logger.error(f"VAD batch inference error: {e}")
+                for *_, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (*_, future), confidence in zip(batch, results, strict=True):
+                if not future.done():
+                    future.set_result(confidence)
+
+    def _run_batch(self, batch: list[tuple[VADStream, np.ndarray, int, asyncio.Future]]) -> list[float]:
+        """Run one inference per sample rate over the batch (worker thread)."""
+        results = [0.0] * len(batch)
+        by_rate: dict[int, list[int]] = {}
+        for index, (_, _, sr, _) in enumerate(batch):
+            by_rate.setdefault(sr, []).append(index)
+
+        for sr, indexes in by_rate.items():
+            x = self._batch_input(sr, len(indexes))
+            for row, index in enumerate(indexes):
+                x[row] = batch[index][1]
+
+            streams = [batch[i][0] for i in indexes]
+            state = np.stack([s.state for s in streams], axis=1)
+            out, state = self._model.session.run(
+                None, {"input": x, "state": state, "sr": np.array(sr, dtype="int64")}
+            )
+
+            for row, (index, stream) in enumerate(zip(indexes, streams, strict=True)):
+                stream.state = state[:, row, :].copy()
+                results[index] = float(out[row][0])
+
+        self.batches += 1
+        self.windows += len(batch)
+        self.max_batch_seen = max(self.max_batch_seen, len(batch))
+        return results
+
+    def _batch_input(self, sr: int, rows: int) -> np.ndarray:
+        """Reusable (rows, context + window) input array for one sample rate."""
+        buffer = self._inputs.get(sr)
+        if buffer is None or buffer.shape[0] < rows:
+            buffer = np.zeros((max(rows, 16), CONTEXT_SAMPLES[sr] + WINDOW_SAMPLES[sr]), dtype="float32")
+            self._inputs[sr] = buffer
+        return buffer[:rows]
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "windows": self.windows,
+            "avg_batch": round(self.windows / self.batches, 2) if self.batches else 0.0,
+            "max_batch": self.max_batch_seen,
+        }
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+
+_service: VADInferenceService | None = None
+
+
+def get_vad_service(model_path: str | Path = DEFAULT_MODEL_PATH) -> VADInferenceService:
+    """Get or create the process-wide VAD inference service (Singleton)."""
+    global _service  # noqa: PLW0603 - One shared model per process
+    if _service is None:
+        _service = VADInferenceService(model_path)
+    return _service
@@ -0,0 +1,102 @@
+"""
+Preallocated VAD window buffer.
+
+Incoming 16-bit PCM is converted once into a fixed float32 array. Pending
+windows are exposed as zero-copy views of shape (n, context + window): each
+row starts with the context samples Silero expects (the tail of the previous
+window), which already sit right before the window in memory.
+"""
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+
+class VADWindowBuffer:
+    """
+    Ring buffer of normalized samples with context-prefixed window views.
+
+    The buffer wraps by moving the (small) unread tail plus context back to
+    the start, so windows are always contiguous and viewable without copies.
+
+    Example:
+        >>> buffer = VADWindowBuffer(window_size=256, context_size=32)
+        >>> buffer.write(pcm_bytes)
+        >>> frames = buffer.pending()   # (n, 288) view
+        >>> buffer.consume(len(frames))
+    """
+
+    def __init__(self, window_size: int, context_size: int, capacity_windows: int = 32):
+        """
+        Args:
+            window_size: Samples per window (256 @ 8kHz, 512 @ 16kHz)
+            context_size: Samples of the previous window prepended to each row
+            capacity_windows: Pending windows held before wrapping (grows if exceeded)
+        """
+        self.window_size = window_size
+        self.context_size = context_size
+        self._buffer = np.zeros(context_size + window_size * capacity_windows, dtype=np.float32)
+        self._carry = b""  # Odd trailing byte of a chunk split mid-sample
+        self.reset()
+
+    def reset(self):
+        """Drop pending audio and zero the context."""
+        self._buffer[:self.context_size] = 0.0
+        self._read = self.context_size
+        self._write = self.context_size
+        self._carry = b""
+
+    def __len__(self) -> int:
+        """Buffered samples not yet consumed."""
+        return self._write - self._read
+
+    def write(self, pcm: bytes) -> None:
+        """Append 16-bit little-endian PCM, normalized to [-1, 1)."""
+        if self._carry:
+            pcm = self._carry + pcm
+            self._carry = b""
+        if len(pcm) % 2:
+            self._carry = pcm[-1:]
+            pcm = pcm[:-1]
+
+        samples = np.frombuffer(pcm, dtype=np.int16)
+        count = len(samples)
+        if not count:
+            return
+
+        if self._write + count > len(self._buffer):
+            self._wrap(count)
+
+        target = self._buffer[self._write:self._write + count]
+        np.multiply(samples, _INT16_SCALE, out=target, casting="unsafe")
+        self._write += count
+
+    def pending(self) -> np.ndarray:
+        """Complete windows not yet consumed, as (n, context + window) views."""
+        count = (self._write - self._read) // self.window_size
+        start = self._read - self.context_size
+        stride = self._buffer.strides[0]
+        return as_strided(
+            self._buffer[start:],
+            shape=(count, self.context_size + self.window_size),
+            strides=(self.window_size * stride, stride),
+            writeable=False,
+        )
+
+    def consume(self, windows: int) -> None:
+        """Mark `windows` complete windows as processed."""
+        self._read += windows * self.window_size
+
+    def _wrap(self, incoming: int) -> None:
+        """Move context + unread samples to the front (grow if they do not fit)."""
+        keep_from = self._read - self.context_size
+        kept = self._write - keep_from
+        required = kept + incoming
+        if required > len(self._buffer):
+            grown = np.zeros(max(required, len(self._buffer) * 2), dtype=np.float32)
+            grown[:kept] = self._buffer[keep_from:self._write]
+            self._buffer = grown
+        else:
+            self._buffer[:kept] = self._buffer[keep_from:self._write]
+        self._read = self.context_size
+        self._write = kept
@@ -26,3 +26,14 @@ class AudioTransport(ABC):
     async def close(self) -> None:
         """Close connectivity."""
         pass
+
+    async def send_mark(self, name: str) -> None:
+        """
+        Queue a named mark behind the audio sent so far.
+        The client echoes it back once playback reaches that point.
+        """
+        await self.send_json({"event": "mark", "mark": {"name": name}})
+
+    async def clear_audio(self) -> None:
+        """Discard audio the client has buffered but not yet played (barge-in)."""
+        await self.send_json({"event": "clear"})
@@ -34,6 +34,7 @@ class STTConfig:
     """Configuración para reconocimiento STT (Base + Advanced)."""
     language: str = "es-MX"
     audio_mode: str = "twilio"  # "twilio", "telnyx", "browser"
+    sample_rate: int | None = None  # PCM16 input rate (None = derived from audio_mode)
     initial_silence_ms: int = 5000
     segmentation_silence_ms: int = 1000
 
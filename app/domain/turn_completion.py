@@ -0,0 +1,168 @@
+"""
+Turn Completion Classifier.
+
+Decides whether a user's utterance is finished, locally and in microseconds,
+so ambiguous turns no longer cost an LLM round trip. The score combines:
+
+- Lexical cues: the punctuation the recognizer put at the end, whether the
+  last word leaves the sentence hanging (conjunctions, prepositions,
+  articles, possessives), trailing fillers ("eh", "este", "um") and short
+  closed answers ("sí", "gracias", "ok").
+- Prosody: how long the caller has been silent so far, from the VAD.
+
+The lexical part only depends on the text and is cached per normalized
+utterance (interim and final results repeat the same text many times).
+Spanish and English vocabularies are built in.
+"""
+import math
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+
+# Words after which a sentence is not finished
+CONTINUATION_WORDS = frozenset({
+    # Spanish
+    "y", "e", "o", "u", "ni", "pero", "sino", "aunque", "que", "porque", "pues", "entonces",
+    "si", "cuando", "como", "donde", "mientras", "cual", "quien", "cuyo",
+    "de", "del", "a", "al", "en", "con", "por", "para", "sin", "sobre", "entre", "hasta", "desde", "hacia",
+    "el", "la", "los", "las", "un", "una", "unos", "unas", "lo",
+    "mi", "mis", "tu", "tus", "su", "sus", "nuestro", "nuestra", "me", "te", "se", "le", "les", "nos",
+    "muy", "tan",
+    # English
+    "and", "or", "but", "because", "if", "when", "while", "which", "who", "than",
+    "the", "an", "to", "of", "with", "for", "in", "on", "at", "from", "about", "into",
+    "my", "your", "his", "our", "their",
+})
+
+# Hesitations: the caller is still thinking
+FILLER_WORDS = frozenset({"eh", "em", "emm", "ehm", "mm", "mmm", "este", "esteee", "um", "uh", "uhm", "hmm", "like"})
+
+# Short answers that are complete on their own
+CLOSED_ANSWERS = frozenset({
+    "sí", "no", "vale", "ok", "okay", "claro", "gracias", "hola", "adiós", "perfecto", "exacto",
+    "correcto", "listo", "bueno", "dale", "órale", "ándale", "ya", "nada", "eso",
+    "yes", "yeah", "yep", "nope", "sure", "thanks", "bye", "hello", "hi", "right", "fine", "done",
+})
+
+_WORD = re.compile(r"[\w']+")
+
+# Logit weights (tuned on the training set in scripts/eval_turn_completion.py)
+_BIAS = 0.4
+_TERMINAL_PUNCTUATION = 2.2
+_HANGING_PUNCTUATION = -2.6
+_CONTINUATION_WORD = -3.2
+_FILLER_WORD = -2.4
+_CLOSED_ANSWER = 2.0
+_SINGLE_WORD = -0.6
+_SILENCE_PIVOT_MS = 900.0  # Silence at which prosody is neutral
+_SILENCE_SCALE_MS = 500.0
+_SILENCE_MAX = 1.5
+
+
+def normalize_utterance(text: str) -> str:
+    """Cache key: case-folded, single-spaced (punctuation and accents are meaningful)."""
+    return " ".join(text.casefold().split())
+
+
+@dataclass(frozen=True, slots=True)
+class TurnCompletion:
+    """Classifier verdict for one utterance."""
+    complete: bool
+    probability: float
+
+
+class TurnCompletionClassifier:
+    """
+    Lexical + prosodic end-of-turn scorer (CPU only, no I/O).
+
+    Example:
+        >>> classifier = TurnCompletionClassifier()
+        >>> classifier.predict("quiero agendar una cita para el").complete
+        False
+        >>> classifier.predict("quiero agendar una cita.", silence_ms=1100).complete
+        True
+    """
+
+    def __init__(self, threshold: float = 0.5, cache_size: int = 2048):
+        """
+        Args:
+            threshold: Probability at or above which the turn is complete
+            cache_size: Lexical scores kept (LRU, keyed by normalized text)
+        """
+        self.threshold = threshold
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, float] = OrderedDict()
+
+        # Stats
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def predict(self, text: str, silence_ms: float | None = None) -> TurnCompletion:
+        """
+        Args:
+            text: Utterance so far (STT final results joined)
+            silence_ms: Caller silence since the last speech, if known
+        """
+        logit = self._lexical_logit(normalize_utterance(text))
+        if silence_ms is not None:
+            prosody = (silence_ms - _SILENCE_PIVOT_MS) / _SILENCE_SCALE_MS
+            logit += max(-_SILENCE_MAX, min(_SILENCE_MAX, prosody))
+        probability = 1.0 / (1.0 + math.exp(-logit))
+        return TurnCompletion(complete=probability >= self.threshold, probability=probability)
+
+    def _lexical_logit(self, key: str) -> float:
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return cached
+
+        self.cache_misses += 1
+        logit = _score(key)
+        self._cache[key] = logit
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return logit
+
+    def stats(self) -> dict:
+        return {
+            "cache_size": len(self._cache),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+        }
+
+
+def _score(utterance: str) -> float:
+    """Lexical logit of a normalized utterance."""
+    words = _WORD.findall(utterance)
+    if not words:
+        return _BIAS
+
+    logit = _BIAS
+    tail = utterance.rstrip()
+    if tail.endswith(("...", "…", ",", ";", ":", "-")):
+        logit += _HANGING_PUNCTUATION
+    elif tail.endswith((".", "?", "!")):
+        logit += _TERMINAL_PUNCTUATION
+
+    last = words[-1]
+    if last in CONTINUATION_WORDS:
+        logit += _CONTINUATION_WORD
+    elif last in FILLER_WORDS:
+        logit += _FILLER_WORD
+    elif len(words) <= 3 and all(word in CLOSED_ANSWERS for word in words):
+        logit += _CLOSED_ANSWER
+    elif len(words) == 1:
+        logit += _SINGLE_WORD
+    return logit
+
+
+_classifier: TurnCompletionClassifier | None = None
+
+
+def get_turn_completion_classifier() -> TurnCompletionClassifier:
+    """Get or create the process-wide classifier (Singleton, shares the cache across calls)."""
+    global _classifier  # noqa: PLW0603 - One classifier per process
+    if _classifier is None:
+        _classifier = TurnCompletionClassifier()
+    return _classifier
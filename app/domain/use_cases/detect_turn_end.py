@@ -2,11 +2,39 @@
 DetectTurnEndUseCase.
 
 Moves timer logic from processor to domain layer (hexagonal architecture).
+Also answers whether an utterance reads as finished (semantic turn end)
+with the local TurnCompletionClassifier.
+
+Adaptive endpointing (optional): the silence threshold follows the caller.
+The VAD reports every pause inside a turn (and pauses we wrongly cut, when
+the caller resumes right after a turn end) and the STT transcripts give the
+speech rate; the threshold tracks the 90th percentile of the caller's
+pauses plus a margin, scaled by speech rate and clamped to configured
+bounds. Fast talkers stop paying for silence sized for slow ones.
 """
 import logging
+import math
+from collections import deque
+
+from app.domain.turn_completion import (
+    TurnCompletion,
+    TurnCompletionClassifier,
+    get_turn_completion_classifier,
+)
 
 logger = logging.getLogger(__name__)
 
+# Adaptive endpointing
+PAUSE_WINDOW = 40           # Most recent pauses kept per caller
+MIN_PAUSES = 5              # Pauses needed before the pause distribution is trusted
+MIN_PAUSE_MS = 100          # Shorter gaps are VAD jitter, not pauses
+PAUSE_QUANTILE = 0.9        # Share of the caller's pauses that must not end the turn
+PAUSE_MARGIN_MS = 100       # Headroom above that quantile
+REFERENCE_WORDS_PER_SECOND = 3.0  # Conversational Spanish/English
+MIN_RATE_SPEECH_MS = 3000   # Voiced time needed before the speech rate is trusted
+RATE_FACTOR_BOUNDS = (0.8, 1.25)
+SMOOTHING = 0.3             # Share of the gap to the target closed per update
+
 
 class DetectTurnEndUseCase:
     """
@@ -20,17 +48,52 @@ class DetectTurnEndUseCase:
         >>> # In VADProcessor
         >>> if use_case.should_end_turn(silence_duration_ms):
         ...     await self.push_frame(EndOfSpeechFrame())
+        >>>
+        >>> # Adaptive: feed observations, the threshold follows the caller
+        >>> use_case.observe_pause(240)          # VAD: speech resumed after 240ms
+        >>> use_case.observe_resumption(700)     # VAD: caller resumed after a turn end
+        >>> use_case.observe_speech(1800, words=6)
     """
 
-    def __init__(self, silence_threshold_ms: int = 500):
+    def __init__(
+        self,
+        silence_threshold_ms: int = 500,
+        completion_classifier: TurnCompletionClassifier | None = None,
+        adaptive: bool = False,
+        min_silence_ms: int = 250,
+        max_silence_ms: int = 1200
+    ):
         """
         Initialize turn end detection.
 
         Args:
             silence_threshold_ms: Milliseconds of silence before ending turn
+            completion_classifier: Semantic scorer (default: process-wide classifier)
+            adaptive: Learn the threshold from the caller's pauses and speech rate
+            min_silence_ms: Lowest adaptive threshold
+            max_silence_ms: Highest adaptive threshold (longer pauses start a new turn)
         """
         self.silence_threshold_ms = silence_threshold_ms
-        logger.info(f"[DetectTurnEnd] Initialized with {silence_threshold_ms}ms threshold")
+        self.base_threshold_ms = silence_threshold_ms
+        self.completion_classifier = completion_classifier or get_turn_completion_classifier()
+
+        # Adaptive endpointing
+        self.adaptive = adaptive
+        self.min_silence_ms = min(min_silence_ms, silence_threshold_ms)
+        self.max_silence_ms = max(max_silence_ms, silence_threshold_ms)
+        self._pauses: deque[float] = deque(maxlen=PAUSE_WINDOW)
+        self._speech_ms = 0.0
+        self._words = 0
+
+        # Stats
+        self.pauses_observed = 0
+        self.false_cutoffs = 0
+        self.adjustments = 0
+
+        logger.info(
+            f"[DetectTurnEnd] Initialized with {silence_threshold_ms}ms threshold"
+            + (f" (adaptive {self.min_silence_ms}-{self.max_silence_ms}ms)" if adaptive else "")
+        )
 
     def should_end_turn(self, silence_duration_ms: int) -> bool:
         """
@@ -52,6 +115,93 @@ class DetectTurnEndUseCase:
 
         return should_end
 
+    def check_completion(self, text: str, silence_ms: float | None = None) -> TurnCompletion:
+        """
+        Determine if an utterance is semantically complete (local, sub-millisecond).
+
+        Args:
+            text: User utterance so far
+            silence_ms: Caller silence so far, if known
+
+        Returns:
+            TurnCompletion with the verdict and its probability
+        """
+        result = self.completion_classifier.predict(text, silence_ms=silence_ms)
+        logger.debug(f"[DetectTurnEnd] Completion p={result.probability:.2f} for '{text[-40:]}'")
+        return result
+
+    def scale(self, seconds: float) -> float:
+        """Scale a configured wait (e.g. the aggregator's turn timers) by the caller's threshold."""
+        return seconds * self.silence_threshold_ms / self.base_threshold_ms if self.base_threshold_ms else seconds
+
+    # -------------------------------------------------------------------------
+    # Adaptive endpointing
+    # -------------------------------------------------------------------------
+
+    def observe_pause(self, pause_ms: float):
+        """A pause inside the turn: speech resumed before the threshold."""
+        if pause_ms < MIN_PAUSE_MS:
+            return
+        self.pauses_observed += 1
+        if self.adaptive:
+            self._pauses.append(pause_ms)
+            self._adapt()
+
+    def observe_resumption(self, pause_ms: float):
+        """
+        The caller resumed speaking `pause_ms` after the last speech, although the turn had ended.
+
+        Pauses up to max_silence_ms count as turns we cut off too early;
+        longer ones are a new turn.
+        """
+        if pause_ms > self.max_silence_ms:
+            return
+        self.false_cutoffs += 1
+        self.observe_pause(pause_ms)
+
+    def observe_speech(self, speech_ms: float, words: int = 0):
+        """Voiced time (VAD) and/or words recognized (STT) for the speech-rate estimate."""
+        self._speech_ms += max(0.0, speech_ms)
+        self._words += words
+        if words and self.adaptive:
+            self._adapt()
+
+    @property
+    def speech_rate(self) -> float | None:
+        """Caller's words per second of voiced time (None until enough speech)."""
+        if self._speech_ms < MIN_RATE_SPEECH_MS or not self._words:
+            return None
+        return self._words / (self._speech_ms / 1000)
+
+    def _adapt(self):
+        target = float(self.base_threshold_ms)
+        if len(self._pauses) >= MIN_PAUSES:
+            pauses = sorted(self._pauses)
+            target = pauses[min(len(pauses) - 1, int(PAUSE_QUANTILE * len(pauses)))] + PAUSE_MARGIN_MS
+
+        rate = self.speech_rate
+        if rate:
+            low, high = RATE_FACTOR_BOUNDS
+            target *= max(low, min(high, REFERENCE_WORDS_PER_SECOND / rate))
+
+        target = max(self.min_silence_ms, min(self.max_silence_ms, target))
+        step = SMOOTHING * (target - self.silence_threshold_ms)
+        threshold = self.silence_threshold_ms + (math.ceil(step) if step > 0 else math.floor(step))  # Converges
+        if threshold != self.silence_threshold_ms:
+            logger.debug(f"[DetectTurnEnd] Adaptive threshold {self.silence_threshold_ms}ms → {threshold}ms")
+            self.silence_threshold_ms = threshold
+            self.adjustments += 1
+
+    def stats(self) -> dict:
+        return {
+            "silence_threshold_ms": self.silence_threshold_ms,
+            "base_threshold_ms": self.base_threshold_ms,
+            "pauses_observed": self.pauses_observed,
+            "false_cutoffs": self.false_cutoffs,
+            "speech_rate": self.speech_rate,
+            "adjustments": self.adjustments,
+        }
+
     def update_threshold(self, new_threshold_ms: int):
         """
         Update silence threshold dynamically.
@@ -61,6 +211,7 @@ class DetectTurnEndUseCase:
         """
         old_threshold = self.silence_threshold_ms
         self.silence_threshold_ms = new_threshold_ms
+        self.base_threshold_ms = new_threshold_ms
 
         logger.info(
             f"[DetectTurnEnd] Threshold updated: {old_threshold}ms → {new_threshold_ms}ms"
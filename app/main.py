@@ -1,3 +1,4 @@
+import asyncio
 import subprocess
 import time
 from contextlib import asynccontextmanager
@@ -12,6 +13,7 @@ from slowapi.util import get_remote_address
 from starlette.middleware.sessions import SessionMiddleware
 
 from app.api import routes_v2
+from app.core.audio.asset_bank import get_audio_asset_bank
 from app.core.config import settings
 from app.core.http_client import http_client
 from app.core.logging_config import configure_logging
@@ -84,6 +86,14 @@ async def lifespan(app: FastAPI):
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+    # 6. Pre-render static audio (background loops, silence) into every wire format and level
+    try:
+        loop = asyncio.get_running_loop()
+        gains = (1.0, settings.BACKGROUND_AUDIO_GAIN)
+        await loop.run_in_executor(None, lambda: get_audio_asset_bank().preload(gains))
+    except Exception as e:
+        logger.error(f"Audio asset preload failed: {e}")
+
     logger.info("✅ Application startup complete")
 
     yield  # App is running
@@ -0,0 +1,106 @@
+import logging
+
+import numpy as np
+
+from app.core.audio import g711
+from app.core.audio.resampler import PolyphaseResampler
+from app.core.frames import AudioFrame, Frame
+from app.core.processor import FrameDirection, FrameProcessor
+
+logger = logging.getLogger(__name__)
+
+PCM16 = "PCM16"
+
+# Media format names seen on the wire -> canonical encoding
+_ENCODING_ALIASES = {
+    "PCMU": "PCMU",
+    "ULAW": "PCMU",
+    "MULAW": "PCMU",
+    "AUDIO/X-MULAW": "PCMU",
+    "PCMA": "PCMA",
+    "ALAW": "PCMA",
+    "AUDIO/X-ALAW": "PCMA",
+    "PCM16": PCM16,
+    "L16": PCM16,
+    "LINEAR16": PCM16,
+    "AUDIO/PCM": PCM16,
+}
+
+_DECODERS = {
+    "PCMU": g711.ulaw_decode,
+    "PCMA": g711.alaw_decode,
+}
+
+
+def normalize_encoding(encoding: str | None) -> str | None:
+    """Canonical encoding name ("PCMU", "PCMA", "PCM16") or None if unknown."""
+    return _ENCODING_ALIASES.get((encoding or "").strip().upper())
+
+
+class AudioIngressProcessor(FrameProcessor):
+    """
+    Transport-edge decode stage for caller audio.
+
+    Turns each inbound chunk (G.711 mu-law / A-law or linear PCM16 at any
+    rate) into PCM16 mono at one canonical rate, so VAD and STT downstream
+    share a single format instead of each guessing. G.711 is decoded once
+    per chunk into a reusable buffer and resampled by a stateful polyphase
+    filter; the frame is rewritten in place (same id, trace and timestamp).
+    """
+    consumed_frames = (AudioFrame,)
+    consumed_directions = (FrameDirection.DOWNSTREAM,)
+
+    def __init__(self, output_rate: int = 16000, default_encoding: str = "PCMU"):
+        """
+        Args:
+            output_rate: Canonical PCM16 rate for downstream processors
+            default_encoding: Encoding of frames that carry no 'encoding' metadata
+        """
+        super().__init__(name="AudioIngressProcessor")
+        self.output_rate = output_rate
+        self.default_encoding = normalize_encoding(default_encoding) or PCM16
+
+        self._decoded = np.empty(0, dtype=np.int16)
+        self._resampler: PolyphaseResampler | None = None
+        self._unknown_encodings: set[str] = set()
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        if (
+            direction == FrameDirection.DOWNSTREAM
+            and isinstance(frame, AudioFrame)
+            and frame.metadata.get('source') == 'user_input'
+            and frame.data
+        ):
+            self._ingest(frame)
+        await self.push_frame(frame, direction)
+
+    def _ingest(self, frame: AudioFrame):
+        """Decode and resample one chunk in place."""
+        raw_encoding = frame.metadata.get('encoding')
+        encoding = normalize_encoding(raw_encoding) if raw_encoding else self.default_encoding
+        if encoding is None:
+            if raw_encoding not in self._unknown_encodings:
+                self._unknown_encodings.add(raw_encoding)
+                logger.warning(f"⚠️ [Ingress] Unknown encoding '{raw_encoding}', treating as PCM16")
+            encoding = PCM16
+
+        decoder = _DECODERS.get(encoding)
+        if decoder is not None:
+            count = len(frame.data)
+            if len(self._decoded) < count:
+                self._decoded = np.empty(count, dtype=np.int16)
+            samples = decoder(frame.data, out=self._decoded[:count])
+        else:
+            if frame.sample_rate == self.output_rate:
+                frame.metadata['encoding'] = PCM16
+                return  # Already canonical: zero work
+            samples = np.frombuffer(frame.data, dtype=np.int16, count=len(frame.data) // 2)
+
+        resampler = self._resampler
+        if resampler is None or resampler.in_rate != frame.sample_rate:
+            resampler = self._resampler = PolyphaseResampler(frame.sample_rate, self.output_rate)
+            logger.info(f"🎧 [Ingress] {encoding} @ {frame.sample_rate}Hz -> PCM16 @ {self.output_rate}Hz")
+
+        frame.data = resampler.process(samples).tobytes()
+        frame.sample_rate = self.output_rate
+        frame.metadata['encoding'] = PCM16
@@ -10,6 +10,7 @@ from app.core.frames import (
     UserStoppedSpeakingFrame,
 )
 from app.core.processor import FrameDirection, FrameProcessor
+from app.domain.use_cases import DetectTurnEndUseCase
 
 logger = logging.getLogger(__name__)
 
@@ -19,14 +20,30 @@ class ContextAggregator(FrameProcessor):
     Aggregates User Transcripts into coherent Turns.
     Manages Conversation History.
     Triggers LLM only when "Turn" is complete (Smart Silence).
+
+    With speculative generation enabled, the turn text is also sent (marked
+    speculative) as soon as the turn timer starts, so the LLM works through
+    the silence we wait out; the commit then confirms it.
     """
-    def __init__(self, config: Any, conversation_history: list[dict], llm_provider: Any = None):
+    consumed_frames = (UserStartedSpeakingFrame, UserStoppedSpeakingFrame, TextFrame)
+    consumed_directions = (FrameDirection.DOWNSTREAM,)
+
+    def __init__(
+        self,
+        config: Any,
+        conversation_history: list[dict],
+        detect_turn_end: DetectTurnEndUseCase | None = None,
+        speculative: bool = False
+    ):
         super().__init__(name="ContextAggregator")
         self.config = config
         # NOTE: conversation_history is a shared mutable list reference.
         # It MUST be modified in-place to maintain sync with Orchestrator.
         self.conversation_history = conversation_history
-        self.llm_provider = llm_provider
+        # Semantic completion runs locally (shared with the VAD's turn-end logic)
+        self.detect_turn_end = detect_turn_end or DetectTurnEndUseCase(
+            silence_threshold_ms=getattr(config, 'silence_timeout_ms', 500)
+        )
 
         # State
         self.interim_buffer = ""
@@ -38,6 +55,10 @@ class ContextAggregator(FrameProcessor):
         self.semantic_timeout = 1.2 # Extended wait if incomplete
         self._turn_timer_task = None
 
+        # Speculative generation (LLM starts during the end-of-turn silence)
+        self.speculative = speculative
+        self._speculated_text: str | None = None
+
         # Events
         self.response_required = asyncio.Event()
 
@@ -69,6 +90,7 @@ class ContextAggregator(FrameProcessor):
         if self._turn_timer_task:
             self._turn_timer_task.cancel()
             self._turn_timer_task = None
+        self._speculated_text = None  # The CancelFrame below discards any speculation
 
         # Barge-in: Send cancel signal downstream
         await self.push_frame(CancelFrame(reason="User Barge-In"))
@@ -95,18 +117,23 @@ class ContextAggregator(FrameProcessor):
 
     async def _monitor_turn_completion(self):
         try:
+            # 0. Speculate: the LLM starts now, its output is held until the commit
+            if self.speculative:
+                await self._speculate()
+
             # 1. Wait initial short timeout (e.g. 0.6s)
-            await asyncio.sleep(self.turn_timeout)
+            turn_timeout = self.detect_turn_end.scale(self.turn_timeout)  # Follows the caller's pacing
+            await asyncio.sleep(turn_timeout)
 
             # 2. Semantic Check (if enabled and provider available)
             strategy = getattr(self.config, 'segmentation_strategy', 'default')
 
-            if strategy == 'semantic' and self.llm_provider and len(self.current_turn_text) > 5:
-                is_complete = await self._check_semantic_completion(self.current_turn_text)
+            if strategy == 'semantic' and len(self.current_turn_text) > 5:
+                is_complete = self._check_semantic_completion(self.current_turn_text)
                 if not is_complete:
                     logger.info(f"🤔 [SEMANTIC] Sentence incomplete: '{self.current_turn_text}'. Extending wait.")
                     # Wait additional time (giving user time to think)
-                    await asyncio.sleep(self.semantic_timeout - self.turn_timeout)
+                    await asyncio.sleep(self.detect_turn_end.scale(self.semantic_timeout) - turn_timeout)
 
             # 3. Commit Turn
             await self._commit_turn()
@@ -118,33 +145,21 @@ class ContextAggregator(FrameProcessor):
             # Fallback commit on error to avoid stalling
             await self._commit_turn()
 
-    async def _check_semantic_completion(self, text: str) -> bool:
+    async def _speculate(self):
+        text = self.current_turn_text.strip()
+        if not text or text == self._speculated_text:
+            return
+        self._speculated_text = text
+        await self.push_frame(TextFrame(text=text, is_final=True, metadata={"speculative": True}))
+
+    def _check_semantic_completion(self, text: str) -> bool:
         """
-        Ask LLM if the sentence is complete.
+        Whether the sentence reads as complete (local classifier, no LLM round trip).
         Returns True if complete, False if incomplete.
         """
-        try:
-            system_prompt = (
-                "You are a helpful assistant serving as a semantic detector. "
-                "Analyze the user's speech transcript. "
-                "Output ONLY 'YES' if the sentence is syntactically complete and makes sense as a turn end. "
-                "Output 'NO' if it seems broken, interrupted, or trailing off."
-            )
-
-            response = ""
-            messages = [{"role": "user", "content": f"Text: \"{text}\""}]
-
-            # Use low temperature for determinism
-            async for token in self.llm_provider.get_stream(messages, system_prompt, temperature=0.0, max_tokens=5):
-                response += token
-
-            result = response.strip().upper()
-            return "YES" in result
-
-        except Exception as e:
-            # Fail safe: assume complete to proceed
-            logger.warning(f"⚠️ Semantic check failed: {e}")
-            return True
+        # The caller has been silent for the VAD end-of-speech window plus our initial wait
+        silence_ms = self.detect_turn_end.silence_threshold_ms + self.detect_turn_end.scale(self.turn_timeout) * 1000
+        return self.detect_turn_end.check_completion(text, silence_ms=silence_ms).complete
 
     async def _commit_turn(self):
         text = self.current_turn_text.strip()
@@ -155,6 +170,7 @@ class ContextAggregator(FrameProcessor):
 
         # 1. Update SHARED History (In-Place Mutation)
         self.conversation_history.append({"role": "user", "content": text})
+        self.detect_turn_end.observe_speech(0, words=len(text.split()))  # Speech-rate estimate
 
         # 1.1 Apply Context Window limit
         context_window = getattr(self.config, 'context_window', 10)
@@ -167,6 +183,7 @@ class ContextAggregator(FrameProcessor):
 
         # 2. Reset State
         self.current_turn_text = ""
+        self._speculated_text = None
 
         # 3. Trigger LLM by pushing Final TextFrame
         await self.push_frame(TextFrame(text=text, is_final=True))
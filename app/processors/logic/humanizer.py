@@ -12,6 +12,9 @@ class HumanizerProcessor(FrameProcessor):
     Injects "human" elements like fillers (muletillas) if enabled in config.
     Passes modified TextFrame to TTS.
     """
+    consumed_frames = (TextFrame,)
+    consumed_directions = (FrameDirection.DOWNSTREAM,)
+
     def __init__(self, config):
         super().__init__(name="HumanizerProcessor")
         self.config = config
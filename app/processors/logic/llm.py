@@ -2,12 +2,15 @@ import asyncio
 import logging
 import re
 import uuid
+from dataclasses import dataclass
 from typing import Any
 
 from app.core.audio.hold_audio import HoldAudioPlayer
 from app.core.frames import CancelFrame, EndTaskFrame, Frame, TextFrame
+from app.core.metrics import llm_speculation_total, llm_speculation_wasted_chunks_total
 from app.core.processor import FrameDirection, FrameProcessor
 from app.core.prompt_builder import PromptBuilder
+from app.core.turns import CancellationToken, TurnManager
 from app.domain.models.llm_models import LLMFunctionCall
 from app.domain.models.tool_models import ToolRequest
 from app.domain.ports import LLMMessage, LLMPort, LLMRequest
@@ -15,11 +18,34 @@ from app.domain.use_cases import ExecuteToolUseCase
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass(slots=True)
+class _Speculation:
+    """A generation started before the user's turn was confirmed."""
+    text: str
+    token: CancellationToken
+    chunks: int = 0  # Streamed text chunks (wasted if the turn is not confirmed)
+
+
 class LLMProcessor(FrameProcessor):
     """
     Consumes TextFrames (User Transcripts), sends to LLM via LLMPort, produces TextFrames (Assistant Response).
     Handles function calling, hold audio, and conversation history.
+
+    Each response is a turn generation (see app.core.turns): its frames are
+    stamped with the generation and the generation task (stream and tool
+    calls included) is bound to the turn's cancellation token.
+
+    Speculative generation: a final TextFrame marked metadata["speculative"]
+    (sent by the ContextAggregator as soon as the user stops talking) starts
+    the response while the turn timers are still running. Its sentences are
+    held (only the first one may go to TTS, which holds the audio) and tools
+    are not run until the committed turn confirms the same text; anything
+    else cancels the speculation like a barge-in.
     """
+    consumed_frames = (TextFrame, CancelFrame)
+    consumed_directions = (FrameDirection.DOWNSTREAM,)
+
     def __init__(
         self,
         llm_port: LLMPort,
@@ -28,7 +54,9 @@ class LLMProcessor(FrameProcessor):
         context: dict | None = None,
         execute_tool_use_case: ExecuteToolUseCase | None = None,
         trace_id: str | None = None,
-        hold_audio_player: HoldAudioPlayer | None = None
+        hold_audio_player: HoldAudioPlayer | None = None,
+        turns: TurnManager | None = None,
+        speculative_tts: bool = False
     ):
         super().__init__(name="LLMProcessor")
         self.llm_port = llm_port
@@ -39,22 +67,29 @@ class LLMProcessor(FrameProcessor):
         self.execute_tool = execute_tool_use_case
         self.trace_id = trace_id or str(uuid.uuid4())
         self.hold_audio_player = hold_audio_player
+        self.turns = turns or TurnManager()
         self._current_task: asyncio.Task | None = None
 
+        # Speculation
+        self.speculative_tts = speculative_tts
+        self._speculation: _Speculation | None = None
+        self.speculation_hits = 0
+        self.speculation_misses = 0
+        self.speculation_wasted_chunks = 0
+
     async def process_frame(self, frame: Frame, direction: int):
         if direction == FrameDirection.DOWNSTREAM:
             if isinstance(frame, TextFrame) and frame.is_final:
-                # Implicit interruption: cancel previous generation
-                if self._current_task and not self._current_task.done():
-                    self._current_task.cancel()
-
-                # Start new generation
-                self._current_task = asyncio.create_task(self._handle_user_text(frame.text))
+                if frame.metadata.get('speculative'):
+                    self._start_speculation(frame.text)
+                elif not self._confirm_speculation(frame.text):
+                    # Start new generation (implicitly cancels the previous one)
+                    token = self.turns.begin()
+                    self._current_task = token.bind(asyncio.create_task(self._handle_user_text(frame.text, token)))
 
             elif isinstance(frame, CancelFrame):
                 logger.info("🛑 [LLM] Received CancelFrame. Stopping generation.")
-                if self._current_task and not self._current_task.done():
-                    self._current_task.cancel()
+                self.turns.cancel(frame.reason)
                 await self.push_frame(frame, direction)
 
             else:
@@ -62,7 +97,44 @@ class LLMProcessor(FrameProcessor):
         else:
             await self.push_frame(frame, direction)
 
-    async def _handle_user_text(self, text: str):
+    def _start_speculation(self, text: str):
+        """Generate for a turn that is not confirmed yet (output held)."""
+        token = self.turns.begin(speculative=True)
+        speculation = _Speculation(text=text.strip(), token=token)
+        self._speculation = speculation
+        token.add_callback(lambda: self._on_speculation_cancelled(speculation))
+        self._current_task = token.bind(asyncio.create_task(self._handle_user_text(text, token)))
+        logger.debug(f"🔮 [LLM] trace={self.trace_id} Speculating on: {text[:50]}")
+
+    def _confirm_speculation(self, text: str) -> bool:
+        """Confirm the running speculation if it was made for `text`. Returns False on a miss."""
+        speculation = self._speculation
+        self._speculation = None
+        if (
+            speculation is None
+            or speculation.token is not self.turns.token
+            or speculation.token.cancelled
+            or speculation.text != text.strip()
+            or self._current_task is None
+            or self._current_task.done()
+        ):
+            return False
+
+        speculation.token.confirm()
+        self.speculation_hits += 1
+        llm_speculation_total.labels(outcome="hit").inc()
+        logger.info(f"🔮 [LLM] trace={self.trace_id} Speculation confirmed ({speculation.chunks} chunks ahead)")
+        return True
+
+    def _on_speculation_cancelled(self, speculation: _Speculation):
+        if speculation.token.confirmed:
+            return  # A confirmed turn being interrupted is not a miss
+        self.speculation_misses += 1
+        self.speculation_wasted_chunks += speculation.chunks
+        llm_speculation_total.labels(outcome="miss").inc()
+        llm_speculation_wasted_chunks_total.inc(speculation.chunks)
+
+    async def _handle_user_text(self, text: str, token: CancellationToken):
         """
         Main LLM Loop:
         1. Update history.
@@ -76,11 +148,16 @@ class LLMProcessor(FrameProcessor):
 
 
         # 1. Update History (Deduplicated logic)
-        if not self.conversation_history or self.conversation_history[-1].get("content") != text:
-            self.conversation_history.append({"role": "user", "content": text})
+        # Speculative turns leave history alone: the aggregator commits the turn if it is confirmed
+        if token.speculative:
+            pending_user_text = text
+        else:
+            pending_user_text = None
+            if not self.conversation_history or self.conversation_history[-1].get("content") != text:
+                self.conversation_history.append({"role": "user", "content": text})
 
         try:
-            await self._generate_llm_response()
+            await self._generate_llm_response(token, pending_user_text=pending_user_text)
 
         except asyncio.CancelledError:
             logger.info(f"🛑 [LLM] trace={self.trace_id} Generation cancelled.")
@@ -88,17 +165,31 @@ class LLMProcessor(FrameProcessor):
         except Exception as e:
             logger.error(f"[LLM] trace={self.trace_id} Error: {e}", exc_info=True)
 
-    async def _generate_llm_response(self, tool_result_message: dict | None = None):
+    async def _generate_llm_response(
+        self,
+        token: CancellationToken,
+        tool_result_message: dict | None = None,
+        pending_user_text: str | None = None
+    ):
         """
         Generate LLM response suitable for conversation loop.
+
+        Args:
+            token: Turn the response belongs to
+            tool_result_message: Function call result (continuation)
+            pending_user_text: User turn not yet in history (speculation)
         """
+        history = self.conversation_history
+        if pending_user_text is not None:
+            history = [*history, {"role": "user", "content": pending_user_text}]
+
         # Apply Logic: Context Window
         context_window = getattr(self.config, 'context_window', 10)
 
         if isinstance(context_window, int) and context_window > 0:
-            history_slice = self.conversation_history[-context_window:]
+            history_slice = history[-context_window:]
         else:
-            history_slice = self.conversation_history
+            history_slice = history
 
         # Build messages
         messages = [LLMMessage(role=msg["role"], content=msg["content"])
@@ -136,6 +227,9 @@ class LLMProcessor(FrameProcessor):
         full_response_buffer = ""
         sentence_buffer = ""
         should_end_call = False
+        held: list[TextFrame] = []  # Sentences of an unconfirmed speculative turn
+        sentences = 0
+        speculation = self._speculation if self._speculation and self._speculation.token is token else None
 
         async for chunk in self.llm_port.generate_stream(request):
             # Case A: Function Call
@@ -145,7 +239,12 @@ class LLMProcessor(FrameProcessor):
                     f"{chunk.function_call.name}({list(chunk.function_call.arguments.keys())})"
                 )
 
+                # Tools have side effects: never run them for an unconfirmed turn
+                await self._release(token, held)
+
                 tool_response = await self._execute_tool(chunk.function_call)
+                if token.cancelled:
+                    return  # Barge-in during the tool call: no follow-up generation
 
                 self.conversation_history.append({
                     "role": "assistant",
@@ -160,6 +259,7 @@ class LLMProcessor(FrameProcessor):
 
                 # Recursive Loop
                 await self._generate_llm_response(
+                    token,
                     tool_result_message={
                         "role": "function",
                         "content": tool_result_content
@@ -171,6 +271,8 @@ class LLMProcessor(FrameProcessor):
             if chunk.has_text:
                 token_text = chunk.text
                 full_response_buffer += token_text
+                if speculation is not None:
+                    speculation.chunks += 1
 
                 # [TRACING] Log Token Stream
                 # logger.debug(f"💭 [LLM_STREAM] Token: '{token_text}'")  # Commented out to reduce noise, enable for deep debug
@@ -186,12 +288,25 @@ class LLMProcessor(FrameProcessor):
                 # Smart heuristic for sentence splitting (Punctuation + Space or End of Line)
                 # Adds logical pause for TTS
                 if len(sentence_buffer) > 10 and re.search(r'[.?!]\s+$', sentence_buffer):
-                    await self.push_frame(TextFrame(text=sentence_buffer, trace_id=self.trace_id))
+                    await self._emit(
+                        TextFrame(text=sentence_buffer, trace_id=self.trace_id, generation=token.generation),
+                        token, held, early=self.speculative_tts and sentences == 0
+                    )
+                    sentences += 1
                     sentence_buffer = ""
 
+        if token.cancelled:
+            return
+
         # Flush remaining text
         if sentence_buffer.strip():
-            await self.push_frame(TextFrame(text=sentence_buffer, trace_id=self.trace_id))
+            await self._emit(
+                TextFrame(text=sentence_buffer, trace_id=self.trace_id, generation=token.generation),
+                token, held, early=self.speculative_tts and sentences == 0
+            )
+
+        # Speculative turn: hold here until the user's turn is confirmed (or cancelled)
+        await self._release(token, held)
 
         # Update History
         if full_response_buffer.strip():
@@ -204,7 +319,29 @@ class LLMProcessor(FrameProcessor):
         if should_end_call:
             logger.info("📞 [LLM] Detected [END_CALL] signal. Initiating hangup.")
             # Send SystemFrame to trigger architecture shutdown flow
-            await self.push_frame(EndTaskFrame(), FrameDirection.DOWNSTREAM)
+            await self.push_frame(EndTaskFrame(generation=token.generation), FrameDirection.DOWNSTREAM)
+
+    async def _emit(self, frame: TextFrame, token: CancellationToken, held: list[TextFrame], early: bool = False):
+        """
+        Push a response sentence, or hold it while its speculative turn is unconfirmed.
+
+        Args:
+            early: Release it anyway (first sentence: TTS synthesizes it and holds the audio)
+        """
+        if token.confirmed:
+            await self._release(token, held)
+            await self.push_frame(frame)
+        elif early and not held:
+            await self.push_frame(frame)
+        else:
+            held.append(frame)
+
+    async def _release(self, token: CancellationToken, held: list[TextFrame]):
+        """Wait for the turn to be confirmed, then push the held sentences in order."""
+        if not token.confirmed:
+            await token.wait_confirmed()
+        while held:
+            await self.push_frame(held.pop(0))
 
     async def _execute_tool(self, function_call: LLMFunctionCall):
         """
@@ -251,5 +388,14 @@ class LLMProcessor(FrameProcessor):
         logger.info(f"🔧 [LLM] Tool result success={tool_response.success}")
         return tool_response
 
+    def stats(self) -> dict:
+        decided = self.speculation_hits + self.speculation_misses
+        return {
+            "speculation_hits": self.speculation_hits,
+            "speculation_misses": self.speculation_misses,
+            "speculation_hit_rate": self.speculation_hits / decided if decided else 0.0,
+            "speculation_wasted_chunks": self.speculation_wasted_chunks,
+        }
+
     def _build_system_prompt(self):
         return PromptBuilder.build_system_prompt(self.config, self.context)
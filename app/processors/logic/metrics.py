@@ -12,6 +12,9 @@ class MetricsProcessor(FrameProcessor):
     Tracks pipeline latency metrics.
     Specifically measures "Time to First Audio" (TTFA) after User Stopped Speaking.
     """
+    consumed_frames = (UserStoppedSpeakingFrame, AudioFrame)
+    consumed_directions = (FrameDirection.DOWNSTREAM,)
+
     def __init__(self, config: Any):
         super().__init__(name="MetricsProcessor")
         self.config = config
@@ -11,6 +11,9 @@ class TranscriptReporter(FrameProcessor):
     Passive processor that reports TextFrames to a callback (e.g. WebSocket)
     without modifying the frame flow.
     """
+    consumed_frames = (TextFrame,)
+    consumed_directions = (FrameDirection.DOWNSTREAM,)
+
     def __init__(self, callback: Callable[[str, str], Awaitable[None]], role_label: str = "assistant"):
         super().__init__(name=f"TranscriptReporter-{role_label}")
         self.callback = callback
@@ -1,11 +1,12 @@
 import asyncio
 import contextlib
-import json
 import logging
 from typing import Any
 
 from app.core.frames import AudioFrame, CancelFrame, Frame, TextFrame
 from app.core.processor import FrameDirection, FrameProcessor
+from app.core.stt_io import DEFAULT_WRITE_INTERVAL_MS, STTStream, get_stt_io_worker
+from app.core.transcript_filters import TranscriptFilters
 from app.domain.ports.stt_port import STTConfig
 from app.services.base import STTEvent, STTProvider, STTResultReason
 
@@ -15,15 +16,40 @@ class STTProcessor(FrameProcessor):
     """
     Consumes AudioFrames, writes to Azure PushStream.
     Listens to Azure Events, produces TextFrames.
+
+    Results are filtered (blacklist, minimum length, interruption phrases)
+    with TranscriptFilters compiled once in `initialize`, so recognizer
+    callbacks never parse config or scan phrase lists. The agent config is a
+    snapshot loaded at call start, so the filters are fixed for the whole
+    call; config edits apply from the next call.
+
+    Recognizer I/O goes through the process-wide STTIOWorker: audio is
+    coalesced and written from its thread, and recognition events come back
+    to the loop in batches. No SDK call runs on the event loop.
     """
-    def __init__(self, provider: STTProvider, config: Any, loop: asyncio.AbstractEventLoop, control_channel=None):
+    consumed_frames = (AudioFrame,)
+    consumed_directions = (FrameDirection.DOWNSTREAM,)
+
+    def __init__(
+        self,
+        provider: STTProvider,
+        config: Any,
+        loop: asyncio.AbstractEventLoop,
+        control_channel=None,
+        sample_rate: int | None = None,
+        write_interval_ms: int = DEFAULT_WRITE_INTERVAL_MS
+    ):
         super().__init__(name="STTProcessor")
         self.provider = provider
         self.config = config
+        self.sample_rate = sample_rate  # PCM16 rate from AudioIngressProcessor (None = legacy per-client rate)
         self.loop = loop
+        self.write_interval_ms = write_interval_ms  # Recognizer write cadence (STT I/O worker)
         self.control_channel = control_channel
         self.push_stream = None # Azure PushAudioInputStream
         self.recognizer = None
+        self.stt_stream: STTStream | None = None
+        self.filters: TranscriptFilters | None = None
 
     async def initialize(self):
         """
@@ -32,10 +58,12 @@ class STTProcessor(FrameProcessor):
         # Get profile configuration (type-safe, centralized)
         client_type = getattr(self.config, 'client_type', 'twilio')
         profile = self.config.get_profile(client_type)
+        self.filters = TranscriptFilters.from_config(self.config)
 
         stt_config = STTConfig(
             language=profile.stt_language or 'es-MX',
             audio_mode=client_type,
+            sample_rate=self.sample_rate,
 
             # Basic
             initial_silence_ms=profile.initial_silence_timeout_ms or 5000,
@@ -61,6 +89,15 @@ class STTProcessor(FrameProcessor):
                 config=stt_config
             )
 
+             # Writes and events go through the shared I/O worker
+             if hasattr(self.recognizer, 'write'):
+                 self.stt_stream = get_stt_io_worker().open_stream(
+                     self.recognizer,
+                     self.loop,
+                     self._handle_stt_events,
+                     write_interval_ms=self.write_interval_ms
+                 )
+
              # Register unified callback via Wrapper's subscribe
              # We assume the provider implements the uniform interface
              self.recognizer.subscribe(self._on_stt_event)
@@ -78,9 +115,9 @@ class STTProcessor(FrameProcessor):
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         if direction == FrameDirection.DOWNSTREAM:
             if isinstance(frame, AudioFrame):
-                # Write to Azure Stream
-                if self.recognizer and hasattr(self.recognizer, 'write'):
-                    self.recognizer.write(frame.data)
+                # Hand off to the STT I/O worker (coalesced write off the loop)
+                if self.stt_stream:
+                    self.stt_stream.write(frame.data)
 
                 # Propagate audio to next processor (VAD)
                 await self.push_frame(frame, direction)
@@ -91,6 +128,9 @@ class STTProcessor(FrameProcessor):
             await self.push_frame(frame, direction)
 
     async def cleanup(self):
+        if self.stt_stream:
+            await self.stt_stream.close()  # Flush pending audio first
+            self.stt_stream = None
         if self.recognizer:
             # Non-blocking cleanup attempt
             with contextlib.suppress(Exception):
@@ -100,72 +140,55 @@ class STTProcessor(FrameProcessor):
 
     def _on_stt_event(self, evt: STTEvent):
         """
-        Unified callback from Provider Wrapper.
+        Unified callback from Provider Wrapper (SDK thread).
         evt is app.services.base.STTEvent
         """
+        if self.stt_stream:
+            self.stt_stream.on_event(evt)  # Delivered to the loop in batches
+        else:
+            asyncio.run_coroutine_threadsafe(self._handle_stt_events([evt]), self.loop)
+
+    async def _handle_stt_events(self, events: list[STTEvent]):
+        """Filter a batch of recognizer events on the loop and push the results in order."""
+        for evt in events:
+            await self._handle_stt_event(evt)
+
+    async def _handle_stt_event(self, evt: STTEvent):
         if evt.reason == STTResultReason.RECOGNIZED_SPEECH:
             text = evt.text
             if text:
-                # --- Filtering Logic ---
+                # --- Filtering Logic (precompiled, see TranscriptFilters) ---
+                filters = self.filters
+                if filters is None:
+                    filters = self.filters = TranscriptFilters.from_config(self.config)
 
                 # 1. Blacklist (Hallucinations)
-                blacklist_str = getattr(self.config, 'hallucination_blacklist', '') or ''
-                blacklist = [x.strip() for x in blacklist_str.split(',') if x.strip()]
-                if any(bad_phrase in text for bad_phrase in blacklist):
+                if filters.blacklist.search(text):
                     logger.warning(f"🔇 [STT] Ignored (Blacklist): {text}")
                     return
 
                 # 2. Min Characters (Interruption Threshold)
-                val = getattr(self.config, 'input_min_characters', 2)
-                min_chars = val if val is not None else 2
-                if len(text) < min_chars:
-                    logger.warning(f"🔇 [STT] Ignored (Too Short < {min_chars}): {text}")
+                if len(text) < filters.min_characters:
+                    logger.warning(f"🔇 [STT] Ignored (Too Short < {filters.min_characters}): {text}")
                     return
 
                 # 3. Interruption Phrases (Force Stop)
-                # Use profile configuration for type-safe access
-                client_type = getattr(self.config, 'client_type', 'twilio')
-                profile = self.config.get_profile(client_type)
-
-                phrases_json = profile.interruption_phrases
-
-                if phrases_json:
-                    text_lower = text.lower()
-                    try:
-                        if isinstance(phrases_json, str):
-                            phrases = json.loads(phrases_json)
-                        else:
-                            phrases = phrases_json
-
-                        if isinstance(phrases, list):
-                            for phrase in phrases:
-                                if phrase.lower() in text_lower:
-                                    logger.info(f"⚡ [STT] Interruption Phrase Detected: '{phrase}' - FORCING STOP")
-
-                                    # Out-of-Band Signal (Priority)
-                                    if self.control_channel:
-                                        asyncio.run_coroutine_threadsafe(
-                                            self.control_channel.send_interrupt(text=f"Keyword: {phrase}"),
-                                            self.loop
-                                        )
-
-                                    # In-Band Signal (Fallback)
-                                    asyncio.run_coroutine_threadsafe(
-                                        self.push_frame(CancelFrame()),
-                                        self.loop
-                                    )
-                                    break
-                    except Exception as e:
-                        logger.warning(f"Failed to parse interruption_phrases: {e}")
+                phrase = filters.interruption_phrases.search(text)
+                if phrase:
+                    logger.info(f"⚡ [STT] Interruption Phrase Detected: '{phrase}' - FORCING STOP")
+
+                    # Out-of-Band Signal (Priority)
+                    if self.control_channel:
+                        await self.control_channel.send_interrupt(text=f"Keyword: {phrase}")
+
+                    # In-Band Signal (Fallback)
+                    await self.push_frame(CancelFrame())
 
                 logger.info(f"🎤 [STT] Recognized: {text}")
 
                 # [TRACING] Log STT Event
                 logger.debug(f"👂 [STT_EVENT] Text: '{text}' | Confidence: High | Trace: {getattr(self.config, 'stream_id', 'unknown')}")
 
-                asyncio.run_coroutine_threadsafe(
-                    self.push_frame(TextFrame(text=text, is_final=True)),
-                    self.loop
-                )
+                await self.push_frame(TextFrame(text=text, is_final=True))
         elif evt.reason == STTResultReason.CANCELED:
             logger.warning(f"STT Canceled. Details: {evt.error_details}")
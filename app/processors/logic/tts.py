@@ -5,6 +5,7 @@ from typing import Any
 
 from app.core.frames import AudioFrame, CancelFrame, Frame, TextFrame
 from app.core.processor import FrameDirection, FrameProcessor
+from app.core.turns import CancellationToken, TurnManager
 from app.domain.ports import TTSPort, TTSRequest
 
 logger = logging.getLogger(__name__)
@@ -15,11 +16,27 @@ class TTSProcessor(FrameProcessor):
     Consumes TextFrames, calls TTS Port (Hexagonal), produces AudioFrames.
     Supports cancellation via CancelFrame.
     Implements true streaming for low latency.
+
+    Each sentence is synthesized under its turn's cancellation token (see
+    app.core.turns): a cancelled turn stops its running synthesis and its
+    queued sentences are skipped when dequeued, so the worker never has to
+    be killed and restarted. Audio is stamped with the turn generation.
+    Audio of a speculative turn is synthesized ahead but held until the turn
+    is confirmed.
+
+    When given an output budget (the call's AudioManager), each chunk waits
+    for room in the playout buffer, so a long answer is produced no faster
+    than it can be played.
     """
-    def __init__(self, tts_port: TTSPort, config: Any):
+    consumed_frames = (TextFrame, CancelFrame)
+    consumed_directions = (FrameDirection.DOWNSTREAM,)
+
+    def __init__(self, tts_port: TTSPort, config: Any, output_budget: Any = None, turns: TurnManager | None = None):
         super().__init__(name="TTSProcessor")
         self.tts_port = tts_port
         self.config = config
+        self.output_budget = output_budget  # Exposes `async wait_for_room()`
+        self.turns = turns or TurnManager()
 
         # Backpressure configuration
         self.backpressure_threshold = getattr(config, 'tts_backpressure_threshold', 3)
@@ -31,6 +48,9 @@ class TTSProcessor(FrameProcessor):
         # Flags
         self._is_running = False
 
+        # Playout segments: one per synthesized sentence (see PlayoutTracker)
+        self._segment_counter = 0
+
     async def start(self):
         """Start the TTS processing worker."""
         if not self._is_running:
@@ -46,11 +66,13 @@ class TTSProcessor(FrameProcessor):
                 if not self._is_running:
                     await self.start()
 
-                await self._tts_queue.put((frame.text, frame.trace_id))
+                if self.turns.is_stale(frame.generation):
+                    return
+                await self._tts_queue.put((frame.text, frame.trace_id, self.turns.token_for(frame.generation)))
 
             elif isinstance(frame, CancelFrame):
-                logger.info("🛑 [TTS] Received CancelFrame. Clearing queue.")
-                await self._clear_queue()
+                logger.info("🛑 [TTS] Received CancelFrame. Cancelling turn.")
+                self.turns.cancel(frame.reason)
                 await self.push_frame(frame, direction)
             else:
                 await self.push_frame(frame, direction)
@@ -61,7 +83,7 @@ class TTSProcessor(FrameProcessor):
         """Sequential TTS Worker Loop."""
         while self._is_running:
             try:
-                text, trace_id = await self._tts_queue.get()
+                text, trace_id, token = await self._tts_queue.get()
 
                 # --- Response Pacing (Profile Config) ---
                 client_type = getattr(self.config, 'client_type', 'twilio')
@@ -69,12 +91,22 @@ class TTSProcessor(FrameProcessor):
 
                 delay = profile.response_delay_seconds or 0.0
 
-                if delay > 0:
+                if delay > 0 and not token.cancelled:
                     logger.debug(f"⏳ [TTS] Pacing: Waiting {delay}s...")
                     await asyncio.sleep(delay)
                 # ----------------------------------------
 
-                await self._synthesize(text, trace_id)
+                if token.cancelled:
+                    self._tts_queue.task_done()
+                    continue  # Sentence of a cancelled turn: dropped without synthesis
+
+                # Synthesis runs as its own task so cancelling the turn stops it, not the worker
+                synthesis = token.bind(asyncio.create_task(self._synthesize(text, trace_id, token)))
+                try:
+                    await asyncio.wait({synthesis})
+                except asyncio.CancelledError:
+                    synthesis.cancel()
+                    raise
                 self._tts_queue.task_done()
 
             except asyncio.CancelledError:
@@ -82,29 +114,7 @@ class TTSProcessor(FrameProcessor):
             except Exception as e:
                 logger.error(f"TTS Worker Error: {e}")
 
-    async def _clear_queue(self):
-        """Flush pending texts and restart worker logic if needed."""
-        # Empty the queue
-        while not self._tts_queue.empty():
-            try:
-                self._tts_queue.get_nowait()
-                self._tts_queue.task_done()
-            except asyncio.QueueEmpty:
-                break
-
-        # Note: We rely on the Port implementation to handle cancellation of active properties
-        # For true cancellation, we might need a flag or restart the worker
-        # Restarting worker is the safest way to kill active synthesis
-        if self._worker_task and not self._worker_task.done():
-            self._worker_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._worker_task
-
-            # Restart
-            if self._is_running:
-                self._worker_task = asyncio.create_task(self._worker())
-
-    async def _synthesize(self, text: str, trace_id: str):
+    async def _synthesize(self, text: str, trace_id: str, token: CancellationToken):
         if not text:
             return
 
@@ -138,18 +148,44 @@ class TTSProcessor(FrameProcessor):
             # Determine correct sample rate
             sr = 16000 if getattr(self.config, 'client_type', 'twilio') == 'browser' else 8000
 
+            # Chunks carry their sentence so the sink can tag playback with marks.
+            # trace_id is per call; the turn generation tells responses apart.
+            self._segment_counter += 1
+            segment = {"segment": self._segment_counter, "text": text, "response_id": f"{trace_id}:{token.generation}"}
+
             # True Streaming: Emit processing audio chunks as they arrive
             # This reduces TTFB (Time To First Byte) significantly
 
+            held: list[AudioFrame] = []  # Speculative turn: synthesized ahead, played once confirmed
+
             async for audio_chunk in self.tts_port.synthesize_stream(request):
                 # We can batch small chunks if needed, or send raw
                 # Sending immediately for best latency
                 if audio_chunk:
-                   await self.push_frame(
-                       AudioFrame(data=audio_chunk, sample_rate=sr, channels=1)
+                   frame = AudioFrame(
+                       data=audio_chunk, sample_rate=sr, channels=1,
+                       generation=token.generation, metadata=dict(segment)
                    )
-                   # [TRACING] Log TTS Audio Chunk
-                   logger.debug(f"🔊 [TTS_CHUNK] Sent {len(audio_chunk)} bytes")
+                   if not token.confirmed:
+                       held.append(frame)
+                       continue
+                   for pending in held:
+                       await self._push_audio(pending)
+                   held.clear()
+                   await self._push_audio(frame)
+
+            if not token.confirmed:
+                await token.wait_confirmed()
+            for pending in held:
+                await self._push_audio(pending)
+
+            # Empty frame closes the segment (its mark follows the last byte)
+            await self.push_frame(
+                AudioFrame(
+                    data=b"", sample_rate=sr, channels=1,
+                    generation=token.generation, metadata={**segment, "segment_end": True}
+                )
+            )
 
 
             # Note: We don't log "Received X bytes" total anymore since we stream
@@ -158,6 +194,13 @@ class TTSProcessor(FrameProcessor):
         except Exception as e:
             logger.error(f"TTS Error: {e}", exc_info=True)
 
+    async def _push_audio(self, frame: AudioFrame):
+        if self.output_budget is not None:
+            await self.output_budget.wait_for_room()
+        await self.push_frame(frame)
+        # [TRACING] Log TTS Audio Chunk
+        logger.debug(f"🔊 [TTS_CHUNK] Sent {len(frame.data)} bytes")
+
     async def stop(self):
         """Stops the TTS processor and cleans up tasks."""
         self._is_running = False
@@ -166,4 +209,8 @@ class TTSProcessor(FrameProcessor):
             with contextlib.suppress(asyncio.CancelledError):
                 await self._worker_task
             self._worker_task = None
-        await super().stop()
+
+    async def cleanup(self):
+        """Pipeline shutdown hook."""
+        await self.stop()
+        await super().cleanup()
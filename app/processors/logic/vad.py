@@ -3,11 +3,11 @@ import time
 from pathlib import Path
 from typing import Any
 
-import numpy as np
-
 from app.core.frames import AudioFrame, Frame, UserStartedSpeakingFrame, UserStoppedSpeakingFrame
 from app.core.processor import FrameDirection, FrameProcessor
-from app.core.vad.model import SileroOnnxModel
+from app.core.vad.energy_gate import EnergyGate
+from app.core.vad.service import CONTEXT_SAMPLES, WINDOW_SAMPLES, VADStream, get_vad_service
+from app.core.vad.window_buffer import VADWindowBuffer
 from app.domain.use_cases import DetectTurnEndUseCase
 
 logger = logging.getLogger(__name__)
@@ -17,15 +17,28 @@ class VADProcessor(FrameProcessor):
     """
     Analyzes AudioFrames using Silero VAD (ONNX) to detect Voice Activity.
     Emits UserStartedSpeakingFrame / UserStoppedSpeakingFrame based on 'Smart Turn' logic.
+
+    Inference runs on the process-wide VADInferenceService (one shared model,
+    batched across calls, off the event loop); this processor only keeps its
+    call's recurrent state (VADStream).
     """
-    def __init__(self, config: Any, detect_turn_end=None, control_channel=None):
+    consumed_frames = (AudioFrame,)
+    consumed_directions = (FrameDirection.DOWNSTREAM,)
+
+    def __init__(
+        self,
+        config: Any,
+        detect_turn_end=None,
+        control_channel=None,
+        sample_rate: int | None = None,
+        energy_gate: bool = True
+    ):
         super().__init__(name="VADProcessor")
         self.config = config
         self.control_channel = control_channel
 
         # VAD State
-        self.vad_model = None
-        self.buffer = bytearray()
+        self.vad_stream: VADStream | None = None
         self.speaking = False
         self.silence_frames = 0
         self.speech_frames = 0
@@ -33,6 +46,11 @@ class VADProcessor(FrameProcessor):
         # State: Confirmation Window (False Positive Prevention)
         self._voice_detected_at: float | None = None
 
+        # State: Adaptive endpointing observations
+        self._speech_started_at: float | None = None
+        self._stopped_at: float | None = None
+        self._stop_silence_ms = 0
+
         # Domain Logic: Turn End Detection
         self.detect_turn_end = detect_turn_end or DetectTurnEndUseCase(
             silence_threshold_ms=getattr(config, 'silence_timeout_ms', 500)
@@ -51,8 +69,8 @@ class VADProcessor(FrameProcessor):
         # Barge-in Control
         self.barge_in_enabled = profile.barge_in_enabled if profile.barge_in_enabled is not None else True
 
-        # Determine Sample Rate
-        self.target_sr = 16000 if client_type == 'browser' else 8000
+        # Determine Sample Rate (canonical ingress rate when the pipeline decodes audio)
+        self.target_sr = sample_rate or (16000 if client_type == 'browser' else 8000)
 
         # Determine VAD Threshold (with fallback priority)
         self.threshold_start = profile.interruption_sensitivity or profile.vad_threshold or 0.5
@@ -63,6 +81,17 @@ class VADProcessor(FrameProcessor):
         # 512 samples @ 16k = 32ms. 256 samples @ 8k = 32ms.
         self.chunk_duration_ms = 32
 
+        # Window buffer: context-prefixed windows as zero-copy views
+        self.buffer = VADWindowBuffer(
+            window_size=WINDOW_SAMPLES[self.target_sr],
+            context_size=CONTEXT_SAMPLES[self.target_sr]
+        )
+
+        # Energy pre-gate: skip model inference on clear silence
+        self.energy_gate = None
+        if energy_gate:
+            self.energy_gate = EnergyGate(context_size=CONTEXT_SAMPLES[self.target_sr])
+
         # Confirmation window
         self.confirmation_window_ms = getattr(self.config, 'vad_confirmation_window_ms', 200)
         self.confirmation_enabled = getattr(self.config, 'vad_enable_confirmation', True)
@@ -71,7 +100,7 @@ class VADProcessor(FrameProcessor):
         self._init_model()
 
     def _init_model(self):
-        """Locate and load Silero ONNX model."""
+        """Locate the Silero ONNX model and open a stream on the shared service."""
         try:
             # Try standard relative path first
             model_path = Path("app/core/vad/data/silero_vad.onnx")
@@ -82,7 +111,7 @@ class VADProcessor(FrameProcessor):
                  model_path = Path.cwd() / "app" / "core" / "vad" / "data" / "silero_vad.onnx"
 
             if model_path.exists():
-                self.vad_model = SileroOnnxModel(str(model_path))
+                self.vad_stream = get_vad_service(model_path).create_stream()
             else:
                  logger.warning(f"⚠️ Silero ONNX model not found at {model_path}. VAD disabled.")
 
@@ -100,79 +129,101 @@ class VADProcessor(FrameProcessor):
             await self.push_frame(frame, direction)
 
     async def _process_audio(self, frame: AudioFrame):
-        if not self.vad_model:
+        if not self.vad_stream:
             return
 
         # 1. Add to buffer
-        self.buffer.extend(frame.data)
+        self.buffer.write(frame.data)
 
-        # 2. Process in correct chunk sizes (Silero Requirement)
-        required_samples = 512 if self.target_sr == 16000 else 256
-        chunk_size = required_samples * 2
-
-        while len(self.buffer) >= chunk_size:
-            chunk_bytes = self.buffer[:chunk_size]
-            self.buffer = self.buffer[chunk_size:]
+        # 2. Infer pending windows the energy gate lets through (256/512 samples each)
+        frames = self.buffer.pending()
+        if not len(frames):
+            return
 
-            # Convert bytes to float32 numpy array
-            audio_int16 = np.frombuffer(chunk_bytes, dtype=np.int16)
-            audio_float32 = audio_int16.astype(np.float32) / 32768.0
+        rows, targets = self.energy_gate.plan(frames) if self.energy_gate else (frames, range(len(frames)))
 
+        confidences = [0.0] * len(frames)  # Gated windows are silence
+        if len(rows):
             try:
-                confidence = self.vad_model(audio_float32, self.target_sr)
+                results = await self.vad_stream.infer_frames(rows, self.target_sr)
             except Exception as e:
                 logger.error(f"VAD Inference Error: {e}")
-                confidence = 0.0
-
-            # Smart Turn Logic
-            if confidence > self.threshold_start:
-                self.silence_frames = 0
-                self.speech_frames += 1
-
-                # Logic: Start Speaking?
-                if not self.speaking and self.speech_frames >= self.min_speech_frames:
-
-                    if not self._voice_detected_at:
-                        # First detection: Mark timestamp
-                        self._voice_detected_at = time.time()
-
-                        if not self.confirmation_enabled or self.confirmation_window_ms <= 0:
-                            # Immediate trigger (No confirmation)
-                            await self._trigger_start_speaking(confidence, immediate=True)
-
-                    elif self._voice_detected_at:
-                        # Sustained detection: Check confirmation window
-                        elapsed_ms = (time.time() - self._voice_detected_at) * 1000
-                        if elapsed_ms >= self.confirmation_window_ms:
-                            # Confirmed! trigger
-                            await self._trigger_start_speaking(confidence, immediate=False, elapsed=elapsed_ms)
-
-            elif confidence < self.threshold_return:
-                # Logic: Stop Speaking?
-
-                # Check for False Positive (Voice stopped before confirmation)
-                if self._voice_detected_at and not self.speaking:
+                results = [0.0] * len(rows)
+            for target, confidence in zip(targets, results, strict=True):
+                if target is not None:  # None = gate warm-up window
+                    confidences[target] = confidence
+        self.buffer.consume(len(frames))
+
+        for confidence in confidences:
+            if self.energy_gate and confidence >= self.threshold_return:
+                self.energy_gate.hold()
+            await self._handle_confidence(confidence)
+
+    async def _handle_confidence(self, confidence: float):
+        """Smart Turn state machine for one 32ms window."""
+        if confidence > self.threshold_start:
+            if self.speaking and self.silence_frames:
+                # Speech resumed before the threshold: a pause inside the turn
+                self.detect_turn_end.observe_pause(self.silence_frames * self.chunk_duration_ms)
+            self.silence_frames = 0
+            self.speech_frames += 1
+
+            # Logic: Start Speaking?
+            if not self.speaking and self.speech_frames >= self.min_speech_frames:
+
+                if not self._voice_detected_at:
+                    # First detection: Mark timestamp
+                    self._voice_detected_at = time.time()
+
+                    if not self.confirmation_enabled or self.confirmation_window_ms <= 0:
+                        # Immediate trigger (No confirmation)
+                        await self._trigger_start_speaking(confidence, immediate=True)
+
+                elif self._voice_detected_at:
+                    # Sustained detection: Check confirmation window
                     elapsed_ms = (time.time() - self._voice_detected_at) * 1000
-                    if elapsed_ms < self.confirmation_window_ms:
-                        # False positive, reset
-                        self._voice_detected_at = None
-                        self.speech_frames = 0
-                        # We do NOT log every false positive to avoid noise, unless debug
-
-                if self.speaking:
-                    self.silence_frames += 1
-
-                    # Check Turn End
-                    silence_ms = self.silence_frames * self.chunk_duration_ms
-                    if self.detect_turn_end.should_end_turn(silence_ms):
-                        self.speaking = False
-                        logger.info(f"🤫 [VAD] User STOP speaking (Silence: {silence_ms}ms)")
-                        await self.push_frame(UserStoppedSpeakingFrame(), FrameDirection.DOWNSTREAM)
+                    if elapsed_ms >= self.confirmation_window_ms:
+                        # Confirmed! trigger
+                        await self._trigger_start_speaking(confidence, immediate=False, elapsed=elapsed_ms)
+
+        elif confidence < self.threshold_return:
+            # Logic: Stop Speaking?
+
+            # Check for False Positive (Voice stopped before confirmation)
+            if self._voice_detected_at and not self.speaking:
+                elapsed_ms = (time.time() - self._voice_detected_at) * 1000
+                if elapsed_ms < self.confirmation_window_ms:
+                    # False positive, reset
+                    self._voice_detected_at = None
+                    self.speech_frames = 0
+                    # We do NOT log every false positive to avoid noise, unless debug
+
+            if self.speaking:
+                self.silence_frames += 1
+
+                # Check Turn End
+                silence_ms = self.silence_frames * self.chunk_duration_ms
+                if self.detect_turn_end.should_end_turn(silence_ms):
+                    self.speaking = False
+                    self._stopped_at = time.time()
+                    self._stop_silence_ms = silence_ms
+                    if self._speech_started_at:
+                        self.detect_turn_end.observe_speech((self._stopped_at - self._speech_started_at) * 1000 - silence_ms)
+                    logger.info(f"🤫 [VAD] User STOP speaking (Silence: {silence_ms}ms)")
+                    await self.push_frame(UserStoppedSpeakingFrame(), FrameDirection.DOWNSTREAM)
 
     async def _trigger_start_speaking(self, confidence: float, immediate: bool, elapsed: float = 0):
         """Helper to emit start speaking events."""
         self.speaking = True
         self._voice_detected_at = None
+        # Voice onset: before the min-speech frames and the confirmation window
+        self._speech_started_at = time.time() - (elapsed + self.min_speech_frames * self.chunk_duration_ms) / 1000
+
+        if self._stopped_at:
+            # Caller resumed after we ended the turn: the whole gap since their last speech
+            gap_ms = self._stop_silence_ms + max(0.0, self._speech_started_at - self._stopped_at) * 1000
+            self.detect_turn_end.observe_resumption(gap_ms)
+            self._stopped_at = None
 
         msg_type = "Immediate" if immediate else f"Confirmed ({int(elapsed)}ms)"
         logger.info(f"🗣️ [VAD] User START speaking [{msg_type}] (Conf: {confidence:.2f})")
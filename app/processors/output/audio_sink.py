@@ -1,9 +1,9 @@
-import asyncio
 import logging
 from typing import Any
 
 from app.core.frames import AudioFrame, ControlFrame, Frame, UserStartedSpeakingFrame
 from app.core.processor import FrameDirection, FrameProcessor
+from app.core.turns import TurnManager
 
 logger = logging.getLogger(__name__)
 
@@ -12,12 +12,20 @@ class PipelineOutputSink(FrameProcessor):
     Consumer of AudioFrames. Delegates actual sending to the Orchestrator
     to preserve background sound mixing logic.
     Generic Sink for all transports (Simulator, Twilio, Telnyx).
+
+    Audio is handed to the playout buffer inline (a non-blocking write);
+    the AudioManager's outbound budget is the only queue and TTS waits on
+    it, so there is no second unbounded queue to drain on barge-in.
+    Audio of a cancelled turn (stale generation) is dropped at the door.
     """
-    def __init__(self, orchestrator: Any):
+    consumed_frames = (AudioFrame, UserStartedSpeakingFrame)
+    consumed_directions = (FrameDirection.DOWNSTREAM,)
+
+    def __init__(self, orchestrator: Any, turns: TurnManager | None = None):
         super().__init__(name="PipelineOutputSink")
         self.orchestrator = orchestrator
-        self._queue = asyncio.Queue()
-        self._worker_task = asyncio.create_task(self._worker())
+        self.turns = turns or TurnManager()
+        self._segment: int | None = None  # TTS sentence currently being written
 
     async def process_frame(self, frame: Frame, direction: int):
         if direction == FrameDirection.DOWNSTREAM:
@@ -25,22 +33,15 @@ class PipelineOutputSink(FrameProcessor):
                 # Anti-Echo: Do not play back user input
                 if frame.metadata.get('source') == 'user_input':
                     return
+                if self.turns.is_stale(frame.generation):
+                    return
 
-                # Queue audio for background sending (Non-blocking)
-                await self._queue.put(frame)
+                await self._send_audio(frame)
 
             elif isinstance(frame, UserStartedSpeakingFrame):
                  # Critical: Trigger Barge-in Logic
                  await self.orchestrator.interrupt_speaking()
-                 # Also clear our own sink queue
-                 while not self._queue.empty():
-                     try:
-                        self._queue.get_nowait()
-                        self._queue.task_done()
-                     except asyncio.QueueEmpty:
-                        break
-                     except Exception:
-                        pass
+                 self._segment = None
 
             elif isinstance(frame, ControlFrame):
                 # Other control frames
@@ -50,32 +51,27 @@ class PipelineOutputSink(FrameProcessor):
         else:
             await self.push_frame(frame, direction)
 
-    async def _worker(self):
-        """Background worker to consume audio frames with pacing."""
-        while True:
-            try:
-                frame = await self._queue.get()
-                await self._send_audio(frame)
-                self._queue.task_done()
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Sink Worker Error: {e}")
-
     async def _send_audio(self, frame: AudioFrame):
         # Delegate to orchestrator's buffered sender
         try:
+            # Playout segments: tag each TTS sentence so its playback can be acknowledged
+            segment = frame.metadata.get('segment')
+            if segment is not None and segment != self._segment:
+                self._segment = segment
+                self.orchestrator.begin_audio_segment(frame.metadata.get('text', ''), frame.metadata.get('response_id'))
+            if frame.metadata.get('segment_end'):
+                self._segment = None
+                self.orchestrator.end_audio_segment()
+                return
+            if not frame.data:
+                return
+
             # [TRACING] Log Audio Out to User
             logger.debug(f"📢 [AUDIO_OUT] Sending {len(frame.data)} bytes to User")
             await self.orchestrator.send_audio_chunked(frame.data)
         except Exception as e:
             logger.error(f"Error in PipelineOutputSink delegation: {e}")
 
-    async def cleanup(self):
-        if self._worker_task:
-            self._worker_task.cancel()
-        await super().cleanup()
-
     def set_stream_id(self, stream_id: str):
         # Orchestrator handles stream ID context
         pass
@@ -10,6 +10,11 @@ class PCMProcessor extends AudioWorkletProcessor {
         this.readPtr = 0;
         this.available = 0;
 
+        // Playout marks: sample counters since start, marks fire once played
+        this.totalWritten = 0;
+        this.totalPlayed = 0;
+        this.marks = [];
+
         // --- 2. Input Buffer for Mic (Capture) ---
         this.inBufferSize = 4096;
         this.inBuffer = new Int16Array(this.inBufferSize);
@@ -25,6 +30,13 @@ class PCMProcessor extends AudioWorkletProcessor {
                 this.writeOutput(new Int16Array(data.buffer || data));
             } else if (data && data.type === 'feed') {
                 this.writeOutput(data.buffer);
+            } else if (data && data.type === 'mark') {
+                this.marks.push({ name: data.name, at: this.totalWritten });
+            } else if (data && data.type === 'clear') {
+                this.readPtr = this.writePtr;
+                this.available = 0;
+                this.totalPlayed = this.totalWritten;
+                this.marks = [];
             }
         };
     }
@@ -37,8 +49,13 @@ class PCMProcessor extends AudioWorkletProcessor {
 
             this.outBuffer[this.writePtr] = floatSample;
             this.writePtr = (this.writePtr + 1) % this.bufferSize;
-            this.available = Math.min(this.available + 1, this.bufferSize);
+            if (this.available === this.bufferSize) {
+                this.totalPlayed++; // Overwrote an unplayed sample
+            } else {
+                this.available++;
+            }
         }
+        this.totalWritten += int16Data.length;
     }
 
     process(inputs, outputs, parameters) {
@@ -72,12 +89,18 @@ class PCMProcessor extends AudioWorkletProcessor {
                     channel[i] = this.outBuffer[this.readPtr];
                     this.readPtr = (this.readPtr + 1) % this.bufferSize;
                     this.available--;
+                    this.totalPlayed++;
                 } else {
                     channel[i] = 0; // Silence
                 }
             }
         }
 
+        // --- 3. MARKS (Playback position) ---
+        while (this.marks.length && this.totalPlayed >= this.marks[0].at) {
+            this.port.postMessage({ type: 'mark', name: this.marks.shift().name });
+        }
+
         return true; // Keep processor alive
     }
 }
@@ -45,6 +45,10 @@ export const SimulatorMixin = {
 
         try {
             this.ws = new WebSocket(wsUrl);
+            this.ws.binaryType = 'arraybuffer';
+            this.binaryAudio = false;
+            this.binarySeq = 0;
+            this.binarySamples = 0;
 
             this.ws.onopen = async () => {
                 console.log("WS Connected");
@@ -60,7 +64,8 @@ export const SimulatorMixin = {
                         start: {
                             streamSid: 'browser-' + Date.now(),
                             callSid: 'sim-' + Date.now(),
-                            media_format: { encoding: 'audio/pcm', sample_rate: 16000, channels: 1 }
+                            media_format: { encoding: 'audio/pcm', sample_rate: 16000, channels: 1 },
+                            binary_audio: true // Raw PCM16 frames once the server acks
                         }
                     }));
                 }
@@ -68,9 +73,20 @@ export const SimulatorMixin = {
 
             this.ws.onmessage = (event) => {
                 try {
+                    // Binary audio frame: 12-byte header + PCM16 (see binary_protocol.py)
+                    if (event.data instanceof ArrayBuffer) {
+                        if (event.data.byteLength > 12) {
+                            // Own buffer: the worklet reads .buffer, so no offset views
+                            this.playPcm(new Int16Array(event.data.slice(12)));
+                        }
+                        return;
+                    }
+
                     const msg = JSON.parse(event.data);
 
-                    if (msg.event === 'media' || msg.type === 'audio') {
+                    if (msg.event === 'binary_audio') {
+                        this.binaryAudio = true;
+                    } else if (msg.event === 'media' || msg.type === 'audio') {
                         const payload = msg.media ? msg.media.payload : msg.data;
                         this.playAudio(payload);
                     } else if (msg.type === 'config') {
@@ -103,10 +119,12 @@ export const SimulatorMixin = {
                             const container = document.getElementById('transcript-container');
                             if (container) container.scrollTop = container.scrollHeight;
                         });
+                    } else if (msg.event === 'mark') {
+                        // Playout mark: the worklet echoes it once playback reaches this point
+                        if (this.processor) this.processor.port.postMessage({ type: 'mark', name: msg.mark.name });
                     } else if (msg.event === 'clear') {
-                        // Clear buffers command?
-                        // If we had a 'clear' message handling in Worklet, we would send it here.
-                        // For now ignores.
+                        // Barge-in: drop audio buffered in the worklet (and its pending marks)
+                        if (this.processor) this.processor.port.postMessage({ type: 'clear' });
                     }
                 } catch (err) {
                     console.error("Error processing WS message:", err);
@@ -189,8 +207,28 @@ export const SimulatorMixin = {
                 this.processor.port.onmessage = (event) => {
                     if (!this.ws || this.ws.readyState !== WebSocket.OPEN) return;
 
+                    if (event.data && event.data.type === 'mark') {
+                        // Playback reached a server mark
+                        this.ws.send(JSON.stringify({ event: 'mark', mark: { name: event.data.name } }));
+                        return;
+                    }
+
                     const pcm16 = event.data; // Int16Array
 
+                    if (this.binaryAudio) {
+                        // Header: version, kind, reserved, sequence, timestamp (ms) + raw PCM16
+                        const frame = new ArrayBuffer(12 + pcm16.byteLength);
+                        const header = new DataView(frame);
+                        header.setUint8(0, 1);
+                        header.setUint8(1, 1);
+                        header.setUint32(4, this.binarySeq++ >>> 0, true);
+                        header.setUint32(8, Math.floor(this.binarySamples / 16) >>> 0, true);
+                        new Uint8Array(frame, 12).set(new Uint8Array(pcm16.buffer, pcm16.byteOffset, pcm16.byteLength));
+                        this.binarySamples += pcm16.length;
+                        this.ws.send(frame);
+                        return;
+                    }
+
                     // Convert to Base64 (Main Thread)
                     const bytes = new Uint8Array(pcm16.buffer);
                     let binary = '';
@@ -284,8 +322,15 @@ export const SimulatorMixin = {
             for (let i = 0; i < len; i++) {
                 bytes[i] = binaryString.charCodeAt(i);
             }
-            const pcm16 = new Int16Array(bytes.buffer);
+            this.playPcm(new Int16Array(bytes.buffer));
+        } catch (e) {
+            console.error("Playback Error", e);
+        }
+    },
 
+    playPcm(pcm16) {
+        if (!this.processor) return;
+        try {
             // Feed to Worklet (Ring Buffer)
             this.processor.port.postMessage(pcm16);
 
@@ -0,0 +1,94 @@
+"""
+Microbenchmark: per-frame CPU and allocation cost of the hot-path frame model.
+
+Compares the current slotted, lazy-id AudioFrame (plain and pooled) against a
+replica of the previous dict-backed dataclass that generated UUIDs eagerly.
+
+Usage:
+    python scripts/bench_frames.py [--frames 20000]
+"""
+import argparse
+import sys
+import time
+import timeit
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+# Add project root
+sys.path.append(str(Path.cwd()))
+
+from app.core.frames import AudioFrame, FramePool
+
+CHUNK = b"\x00" * 320  # 20ms @ 8kHz, 16-bit
+
+
+# --- Legacy replica (pre-slots frame model) ---
+
+@dataclass(kw_only=True)
+class LegacyFrame:
+    id: str = field(init=False)
+    name: str = field(init=False)
+    timestamp: float = field(default_factory=time.time)
+    trace_id: str = field(default="")
+    span_id: str = field(init=False)
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.id = str(uuid.uuid4())
+        self.span_id = str(uuid.uuid4())
+        self.name = self.__class__.__name__
+        if not self.trace_id:
+            self.trace_id = str(uuid.uuid4())
+
+
+@dataclass(kw_only=True)
+class LegacyAudioFrame(LegacyFrame):
+    data: bytes
+    sample_rate: int
+    channels: int = 1
+
+
+def _measure(label: str, make, n: int) -> None:
+    # CPU
+    seconds = min(timeit.repeat(make, number=n, repeat=3))
+    cpu_us = seconds / n * 1e6
+
+    # Allocation (frames kept alive so their footprint is counted)
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    kept = [make() for _ in range(n)]
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+
+    print(f"{label:<28} {cpu_us:8.3f} us/frame   {(after - before) / n:8.1f} B/frame   peak {peak / 1024:8.1f} KiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=20000)
+    args = parser.parse_args()
+    n = args.frames
+
+    print(f"Frames per run: {n}\n")
+    _measure("legacy AudioFrame", lambda: LegacyAudioFrame(data=CHUNK, sample_rate=8000), n)
+    _measure("slotted AudioFrame", lambda: AudioFrame(data=CHUNK, sample_rate=8000), n)
+
+    # Pool: steady-state acquire/release, as done by a final consumer
+    pool = FramePool(AudioFrame, max_size=8)
+
+    def pooled():
+        frame = pool.acquire(data=CHUNK, sample_rate=8000)
+        pool.release(frame)
+        return frame
+
+    seconds = min(timeit.repeat(pooled, number=n, repeat=3))
+    print(f"{'pooled AudioFrame':<28} {seconds / n * 1e6:8.3f} us/frame   "
+          f"(created={pool.created}, reused={pool.reused})")
+
+
+if __name__ == "__main__":
+    main()
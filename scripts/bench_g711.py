@@ -0,0 +1,118 @@
+"""
+Microbenchmark: G.711 codec engine throughput in samples per second.
+
+Compares app.core.audio.g711 against a replica of the previous per-sample
+struct implementation (app/core/audio_utils.py) and, when available, the
+stdlib audioop C module. Also reports the one-off table build the old
+module paid at import time.
+
+Usage:
+    python scripts/bench_g711.py [--samples 160] [--seconds 0.5]
+"""
+import argparse
+import struct
+import sys
+import time
+import timeit
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+# Add project root
+sys.path.append(str(Path.cwd()))
+
+from app.core.audio import g711
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    try:
+        import audioop
+    except ImportError:  # Python 3.13+
+        audioop = None
+
+
+# --- Legacy replica (per-sample struct, tables built at import) ---
+
+def legacy_build_tables():
+    table = [0] * 65536
+    for i in range(-32768, 32768):
+        val = -i if i < 0 else i
+        sign = 0x80 if i < 0 else 0x00
+        val = min(val, 32635) + 0x84
+        exp = 7
+        for e in range(7, -1, -1):
+            if val & (1 << (e + 3)):
+                exp = e
+                break
+        table[i + 32768] = ~(sign | (exp << 4) | ((val >> (exp + 3)) & 0x0F)) & 0xFF
+    return table
+
+
+LEGACY_ENCODE = legacy_build_tables()
+LEGACY_DECODE = g711._ULAW_DECODE.tolist()
+
+
+def legacy_decode(fragment: bytes) -> bytes:
+    return b"".join(struct.pack("<h", LEGACY_DECODE[b]) for b in fragment)
+
+
+def legacy_encode(fragment: bytes) -> bytes:
+    result = bytearray()
+    for i in range(0, len(fragment), 2):
+        result.append(LEGACY_ENCODE[struct.unpack_from("<h", fragment, i)[0] + 32768])
+    return bytes(result)
+
+
+def rate(func, samples: int, seconds: float) -> float:
+    """Samples per second for `func` called repeatedly for about `seconds`."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    loops = max(1, int(number * seconds / 0.2))
+    elapsed = min(timer.repeat(repeat=3, number=loops))
+    return samples * loops / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="G.711 codec throughput benchmark")
+    parser.add_argument("--samples", type=int, default=160, help="Samples per chunk (160 = 20ms @ 8kHz)")
+    parser.add_argument("--seconds", type=float, default=0.5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    pcm = rng.integers(-32768, 32768, args.samples).astype(np.int16).tobytes()
+    ulaw = g711.ulaw_encode(pcm).tobytes()
+    decode_out = np.empty(args.samples, dtype=np.int16)
+    encode_out = np.empty(args.samples, dtype=np.uint8)
+
+    start = time.perf_counter()
+    legacy_build_tables()
+    print(f"Legacy import-time table build: {(time.perf_counter() - start) * 1000:.0f} ms\n")
+
+    cases = [
+        ("ulaw decode", "legacy", lambda: legacy_decode(ulaw)),
+        ("ulaw decode", "g711", lambda: g711.ulaw_decode(ulaw).tobytes()),
+        ("ulaw decode", "g711 out=", lambda: g711.ulaw_decode(ulaw, out=decode_out)),
+        ("ulaw encode", "legacy", lambda: legacy_encode(pcm)),
+        ("ulaw encode", "g711", lambda: g711.ulaw_encode(pcm).tobytes()),
+        ("ulaw encode", "g711 out=", lambda: g711.ulaw_encode(pcm, out=encode_out)),
+        ("gain", "g711", lambda: g711.gain(pcm, 0.15)),
+        ("mix", "g711", lambda: g711.mix(pcm, pcm)),
+        ("rms", "g711", lambda: g711.rms(pcm)),
+    ]
+    if audioop:
+        cases += [
+            ("ulaw decode", "audioop", lambda: audioop.ulaw2lin(ulaw, 2)),
+            ("ulaw encode", "audioop", lambda: audioop.lin2ulaw(pcm, 2)),
+            ("gain", "audioop", lambda: audioop.mul(pcm, 2, 0.15)),
+            ("mix", "audioop", lambda: audioop.add(pcm, pcm, 2)),
+            ("rms", "audioop", lambda: audioop.rms(pcm, 2)),
+        ]
+
+    print(f"{'operation':<14}{'impl':<12}{'Msamples/s':>12}   ({args.samples}-sample chunks)")
+    for operation, impl, func in sorted(cases, key=lambda c: c[0]):
+        print(f"{operation:<14}{impl:<12}{rate(func, args.samples, args.seconds) / 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
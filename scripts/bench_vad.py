@@ -0,0 +1,93 @@
+"""
+Benchmark: Silero VAD calls-per-core, per-call models vs shared batched service.
+
+Simulates N concurrent calls each producing one 32ms window per tick.
+- per-call:  one SileroOnnxModel per call, inference inline on the event loop
+- batched:   one VADInferenceService, windows of all calls batched per tick
+
+calls-per-core = real-time audio processed per CPU second (32ms windows).
+
+Usage:
+    python scripts/bench_vad.py [--calls 200] [--ticks 50] [--sample-rate 8000]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root
+sys.path.append(str(Path.cwd()))
+
+from app.core.vad.model import SileroOnnxModel
+from app.core.vad.service import DEFAULT_MODEL_PATH, WINDOW_SAMPLES, VADInferenceService
+
+WINDOW_SECONDS = 0.032
+
+
+def make_audio(calls: int, ticks: int, size: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal((calls, ticks, size)) * 0.1).astype(np.float32)
+
+
+async def run_per_call(audio: np.ndarray, sr: int) -> tuple[float, np.ndarray]:
+    models = [SileroOnnxModel(str(DEFAULT_MODEL_PATH)) for _ in range(audio.shape[0])]
+    out = np.zeros(audio.shape[:2], dtype=np.float32)
+
+    async def call(index: int):
+        for tick in range(audio.shape[1]):
+            out[index, tick] = models[index](audio[index, tick], sr)
+            await asyncio.sleep(0)  # Next packet
+
+    start = time.process_time()
+    await asyncio.gather(*(call(i) for i in range(audio.shape[0])))
+    return time.process_time() - start, out
+
+
+async def run_batched(audio: np.ndarray, sr: int) -> tuple[float, np.ndarray, dict]:
+    service = VADInferenceService(DEFAULT_MODEL_PATH)
+    streams = [service.create_stream() for _ in range(audio.shape[0])]
+    out = np.zeros(audio.shape[:2], dtype=np.float32)
+
+    async def call(index: int):
+        for tick in range(audio.shape[1]):
+            out[index, tick] = await streams[index].infer(audio[index, tick], sr)
+
+    start = time.process_time()
+    await asyncio.gather(*(call(i) for i in range(audio.shape[0])))
+    elapsed = time.process_time() - start
+    stats = service.stats()
+    service.close()
+    return elapsed, out, stats
+
+
+def calls_per_core(cpu_seconds: float, calls: int, ticks: int) -> float:
+    return (calls * ticks * WINDOW_SECONDS) / cpu_seconds
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Silero VAD calls-per-core benchmark")
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--ticks", type=int, default=50)
+    parser.add_argument("--sample-rate", type=int, default=8000, choices=sorted(WINDOW_SAMPLES))
+    args = parser.parse_args()
+
+    audio = make_audio(args.calls, args.ticks, WINDOW_SAMPLES[args.sample_rate])
+    print(f"Silero VAD: {args.calls} calls x {args.ticks} windows @ {args.sample_rate}Hz\n")
+
+    per_call_cpu, per_call_out = await run_per_call(audio, args.sample_rate)
+    batched_cpu, batched_out, stats = await run_batched(audio, args.sample_rate)
+
+    print(f"{'mode':<12}{'cpu (s)':>10}{'us/window':>12}{'calls/core':>12}")
+    for label, cpu in (("per-call", per_call_cpu), ("batched", batched_cpu)):
+        per_window = cpu / (args.calls * args.ticks) * 1e6
+        print(f"{label:<12}{cpu:>10.3f}{per_window:>12.1f}{calls_per_core(cpu, args.calls, args.ticks):>12.0f}")
+
+    print(f"\nbatches: {stats['batches']}  avg batch: {stats['avg_batch']}  max batch: {stats['max_batch']}")
+    print(f"identical results: {bool(np.array_equal(per_call_out, batched_out))}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,203 @@
+"""
+Evaluation: local turn-completion classifier accuracy and latency.
+
+Scores a labelled set of utterances (complete / incomplete) with the
+TurnCompletionClassifier and reports accuracy, precision/recall on
+incomplete turns (the ones we must not cut off) and per-call latency, cold
+and cached. The built-in sets cover typical Spanish and English caller
+utterances as the recognizer punctuates them:
+
+- Training: the utterances the classifier weights were tuned on. Its
+  accuracy is in-sample and overstates real-world performance.
+- Held-out: utterances written after tuning and never used to adjust the
+  weights; this is the figure to quote.
+
+Pass --dataset to evaluate real transcripts instead (JSONL lines:
+{"text": ..., "complete": true|false, "silence_ms": optional}).
+
+Usage:
+    python scripts/eval_turn_completion.py [--dataset turns.jsonl] [--repeat 200] [--verbose]
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add project root
+sys.path.append(str(Path.cwd()))
+
+from app.domain.turn_completion import TurnCompletionClassifier
+
+# (text, complete) -- weights in app/domain/turn_completion.py were tuned on these
+TRAINING_DATASET = [
+    ("Quiero agendar una cita.", True),
+    ("Quiero agendar una cita para el", False),
+    ("Sí.", True),
+    ("No, gracias.", True),
+    ("Mi número es el 55 1234 5678.", True),
+    ("Mi número es el", False),
+    ("¿A qué hora abren?", True),
+    ("Necesito hablar con", False),
+    ("Este...", False),
+    ("Pues, eh", False),
+    ("Me gustaría saber si", False),
+    ("Me gustaría saber si tienen disponibilidad mañana.", True),
+    ("Vale, perfecto.", True),
+    ("Es que yo quería", True),  # Ambiguous: finished phrase without punctuation
+    ("Y también", False),
+    ("Quería preguntar por mi pedido, y", False),
+    ("Quería preguntar por mi pedido.", True),
+    ("Claro.", True),
+    ("Bueno, pues", False),
+    ("Eso es todo.", True),
+    ("Nada más.", True),
+    ("Para el martes a las", False),
+    ("Para el martes a las diez.", True),
+    ("Hola, buenos días.", True),
+    ("Sí, pero", False),
+    ("Con mi esposa y", False),
+    ("¿Me puede repetir?", True),
+    ("Un momento,", False),
+    ("I'd like to book an appointment.", True),
+    ("I'd like to book an appointment for", False),
+    ("Yes.", True),
+    ("Thanks, bye.", True),
+    ("Can you tell me the", False),
+    ("My account number is", True),  # Ambiguous: often followed by digits after a pause
+    ("Um", False),
+    ("What time do you close?", True),
+    ("I was wondering if", False),
+    ("That's all, thanks.", True),
+]
+
+# (text, complete) -- held out: never used to tune the weights
+HOLDOUT_DATASET = [
+    ("Quisiera cambiar la fecha de mi reservación.", True),
+    ("Quisiera cambiar la fecha de mi", False),
+    ("¿Cuánto cuesta el envío?", True),
+    ("El envío a", False),
+    ("Ok, muchas gracias.", True),
+    ("Mi correo es juan punto pérez arroba gmail punto com.", True),
+    ("Mi correo es", False),
+    ("Ajá.", True),
+    ("Déjeme ver, eh", False),
+    ("Lo que pasa es que", False),
+    ("Lo que pasa es que no me llegó el paquete.", True),
+    ("Prefiero en la tarde.", True),
+    ("Prefiero en la", False),
+    ("No sé, tal vez", False),
+    ("Está bien.", True),
+    ("¿Y cuánto tiempo tarda?", True),
+    ("Tengo una duda sobre", False),
+    ("Tengo una duda sobre mi factura.", True),
+    ("Sí, claro, adelante.", True),
+    ("Quiero hablar con un asesor, pero", False),
+    ("Could you send me the", False),
+    ("Could you send me the invoice?", True),
+    ("No, that's it.", True),
+    ("I need to change my", False),
+    ("I need to change my address.", True),
+    ("Hmm", False),
+    ("Sounds good.", True),
+    ("Well, uh", False),
+    ("My order number is 4 8 1 5.", True),
+    ("Sure, go ahead.", True),
+]
+
+
+def builtin_dataset(pairs: list[tuple[str, bool]]) -> list[tuple[str, bool, float | None]]:
+    return [(text, complete, None) for text, complete in pairs]
+
+
+def load_dataset(path: str) -> list[tuple[str, bool, float | None]]:
+    rows = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                item = json.loads(line)
+                rows.append((item["text"], bool(item["complete"]), item.get("silence_ms")))
+    return rows
+
+
+def evaluate(dataset: list[tuple[str, bool, float | None]], repeat: int, verbose: bool) -> dict:
+    classifier = TurnCompletionClassifier()
+
+    # Accuracy + cold latency (first sight of each utterance)
+    cold = []
+    tp = fp = tn = fn = 0  # Positive class: incomplete (a cut-off if missed)
+    for text, complete, silence_ms in dataset:
+        start = time.perf_counter()
+        result = classifier.predict(text, silence_ms=silence_ms)
+        cold.append(time.perf_counter() - start)
+
+        if not complete:
+            tp += not result.complete
+            fn += result.complete
+        else:
+            tn += result.complete
+            fp += not result.complete
+        if verbose and result.complete != complete:
+            print(f"  ✗ p={result.probability:.2f} expected={'complete' if complete else 'incomplete'}: {text!r}")
+
+    # Cached latency (interim/final repeats of the same text)
+    warm = []
+    for _ in range(repeat):
+        for text, _, silence_ms in dataset:
+            start = time.perf_counter()
+            classifier.predict(text, silence_ms=silence_ms)
+            warm.append(time.perf_counter() - start)
+
+    def percentile(values: list[float], q: float) -> float:
+        return statistics.quantiles(values, n=100)[int(q) - 1] * 1e6 if len(values) > 1 else values[0] * 1e6
+
+    total = len(dataset)
+    return {
+        "utterances": total,
+        "accuracy": (tp + tn) / total,
+        "incomplete_recall": tp / (tp + fn) if tp + fn else 0.0,
+        "incomplete_precision": tp / (tp + fp) if tp + fp else 0.0,
+        "false_cutoffs": fn,
+        "cold_p50_us": percentile(cold, 50),
+        "cold_p99_us": percentile(cold, 99),
+        "cached_p50_us": percentile(warm, 50),
+        "cached_p99_us": percentile(warm, 99),
+        **classifier.stats(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dataset", help="JSONL file of labelled utterances (default: built-in sets)")
+    parser.add_argument("--repeat", type=int, default=200, help="Cached passes over the dataset")
+    parser.add_argument("--verbose", action="store_true", help="Print misclassified utterances")
+    args = parser.parse_args()
+
+    if args.dataset:
+        datasets = {args.dataset: load_dataset(args.dataset)}
+    else:
+        datasets = {
+            "training set (in-sample)": builtin_dataset(TRAINING_DATASET),
+            "held-out set": builtin_dataset(HOLDOUT_DATASET),
+        }
+
+    for name, dataset in datasets.items():
+        if args.verbose:
+            print(f"Misclassified ({name}):")
+        report = evaluate(dataset, args.repeat, args.verbose)
+        print_report(name, report)
+
+
+def print_report(name: str, report: dict):
+    print(f"Turn completion classifier: {name}")
+    print(f"  utterances:           {report['utterances']}")
+    print(f"  accuracy:             {report['accuracy']:.1%}")
+    print(f"  incomplete recall:    {report['incomplete_recall']:.1%}  (false cut-offs: {report['false_cutoffs']})")
+    print(f"  incomplete precision: {report['incomplete_precision']:.1%}")
+    print(f"  latency cold:         p50 {report['cold_p50_us']:.1f}us  p99 {report['cold_p99_us']:.1f}us")
+    print(f"  latency cached:       p50 {report['cached_p50_us']:.1f}us  p99 {report['cached_p99_us']:.1f}us")
+
+
+if __name__ == "__main__":
+    main()
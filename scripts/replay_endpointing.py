@@ -0,0 +1,147 @@
+"""
+Replay: static vs adaptive endpointing.
+
+Replays caller turns (speech and pause segments) through DetectTurnEndUseCase
+the way the VADProcessor and ContextAggregator drive it, once with the fixed
+threshold and once adaptive, and reports per caller:
+
+- Response latency: silence after the caller's last word before the turn is
+  committed (VAD threshold + aggregator turn timer, both scaled).
+- False cut-offs: pauses inside a turn that ended it early.
+
+Silence is measured in 32ms VAD windows. The built-in callers are synthetic
+(seeded lognormal pauses: fast, normal and slow talkers); pass --trace to
+replay recorded turns (JSONL lines: {"caller": ..., "segments_ms": [speech,
+pause, speech, ...], "words": ...}).
+
+Usage:
+    python scripts/replay_endpointing.py [--trace turns.jsonl] [--threshold 500] [--turns 60] [--seed 7]
+"""
+import argparse
+import json
+import math
+import random
+import statistics
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+# Add project root
+sys.path.append(str(Path.cwd()))
+
+from app.domain.turn_completion import TurnCompletionClassifier
+from app.domain.use_cases import DetectTurnEndUseCase
+
+VAD_WINDOW_MS = 32
+TURN_TIMEOUT_S = 0.6  # ContextAggregator.turn_timeout
+
+# name: (median pause ms, pause sigma, words per second)
+CALLER_PROFILES = {
+    "fast": (180, 0.35, 4.2),
+    "normal": (300, 0.40, 3.0),
+    "slow": (520, 0.35, 2.1),
+}
+
+
+def synthetic_turns(turns: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    rows = []
+    for caller, (median, sigma, rate) in CALLER_PROFILES.items():
+        for _ in range(turns):
+            segments = []
+            words = 0
+            for index in range(rng.randint(1, 4)):
+                if index:
+                    segments.append(rng.lognormvariate(math.log(median), sigma))
+                speech = rng.uniform(600, 2200)
+                segments.append(speech)
+                words += max(1, round(speech / 1000 * rate))
+            rows.append({"caller": caller, "segments_ms": segments, "words": words})
+    return rows
+
+
+def load_trace(path: str) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def replay(rows: list[dict], threshold_ms: int, adaptive: bool, min_ms: int, max_ms: int) -> dict:
+    """Per-caller latency and cut-off figures for one policy."""
+    classifier = TurnCompletionClassifier()
+    use_cases: dict[str, DetectTurnEndUseCase] = {}
+    latency = defaultdict(list)
+    cutoffs = defaultdict(int)
+    turns = defaultdict(int)
+
+    for row in rows:
+        caller = row["caller"]
+        use_case = use_cases.get(caller)
+        if use_case is None:
+            use_case = use_cases[caller] = DetectTurnEndUseCase(
+                silence_threshold_ms=threshold_ms,
+                completion_classifier=classifier,
+                adaptive=adaptive,
+                min_silence_ms=min_ms,
+                max_silence_ms=max_ms,
+            )
+        turns[caller] += 1
+
+        segments = row["segments_ms"]
+        speech_ms = sum(segments[0::2])
+        use_case.observe_speech(speech_ms)
+        for pause in segments[1::2]:
+            # VAD counts whole 32ms windows of silence
+            silence_ms = int(pause // VAD_WINDOW_MS) * VAD_WINDOW_MS
+            if use_case.should_end_turn(silence_ms):
+                cutoffs[caller] += 1
+                use_case.observe_resumption(pause)
+            else:
+                use_case.observe_pause(silence_ms)
+
+        # End of turn: first VAD window past the threshold, then the aggregator timer
+        end_ms = math.ceil(use_case.silence_threshold_ms / VAD_WINDOW_MS) * VAD_WINDOW_MS
+        latency[caller].append(end_ms + use_case.scale(TURN_TIMEOUT_S) * 1000)
+        use_case.observe_speech(0, words=row.get("words", 0))
+
+    return {
+        caller: {
+            "turns": turns[caller],
+            "latency_p50_ms": statistics.median(latency[caller]),
+            "latency_mean_ms": statistics.fmean(latency[caller]),
+            "false_cutoff_rate": cutoffs[caller] / turns[caller],
+            "final_threshold_ms": use_cases[caller].silence_threshold_ms,
+        }
+        for caller in use_cases
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trace", help="JSONL file of recorded turns (default: synthetic callers)")
+    parser.add_argument("--threshold", type=int, default=500, help="Static silence threshold (ms)")
+    parser.add_argument("--min-silence", type=int, default=250, help="Adaptive lower bound (ms)")
+    parser.add_argument("--max-silence", type=int, default=1200, help="Adaptive upper bound (ms)")
+    parser.add_argument("--turns", type=int, default=60, help="Synthetic turns per caller")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rows = load_trace(args.trace) if args.trace else synthetic_turns(args.turns, args.seed)
+
+    results = {
+        "static": replay(rows, args.threshold, False, args.min_silence, args.max_silence),
+        "adaptive": replay(rows, args.threshold, True, args.min_silence, args.max_silence),
+    }
+
+    print(f"Endpointing replay ({len(rows)} turns, static threshold {args.threshold}ms)")
+    print(f"  {'caller':<10} {'policy':<9} {'p50 latency':>12} {'mean latency':>13} {'false cut-offs':>15} {'threshold':>10}")
+    for caller in results["static"]:
+        for policy, report in results.items():
+            r = report[caller]
+            print(
+                f"  {caller:<10} {policy:<9} {r['latency_p50_ms']:>10.0f}ms {r['latency_mean_ms']:>11.0f}ms "
+                f"{r['false_cutoff_rate']:>14.1%} {r['final_threshold_ms']:>8}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,7 @@ import asyncio
 import logging
 import os
 import sys
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 # Validation requires strong passwords
 os.environ["POSTGRES_USER"] = "test_user"
@@ -79,7 +79,7 @@ async def test_orchestrator_refactor():
         # We Mock the audio_manager instance on the orchestrator logic?
         # No, AudioManager is created inside __init__.
         # We can mock the method on the instance.
-        orchestrator.audio_manager.load_background_audio = MagicMock()
+        orchestrator.audio_manager.load_background_audio = AsyncMock()
 
         await orchestrator.start()
         logger.info("✅ Start lifecycle successful")
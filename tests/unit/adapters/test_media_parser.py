@@ -0,0 +1,117 @@
+"""
+Unit tests for the inbound media fast-path parser.
+
+Validates payload / sequence / timestamp extraction for Twilio, Telnyx and
+browser media events, and that everything else falls back to json.loads.
+"""
+import base64
+import json
+
+import pytest
+
+from app.adapters.telephony.media_parser import SequenceTracker, event_sequence, parse_media_message
+
+AUDIO = bytes(range(160))
+PAYLOAD = base64.b64encode(AUDIO).decode()
+
+
+class TestParseMediaMessage:
+    """Test suite for parse_media_message."""
+
+    def test_twilio_media(self):
+        text = json.dumps({
+            "event": "media",
+            "sequenceNumber": "42",
+            "media": {"track": "inbound", "chunk": "41", "timestamp": "820", "payload": PAYLOAD},
+            "streamSid": "MZ1",
+        })
+
+        packet = parse_media_message(text)
+
+        assert (packet.audio, packet.sequence, packet.timestamp) == (AUDIO, 42, 820)
+
+    def test_telnyx_media_field_order(self):
+        text = json.dumps({
+            "stream_id": "t-1",
+            "media": {"payload": PAYLOAD, "timestamp": "20", "track": "inbound", "chunk": "2"},
+            "sequence_number": "7",
+            "event": "media",
+        })
+
+        packet = parse_media_message(text)
+
+        assert (packet.audio, packet.sequence, packet.timestamp) == (AUDIO, 7, 20)
+
+    def test_browser_media_without_sequence(self):
+        text = json.dumps({"event": "media", "media": {"payload": PAYLOAD, "track": "inbound"}})
+
+        packet = parse_media_message(text)
+
+        assert packet.audio == AUDIO
+        assert packet.sequence is None and packet.timestamp is None
+
+    @pytest.mark.parametrize("message", [
+        {"event": "start", "start": {"streamSid": "MZ1", "media_format": {"encoding": "PCMU"}}},
+        {"event": "stop"},
+        {"event": "media", "mark": "speech_ended", "media": {"payload": PAYLOAD}},
+        {"event": "media", "media": {}},
+        {"event": "media", "media": {"payload": None, "track": "inbound"}},
+    ])
+    def test_falls_back_to_full_parser(self, message):
+        assert parse_media_message(json.dumps(message)) is None
+
+    def test_escaped_payload_falls_back(self):
+        """JSON may escape the solidus; json.loads handles that."""
+        text = '{"event":"media","media":{"payload":"/w\\/="}}'
+
+        assert json.loads(text)["media"]["payload"] == "/w/="
+        assert parse_media_message(text) is None
+
+    def test_compact_and_spaced_json_agree(self):
+        message = {"event": "media", "sequenceNumber": "3", "media": {"payload": PAYLOAD}}
+
+        compact = parse_media_message(json.dumps(message, separators=(",", ":")))
+        spaced = parse_media_message(json.dumps(message))
+
+        assert compact == spaced
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
+
+
+def _track(messages: list[dict]) -> SequenceTracker:
+    """Observe sequences the way the media WebSocket does (fast path, else json.loads)."""
+    tracker = SequenceTracker()
+    for message in messages:
+        text = json.dumps(message)
+        packet = parse_media_message(text)
+        tracker.observe(packet.sequence if packet is not None else event_sequence(json.loads(text)))
+    return tracker
+
+
+def _media(sequence: int) -> dict:
+    return {"event": "media", "sequenceNumber": str(sequence), "media": {"payload": PAYLOAD}}
+
+
+class TestSequenceTracker:
+    """Lost-packet accounting across media and control events."""
+
+    def test_interleaved_mark_is_not_a_lost_packet(self):
+        mark = {"event": "mark", "sequenceNumber": "3", "streamSid": "MZ1", "mark": {"name": "sentence_1"}}
+
+        tracker = _track([_media(1), _media(2), mark, _media(4), _media(5)])
+
+        assert tracker.lost == 0
+        assert tracker.next_sequence == 6
+
+    def test_gap_counts_missing_packets(self):
+        tracker = _track([_media(1), _media(2), _media(5)])
+
+        assert tracker.lost == 2
+
+    def test_event_sequence_fields(self):
+        assert event_sequence({"sequenceNumber": "12"}) == 12
+        assert event_sequence({"sequence_number": 7}) == 7
+        assert event_sequence({"event": "connected"}) is None
+        assert event_sequence({"sequenceNumber": "x"}) is None
@@ -0,0 +1,83 @@
+"""
+Unit tests for browser binary audio framing and SimulatorTransport.
+
+Validates the 12-byte header round trip, rejection of malformed frames and
+that the transport switches from base64 JSON to binary frames on negotiation.
+"""
+import base64
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.adapters.simulator.binary_protocol import (
+    HEADER_SIZE,
+    BinaryFrameError,
+    pack_audio,
+    unpack_audio,
+)
+from app.adapters.simulator.transport import SimulatorTransport
+
+PCM = bytes(range(256)) * 2 + bytes(128)  # 640 bytes = 20ms @ 16kHz
+
+
+class TestBinaryProtocol:
+    """Test suite for binary_protocol."""
+
+    def test_round_trip(self):
+        frame = pack_audio(7, 140, PCM)
+
+        assert len(frame) == HEADER_SIZE + len(PCM) == 652
+        assert unpack_audio(frame) == (7, 140, PCM)
+
+    def test_counters_wrap_to_u32(self):
+        sequence, timestamp_ms, _ = unpack_audio(pack_audio(2**32 + 5, 2**32 + 9, b""))
+
+        assert (sequence, timestamp_ms) == (5, 9)
+
+    @pytest.mark.parametrize("frame", [
+        b"\x01\x01",                                  # Short header
+        b"\x02\x01" + bytes(10) + PCM,                # Unknown version
+        b"\x01\x09" + bytes(10) + PCM,                # Unknown kind
+        pack_audio(0, 0, PCM) + b"\x00",              # Odd PCM16 length
+    ])
+    def test_rejects_malformed_frames(self, frame):
+        with pytest.raises(BinaryFrameError):
+            unpack_audio(frame)
+
+
+class TestSimulatorTransport:
+    """Test suite for SimulatorTransport audio modes."""
+
+    @pytest.fixture
+    def websocket(self):
+        websocket = MagicMock()
+        websocket.send_text = AsyncMock()
+        websocket.send_bytes = AsyncMock()
+        return websocket
+
+    @pytest.mark.asyncio
+    async def test_json_mode_by_default(self, websocket):
+        transport = SimulatorTransport(websocket)
+
+        await transport.send_audio(PCM)
+
+        websocket.send_bytes.assert_not_awaited()
+        sent = json.loads(websocket.send_text.await_args.args[0])
+        assert sent == {"type": "audio", "data": base64.b64encode(PCM).decode()}
+
+    @pytest.mark.asyncio
+    async def test_binary_mode_after_negotiation(self, websocket):
+        transport = SimulatorTransport(websocket, sample_rate=16000)
+        transport.enable_binary_audio()
+
+        await transport.send_audio(PCM)
+        await transport.send_audio(PCM)
+
+        websocket.send_text.assert_not_awaited()
+        frames = [unpack_audio(c.args[0]) for c in websocket.send_bytes.await_args_list]
+        assert frames == [(0, 0, PCM), (1, 20, PCM)]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
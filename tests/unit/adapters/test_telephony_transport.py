@@ -0,0 +1,60 @@
+"""
+Unit tests for the telephony media serializer and TelephonyTransport.
+
+Validates that templated media events are byte-identical to json.dumps of
+the Twilio / Telnyx event shape, and that coalesced chunks stay one message.
+"""
+import base64
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.adapters.telephony.media_serializer import MediaMessageSerializer, build_media_event
+from app.adapters.telephony.transport import TelephonyTransport
+
+
+def _legacy(protocol: str, stream_id: str, chunk: bytes) -> str:
+    return json.dumps(build_media_event(protocol, stream_id, base64.b64encode(chunk).decode("utf-8")))
+
+
+class TestMediaMessageSerializer:
+    """Test suite for MediaMessageSerializer."""
+
+    @pytest.mark.parametrize("protocol", ["twilio", "telnyx"])
+    @pytest.mark.parametrize("stream_id", ["MZ18ad3ab5a668481ce02b83e7395059f0", 'odd "id"\\ñ', "v3:abc/def+=="])
+    @pytest.mark.parametrize("size", [0, 1, 159, 160, 320, 800])
+    def test_byte_identical_to_json_dumps(self, protocol, stream_id, size):
+        chunk = (bytes(range(256)) * 4)[:size]
+
+        assert MediaMessageSerializer(protocol, stream_id).render(chunk) == _legacy(protocol, stream_id, chunk)
+
+    def test_event_shapes(self):
+        twilio = json.loads(MediaMessageSerializer("twilio", "MZ1").render(b"\xff"))
+        telnyx = json.loads(MediaMessageSerializer("telnyx", "t-1").render(b"\xd5"))
+
+        assert twilio == {"event": "media", "streamSid": "MZ1", "media": {"payload": "/w=="}}
+        assert telnyx == {"event": "media", "stream_id": "t-1", "media": {"payload": "1Q==", "track": "inbound_track"}}
+
+
+class TestTelephonyTransport:
+    """Test suite for TelephonyTransport media sends."""
+
+    @pytest.mark.asyncio
+    async def test_send_audio_uses_current_stream_id(self):
+        websocket = MagicMock()
+        websocket.send_text = AsyncMock()
+        transport = TelephonyTransport(websocket, protocol="twilio")
+
+        await transport.send_audio(b"\xff" * 160)  # No stream yet: dropped
+        transport.set_stream_id("MZ1")
+        await transport.send_audio(b"\xff" * 160)
+        transport.set_stream_id("MZ2")
+        await transport.send_audio(b"\xff" * 320)  # Two coalesced frames, one message
+
+        sent = [c.args[0] for c in websocket.send_text.await_args_list]
+        assert sent == [_legacy("twilio", "MZ1", b"\xff" * 160), _legacy("twilio", "MZ2", b"\xff" * 320)]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
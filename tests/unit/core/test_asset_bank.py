@@ -0,0 +1,163 @@
+"""
+Unit tests for the pre-rendered audio asset bank.
+
+Validates WAV decoding, rendering into every wire format, mmap sharing
+and reuse of cached files, and that calls play assets by offset.
+"""
+import asyncio
+import struct
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from app.core.audio import g711
+from app.core.audio.asset_bank import AudioAssetBank, read_wav, wire_format_for_client
+from app.core.config import settings
+from app.core.managers.audio_manager import AudioManager
+
+
+def _wav(payload: bytes, tag: int, rate: int, bits: int, channels: int = 1) -> bytes:
+    block = channels * bits // 8
+    fmt = struct.pack("<HHIIHH", tag, channels, rate, rate * block, block, bits)
+    body = b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+    body += b"data" + struct.pack("<I", len(payload)) + payload
+    return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+@pytest.fixture
+def sounds_dir(tmp_path):
+    directory = tmp_path / "sounds"
+    directory.mkdir()
+    tone = (np.sin(np.arange(8000) * 2 * np.pi * 440 / 8000) * 8000).astype(np.int16)
+    (directory / "office.wav").write_bytes(_wav(g711.alaw_encode(tone).tobytes(), tag=6, rate=8000, bits=8))
+    return directory
+
+
+class TestReadWav:
+    """WAV parsing for the formats we ship."""
+
+    def test_decodes_alaw(self):
+        pcm = np.array([0, 1000, -1000, 20000], dtype=np.int16)
+        samples, rate = read_wav(_wav(g711.alaw_encode(pcm).tobytes(), tag=6, rate=8000, bits=8))
+
+        assert rate == 8000
+        assert np.array_equal(samples, g711.alaw_decode(g711.alaw_encode(pcm)))
+
+    def test_downmixes_stereo_pcm(self):
+        stereo = np.array([100, 300, -200, -400], dtype=np.int16).tobytes()
+        samples, rate = read_wav(_wav(stereo, tag=1, rate=16000, bits=16, channels=2))
+
+        assert rate == 16000
+        assert samples.tolist() == [200, -300]
+
+    def test_rejects_unsupported_format(self):
+        with pytest.raises(ValueError):
+            read_wav(_wav(b"\x00" * 12, tag=3, rate=8000, bits=32))
+
+
+class TestAudioAssetBank:
+    """Rendering, caching and sharing of static clips."""
+
+    @pytest.mark.parametrize("encoding,frame_size", [("PCMU", 160), ("PCMA", 160), ("PCM16", 640)])
+    def test_renders_each_wire_format_in_whole_frames(self, tmp_path, sounds_dir, encoding, frame_size):
+        bank = AudioAssetBank(cache_dir=tmp_path / "cache", sounds_dir=sounds_dir)
+
+        asset = bank.get("office", encoding)
+
+        assert asset.frame_size == frame_size
+        assert len(asset) % frame_size == 0
+        assert asset.frames >= 45  # ~1s clip (resampler delay trims the tail)
+        assert len(asset.frame(asset.frames)) == frame_size  # Wraps around
+
+    def test_silence_matches_codec_silence(self, tmp_path, sounds_dir):
+        bank = AudioAssetBank(cache_dir=tmp_path / "cache", sounds_dir=sounds_dir)
+
+        assert bytes(bank.get("silence", "PCMU").frame(0)) == b"\xff" * 160
+        assert bytes(bank.get("silence", "PCMA").frame(0)) == b"\xd5" * 160
+        assert bytes(bank.get("silence", "PCM16").frame(0)) == b"\x00" * 640
+
+    def test_assets_are_shared_and_files_reused(self, tmp_path, sounds_dir):
+        cache = tmp_path / "cache"
+        first = AudioAssetBank(cache_dir=cache, sounds_dir=sounds_dir)
+        asset = first.get("office", "PCMU")
+
+        assert first.get(str(sounds_dir / "office.wav"), "PCMU") is asset
+        assert asset.data.readonly
+
+        # Another worker maps the published file instead of rendering again
+        second = AudioAssetBank(cache_dir=cache, sounds_dir=sounds_dir)
+        assert bytes(second.get("office", "PCMU").data) == bytes(asset.data)
+        assert first.stats()["rendered"] == 1
+        assert second.stats()["rendered"] == 0
+
+    def test_unknown_or_unsafe_names_are_not_found(self, tmp_path, sounds_dir):
+        bank = AudioAssetBank(cache_dir=tmp_path / "cache", sounds_dir=sounds_dir)
+
+        with pytest.raises(FileNotFoundError):
+            bank.get("rain", "PCMU")
+        with pytest.raises(FileNotFoundError):
+            bank.get("../office", "PCMU")
+        with pytest.raises(ValueError):
+            bank.get("office", "OPUS")
+
+    def test_same_file_name_elsewhere_is_a_different_clip(self, tmp_path, sounds_dir):
+        custom_dir = tmp_path / "custom"
+        custom_dir.mkdir()
+        noise = np.random.default_rng(1).integers(-8000, 8000, 8000).astype(np.int16)
+        (custom_dir / "office.wav").write_bytes(_wav(noise.astype("<i2").tobytes(), tag=1, rate=8000, bits=16))
+        (custom_dir / "silence.wav").write_bytes(_wav(noise.astype("<i2").tobytes(), tag=1, rate=8000, bits=16))
+        bank = AudioAssetBank(cache_dir=tmp_path / "cache", sounds_dir=sounds_dir)
+
+        custom = bank.get(str(custom_dir / "office.wav"), "PCMU")
+        bundled = bank.get("office", "PCMU")
+
+        assert custom is not bundled
+        assert bytes(custom.data) != bytes(bundled.data)
+        assert bank.lookup(str(custom_dir / "office.wav"), "PCMU") is custom
+        assert custom.name == "office"
+
+        # A file named like a synthetic clip is still read from disk
+        assert bytes(bank.get(str(custom_dir / "silence.wav"), "PCMU").data) != bytes(bank.get("silence", "PCMU").data)
+
+    def test_preload_prepares_every_clip_and_format(self, tmp_path, sounds_dir):
+        bank = AudioAssetBank(cache_dir=tmp_path / "cache", sounds_dir=sounds_dir)
+
+        assert bank.preload() == 9  # (silence, comfort_noise, office) x 3 formats
+        assert bank.lookup("office", "PCMA") is not None
+
+    def test_gain_is_baked_into_a_separate_variant(self, tmp_path, sounds_dir):
+        bank = AudioAssetBank(cache_dir=tmp_path / "cache", sounds_dir=sounds_dir)
+
+        full = g711.alaw_decode(bank.get("office", "PCMA").data)
+        quiet = g711.alaw_decode(bank.get("office", "PCMA", gain=0.15).data)
+
+        assert bank.stats()["assets"] == 2
+        assert np.abs(quiet).max() < np.abs(full).max() * 0.2
+
+    def test_wire_format_for_client(self):
+        assert wire_format_for_client("browser") == "PCM16"
+        assert wire_format_for_client("telnyx") == "PCMA"
+        assert wire_format_for_client("twilio") == "PCMU"
+
+
+class TestAudioManagerBackground:
+    """AudioManager plays background audio straight from the shared mapping."""
+
+    @pytest.mark.asyncio
+    async def test_background_frames_are_views_into_asset(self, tmp_path, sounds_dir, monkeypatch):
+        bank = AudioAssetBank(cache_dir=tmp_path / "cache", sounds_dir=sounds_dir)
+        monkeypatch.setattr("app.core.managers.audio_manager.get_audio_asset_bank", lambda: bank)
+        transport = MagicMock()
+        transport.send_audio = AsyncMock()
+        manager = AudioManager(transport, "telnyx", clock=MagicMock())
+
+        await manager.load_background_audio("office")
+        for _ in range(2):
+            manager.on_tick()
+            await asyncio.sleep(0)
+
+        asset = bank.lookup("office", "PCMA", settings.BACKGROUND_AUDIO_GAIN)
+        sent = [c.args[0] for c in transport.send_audio.await_args_list]
+        assert [bytes(chunk) for chunk in sent] == [bytes(asset.frame(0)), bytes(asset.frame(1))]
+        assert all(isinstance(chunk, memoryview) for chunk in sent)
@@ -0,0 +1,168 @@
+"""
+Unit tests for the inbound audio stage.
+
+Validates the streaming polyphase resampler (frequency preservation,
+chunked == one-shot) and that AudioIngressProcessor turns G.711 telephony
+chunks into canonical PCM16 while leaving canonical audio untouched.
+"""
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from app.core.audio import g711
+from app.core.audio.resampler import PolyphaseResampler
+from app.core.frames import AudioFrame, Frame, TextFrame
+from app.core.orchestrator_v2 import VoiceOrchestratorV2
+from app.core.processor import FrameDirection, FrameProcessor
+from app.processors.input.audio_ingress import AudioIngressProcessor, normalize_encoding
+
+
+def _tone(freq: float, rate: int, seconds: float = 1.0, level: float = 10000) -> np.ndarray:
+    t = np.arange(int(rate * seconds)) / rate
+    return (np.sin(2 * np.pi * freq * t) * level).astype(np.int16)
+
+
+def _dominant_frequency(pcm: np.ndarray, rate: int) -> float:
+    spectrum = np.abs(np.fft.rfft(pcm.astype(np.float64)))
+    return np.argmax(spectrum) * rate / len(pcm)
+
+
+class Collector(FrameProcessor):
+    def __init__(self):
+        super().__init__(name="Collector")
+        self.frames: list[Frame] = []
+
+    async def process_frame(self, frame: Frame, direction: int):
+        self.frames.append(frame)
+
+
+class TestPolyphaseResampler:
+    """Test suite for PolyphaseResampler."""
+
+    @pytest.mark.parametrize("in_rate,out_rate", [(8000, 16000), (16000, 8000), (48000, 16000), (16000, 24000)])
+    def test_tone_frequency_and_length(self, in_rate, out_rate):
+        resampler = PolyphaseResampler(in_rate, out_rate)
+
+        out = resampler.process(_tone(440, in_rate))
+
+        assert len(out) == out_rate
+        assert _dominant_frequency(out, out_rate) == pytest.approx(440, abs=1)
+
+    @pytest.mark.parametrize("in_rate,out_rate", [(8000, 16000), (48000, 16000), (16000, 24000)])
+    def test_chunked_matches_one_shot(self, in_rate, out_rate):
+        pcm = _tone(700, in_rate, seconds=0.5)
+        expected = PolyphaseResampler(in_rate, out_rate).process(pcm).copy()
+
+        resampler = PolyphaseResampler(in_rate, out_rate)
+        chunks = [resampler.process(chunk).copy() for chunk in np.array_split(pcm, 23)]
+
+        np.testing.assert_array_equal(np.concatenate(chunks), expected)
+
+    def test_downsampling_rejects_aliases(self):
+        """A 6kHz tone cannot be represented at 8kHz and must be filtered out."""
+        out = PolyphaseResampler(16000, 8000).process(_tone(6000, 16000))
+
+        assert np.sqrt(np.mean(out[100:].astype(np.float64) ** 2)) < 10
+
+    def test_passthrough_copies(self):
+        pcm = _tone(440, 16000, seconds=0.02)
+
+        np.testing.assert_array_equal(PolyphaseResampler(16000, 16000).process(pcm), pcm)
+
+    def test_reset_clears_history(self):
+        resampler = PolyphaseResampler(8000, 16000)
+        first = resampler.process(_tone(440, 8000, seconds=0.02)).copy()
+        resampler.process(_tone(1000, 8000, seconds=0.02))
+
+        resampler.reset()
+
+        np.testing.assert_array_equal(resampler.process(_tone(440, 8000, seconds=0.02)), first)
+
+
+class TestAudioIngressProcessor:
+    """Test suite for AudioIngressProcessor."""
+
+    def test_normalize_encoding(self):
+        assert normalize_encoding("audio/x-mulaw") == "PCMU"
+        assert normalize_encoding("PCMA") == "PCMA"
+        assert normalize_encoding("audio/pcm") == "PCM16"
+        assert normalize_encoding("opus") is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("encoding,encode", [("PCMU", g711.ulaw_encode), ("PCMA", g711.alaw_encode)])
+    async def test_g711_decoded_and_upsampled(self, encoding, encode):
+        ingress = AudioIngressProcessor(output_rate=16000)
+        sink = Collector()
+        ingress.link(sink)
+        pcm = _tone(440, 8000)
+
+        for chunk in np.array_split(pcm, 50):  # 20ms packets
+            frame = AudioFrame(
+                data=encode(chunk).tobytes(),
+                sample_rate=8000,
+                metadata={'source': 'user_input', 'encoding': encoding}
+            )
+            await ingress.process_frame(frame, FrameDirection.DOWNSTREAM)
+
+        assert all(f.sample_rate == 16000 and f.metadata['encoding'] == "PCM16" for f in sink.frames)
+        out = np.frombuffer(b"".join(f.data for f in sink.frames), dtype=np.int16)
+        assert len(out) == 16000
+        assert _dominant_frequency(out, 16000) == pytest.approx(440, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_canonical_audio_untouched(self):
+        ingress = AudioIngressProcessor(output_rate=16000)
+        sink = Collector()
+        ingress.link(sink)
+        data = _tone(440, 16000, seconds=0.02).tobytes()
+        frame = AudioFrame(data=data, sample_rate=16000, metadata={'source': 'user_input', 'encoding': 'audio/pcm'})
+
+        await ingress.process_frame(frame, FrameDirection.DOWNSTREAM)
+
+        assert sink.frames[0] is frame
+        assert frame.data is data
+
+    @pytest.mark.asyncio
+    async def test_other_frames_pass_through(self):
+        ingress = AudioIngressProcessor()
+        sink = Collector()
+        ingress.link(sink)
+        bot_audio = AudioFrame(data=b"\xff" * 160, sample_rate=8000)
+        text = TextFrame(text="hola")
+
+        await ingress.process_frame(bot_audio, FrameDirection.DOWNSTREAM)
+        await ingress.process_frame(text, FrameDirection.DOWNSTREAM)
+
+        assert sink.frames == [bot_audio, text]
+        assert bot_audio.data == b"\xff" * 160
+
+
+class TestNegotiatedFormat:
+    """Caller audio is tagged with the format from the transport 'start' event."""
+
+    @pytest.mark.asyncio
+    async def test_push_audio_uses_negotiated_rate(self):
+        orchestrator = VoiceOrchestratorV2(
+            transport=MagicMock(),
+            stt_port=MagicMock(),
+            llm_port=MagicMock(),
+            tts_port=MagicMock(),
+            config_repo=MagicMock(),
+            call_repo=MagicMock(),
+            client_type="telnyx",
+        )
+        orchestrator.pipeline = MagicMock(queue_frame=AsyncMock())
+        assert orchestrator.audio_sample_rate == 8000
+
+        orchestrator.audio_encoding = "L16"
+        orchestrator.audio_sample_rate = 16000
+        await orchestrator.push_audio(b"\x00\x00" * 320)
+
+        frame = orchestrator.pipeline.queue_frame.await_args.args[0]
+        assert frame.sample_rate == 16000
+        assert frame.metadata["encoding"] == "L16"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
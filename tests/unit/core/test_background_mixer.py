@@ -0,0 +1,92 @@
+"""
+Unit tests for the background audio mixer.
+
+Validates that mixed frames match a decode/add/encode reference, that the
+silence path hands out pre-encoded views untouched, and that AudioManager
+keeps ambience under speech.
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from app.core.audio import g711
+from app.core.audio.mixer import BackgroundMixer
+from app.core.managers.audio_manager import AudioManager
+
+RNG = np.random.default_rng(seed=7)
+
+
+def _random_codes(size: int) -> bytes:
+    return RNG.integers(0, 256, size, dtype=np.uint8).tobytes()
+
+
+class TestBackgroundMixer:
+    """Test suite for BackgroundMixer."""
+
+    @pytest.mark.parametrize("encoding,decode,encode", [
+        ("PCMU", g711.ulaw_decode, g711.ulaw_encode),
+        ("PCMA", g711.alaw_decode, g711.alaw_encode),
+    ])
+    def test_g711_mix_matches_reference(self, encoding, decode, encode):
+        ambience, speech = _random_codes(800), _random_codes(320)
+        mixer = BackgroundMixer(ambience, encoding, 160)
+
+        mixed = mixer.mix(speech)
+
+        expected = encode(g711.mix(decode(speech), decode(ambience[:320])))
+        assert bytes(mixed) == expected.tobytes()
+        assert mixer.position == 320
+
+    def test_pcm16_mix_saturates(self):
+        ambience = np.array([1000, -1000] * 320, dtype=np.int16).tobytes()
+        speech = np.array([32000, -32000] * 320, dtype=np.int16).tobytes()
+        mixer = BackgroundMixer(ambience, "PCM16", 640)
+
+        mixed = np.frombuffer(mixer.mix(speech), dtype=np.int16)
+
+        assert mixed[:2].tolist() == [32767, -32768]
+
+    def test_silence_path_is_a_view_into_the_loop(self):
+        ambience = bytes(range(160)) * 3
+        mixer = BackgroundMixer(ambience, "PCMU", 160)
+
+        frames = [mixer.ambience_frame() for _ in range(4)]
+
+        assert [bytes(f) for f in frames] == [ambience[:160]] * 4
+        assert frames[0].obj is ambience
+        assert mixer.stats() == {"ambience_passthrough_frames": 4, "ambience_mixed_frames": 0}
+
+    def test_loop_wraps_mid_frame(self):
+        ambience = _random_codes(240)
+        mixer = BackgroundMixer(ambience, "PCMU", 160)
+
+        mixer.ambience_frame()
+        wrapped = mixer.ambience_frame()
+
+        assert bytes(wrapped) == ambience[160:] + ambience[:80]
+        assert mixer.position == 80
+
+
+class TestAudioManagerMixing:
+    """AudioManager blends ambience under speech and sends it alone in silence."""
+
+    @pytest.mark.asyncio
+    async def test_ambience_under_speech_and_alone(self):
+        sent = []
+        transport = MagicMock()
+        transport.send_audio = AsyncMock(side_effect=lambda chunk: sent.append(bytes(chunk)))  # Mix buffer is reused
+        manager = AudioManager(transport, "twilio", clock=MagicMock())
+        ambience = g711.ulaw_encode(RNG.integers(-2000, 2000, 1600, dtype=np.int16)).tobytes()
+        manager.set_background_audio(ambience)
+        await manager.send_audio_chunked(b"\xff" * 320)  # 2 frames of mu-law silence
+
+        for _ in range(3):
+            manager.on_tick()
+            await asyncio.sleep(0)
+
+        assert sent[0] == ambience[:160]  # mu-law silence + ambience == ambience
+        assert sent[1] == ambience[160:320]
+        assert sent[2] == ambience[320:480]  # Speech drained: pre-encoded ambience
+        assert manager.stats()["ambience_mixed_frames"] == 2
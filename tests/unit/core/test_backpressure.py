@@ -7,7 +7,16 @@ Tests queue overflow prevention, BackpressureFrame emission.
 import pytest
 import asyncio
 from app.core.pipeline import Pipeline
-from app.core.frames import Frame, TextFrame, BackpressureFrame, SystemFrame
+from app.core.backpressure import BackpressurePolicySet, CoalescePolicy, DropOldestPolicy
+from app.core.frames import (
+    AudioFrame,
+    BackpressureFrame,
+    CancelFrame,
+    Frame,
+    RMSFrame,
+    SystemFrame,
+    TextFrame,
+)
 from app.core.processor import FrameProcessor, FrameDirection
 
 
@@ -97,5 +106,106 @@ class TestBackpressure:
         assert isinstance(frame, SystemFrame)
 
 
+class TestBackpressurePolicies:
+    """Test suite for frame-type-aware backpressure policies."""
+
+    @staticmethod
+    def _queued_frames(pipeline):
+        return [entry[2] for entry in sorted(pipeline._queue._queue)]
+
+    @pytest.mark.asyncio
+    async def test_policy_mapping(self):
+        policies = BackpressurePolicySet.for_queue_size(100)
+
+        assert policies.policy_for(AudioFrame(data=b"", sample_rate=8000)).name == "drop_oldest"
+        assert policies.policy_for(RMSFrame(rms=0.1)).name == "coalesce"
+        assert policies.policy_for(TextFrame(text="ho", is_final=False)).name == "coalesce"
+        assert policies.policy_for(TextFrame(text="hola")).name == "drop_newest"
+        assert policies.policy_for(CancelFrame()).name == "never_drop"
+
+    @pytest.mark.asyncio
+    async def test_audio_drops_oldest(self):
+        """Fresh audio replaces stale audio once the audio budget is spent."""
+        policies = BackpressurePolicySet(
+            audio=DropOldestPolicy(capacity=3),
+            coalesce=CoalescePolicy(),
+            critical=BackpressurePolicySet.for_queue_size(10).critical,
+            default=BackpressurePolicySet.for_queue_size(10).default,
+        )
+        pipeline = Pipeline(processors=[], max_queue_size=10, backpressure=policies)
+
+        frames = [AudioFrame(data=bytes([i]), sample_rate=8000) for i in range(5)]
+        for frame in frames:
+            await pipeline.queue_frame(frame)
+
+        assert self._queued_frames(pipeline) == frames[2:]
+        stats = pipeline.get_backpressure_stats()
+        assert stats["dropped"] == {"AudioFrame:drop_oldest": 2}
+        assert pipeline._dropped_frames_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rms_and_interim_text_coalesce(self):
+        pipeline = Pipeline(processors=[], max_queue_size=10)
+
+        await pipeline.queue_frame(RMSFrame(rms=0.1))
+        await pipeline.queue_frame(TextFrame(text="ho", is_final=False))
+        latest_rms = RMSFrame(rms=0.3)
+        latest_text = TextFrame(text="hola", is_final=False)
+        await pipeline.queue_frame(latest_rms)
+        await pipeline.queue_frame(latest_text)
+
+        assert self._queued_frames(pipeline) == [latest_rms, latest_text]
+        assert pipeline.get_backpressure_stats()["dropped"] == {
+            "RMSFrame:coalesced": 1,
+            "TextFrame:coalesced": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_system_frames_never_dropped_when_full(self):
+        """A full queue evicts droppable audio to admit a CancelFrame."""
+        pipeline = Pipeline(processors=[], max_queue_size=4)
+        audio = [AudioFrame(data=bytes([i]), sample_rate=8000) for i in range(2)]
+        for frame in audio:
+            await pipeline.queue_frame(frame)
+        for i in range(2):
+            await pipeline.queue_frame(TextFrame(text=f"final{i}"))
+
+        cancel = CancelFrame()
+        await pipeline.queue_frame(cancel)
+
+        queued = self._queued_frames(pipeline)
+        assert cancel in queued
+        assert audio[0] not in queued
+        assert pipeline.get_backpressure_stats()["dropped"] == {"AudioFrame:evicted_for_critical": 1}
+
+    @pytest.mark.asyncio
+    async def test_control_frames_admitted_past_capacity(self):
+        pipeline = Pipeline(processors=[], max_queue_size=2)
+        for i in range(2):
+            await pipeline.queue_frame(TextFrame(text=f"final{i}"))
+
+        await pipeline.queue_frame(CancelFrame())
+        await pipeline.queue_frame(CancelFrame())
+
+        assert sum(isinstance(f, CancelFrame) for f in self._queued_frames(pipeline)) == 2
+        assert pipeline._dropped_frames_count == 0
+
+    @pytest.mark.asyncio
+    async def test_consumed_frames_release_budget(self):
+        """Processing a frame frees its slot in the policy budget."""
+        pipeline = Pipeline(processors=[DummyProcessor()], max_queue_size=10)
+        await pipeline.start()
+
+        for i in range(20):
+            await pipeline.queue_frame(AudioFrame(data=bytes([i]), sample_rate=8000))
+            await asyncio.sleep(0)
+
+        await asyncio.sleep(0.05)
+        await pipeline.stop()
+
+        assert pipeline._backpressure.audio.pending == {}
+        assert pipeline._dropped_frames_count == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
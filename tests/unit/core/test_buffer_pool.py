@@ -0,0 +1,98 @@
+"""
+Unit tests for the zero-copy outbound audio path.
+
+Validates pooled buffer reuse and accounting, and that the playout buffer
+hands out views into the TTS buffer, copying only frames that straddle
+two chunks.
+"""
+import pytest
+
+from app.core.audio.buffer_pool import AudioBufferPool
+from app.core.audio.playout_buffer import PlayoutBuffer
+
+
+class TestAudioBufferPool:
+    """Test suite for AudioBufferPool."""
+
+    def test_released_buffers_are_reused(self):
+        pool = AudioBufferPool()
+
+        first = pool.acquire(640)
+        pool.release(first)
+        second = pool.acquire(640)
+
+        assert second is first
+        assert pool.stats() == {
+            "allocated_bytes": 640,
+            "in_use_bytes": 640,
+            "peak_in_use_bytes": 640,
+            "acquired": 2,
+            "reused": 1,
+        }
+
+    def test_excess_idle_buffers_are_freed(self):
+        pool = AudioBufferPool(max_free_per_size=1)
+        buffers = [pool.acquire(160) for _ in range(3)]
+
+        for buffer in buffers:
+            pool.release(buffer)
+
+        assert pool.in_use_bytes == 0
+        assert pool.allocated_bytes == 160
+        assert pool.peak_in_use_bytes == 480
+
+
+class TestZeroCopyPlayout:
+    """PlayoutBuffer frames are views into the written audio."""
+
+    def test_frames_are_views_into_tts_chunk(self):
+        tts_chunk = bytes(range(160)) * 4
+        buffer = PlayoutBuffer(frame_size=160, prebuffer_frames=1)
+        buffer.write(memoryview(tts_chunk)[:480])
+
+        frames = [buffer.next_frame() for _ in range(3)]
+
+        assert all(frame.obj is tts_chunk for frame in frames)
+        assert b"".join(frames) == tts_chunk[:480]
+        assert buffer.copied_bytes == 0
+        assert buffer.zero_copy_frames == 3
+
+    def test_straddling_frame_uses_pooled_buffer(self):
+        pool = AudioBufferPool()
+        buffer = PlayoutBuffer(frame_size=160, prebuffer_frames=1, pool=pool)
+        buffer.write(b"\x01" * 100)
+        buffer.write(b"\x02" * 220)
+
+        first = buffer.next_frame()
+        assert first == b"\x01" * 100 + b"\x02" * 60
+        assert pool.in_use_bytes == 160
+
+        second = buffer.next_frame()
+        assert second == b"\x02" * 160
+        assert pool.in_use_bytes == 0  # Released once the next frame is taken
+        assert buffer.copied_bytes == 160
+
+    def test_retained_bytes_counts_whole_producer_buffers(self):
+        tts_chunk = b"\x00" * 4096
+        buffer = PlayoutBuffer(frame_size=160, prebuffer_frames=1)
+        buffer.write(tts_chunk)
+        buffer.next_frame()
+
+        assert len(buffer) == 4096 - 160
+        assert buffer.stats()["retained_bytes"] == 4096
+
+    def test_close_returns_pooled_memory(self):
+        pool = AudioBufferPool()
+        buffer = PlayoutBuffer(frame_size=160, prebuffer_frames=1, pool=pool)
+        buffer.write(b"\x01" * 100)
+        buffer.write(b"\x02" * 100)
+        buffer.next_frame()
+
+        buffer.close()
+
+        assert pool.in_use_bytes == 0
+        assert len(buffer) == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,241 @@
+"""
+Unit tests for paced outbound audio.
+
+Validates the shared egress clock (one tick for all calls, bounded catch-up),
+the playout buffer (prebuffer, tail flush, barge-in clear), that
+AudioManager sends exactly one frame per tick and that its outbound budget
+pauses and resumes TTS at the watermarks.
+"""
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.audio.egress_clock import EgressClock
+from app.core.audio.playout_buffer import PlayoutBuffer
+from app.core.managers.audio_manager import AudioManager
+
+
+class CountingSubscriber:
+    def __init__(self):
+        self.ticks = 0
+
+    def on_tick(self):
+        self.ticks += 1
+
+
+class TestEgressClock:
+    """Test suite for EgressClock."""
+
+    @pytest.mark.asyncio
+    async def test_one_tick_drives_all_subscribers(self):
+        clock = EgressClock(interval=0.005)
+        subscribers = [CountingSubscriber() for _ in range(3)]
+        for subscriber in subscribers:
+            clock.register(subscriber)
+
+        await asyncio.sleep(0.1)
+        await clock.stop()
+
+        counts = {s.ticks for s in subscribers}
+        assert len(counts) == 1
+        assert 10 <= counts.pop() <= 21
+
+    @pytest.mark.asyncio
+    async def test_catch_up_is_bounded(self):
+        clock = EgressClock(interval=0.005, max_catchup_ticks=2)
+        subscriber = CountingSubscriber()
+        clock.register(subscriber)
+        await asyncio.sleep(0.012)
+
+        before = subscriber.ticks
+        time.sleep(0.05)  # Stall the loop for ~10 ticks
+        await asyncio.sleep(0.002)  # Let the clock wake up once
+        burst = subscriber.ticks - before
+        await clock.stop()
+
+        assert burst == 3  # The late tick plus 2 catch-up ticks, not 10
+        assert clock.resyncs == 1
+
+    @pytest.mark.asyncio
+    async def test_idles_out_without_subscribers(self):
+        clock = EgressClock(interval=0.005)
+        subscriber = CountingSubscriber()
+        clock.register(subscriber)
+        clock.unregister(subscriber)
+
+        await asyncio.sleep(0.02)
+
+        assert clock._task is None
+        assert subscriber.ticks == 0
+
+
+class TestPlayoutBuffer:
+    """Test suite for PlayoutBuffer."""
+
+    def test_prebuffers_before_talkspurt(self):
+        buffer = PlayoutBuffer(frame_size=160, prebuffer_frames=2)
+        buffer.write(b"\x01" * 160)
+
+        assert buffer.next_frame() is None  # Waiting for a second frame
+        buffer.write(b"\x02" * 160)
+        assert buffer.next_frame() == b"\x01" * 160
+        assert buffer.next_frame() == b"\x02" * 160
+        assert buffer.next_frame() is None
+        assert not buffer.playing
+
+    def test_short_utterance_flushed_when_producer_idle(self):
+        buffer = PlayoutBuffer(frame_size=160, prebuffer_frames=2)
+        buffer.write(b"\x01" * 100)
+
+        frames = [buffer.next_frame() for _ in range(4)]
+
+        assert frames == [None, None, b"\x01" * 100, None]
+
+    def test_clear_drops_pending_audio(self):
+        buffer = PlayoutBuffer(frame_size=160)
+        buffer.write(b"\x00" * 1600)
+        buffer.next_frame()
+
+        assert buffer.clear() == 1440
+        assert len(buffer) == 0
+        assert buffer.next_frame() is None
+
+
+class TestAudioManagerPacing:
+    """AudioManager sends one frame per egress tick."""
+
+    @pytest.mark.asyncio
+    async def test_sends_one_frame_per_tick(self):
+        transport = MagicMock()
+        transport.send_audio = AsyncMock()
+        manager = AudioManager(transport, "twilio", clock=MagicMock())
+        await manager.send_audio_chunked(b"\xff" * 800)  # 5 frames
+
+        for _ in range(3):
+            manager.on_tick()
+            await asyncio.sleep(0)
+
+        assert transport.send_audio.await_count == 3
+        assert all(len(c.args[0]) == 160 for c in transport.send_audio.await_args_list)
+
+    @pytest.mark.asyncio
+    async def test_interrupt_stops_audio_immediately(self):
+        transport = MagicMock()
+        transport.send_audio = AsyncMock()
+        manager = AudioManager(transport, "twilio", clock=MagicMock())
+        await manager.send_audio_chunked(b"\xff" * 16000)  # 2s of audio
+        manager.on_tick()
+        await asyncio.sleep(0)
+
+        await manager.interrupt_speaking()
+        for _ in range(5):
+            manager.on_tick()
+            await asyncio.sleep(0)
+
+        assert transport.send_audio.await_count == 1
+        assert manager.stats()["cleared_bytes"] == 15840
+
+    @pytest.mark.asyncio
+    async def test_slow_socket_holds_frames(self):
+        transport = MagicMock()
+        gate = asyncio.Event()
+
+        async def slow_send(chunk):
+            await gate.wait()
+
+        transport.send_audio = AsyncMock(side_effect=slow_send)
+        manager = AudioManager(transport, "twilio", clock=MagicMock())
+        await manager.start()
+        await manager.send_audio_chunked(b"\xff" * 800)
+
+        for _ in range(4):
+            manager.on_tick()
+            await asyncio.sleep(0)
+
+        assert transport.send_audio.await_count == 1
+        assert manager.late_sends == 3
+        assert len(manager.playout) == 640
+        gate.set()
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_owed_frames_are_coalesced(self):
+        """After a slow send, the skipped ticks' frames go out in one message."""
+        transport = MagicMock()
+        gate = asyncio.Event()
+
+        async def slow_send(chunk):
+            await gate.wait()
+
+        transport.send_audio = AsyncMock(side_effect=slow_send)
+        manager = AudioManager(transport, "twilio", clock=MagicMock())
+        await manager.send_audio_chunked(b"\xff" * 1600)
+
+        manager.on_tick()  # Frame 1 (stalls)
+        manager.on_tick()  # Owed
+        manager.on_tick()  # Owed
+        gate.set()
+        await manager._send_task
+        manager.on_tick()
+        await asyncio.sleep(0)
+
+        sizes = [len(c.args[0]) for c in transport.send_audio.await_args_list]
+        assert sizes == [160, 480]
+
+
+
+class TestOutboundBudget:
+    """AudioManager watermarks pause and resume TTS output."""
+
+    @pytest.fixture
+    def transport(self):
+        transport = MagicMock()
+        transport.send_audio = AsyncMock()
+        transport.clear_audio = AsyncMock()
+        return transport
+
+    @pytest.mark.asyncio
+    async def test_pauses_at_high_and_resumes_at_low_watermark(self, transport):
+        manager = AudioManager(transport, "twilio", clock=MagicMock(), high_watermark_ms=100, low_watermark_ms=40)
+        await manager.start()
+        await manager.send_audio_chunked(b"\xff" * 800)  # 100ms: at the high watermark
+
+        waiter = asyncio.create_task(manager.wait_for_room())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        for _ in range(2):  # 60ms left: still above low
+            manager.on_tick()
+            await asyncio.sleep(0)
+        assert not waiter.done()
+
+        manager.on_tick()  # 40ms left
+        await asyncio.sleep(0)
+        assert waiter.done()
+        assert manager.stats()["backpressure_waits"] == 1
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_barge_in_releases_paused_tts(self, transport):
+        manager = AudioManager(transport, "twilio", clock=MagicMock(), high_watermark_ms=100, low_watermark_ms=40)
+        await manager.start()
+        await manager.send_audio_chunked(b"\xff" * 1600)
+        waiter = asyncio.create_task(manager.wait_for_room())
+        await asyncio.sleep(0)
+
+        await manager.interrupt_speaking()
+        await asyncio.sleep(0)
+
+        assert waiter.done()
+        await manager.stop()
+
+    def test_byte_cap_tightens_duration_budget(self, transport):
+        manager = AudioManager(transport, "browser", clock=MagicMock(), high_watermark_ms=3000, max_buffered_bytes=32000)
+
+        assert manager.high_watermark_bytes == 32000  # Not 96000 (3s @ 16kHz PCM16)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,104 @@
+"""
+Unit tests for interest-based frame routing.
+
+Validates that frames skip processors that did not declare interest in them,
+while undeclared processors keep receiving every frame.
+"""
+import asyncio
+
+import pytest
+
+from app.core.frames import AudioFrame, Frame, TextFrame, UserStartedSpeakingFrame
+from app.core.pipeline import Pipeline, PipelineStage
+from app.core.processor import FrameDirection, FrameProcessor
+
+
+class RecordingProcessor(FrameProcessor):
+    """Pass-through processor that records frames it receives."""
+
+    def __init__(self, name: str, consumes=None, directions=None):
+        super().__init__(name=name)
+        if consumes is not None:
+            self.consumed_frames = consumes
+        if directions is not None:
+            self.consumed_directions = directions
+        self.processed: list[Frame] = []
+
+    async def process_frame(self, frame: Frame, direction: int):
+        self.processed.append(frame)
+        await self.push_frame(frame, direction)
+
+
+class TestFrameRouting:
+    """Test suite for the compiled routing table."""
+
+    def test_wants_matches_type_and_direction(self):
+        p = RecordingProcessor("P", consumes=(TextFrame,), directions=(FrameDirection.DOWNSTREAM,))
+
+        assert p.wants(TextFrame, FrameDirection.DOWNSTREAM)
+        assert not p.wants(AudioFrame, FrameDirection.DOWNSTREAM)
+        assert not p.wants(TextFrame, FrameDirection.UPSTREAM)
+
+    def test_undeclared_processor_wants_everything(self):
+        p = RecordingProcessor("P")
+
+        assert p.wants(AudioFrame, FrameDirection.DOWNSTREAM)
+        assert p.wants(TextFrame, FrameDirection.UPSTREAM)
+
+    def test_routes_compiled_at_construction(self):
+        audio = RecordingProcessor("Audio", consumes=(AudioFrame,))
+        text = RecordingProcessor("Text", consumes=(TextFrame,))
+        pipeline = Pipeline([audio, text])
+
+        # Audio leaving `audio` skips `text` and goes straight to the sink
+        assert audio._routes[(AudioFrame, FrameDirection.DOWNSTREAM)] is pipeline._sink
+        assert pipeline._source._routes[(TextFrame, FrameDirection.DOWNSTREAM)] is text
+
+    @pytest.mark.asyncio
+    async def test_audio_skips_uninterested_processors(self):
+        vad = RecordingProcessor("VAD", consumes=(AudioFrame,))
+        llm = RecordingProcessor("LLM", consumes=(TextFrame,))
+        tts = RecordingProcessor("TTS", consumes=(TextFrame,))
+        sink = RecordingProcessor("Sink", consumes=(AudioFrame, UserStartedSpeakingFrame))
+        pipeline = Pipeline([vad, llm, tts, sink])
+        await pipeline.start()
+
+        audio = AudioFrame(data=b"\x00\x00", sample_rate=8000)
+        text = TextFrame(text="hola")
+        await pipeline.queue_frame(audio)
+        await pipeline.queue_frame(text)
+        await asyncio.sleep(0.05)
+        await pipeline.stop()
+
+        assert vad.processed == [audio]
+        assert llm.processed == [text]
+        assert tts.processed == [text]
+        assert sink.processed == [audio]
+
+    @pytest.mark.asyncio
+    async def test_upstream_skips_downstream_only_processors(self):
+        first = RecordingProcessor("First")
+        downstream_only = RecordingProcessor("Down", directions=(FrameDirection.DOWNSTREAM,))
+        last = RecordingProcessor("Last")
+        pipeline = Pipeline([first, downstream_only, last])
+        await pipeline.start()
+
+        frame = TextFrame(text="up")
+        await pipeline.queue_frame(frame, FrameDirection.UPSTREAM)
+        await asyncio.sleep(0.05)
+        await pipeline.stop()
+
+        assert last.processed == [frame]
+        assert downstream_only.processed == []
+        assert first.processed == [frame]
+
+    def test_routes_never_cross_stage_boundaries(self):
+        audio = RecordingProcessor("Audio", consumes=(AudioFrame,))
+        text = RecordingProcessor("Text", consumes=(TextFrame,))
+        Pipeline(stages=[[audio], [text]])
+
+        assert isinstance(audio._routes[(AudioFrame, FrameDirection.DOWNSTREAM)], PipelineStage)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
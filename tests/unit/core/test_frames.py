@@ -0,0 +1,107 @@
+"""
+Unit tests for the slotted Frame model.
+
+Validates lazy identifier allocation, to_dict compatibility and FramePool reuse.
+"""
+import copy
+
+import pytest
+
+from app.core.frames import AudioFrame, FramePool, RMSFrame, TextFrame
+
+
+class TestFrameModel:
+    """Test suite for the allocation-light frame model."""
+
+    def test_frames_are_slotted(self):
+        """Frames should not carry a per-instance __dict__."""
+        frame = AudioFrame(data=b"\x00\x00", sample_rate=8000)
+
+        assert not hasattr(frame, "__dict__")
+        with pytest.raises(AttributeError):
+            frame.unknown_attribute = 1
+
+    def test_ids_are_lazy(self):
+        """id/span_id/trace_id should only be generated when read."""
+        frame = AudioFrame(data=b"\x00\x00", sample_rate=8000)
+
+        assert frame._id is None
+        assert frame._span_id is None
+
+        first = frame.id
+        assert len(first) == 36
+        assert frame.id == first  # Stable once generated
+
+    def test_explicit_trace_id_preserved(self):
+        """Provided trace_id must not be replaced."""
+        frame = TextFrame(text="hola", trace_id="trace-abc")
+
+        assert frame.trace_id == "trace-abc"
+
+        frame.trace_id = "trace-xyz"
+        assert frame.trace_id == "trace-xyz"
+
+    def test_name_is_class_name(self):
+        assert RMSFrame(rms=0.1).name == "RMSFrame"
+
+    def test_frames_compare_by_identity(self):
+        """Two frames with equal content are still distinct frames."""
+        a = TextFrame(text="same", trace_id="t")
+        b = TextFrame(text="same", trace_id="t")
+
+        assert a != b
+        assert a != copy.copy(a)
+
+    def test_to_dict_keeps_public_shape(self):
+        """to_dict should expose the same keys as before (no private slots)."""
+        frame = AudioFrame(data=b"\x01\x02\x03\x04", sample_rate=16000, metadata={"k": "v"})
+        data = frame.to_dict()
+
+        assert data["id"] == frame.id
+        assert data["name"] == "AudioFrame"
+        assert data["span_id"] == frame.span_id
+        assert data["trace_id"] == frame.trace_id
+        assert data["metadata"] == {"k": "v"}
+        assert data["data"] == "<bytes len=4>"
+        assert "_id" not in data and "_span_id" not in data
+
+        assert frame.to_dict(include_binary=True)["data"] == b"\x01\x02\x03\x04"
+
+    def test_to_dict_handles_memoryview_data(self):
+        """Outbound TTS audio is a memoryview over a pooled buffer."""
+        frame = AudioFrame(data=memoryview(bytearray(b"\x01\x02\x03\x04"))[1:], sample_rate=8000)
+
+        assert frame.to_dict()["data"] == "<bytes len=3>"
+        assert frame.to_dict(include_binary=True)["data"] == b"\x02\x03\x04"
+
+
+class TestFramePool:
+    """Test suite for optional frame pooling."""
+
+    def test_release_and_reuse(self):
+        pool = FramePool(AudioFrame, max_size=2)
+        frame = pool.acquire(data=b"\x00\x00", sample_rate=8000)
+        first_id = frame.id
+        pool.release(frame)
+
+        reused = pool.acquire(data=b"\x01\x01", sample_rate=16000, trace_id="t-2")
+
+        assert reused is frame
+        assert reused.data == b"\x01\x01"
+        assert reused.sample_rate == 16000
+        assert reused.trace_id == "t-2"
+        assert reused.metadata == {}
+        assert reused.id != first_id  # Identity reset on reuse
+        assert (pool.created, pool.reused) == (1, 1)
+
+    def test_pool_is_bounded_and_typed(self):
+        pool = FramePool(AudioFrame, max_size=1)
+        pool.release(AudioFrame(data=b"", sample_rate=8000))
+        pool.release(AudioFrame(data=b"", sample_rate=8000))
+        pool.release(RMSFrame(rms=0.0))  # Wrong type: ignored
+
+        assert len(pool) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,104 @@
+"""
+Unit tests for the vectorized G.711 codec engine.
+
+Validates bit-exactness with audioop (when available), known code points,
+zero-copy output buffers and the AudioProcessor / audio_utils facades.
+"""
+import warnings
+
+import numpy as np
+import pytest
+
+from app.core import audio_utils
+from app.core.audio import g711
+from app.core.audio_processor import AudioProcessor
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    try:
+        import audioop
+    except ImportError:  # Python 3.13+
+        audioop = None
+
+ALL_PCM = np.arange(-32768, 32768, dtype=np.int16).tobytes()
+ALL_CODES = bytes(range(256))
+
+requires_audioop = pytest.mark.skipif(audioop is None, reason="audioop not available (Python 3.13+)")
+
+
+class TestG711Engine:
+    """Test suite for app.core.audio.g711."""
+
+    def test_known_code_points(self):
+        pcm = np.array([0, -1, 1000, -1000, 32767, -32768], dtype=np.int16)
+
+        assert g711.ulaw_encode(pcm).tolist() == [0xFF, 0x7E, 0xCE, 0x4E, 0x80, 0x00]
+        assert g711.alaw_encode(pcm).tolist() == [0xD5, 0x55, 0xFA, 0x7A, 0xAA, 0x2A]
+        assert g711.ulaw_decode(bytes([0xFF, 0x00])).tolist() == [0, -32124]
+        assert g711.alaw_decode(bytes([0xD5, 0x2A])).tolist() == [8, -32256]
+
+    def test_round_trip_error_is_bounded(self):
+        """Quantization error stays within the largest segment step."""
+        pcm = np.frombuffer(ALL_PCM, dtype=np.int16).astype(np.int32)
+        for encode, decode in ((g711.ulaw_encode, g711.ulaw_decode), (g711.alaw_encode, g711.alaw_decode)):
+            restored = decode(encode(ALL_PCM)).astype(np.int32)
+            assert np.abs(restored - pcm).max() <= 1024
+
+    @requires_audioop
+    def test_codecs_match_audioop_exhaustively(self):
+        assert g711.ulaw_encode(ALL_PCM).tobytes() == audioop.lin2ulaw(ALL_PCM, 2)
+        assert g711.alaw_encode(ALL_PCM).tobytes() == audioop.lin2alaw(ALL_PCM, 2)
+        assert g711.ulaw_decode(ALL_CODES).tobytes() == audioop.ulaw2lin(ALL_CODES, 2)
+        assert g711.alaw_decode(ALL_CODES).tobytes() == audioop.alaw2lin(ALL_CODES, 2)
+
+    @requires_audioop
+    @pytest.mark.parametrize("factor", [0.0, 0.15, 0.7, 1.0, 1.5, -1.0])
+    def test_gain_matches_audioop(self, factor):
+        assert g711.gain(ALL_PCM, factor).tobytes() == audioop.mul(ALL_PCM, 2, factor)
+
+    @requires_audioop
+    def test_pcm_helpers_match_audioop(self):
+        rng = np.random.default_rng(0)
+        a = rng.integers(-32768, 32768, 4000).astype(np.int16).tobytes()
+        b = rng.integers(-32768, 32768, 3000).astype(np.int16).tobytes()
+
+        assert g711.mix(a, b).tobytes() == audioop.add(a[:len(b)], b, 2)
+        assert g711.rms(a) == audioop.rms(a, 2)
+        assert g711.peak(ALL_PCM) == audioop.max(ALL_PCM, 2)
+
+    def test_out_buffers_are_reused(self):
+        pcm = np.zeros(160, dtype=np.int16)
+        codes = np.empty(160, dtype=np.uint8)
+        decoded = np.empty(160, dtype=np.int16)
+
+        assert g711.ulaw_encode(pcm, out=codes) is codes
+        assert g711.ulaw_decode(codes, out=decoded) is decoded
+        assert g711.gain(pcm, 0.5, out=decoded) is decoded
+
+    def test_empty_fragments(self):
+        assert g711.rms(b"") == 0
+        assert g711.peak(b"") == 0
+        assert g711.ulaw_encode(b"").size == 0
+
+
+class TestCodecFacades:
+    """AudioProcessor and audio_utils delegate to the engine."""
+
+    def test_facades_agree(self):
+        assert AudioProcessor.lin2ulaw(ALL_PCM, 2) == audio_utils.lin2ulaw(ALL_PCM, 2)
+        assert AudioProcessor.alaw2lin(ALL_CODES, 2) == audio_utils.alaw2lin(ALL_CODES, 2)
+        assert AudioProcessor.max_val(ALL_PCM, 2) == audio_utils.max(ALL_PCM, 2) == 32768
+
+    def test_audio_utils_helpers_no_longer_shadow_builtins(self):
+        """mul/lin2alaw used to call the module's own `max` and raise."""
+        assert audio_utils.mul(np.array([16, -16], dtype=np.int16).tobytes(), 2, 0.5) == \
+            np.array([8, -8], dtype=np.int16).tobytes()
+        assert len(audio_utils.lin2alaw(b"\x00\x10", 2)) == 1
+
+    def test_width_must_be_two(self):
+        with pytest.raises(ValueError):
+            AudioProcessor.ulaw2lin(b"\x00", 1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,112 @@
+"""
+Unit tests for the Pipeline profiler.
+
+Validates exclusive per-processor service time, queue-wait tracking,
+throughput/drop reporting and that profiling stays off by default.
+"""
+import asyncio
+
+import pytest
+
+from app.core.frames import AudioFrame, Frame, TextFrame
+from app.core.pipeline import Pipeline
+from app.core.processor import FrameProcessor
+from app.core.profiler import LatencyHistogram, PipelineProfiler
+
+
+class SleepyProcessor(FrameProcessor):
+    """Pass-through processor that sleeps before forwarding."""
+
+    def __init__(self, name: str, delay: float = 0.0):
+        super().__init__(name=name)
+        self.delay = delay
+
+    async def process_frame(self, frame: Frame, direction: int):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        await self.push_frame(frame, direction)
+
+
+class TestLatencyHistogram:
+    """Test suite for the local bucketed aggregate."""
+
+    def test_percentiles_use_bucket_bounds(self):
+        histogram = LatencyHistogram()
+        for _ in range(99):
+            histogram.observe(0.002)
+        histogram.observe(0.3)
+
+        data = histogram.to_dict()
+        assert data["count"] == 100
+        assert data["p50_ms"] == 2.5
+        assert data["p99_ms"] == 2.5
+        assert data["max_ms"] == 300.0
+
+    def test_empty_histogram(self):
+        assert LatencyHistogram().to_dict()["p95_ms"] == 0.0
+
+
+class TestPipelineProfiler:
+    """Test suite for pipeline instrumentation."""
+
+    def test_disabled_by_default(self):
+        a = SleepyProcessor("A")
+        pipeline = Pipeline([a])
+
+        assert pipeline.profiler is None
+        assert a._profiler is None
+        assert pipeline.get_profile_snapshot() is None
+
+    @pytest.mark.asyncio
+    async def test_service_time_is_exclusive(self):
+        """A fast processor in front of a slow one must not be charged for it."""
+        profiler = PipelineProfiler("call-1", export_prometheus=False)
+        fast = SleepyProcessor("Fast")
+        slow = SleepyProcessor("Slow", delay=0.03)
+        pipeline = Pipeline([fast, slow], profiler=profiler)
+        await pipeline.start()
+
+        await pipeline.queue_frame(TextFrame(text="hola"))
+        await asyncio.sleep(0.08)
+        await pipeline.stop()
+
+        processors = profiler.snapshot()["processors"]
+        assert processors["Slow"]["count"] == 1
+        assert processors["Slow"]["max_ms"] >= 25
+        assert processors["Fast"]["max_ms"] < 10
+
+    @pytest.mark.asyncio
+    async def test_queue_wait_and_throughput(self):
+        profiler = PipelineProfiler("call-2", export_prometheus=False)
+        pipeline = Pipeline([SleepyProcessor("A", delay=0.01)], profiler=profiler)
+
+        for i in range(3):
+            await pipeline.queue_frame(TextFrame(text=str(i)))
+        await pipeline.queue_frame(AudioFrame(data=b"\x00\x00", sample_rate=8000))
+        await pipeline.start()
+        await asyncio.sleep(0.1)
+        await pipeline.stop()
+
+        snapshot = pipeline.get_profile_snapshot()
+        assert snapshot["call_id"] == "call-2"
+        assert snapshot["throughput"] == {"TextFrame": 3, "AudioFrame": 1}
+        assert snapshot["queue_wait"]["TextFrame"]["count"] == 3
+        assert snapshot["queue_wait"]["AudioFrame"]["max_ms"] >= 25  # Waited behind 3 slow frames
+        assert pipeline._enqueued_at == {}
+
+    @pytest.mark.asyncio
+    async def test_snapshot_includes_drops(self):
+        profiler = PipelineProfiler(export_prometheus=False)
+        pipeline = Pipeline([SleepyProcessor("A")], max_queue_size=4, profiler=profiler)
+
+        for _ in range(5):
+            await pipeline.queue_frame(AudioFrame(data=b"\x00\x00", sample_rate=8000))
+
+        snapshot = pipeline.get_profile_snapshot()
+        assert snapshot["dropped"] == {"AudioFrame:drop_oldest": 3}
+        assert snapshot["dropped_total"] == 3
+        assert len(pipeline._enqueued_at) == 2  # Evicted entries are forgotten
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,195 @@
+"""
+Unit tests for staged (per-group concurrent) Pipeline execution.
+
+Validates that slow downstream groups do not stall upstream ingestion,
+per-direction ordering, and SystemFrame priority inside stage inboxes.
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.config import settings
+from app.core.frames import CancelFrame, Frame, TextFrame
+from app.core.pipeline import Pipeline, PipelineStage
+from app.core.pipeline_factory import PipelineFactory
+from app.core.processor import FrameDirection, FrameProcessor
+from app.processors.logic.stt import STTProcessor
+
+
+class RecordingProcessor(FrameProcessor):
+    """Pass-through processor that records frames, optionally slowly."""
+
+    def __init__(self, name: str, delay: float = 0.0):
+        super().__init__(name=name)
+        self.delay = delay
+        self.processed: list[Frame] = []
+
+    async def process_frame(self, frame: Frame, direction: int):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.processed.append(frame)
+        await self.push_frame(frame, direction)
+
+
+class Reflector(RecordingProcessor):
+    """Echoes every question upstream (e.g. a sink reporting playback)."""
+
+    async def process_frame(self, frame: Frame, direction: int):
+        self.processed.append(frame)
+        if direction == FrameDirection.DOWNSTREAM and frame.text.startswith("q"):
+            await self.push_frame(TextFrame(text="echo"), FrameDirection.UPSTREAM)
+
+
+class Replier(RecordingProcessor):
+    """Answers every upstream echo with a new downstream frame."""
+
+    async def process_frame(self, frame: Frame, direction: int):
+        if direction == FrameDirection.UPSTREAM:
+            self.processed.append(frame)
+            await self.push_frame(TextFrame(text="a"), FrameDirection.DOWNSTREAM)
+
+
+class TestPipelineStages:
+    """Test suite for staged execution mode."""
+
+    def test_stages_insert_boundaries(self):
+        """A PipelineStage should sit between consecutive groups only."""
+        a, b, c = RecordingProcessor("A"), RecordingProcessor("B"), RecordingProcessor("C")
+        pipeline = Pipeline(stages=[[a, b], [c]])
+
+        assert pipeline.processors == [a, b, c]
+        assert a._next is b
+        assert isinstance(b._next, PipelineStage)
+        assert b._next._next is c
+        assert len(pipeline._stages) == 1
+
+    def test_processors_and_stages_are_exclusive(self):
+        with pytest.raises(ValueError):
+            Pipeline([RecordingProcessor("A")], stages=[[RecordingProcessor("B")]])
+
+    @pytest.mark.asyncio
+    async def test_slow_stage_does_not_block_ingestion(self):
+        """Upstream group keeps consuming while a downstream group is busy."""
+        fast = RecordingProcessor("Fast")
+        slow = RecordingProcessor("Slow", delay=0.05)
+        pipeline = Pipeline(stages=[[fast], [slow]], stage_queue_size=50)
+        await pipeline.start()
+
+        for i in range(10):
+            await pipeline.queue_frame(TextFrame(text=f"msg{i}"))
+
+        await asyncio.sleep(0.05)
+        ingested = len(fast.processed)
+        await pipeline.stop()
+
+        assert ingested == 10
+        assert len(slow.processed) < 10
+
+    @pytest.mark.asyncio
+    async def test_order_preserved_per_direction(self):
+        first = RecordingProcessor("First")
+        last = RecordingProcessor("Last")
+        pipeline = Pipeline(stages=[[first], [last]])
+        await pipeline.start()
+
+        frames = [TextFrame(text=str(i)) for i in range(20)]
+        for frame in frames:
+            await pipeline.queue_frame(frame)
+
+        await asyncio.sleep(0.1)
+        await pipeline.stop()
+
+        assert last.processed == frames
+
+    @pytest.mark.asyncio
+    async def test_system_frames_jump_ahead_in_stage(self):
+        """Queued data frames should not delay a SystemFrame inside a stage inbox."""
+        stage = PipelineStage(max_queue_size=10)
+        sink = RecordingProcessor("Sink")
+        stage.link(sink)
+
+        for i in range(3):
+            await stage.process_frame(TextFrame(text=str(i)), FrameDirection.DOWNSTREAM)
+        await stage.process_frame(CancelFrame(), FrameDirection.DOWNSTREAM)
+
+        await stage.start()
+        await asyncio.sleep(0.05)
+        await stage.cleanup()
+
+        assert isinstance(sink.processed[0], CancelFrame)
+        assert len(sink.processed) == 4
+
+    @pytest.mark.asyncio
+    async def test_full_inboxes_in_both_directions_do_not_deadlock(self):
+        """Replies pushed against the flow never wait on a full inbox."""
+        stage = PipelineStage(max_queue_size=1)
+        head, tail = Replier("Head"), Reflector("Tail")
+        head.link(stage)
+        stage.link(tail)
+        await stage.start()
+
+        async def exchange():
+            for i in range(5):
+                await head.push_frame(TextFrame(text=f"q{i}"), FrameDirection.DOWNSTREAM)
+            while len(tail.processed) < 10:
+                await asyncio.sleep(0.005)
+
+        try:
+            await asyncio.wait_for(exchange(), 1)
+        finally:
+            await stage.cleanup()
+
+        assert len(head.processed) == 5  # Every echo travelled back upstream
+        assert sorted(f.text for f in tail.processed) == sorted([f"q{i}" for i in range(5)] + ["a"] * 5)
+
+    @pytest.mark.asyncio
+    async def test_clear_queue_keeps_system_frames(self):
+        stage = PipelineStage(max_queue_size=10)
+        for i in range(3):
+            await stage.process_frame(TextFrame(text=str(i)), FrameDirection.DOWNSTREAM)
+        await stage.process_frame(CancelFrame(), FrameDirection.DOWNSTREAM)
+
+        await stage.clear_queue()
+
+        assert stage.qsize() == 1
+
+
+
+class TestFactoryExecutionMode:
+    """PipelineFactory picks the execution mode from Settings."""
+
+    @pytest.mark.asyncio
+    async def test_factory_builds_staged_pipeline(self, monkeypatch):
+        monkeypatch.setattr(settings, "PIPELINE_EXECUTION_MODE", "staged")
+        monkeypatch.setattr(settings, "PIPELINE_STAGE_QUEUE_SIZE", 20)
+        profile = SimpleNamespace(
+            stt_language="es-MX", initial_silence_timeout_ms=None, interruption_phrases=None,
+            barge_in_enabled=True, interruption_sensitivity=None, vad_threshold=None, response_delay_seconds=0.0,
+        )
+        config = SimpleNamespace(client_type="twilio", get_profile=lambda _: profile)
+
+        pipeline = await PipelineFactory.create_pipeline(
+            config=config,
+            stt_port=SimpleNamespace(create_recognizer=lambda config: MagicMock()),
+            llm_port=MagicMock(),
+            tts_port=MagicMock(),
+            control_channel=None,
+            conversation_history=[],
+            initial_context_data={},
+            crm_manager=None,
+            tools={},
+            stream_id="test-call",
+            transcript_callback=AsyncMock(),
+            orchestrator_ref=MagicMock(audio_encoding="PCMU"),
+            loop=asyncio.get_running_loop(),
+        )
+        await next(p for p in pipeline.processors if isinstance(p, STTProcessor)).cleanup()
+
+        assert len(pipeline._stages) == 4
+        assert {stage.max_queue_size for stage in pipeline._stages} == {20}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
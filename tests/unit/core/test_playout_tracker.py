@@ -0,0 +1,229 @@
+"""
+Unit tests for playback-position tracking.
+
+Validates that sentence marks follow their last byte, that acknowledged and
+time-estimated playback give the heard text, and that a barge-in clears the
+client buffer and trims the conversation history to what was heard.
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.audio.playout_tracker import HeardAudio, PlayoutTracker, truncate_at_word
+from app.core.frames import AudioFrame, TextFrame
+from app.core.managers.audio_manager import AudioManager
+from app.core.orchestrator_v2 import VoiceOrchestratorV2
+from app.core.turns import TurnManager
+from app.processors.logic.tts import TTSProcessor
+
+
+class TestPlayoutTracker:
+    """Test suite for PlayoutTracker."""
+
+    def test_mark_due_after_last_byte(self):
+        tracker = PlayoutTracker(bytes_per_second=8000)
+        tracker.begin("Hola.", "r1", position=0)
+        tracker.close(position=320)
+
+        assert tracker.advance(sent_position=160, now=0.0) == []
+        assert tracker.advance(sent_position=320, now=0.02) == ["seg-1"]
+        assert tracker.advance(sent_position=320, now=0.04) == []
+
+    def test_acknowledged_segments_are_heard_in_full(self):
+        tracker = PlayoutTracker(bytes_per_second=8000)
+        tracker.begin("Hola.", "r1", position=0)
+        tracker.begin("¿Cómo está?", "r1", position=8000)
+        tracker.close(position=16000)
+        tracker.advance(sent_position=16000, now=0.0)
+
+        tracker.acknowledge("seg-2", now=2.0)
+        heard = tracker.heard(now=2.0, sent_position=16000)
+
+        assert heard == HeardAudio(response_id="r1", text="Hola. ¿Cómo está?", complete=True)
+        assert not tracker.pending
+
+    def test_partial_segment_is_estimated_from_time(self):
+        tracker = PlayoutTracker(bytes_per_second=8000, playback_latency=0.0)
+        tracker.begin("Primera frase.", "r1", position=0)
+        tracker.begin("uno dos tres cuatro", "r1", position=8000)
+        tracker.close(position=16000)
+        tracker.advance(sent_position=1, now=0.0)
+        tracker.advance(sent_position=16000, now=0.5)
+        tracker.acknowledge("seg-1", now=1.0)
+
+        heard = tracker.heard(now=1.5, sent_position=16000)  # Half of the second sentence
+
+        assert heard.text == "Primera frase. uno dos"
+        assert not heard.complete
+
+    def test_barge_in_hears_only_the_latest_response(self):
+        tracker = PlayoutTracker(bytes_per_second=8000, playback_latency=0.0)
+        tracker.begin("Hola, buenos días.", "r1", position=0)
+        tracker.begin("¿En qué le ayudo?", "r1", position=8000)
+        tracker.close(position=16000)
+        tracker.advance(sent_position=16000, now=0.0)
+        tracker.acknowledge("seg-2", now=2.0)
+
+        tracker.begin("Su cita es el martes a las diez.", "r2", position=16000)
+        tracker.close(position=32000)
+        assert tracker.stats()["segments"] == 1  # r1 was played: pruned
+        tracker.advance(sent_position=16001, now=2.5)
+        tracker.advance(sent_position=32000, now=3.0)
+
+        heard = tracker.heard(now=3.5, sent_position=32000)  # Half of the second response
+
+        assert heard == HeardAudio(response_id="r2", text="Su cita es el", complete=False)
+
+    def test_acknowledge_prunes_older_responses(self):
+        tracker = PlayoutTracker(bytes_per_second=8000)
+        tracker.begin("Hola.", "r1", position=0)
+        tracker.begin("Su cita es el martes.", "r2", position=8000)
+        tracker.close(position=16000)
+        tracker.advance(sent_position=16000, now=0.0)
+
+        tracker.acknowledge("seg-1", now=1.0)
+
+        assert tracker.stats()["segments"] == 1
+        assert tracker.heard(now=1.0, sent_position=16000).response_id == "r2"
+
+    def test_unknown_mark_is_ignored(self):
+        tracker = PlayoutTracker(bytes_per_second=8000)
+        tracker.begin("Hola.", "r1", position=0)
+
+        assert tracker.acknowledge("seg-9") is False
+
+    @pytest.mark.parametrize("fraction, expected", [
+        (0.0, ""),
+        (0.5, "uno dos"),
+        (0.6, "uno dos"),
+        (1.0, "uno dos tres cuatro"),
+    ])
+    def test_truncate_at_word(self, fraction, expected):
+        assert truncate_at_word("uno dos tres cuatro", fraction) == expected
+
+
+class TestAudioManagerMarks:
+    """AudioManager sends marks behind their audio and clears on barge-in."""
+
+    @pytest.fixture
+    def transport(self):
+        transport = MagicMock()
+        transport.send_audio = AsyncMock()
+        transport.send_mark = AsyncMock()
+        transport.clear_audio = AsyncMock()
+        return transport
+
+    @pytest.mark.asyncio
+    async def test_mark_follows_segment_audio(self, transport):
+        manager = AudioManager(transport, "twilio", clock=MagicMock())
+        events = []
+        transport.send_audio.side_effect = lambda chunk: events.append("audio")
+        transport.send_mark.side_effect = lambda name: events.append(name)
+
+        manager.begin_segment("Hola.", "r1")
+        await manager.send_audio_chunked(b"\xff" * 320)
+        manager.end_segment()
+        for _ in range(3):
+            manager.on_tick()
+            await asyncio.sleep(0)
+
+        assert events == ["audio", "audio", "seg-1"]
+        assert manager.on_mark("seg-1") is True
+        assert manager.is_bot_speaking is False
+
+    @pytest.mark.asyncio
+    async def test_interrupt_clears_client_and_reports_heard(self, transport):
+        manager = AudioManager(transport, "twilio", clock=MagicMock())
+        manager.begin_segment("Hola.", "r1")
+        await manager.send_audio_chunked(b"\xff" * 320)
+        manager.end_segment()
+        manager.begin_segment("Le llamo por su pedido.", "r1")
+        await manager.send_audio_chunked(b"\xff" * 16000)
+        for _ in range(3):
+            manager.on_tick()
+            await asyncio.sleep(0)
+        manager.on_mark("seg-1")
+
+        heard = await manager.interrupt_speaking()
+
+        assert heard.text.startswith("Hola.")
+        assert not heard.complete
+        transport.clear_audio.assert_awaited_once()
+        assert len(manager.playout) == 0
+
+
+class TestResponseIds:
+    """Each LLM response gets its own playout id within the call."""
+
+    @pytest.mark.asyncio
+    async def test_turns_of_one_call_have_distinct_response_ids(self):
+        async def synthesize_stream(request):
+            yield b"\x01" * 160
+
+        port = MagicMock()
+        port.synthesize_stream = synthesize_stream
+        config = SimpleNamespace(client_type="twilio", get_profile=lambda _: SimpleNamespace(response_delay_seconds=0.0))
+        turns = TurnManager()
+        tts = TTSProcessor(port, config, turns=turns)
+        pushed = []
+        tts.push_frame = AsyncMock(side_effect=lambda frame, direction=None: pushed.append(frame))
+        try:
+            for text in ("Hola.", "Su cita es el martes."):
+                token = turns.begin()
+                await tts.process_frame(TextFrame(text=text, trace_id="call-1", generation=token.generation), 1)
+                await asyncio.wait_for(tts._tts_queue.join(), 1)
+        finally:
+            await tts.stop()
+
+        ids = list(dict.fromkeys(f.metadata["response_id"] for f in pushed if isinstance(f, AudioFrame)))
+        assert len(ids) == 2
+        assert all(i.startswith("call-1") for i in ids)
+
+
+class TestHistoryTruncation:
+    """The orchestrator keeps only the heard part of an interrupted turn."""
+
+    @pytest.fixture
+    def orchestrator(self):
+        transport = MagicMock()
+        return VoiceOrchestratorV2(
+            transport=transport,
+            stt_port=MagicMock(),
+            llm_port=MagicMock(),
+            tts_port=MagicMock(),
+            config_repo=MagicMock(),
+            call_repo=MagicMock(),
+        )
+
+    def test_replaces_interrupted_response(self, orchestrator):
+        orchestrator.conversation_history[:] = [
+            {"role": "user", "content": "Hola"},
+            {"role": "assistant", "content": "Buenos días. Le llamo por su pedido de ayer."},
+        ]
+
+        orchestrator._truncate_history_to_heard(HeardAudio("r1", "Buenos días. Le llamo", complete=False))
+
+        assert orchestrator.conversation_history[-1] == {"role": "assistant", "content": "Buenos días. Le llamo..."}
+
+    def test_drops_unheard_response(self, orchestrator):
+        orchestrator.conversation_history[:] = [
+            {"role": "user", "content": "Hola"},
+            {"role": "assistant", "content": "Buenos días."},
+        ]
+
+        orchestrator._truncate_history_to_heard(HeardAudio("r1", "", complete=False))
+
+        assert orchestrator.conversation_history == [{"role": "user", "content": "Hola"}]
+
+    def test_records_cancelled_response(self, orchestrator):
+        orchestrator.conversation_history[:] = [{"role": "user", "content": "Hola"}]
+
+        orchestrator._truncate_history_to_heard(HeardAudio("r1", "Buenos días.", complete=False))
+
+        assert orchestrator.conversation_history[-1] == {"role": "assistant", "content": "Buenos días..."}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
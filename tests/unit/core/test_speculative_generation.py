@@ -0,0 +1,230 @@
+"""
+Unit tests for speculative LLM generation during end-of-turn silence.
+
+Validates that speculative output is held until the turn is confirmed, that
+a confirmed speculation is not regenerated, and that misses are cancelled
+and counted.
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.config import settings
+from app.core.frames import AudioFrame, CancelFrame, Frame, TextFrame
+from app.core.pipeline_factory import PipelineFactory
+from app.core.turns import TurnManager
+from app.domain.models.llm_models import LLMChunk
+from app.processors.logic.aggregator import ContextAggregator
+from app.processors.logic.llm import LLMProcessor
+from app.processors.logic.stt import STTProcessor
+from app.processors.logic.tts import TTSProcessor
+
+
+class ScriptedLLM:
+    """LLM port streaming a fixed reply, optionally pausing mid-stream."""
+
+    def __init__(self, reply: list[str], pause: asyncio.Event | None = None):
+        self.reply = reply
+        self.pause = pause
+        self.requests = []
+
+    async def generate_stream(self, request):
+        self.requests.append(request)
+        for index, text in enumerate(self.reply):
+            if self.pause is not None and index == 1:
+                await self.pause.wait()
+            yield LLMChunk(text=text)
+
+
+def _llm(port: ScriptedLLM, history: list, speculative_tts: bool = False) -> tuple[LLMProcessor, list[Frame]]:
+    llm = LLMProcessor(port, SimpleNamespace(), history, turns=TurnManager(), speculative_tts=speculative_tts)
+    llm._build_system_prompt = lambda: ""
+    pushed: list[Frame] = []
+    llm.push_frame = AsyncMock(side_effect=lambda frame, direction=None: pushed.append(frame))
+    return llm, pushed
+
+
+def _speculative(text: str) -> TextFrame:
+    return TextFrame(text=text, is_final=True, metadata={"speculative": True})
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestLLMSpeculation:
+    """LLMProcessor holds and releases speculative output."""
+
+    @pytest.mark.asyncio
+    async def test_output_held_until_confirmed(self):
+        history = [{"role": "assistant", "content": "Hola"}]
+        port = ScriptedLLM(["Claro, mañana a las diez. ", "¿Algo más? "])
+        llm, pushed = _llm(port, history)
+
+        await llm.process_frame(_speculative("quiero una cita"), 1)
+        await _settle()
+
+        assert pushed == []  # Generated ahead, nothing released
+        assert history == [{"role": "assistant", "content": "Hola"}]  # History untouched
+        assert port.requests[0].messages[-1].content == "quiero una cita"
+
+        # The aggregator commits the turn exactly as speculated
+        history.append({"role": "user", "content": "quiero una cita"})
+        await llm.process_frame(TextFrame(text="quiero una cita", is_final=True), 1)
+        await _settle()
+
+        assert [f.text for f in pushed] == ["Claro, mañana a las diez. ", "¿Algo más? "]
+        assert len(port.requests) == 1  # Not regenerated
+        assert history[-1]["role"] == "assistant"
+        assert llm.stats()["speculation_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_miss_cancels_speculation_and_regenerates(self):
+        pause = asyncio.Event()
+        port = ScriptedLLM(["Vale. ", "Perfecto. "], pause=pause)
+        llm, pushed = _llm(port, [])
+
+        await llm.process_frame(_speculative("quiero"), 1)
+        await _settle()
+        speculation = llm.turns.token
+
+        # The user kept talking: the committed turn differs
+        await llm.process_frame(TextFrame(text="quiero cancelar mi cita", is_final=True), 1)
+        pause.set()
+        await _settle()
+
+        assert speculation.cancelled
+        assert len(port.requests) == 2
+        assert all(f.generation == llm.turns.token.generation for f in pushed)
+        stats = llm.stats()
+        assert stats["speculation_misses"] == 1
+        assert stats["speculation_wasted_chunks"] == 1
+        assert stats["speculation_hit_rate"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_barge_in_discards_speculation(self):
+        pause = asyncio.Event()
+        llm, pushed = _llm(ScriptedLLM(["Vale. ", "Bien. "], pause=pause), [])
+
+        await llm.process_frame(_speculative("hola"), 1)
+        await _settle()
+        await llm.process_frame(CancelFrame(reason="User Barge-In"), 1)
+        pause.set()
+        await _settle()
+
+        assert [type(f) for f in pushed] == [CancelFrame]
+        assert llm.stats()["speculation_misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_first_sentence_released_early_for_tts(self):
+        llm, pushed = _llm(ScriptedLLM(["Buenos días, señor. ", "Le ayudo. "]), [], speculative_tts=True)
+
+        await llm.process_frame(_speculative("hola"), 1)
+        await _settle()
+
+        assert [f.text for f in pushed] == ["Buenos días, señor. "]
+        assert not llm.turns.token.confirmed
+
+
+class TestTTSSpeculation:
+    """TTS synthesizes a speculative sentence ahead but holds the audio."""
+
+    @pytest.mark.asyncio
+    async def test_audio_held_until_confirmed(self):
+        async def synthesize_stream(request):
+            yield b"\x01" * 160
+
+        turns = TurnManager()
+        config = SimpleNamespace(
+            client_type="twilio",
+            get_profile=lambda _: SimpleNamespace(response_delay_seconds=0.0),
+        )
+        tts = TTSProcessor(SimpleNamespace(synthesize_stream=synthesize_stream), config, turns=turns)
+        pushed: list[Frame] = []
+        tts.push_frame = AsyncMock(side_effect=lambda frame, direction=None: pushed.append(frame))
+        token = turns.begin(speculative=True)
+        try:
+            await tts.process_frame(TextFrame(text="Buenos días.", generation=token.generation), 1)
+            await _settle()
+            assert pushed == []
+
+            token.confirm()
+            await asyncio.wait_for(tts._tts_queue.join(), 1)
+            assert [len(f.data) for f in pushed if isinstance(f, AudioFrame)] == [160, 0]
+        finally:
+            await tts.stop()
+
+
+class TestAggregatorSpeculation:
+    """ContextAggregator speculates as soon as the turn timer starts."""
+
+    @pytest.mark.asyncio
+    async def test_speculates_then_commits(self):
+        aggregator = ContextAggregator(SimpleNamespace(), [], speculative=True)
+        aggregator.turn_timeout = 0.01
+        pushed: list[Frame] = []
+        aggregator.push_frame = AsyncMock(side_effect=lambda frame, direction=None: pushed.append(frame))
+
+        await aggregator.process_frame(TextFrame(text="quiero una cita"), 1)
+        await asyncio.sleep(0.05)
+
+        assert [(f.text, f.metadata.get("speculative", False)) for f in pushed] == [
+            ("quiero una cita", True),
+            ("quiero una cita", False),
+        ]
+
+
+class TestFactorySpeculation:
+    """SPECULATIVE_GENERATION_ENABLED turns speculation on for a call's pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_call_pipeline_takes_speculative_path(self, monkeypatch):
+        recognizer = SimpleNamespace(
+            subscribe=lambda callback: None,
+            write=lambda data: None,
+            start_continuous_recognition_async=lambda: SimpleNamespace(get=lambda: None),
+            stop_continuous_recognition_async=lambda: SimpleNamespace(get=lambda: None),
+        )
+        profile = SimpleNamespace(
+            stt_language="es-MX", initial_silence_timeout_ms=None, interruption_phrases=None,
+            barge_in_enabled=True, interruption_sensitivity=None, vad_threshold=None, response_delay_seconds=0.0,
+        )
+        config = SimpleNamespace(client_type="twilio", get_profile=lambda _: profile)
+        history: list = []
+        port = ScriptedLLM(["Claro, mañana a las diez. "])
+        monkeypatch.setattr(settings, "SPECULATIVE_GENERATION_ENABLED", True)
+
+        pipeline = await PipelineFactory.create_pipeline(
+            config=config,
+            stt_port=SimpleNamespace(create_recognizer=lambda config: recognizer),
+            llm_port=port,
+            tts_port=SimpleNamespace(),
+            control_channel=None,
+            conversation_history=history,
+            initial_context_data={},
+            crm_manager=None,
+            tools={},
+            stream_id="test-call",
+            transcript_callback=AsyncMock(),
+            orchestrator_ref=MagicMock(audio_encoding="PCMU"),
+            loop=asyncio.get_running_loop(),
+        )
+        aggregator = next(p for p in pipeline.processors if isinstance(p, ContextAggregator))
+        llm = next(p for p in pipeline.processors if isinstance(p, LLMProcessor))
+        stt = next(p for p in pipeline.processors if isinstance(p, STTProcessor))
+        llm._build_system_prompt = lambda: ""
+        llm.push_frame = AsyncMock()
+        aggregator.turn_timeout = 0.01
+        try:
+            await aggregator.process_frame(TextFrame(text="quiero una cita"), 1)
+            await asyncio.sleep(0.05)
+        finally:
+            await stt.cleanup()
+
+        assert aggregator.speculative
+        assert len(port.requests) == 1  # Generated during the silence, not again on commit
+        assert llm.stats()["speculation_hits"] == 1
+        assert history[-1]["role"] == "assistant"
@@ -0,0 +1,190 @@
+"""
+Unit tests for the shared STT I/O worker.
+
+Validates that audio is coalesced into writes made on writer threads,
+that closing flushes pending audio, that a stalled write does not hold up
+other calls, and that recognizer events reach the loop in order and in
+batches.
+"""
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.frames import AudioFrame
+from app.core.stt_io import STTIOWorker
+from app.processors.logic.stt import STTProcessor
+from app.services.base import STTEvent, STTResultReason
+
+
+class RecordingRecognizer:
+    """Recognizer stub recording each write and the thread it ran on."""
+
+    def __init__(self):
+        self.writes: list[tuple[bytes, str]] = []
+        self.callback = None
+
+    def write(self, data: bytes):
+        self.writes.append((data, threading.current_thread().name))
+
+    def subscribe(self, callback):
+        self.callback = callback
+
+
+class BlockingRecognizer:
+    """Recognizer whose write stalls in "native code" until released."""
+
+    def __init__(self):
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def write(self, data: bytes):
+        self.entered.set()
+        self.release.wait(5)
+
+
+async def _noop(events):
+    pass
+
+
+class TestSTTIOWorker:
+    """Coalesced writes off the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_frames_are_coalesced_on_worker_thread(self):
+        recognizer = RecordingRecognizer()
+        stream = STTIOWorker().open_stream(recognizer, asyncio.get_running_loop(), _noop, write_interval_ms=50)
+
+        for index in range(5):
+            stream.write(bytes([index]) * 320)
+        await asyncio.sleep(0.1)
+
+        assert b"".join(data for data, _ in recognizer.writes) == b"".join(bytes([i]) * 320 for i in range(5))
+        assert len(recognizer.writes) < 5
+        assert {thread for _, thread in recognizer.writes} == {"stt-io-0"}
+        assert stream.stats()["frames"] == 5
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending_audio(self):
+        recognizer = RecordingRecognizer()
+        worker = STTIOWorker()
+        stream = worker.open_stream(recognizer, asyncio.get_running_loop(), _noop, write_interval_ms=10_000)
+
+        stream.write(b"\x01" * 320)
+        stream.write(b"\x02" * 320)
+        await stream.close()
+
+        assert recognizer.writes[-1][0] == b"\x01" * 320 + b"\x02" * 320
+        assert worker.stats()["streams"] == 0
+
+        stream.write(b"\x03")  # Ignored after close
+        assert not stream._audio
+
+    @pytest.mark.asyncio
+    async def test_write_errors_do_not_stop_the_worker(self):
+        failing = SimpleNamespace(write=MagicMock(side_effect=RuntimeError("native stall")))
+        recognizer = RecordingRecognizer()
+        worker = STTIOWorker()
+        loop = asyncio.get_running_loop()
+        bad = worker.open_stream(failing, loop, _noop, write_interval_ms=10)
+        good = worker.open_stream(recognizer, loop, _noop, write_interval_ms=10)
+
+        bad.write(b"\x00")
+        good.write(b"\x01")
+        await asyncio.sleep(0.05)
+
+        assert worker.stats()["write_errors"] == 1
+        assert [data for data, _ in recognizer.writes] == [b"\x01"]
+
+    @pytest.mark.asyncio
+    async def test_slow_write_does_not_delay_other_calls(self):
+        slow, fast = BlockingRecognizer(), RecordingRecognizer()
+        worker = STTIOWorker(threads=2)
+        loop = asyncio.get_running_loop()
+        stalled = worker.open_stream(slow, loop, _noop, write_interval_ms=10)
+        healthy = worker.open_stream(fast, loop, _noop, write_interval_ms=10)
+        try:
+            stalled.write(b"\x00")
+            assert await asyncio.to_thread(slow.entered.wait, 1)
+            healthy.write(b"\x01")
+            await asyncio.sleep(0.05)
+
+            assert [data for data, _ in fast.writes] == [b"\x01"]
+        finally:
+            slow.release.set()
+
+    @pytest.mark.asyncio
+    async def test_new_calls_avoid_a_stalled_thread(self, monkeypatch):
+        monkeypatch.setattr("app.core.stt_io.STALL_MS", 0)
+        slow = BlockingRecognizer()
+        worker = STTIOWorker(threads=2)
+        loop = asyncio.get_running_loop()
+        stalled = worker.open_stream(slow, loop, _noop, write_interval_ms=10)
+        worker.open_stream(RecordingRecognizer(), loop, _noop)
+        try:
+            stalled.write(b"\x00")
+            assert await asyncio.to_thread(slow.entered.wait, 1)
+            await asyncio.sleep(0.01)
+
+            late = worker.open_stream(RecordingRecognizer(), loop, _noop)
+
+            assert late.writer is not stalled.writer  # Tie on load, stalled thread skipped
+            assert worker.stats()["stalled_threads"] == 1
+        finally:
+            slow.release.set()
+
+    @pytest.mark.asyncio
+    async def test_events_delivered_in_order_in_batches(self):
+        delivered: list[list[int]] = []
+
+        async def on_events(events):
+            delivered.append(list(events))
+
+        stream = STTIOWorker().open_stream(RecordingRecognizer(), asyncio.get_running_loop(), on_events)
+
+        def sdk_thread():
+            for index in range(10):
+                stream.on_event(index)
+
+        await asyncio.to_thread(sdk_thread)
+        await asyncio.sleep(0.01)
+
+        assert [event for batch in delivered for event in batch] == list(range(10))
+        assert len(delivered) < 10
+
+
+class TestSTTProcessorIO:
+    """STTProcessor never calls the recognizer on the loop."""
+
+    @pytest.mark.asyncio
+    async def test_audio_and_results_go_through_worker(self):
+        recognizer = RecordingRecognizer()
+        recognizer.start_continuous_recognition_async = lambda: SimpleNamespace(get=lambda: None)
+        recognizer.stop_continuous_recognition_async = lambda: SimpleNamespace(get=lambda: None)
+        profile = SimpleNamespace(stt_language="es-MX", initial_silence_timeout_ms=None, interruption_phrases=None)
+        config = SimpleNamespace(
+            client_type="twilio",
+            hallucination_blacklist="",
+            input_min_characters=2,
+            get_profile=lambda _: profile,
+        )
+        provider = SimpleNamespace(create_recognizer=lambda config: recognizer)
+        stt = STTProcessor(provider=provider, config=config, loop=asyncio.get_running_loop(), write_interval_ms=20)
+        stt.push_frame = AsyncMock()
+        await stt.initialize()
+        assert stt.stt_stream.write_interval == pytest.approx(0.02)
+
+        await stt.process_frame(AudioFrame(data=b"\x01" * 320, sample_rate=8000), 1)
+        await asyncio.to_thread(
+            recognizer.callback, STTEvent(reason=STTResultReason.RECOGNIZED_SPEECH, text="Hola, buenos días")
+        )
+        await asyncio.sleep(0.01)
+        await stt.cleanup()
+
+        assert [data for data, _ in recognizer.writes] == [b"\x01" * 320]
+        assert recognizer.writes[0][1].startswith("stt-io-")
+        pushed = [c.args[0] for c in stt.push_frame.await_args_list]
+        assert [type(f).__name__ for f in pushed] == ["AudioFrame", "TextFrame"]
+        assert stt.stt_stream is None
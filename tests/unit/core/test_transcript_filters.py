@@ -0,0 +1,128 @@
+"""
+Unit tests for precompiled STT transcript filters.
+
+Validates Aho-Corasick matching on normalized text, compile caching per
+config version and the STTProcessor filtering path.
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core.transcript_filters import (
+    PhraseMatcher,
+    TranscriptFilters,
+    compile_transcript_filters,
+    normalize_text,
+)
+from app.processors.logic.stt import STTProcessor
+from app.services.base import STTEvent, STTResultReason
+
+
+def _config(blacklist: str = "", phrases=None, min_chars: int = 2) -> SimpleNamespace:
+    profile = SimpleNamespace(interruption_phrases=phrases)
+    return SimpleNamespace(
+        client_type="twilio",
+        hallucination_blacklist=blacklist,
+        input_min_characters=min_chars,
+        get_profile=lambda _: profile,
+    )
+
+
+class TestPhraseMatcher:
+    """Multi-pattern matching ignoring case and accents."""
+
+    def test_normalize_text(self):
+        assert normalize_text("Sí, ESPERA") == "si, espera"
+        assert normalize_text("Ya basta") == "ya basta"
+
+    def test_matches_any_phrase_ignoring_case_and_accents(self):
+        matcher = PhraseMatcher(["espera", "un momento", "alto"])
+
+        assert matcher.search("Oye, ESPÉRA por favor") == "espera"
+        assert matcher.search("dame UN MOMENTO") == "un momento"
+        assert matcher.search("Está bien, gracias") is None
+
+    def test_overlapping_phrases_use_failure_links(self):
+        matcher = PhraseMatcher(["abcd", "bce"])
+
+        assert matcher.search("xabce") == "bce"
+        assert matcher.search("xxabcd") == "abcd"
+
+    def test_reports_earliest_match_in_text(self):
+        matcher = PhraseMatcher(["para", "no"])
+
+        assert matcher.search("no, para ya") == "no"
+
+    def test_empty_matcher(self):
+        matcher = PhraseMatcher(["", "  "])
+
+        assert not matcher
+        assert matcher.search("cualquier cosa") is None
+
+
+class TestTranscriptFilters:
+    """Compilation from the agent config."""
+
+    def test_from_config_parses_json_phrases(self):
+        filters = TranscriptFilters.from_config(_config("Mm.,Ah.", '["Espera", "alto"]', min_chars=3))
+
+        assert filters.blacklist.search("mm.") == "Mm."
+        assert filters.interruption_phrases.search("ALTO ahí") == "alto"
+        assert filters.min_characters == 3
+
+    def test_invalid_phrases_are_ignored(self):
+        filters = TranscriptFilters.from_config(_config(phrases="not json"))
+
+        assert not filters.interruption_phrases
+
+    def test_same_config_version_is_compiled_once(self):
+        first = TranscriptFilters.from_config(_config("Pero.", ["espera"]))
+        second = TranscriptFilters.from_config(_config("Pero.", ["espera"]))
+        changed = TranscriptFilters.from_config(_config("Pero.", ["alto"]))
+
+        assert first is second
+        assert changed is not first
+        assert compile_transcript_filters.cache_info().hits >= 1
+
+
+class TestSTTProcessorFiltering:
+    """Recognizer callbacks use the precompiled filters."""
+
+    @pytest.mark.asyncio
+    async def test_interruption_phrase_signals_and_text_flows(self):
+        loop = asyncio.get_running_loop()
+        control = SimpleNamespace(send_interrupt=AsyncMock())
+        stt = STTProcessor(provider=None, config=_config("Mm.", ["espera"]), loop=loop, control_channel=control)
+        stt.push_frame = AsyncMock()
+
+        await asyncio.to_thread(stt._on_stt_event, STTEvent(reason=STTResultReason.RECOGNIZED_SPEECH, text="Espérame tantito"))
+        await asyncio.sleep(0.01)
+
+        control.send_interrupt.assert_awaited_once_with(text="Keyword: espera")
+        pushed = [c.args[0] for c in stt.push_frame.await_args_list]
+        assert [type(f).__name__ for f in pushed] == ["CancelFrame", "TextFrame"]
+
+    @pytest.mark.asyncio
+    async def test_blacklisted_and_short_results_are_dropped(self):
+        loop = asyncio.get_running_loop()
+        stt = STTProcessor(provider=None, config=_config("Mm.", min_chars=3), loop=loop)
+        stt.push_frame = AsyncMock()
+
+        for text in ("mm.", "sí"):
+            await asyncio.to_thread(stt._on_stt_event, STTEvent(reason=STTResultReason.RECOGNIZED_SPEECH, text=text))
+        await asyncio.sleep(0.01)
+
+        stt.push_frame.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_filters_are_compiled_once_per_call(self):
+        stt = STTProcessor(provider=None, config=_config(phrases=["espera"]), loop=asyncio.get_running_loop())
+        stt.push_frame = AsyncMock()
+
+        for text in ("Hola, buenos días", "Quiero una cita"):
+            await stt._handle_stt_event(STTEvent(reason=STTResultReason.RECOGNIZED_SPEECH, text=text))
+
+        assert stt.filters is TranscriptFilters.from_config(stt.config)
+        assert stt.push_frame.await_count == 2
@@ -0,0 +1,168 @@
+"""
+Unit tests for turn generations and cancellation tokens.
+
+Validates that cancelling a turn stops the work bound to it (TTS synthesis
+included) and that every buffer drops frames of older generations.
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.frames import AudioFrame, CancelFrame, Frame, TextFrame
+from app.core.pipeline import Pipeline
+from app.core.processor import FrameProcessor
+from app.core.turns import CancellationToken, TurnManager
+from app.processors.logic.tts import TTSProcessor
+from app.processors.output.audio_sink import PipelineOutputSink
+
+
+class RecordingProcessor(FrameProcessor):
+    def __init__(self, name: str):
+        super().__init__(name=name)
+        self.processed: list[Frame] = []
+
+    async def process_frame(self, frame: Frame, direction: int):
+        self.processed.append(frame)
+        await self.push_frame(frame, direction)
+
+
+class TestTurnManager:
+    """Generation counter and stale-frame fence."""
+
+    def test_begin_supersedes_previous_turn(self):
+        turns = TurnManager()
+        first = turns.begin()
+        second = turns.begin()
+
+        assert first.cancelled and first.reason == "superseded"
+        assert not second.cancelled
+        assert turns.is_stale(first.generation)
+        assert not turns.is_stale(second.generation)
+        assert not turns.is_stale(0)  # Untracked frames are never stale
+
+    def test_cancel_fences_current_turn(self):
+        turns = TurnManager()
+        token = turns.begin()
+
+        assert turns.cancel("barge-in") is True
+        assert token.cancel("again") is False
+        assert token.cancelled and token.reason == "barge-in"
+        assert turns.is_stale(token.generation)
+        assert turns.token_for(token.generation).cancelled
+        assert turns.stats()["turns_cancelled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancel_cancels_bound_task(self):
+        token = CancellationToken(1)
+        task = token.bind(asyncio.create_task(asyncio.sleep(10)))
+
+        token.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    @pytest.mark.asyncio
+    async def test_finished_tasks_are_unbound(self):
+        token = CancellationToken(1)
+        task = token.bind(asyncio.create_task(asyncio.sleep(0)))
+        await task
+        await asyncio.sleep(0)  # Done callbacks run on the next loop iteration
+
+        assert token._callbacks == []
+
+
+class TestTTSCancellation:
+    """TTS stops synthesis of a cancelled turn without restarting its worker."""
+
+    @staticmethod
+    def _tts(turns: TurnManager) -> tuple[TTSProcessor, list[Frame]]:
+        started = asyncio.Event()
+
+        async def synthesize_stream(request):
+            yield b"\x01" * 160
+            started.set()
+            await asyncio.sleep(10)  # Long sentence still streaming
+            yield b"\x02" * 160
+
+        port = MagicMock()
+        port.synthesize_stream = synthesize_stream
+        config = SimpleNamespace(
+            client_type="twilio",
+            get_profile=lambda _: SimpleNamespace(response_delay_seconds=0.0),
+        )
+        tts = TTSProcessor(port, config, turns=turns)
+        tts.started = started
+        pushed: list[Frame] = []
+        tts.push_frame = AsyncMock(side_effect=lambda frame, direction=None: pushed.append(frame))
+        return tts, pushed
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_synthesis_and_skips_queued_sentences(self):
+        turns = TurnManager()
+        tts, pushed = self._tts(turns)
+        token = turns.begin()
+        worker = None
+        try:
+            await tts.process_frame(TextFrame(text="uno", generation=token.generation), 1)
+            await tts.process_frame(TextFrame(text="dos", generation=token.generation), 1)
+            worker = tts._worker_task
+            await asyncio.wait_for(tts.started.wait(), 1)
+
+            await tts.process_frame(CancelFrame(reason="barge-in"), 1)
+            await asyncio.wait_for(tts._tts_queue.join(), 1)
+
+            audio = [f for f in pushed if isinstance(f, AudioFrame)]
+            assert [f.generation for f in audio] == [token.generation]
+            assert isinstance(pushed[-1], CancelFrame)
+            assert tts._worker_task is worker and not worker.done()
+        finally:
+            await tts.stop()
+
+    @pytest.mark.asyncio
+    async def test_stale_text_is_not_queued(self):
+        turns = TurnManager()
+        tts, _ = self._tts(turns)
+        stale = turns.begin()
+        turns.cancel()
+        try:
+            await tts.process_frame(TextFrame(text="tarde", generation=stale.generation), 1)
+            assert tts._tts_queue.qsize() == 0
+        finally:
+            await tts.stop()
+
+
+class TestStaleFrameFencing:
+    """Buffers drop older generations as frames surface."""
+
+    @pytest.mark.asyncio
+    async def test_output_sink_drops_stale_audio(self):
+        turns = TurnManager()
+        orchestrator = MagicMock()
+        orchestrator.send_audio_chunked = AsyncMock()
+        sink = PipelineOutputSink(orchestrator, turns=turns)
+        stale = turns.begin()
+        turns.cancel()
+
+        await sink.process_frame(AudioFrame(data=b"\x00" * 160, sample_rate=8000, generation=stale.generation), 1)
+        await sink.process_frame(AudioFrame(data=b"\x00" * 160, sample_rate=8000), 1)
+
+        assert orchestrator.send_audio_chunked.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_pipeline_and_stages_skip_stale_frames(self):
+        turns = TurnManager()
+        head, tail = RecordingProcessor("Head"), RecordingProcessor("Tail")
+        pipeline = Pipeline(stages=[[head], [tail]], turns=turns)
+        stale = turns.begin()
+
+        # Queued before the barge-in, surfaces after it
+        await pipeline.queue_frame(TextFrame(text="viejo", generation=stale.generation))
+        turns.cancel()
+        await pipeline.queue_frame(TextFrame(text="nuevo"))
+        await pipeline.start()
+        await asyncio.sleep(0.05)
+        await pipeline.stop()
+
+        assert [f.text for f in tail.processed] == ["nuevo"]
+        assert pipeline.get_backpressure_stats()["dropped_total"] == 1
@@ -0,0 +1,132 @@
+"""
+Unit tests for the VAD energy pre-gate.
+
+Validates that clear silence skips inference after the hangover, that
+onsets reopen the gate with a warm-up window, and that the noise floor adapts.
+"""
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.core.audio_processor import AudioProcessor
+from app.core.vad.energy_gate import EnergyGate
+from app.processors.logic.vad import VADProcessor
+
+CONTEXT = 32
+WINDOW = 256
+
+
+def _frames(level: float, count: int, seed: int = 0) -> np.ndarray:
+    """Framed rows of white noise at the given RMS level."""
+    rng = np.random.default_rng(seed)
+    return (rng.standard_normal((count, CONTEXT + WINDOW)) * level).astype(np.float32)
+
+
+def _tone(level: float, count: int) -> np.ndarray:
+    """Framed rows of a low-frequency tone (few zero crossings)."""
+    t = np.arange(CONTEXT + WINDOW) / 8000
+    row = (np.sin(2 * np.pi * 200 * t) * level * np.sqrt(2)).astype(np.float32)
+    return np.tile(row, (count, 1))
+
+
+class TestAudioProcessorFeatures:
+    """Vectorized per-window features."""
+
+    def test_rms_frames_matches_rms(self):
+        pcm = np.random.default_rng(2).integers(-20000, 20000, (3, 160)).astype(np.int16)
+        expected = [AudioProcessor.rms(row.tobytes(), 2) for row in pcm]
+
+        assert [int(v) for v in AudioProcessor.rms_frames(pcm)] == expected
+
+    def test_zero_crossing_rate(self):
+        frames = np.array([[1.0, -1.0, 1.0, -1.0, 1.0], [1.0, 1.0, 1.0, 1.0, 1.0]])
+
+        np.testing.assert_array_equal(AudioProcessor.zero_crossing_rate(frames), [1.0, 0.0])
+
+
+class TestEnergyGate:
+    """Test suite for EnergyGate."""
+
+    def test_silence_is_skipped_after_hangover(self):
+        gate = EnergyGate(context_size=CONTEXT, hangover_windows=8)
+
+        rows, targets = gate.plan(_frames(0.0002, 50))
+
+        assert targets == list(range(8))
+        assert len(rows) == 8
+        assert gate.stats()["skipped"] == 42
+
+    def test_onset_reopens_with_warmup_row(self):
+        gate = EnergyGate(context_size=CONTEXT, hangover_windows=2)
+        gate.plan(_frames(0.0002, 10))  # Gate closed
+
+        silence = _frames(0.0002, 1, seed=1)
+        speech = _tone(0.1, 2)
+        frames = np.concatenate((silence, speech))
+        rows, targets = gate.plan(frames)
+
+        assert targets == [None, 1, 2]
+        np.testing.assert_array_equal(rows[0], frames[0])
+
+    def test_warmup_row_carried_across_calls(self):
+        gate = EnergyGate(context_size=CONTEXT, hangover_windows=0)
+        last_silence = _frames(0.0002, 3, seed=3)
+        gate.plan(last_silence)
+
+        rows, targets = gate.plan(_tone(0.1, 1))
+
+        assert targets == [None, 0]
+        np.testing.assert_array_equal(rows[0], last_silence[-1])
+
+    def test_hold_extends_hangover(self):
+        gate = EnergyGate(context_size=CONTEXT, hangover_windows=2)
+        gate.plan(_frames(0.0002, 10))
+
+        gate.hold()
+        _, targets = gate.plan(_frames(0.0002, 4))
+
+        assert targets == [None, 0, 1]  # Warm-up with the last skipped window first
+
+    def test_quiet_fricative_passes(self):
+        """High zero-crossing noise just above the floor is sent to the model."""
+        gate = EnergyGate(context_size=CONTEXT, hangover_windows=0, initial_floor=0.001)
+        quiet_hiss = _frames(0.0018, 1)  # Below threshold (0.002) but above floor * 1.41
+
+        _, targets = gate.plan(quiet_hiss)
+
+        assert targets == [0]
+
+    def test_noise_floor_tracks_line_noise(self):
+        gate = EnergyGate(context_size=CONTEXT, hangover_windows=0)
+        gate.plan(_tone(0.005, 400))
+
+        assert gate.noise_floor == pytest.approx(0.005, rel=0.05)
+        # Speech well above the adapted floor still opens the gate
+        _, targets = gate.plan(_tone(0.05, 1))
+        assert targets[-1] == 0
+
+    def test_threshold_is_capped(self):
+        gate = EnergyGate(context_size=CONTEXT, max_threshold=0.02)
+        gate.noise_floor = 0.5
+
+        assert gate.threshold == 0.02
+
+
+class TestVADProcessorGate:
+    """The gate can be switched off per processor."""
+
+    def test_gate_enabled_by_default_and_optional(self):
+        profile = SimpleNamespace(barge_in_enabled=True, interruption_sensitivity=None, vad_threshold=None)
+        config = SimpleNamespace(client_type="twilio", get_profile=lambda _: profile)
+        with patch.object(VADProcessor, "_init_model"):
+            gated = VADProcessor(config)
+            ungated = VADProcessor(config, energy_gate=False)
+
+        assert isinstance(gated.energy_gate, EnergyGate)
+        assert ungated.energy_gate is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,115 @@
+"""
+Unit tests for the shared, batched Silero VAD inference service.
+
+Validates that batched inference across calls matches the per-call
+SileroOnnxModel exactly and that concurrent windows share one inference.
+"""
+import asyncio
+
+import numpy as np
+import pytest
+
+pytest.importorskip("onnxruntime")
+
+from app.core.vad.model import SileroOnnxModel  # noqa: E402
+from app.core.vad.service import DEFAULT_MODEL_PATH, VADInferenceService  # noqa: E402
+from app.core.vad.window_buffer import VADWindowBuffer  # noqa: E402
+
+
+def _windows(seed: int, count: int, size: int) -> list[np.ndarray]:
+    rng = np.random.default_rng(seed)
+    return [(rng.standard_normal(size) * 0.2).astype(np.float32) for _ in range(count)]
+
+
+@pytest.fixture
+def service():
+    service = VADInferenceService(DEFAULT_MODEL_PATH)
+    yield service
+    service.close()
+
+
+class TestVADInferenceService:
+    """Test suite for VADInferenceService."""
+
+    @pytest.mark.asyncio
+    async def test_matches_per_call_model(self, service):
+        """Concurrent calls (mixed sample rates) get the same confidences as dedicated models."""
+        calls = [(8000, _windows(i, 12, 256)) for i in range(4)]
+        calls += [(16000, _windows(10 + i, 12, 512)) for i in range(2)]
+
+        expected = []
+        for sr, windows in calls:
+            model = SileroOnnxModel(str(DEFAULT_MODEL_PATH))
+            expected.append([float(model(w, sr)) for w in windows])
+
+        async def run_call(sr, windows):
+            stream = service.create_stream()
+            return [await stream.infer(w, sr) for w in windows]
+
+        results = await asyncio.gather(*(run_call(sr, windows) for sr, windows in calls))
+
+        assert results == expected
+        assert service.stats()["max_batch"] > 1
+        assert service.batches < sum(len(w) for _, w in calls)
+
+    @pytest.mark.asyncio
+    async def test_windows_of_same_stream_are_sequential(self, service):
+        """Two windows of one stream must not share a batch (state dependency)."""
+        windows = _windows(3, 2, 256)
+        model = SileroOnnxModel(str(DEFAULT_MODEL_PATH))
+        expected = [float(model(w, 8000)) for w in windows]
+
+        stream = service.create_stream()
+        results = await asyncio.gather(*(stream.infer(w, 8000) for w in windows))
+
+        assert list(results) == expected
+        assert service.batches == 2
+
+    @pytest.mark.asyncio
+    async def test_framed_windows_match_model(self, service):
+        """Context-prefixed views from VADWindowBuffer give the per-call results."""
+        pcm = (np.random.default_rng(7).standard_normal(256 * 6) * 3000).astype(np.int16)
+        windows = pcm.reshape(6, 256).astype(np.float32) / 32768.0
+        model = SileroOnnxModel(str(DEFAULT_MODEL_PATH))
+        expected = [float(model(w, 8000)) for w in windows]
+
+        buffer = VADWindowBuffer(window_size=256, context_size=32)
+        stream = service.create_stream()
+        results = []
+        for chunk in np.array_split(pcm, 9):  # Uneven chunks, several windows per call
+            buffer.write(chunk.tobytes())
+            frames = buffer.pending()
+            results.extend(await stream.infer_frames(frames, 8000))
+            buffer.consume(len(frames))
+
+        assert results == expected
+
+    @pytest.mark.asyncio
+    async def test_rejects_wrong_window_size(self, service):
+        stream = service.create_stream()
+        with pytest.raises(ValueError):
+            await stream.infer(np.zeros(100, dtype=np.float32), 8000)
+        with pytest.raises(ValueError):
+            await stream.infer(np.zeros(256, dtype=np.float32), 44100)
+
+
+    def test_recovers_from_worker_left_on_closed_loop(self, service):
+        stream = service.create_stream()
+        old_loop = asyncio.new_event_loop()
+        stale = old_loop.create_future()
+        service._pending.append((stream, np.zeros(288, dtype=np.float32), 8000, stale))
+        idle = asyncio.sleep(3600)
+        service._worker = old_loop.create_task(idle)
+        service._worker._log_destroy_pending = False
+        old_loop.close()
+
+        async def infer():
+            return await asyncio.wait_for(stream.infer(_windows(1, 1, 256)[0], 8000), 5)
+
+        assert 0.0 <= asyncio.run(infer()) <= 1.0
+        assert service._pending == []  # Stale request dropped, not run on the new loop
+        idle.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,82 @@
+"""
+Unit tests for the preallocated VAD window buffer.
+
+Validates that windows are zero-copy views carrying the right context,
+including across wrap-around, growth and chunks split mid-sample.
+"""
+import numpy as np
+import pytest
+
+from app.core.vad.window_buffer import VADWindowBuffer
+
+
+def _pcm(samples: np.ndarray) -> bytes:
+    return samples.astype(np.int16).tobytes()
+
+
+def _expected_rows(samples: np.ndarray, window: int, context: int) -> np.ndarray:
+    """Reference framing: previous window tail (zeros first) + window."""
+    audio = samples.astype(np.float32) / 32768.0
+    padded = np.concatenate((np.zeros(context, dtype=np.float32), audio))
+    count = len(audio) // window
+    return np.stack([padded[i * window:i * window + context + window] for i in range(count)])
+
+
+class TestVADWindowBuffer:
+    """Test suite for VADWindowBuffer."""
+
+    def test_rows_are_context_prefixed_views(self):
+        samples = np.arange(-600, 600, dtype=np.int16) * 20
+        buffer = VADWindowBuffer(window_size=256, context_size=32)
+        buffer.write(_pcm(samples))
+
+        frames = buffer.pending()
+
+        assert frames.shape == (4, 288)
+        assert np.shares_memory(frames, buffer._buffer)
+        np.testing.assert_array_equal(frames, _expected_rows(samples, 256, 32))
+
+    def test_consume_keeps_partial_window(self):
+        buffer = VADWindowBuffer(window_size=256, context_size=32)
+        buffer.write(_pcm(np.ones(300)))
+        buffer.consume(len(buffer.pending()))
+
+        assert len(buffer) == 44
+        assert len(buffer.pending()) == 0
+
+    def test_streaming_across_wrap_and_growth(self):
+        """20ms chunks over many wraps produce the same rows as one-shot framing."""
+        rng = np.random.default_rng(1)
+        samples = rng.integers(-32768, 32767, 160 * 200).astype(np.int16)
+        buffer = VADWindowBuffer(window_size=256, context_size=32, capacity_windows=2)
+
+        rows = []
+        for offset in range(0, len(samples), 480):  # Three chunks per write, sometimes > capacity
+            buffer.write(_pcm(samples[offset:offset + 480]))
+            frames = buffer.pending()
+            rows.extend(np.array(frames))
+            buffer.consume(len(frames))
+
+        np.testing.assert_array_equal(np.stack(rows), _expected_rows(samples, 256, 32))
+
+    def test_odd_byte_chunks_are_carried(self):
+        samples = np.arange(512, dtype=np.int16)
+        data = _pcm(samples)
+        buffer = VADWindowBuffer(window_size=256, context_size=32)
+        buffer.write(data[:101])
+        buffer.write(data[101:])
+
+        np.testing.assert_array_equal(buffer.pending(), _expected_rows(samples, 256, 32))
+
+    def test_reset_zeroes_context(self):
+        buffer = VADWindowBuffer(window_size=256, context_size=32)
+        buffer.write(_pcm(np.full(256, 1000)))
+        buffer.consume(1)
+        buffer.reset()
+        buffer.write(_pcm(np.full(256, 1000)))
+
+        assert not buffer.pending()[0, :32].any()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,172 @@
+"""
+Unit tests for adaptive per-caller endpointing.
+
+Validates that the silence threshold follows the caller's pauses and speech
+rate within bounds, that false cut-offs widen it, and that the VADProcessor
+and ContextAggregator feed and use it.
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.config import settings
+from app.core.pipeline_factory import PipelineFactory
+from app.domain.turn_completion import TurnCompletionClassifier
+from app.domain.use_cases import DetectTurnEndUseCase
+from app.processors.logic.aggregator import ContextAggregator
+from app.processors.logic.stt import STTProcessor
+from app.processors.logic.vad import VADProcessor
+
+
+def _use_case(**kwargs) -> DetectTurnEndUseCase:
+    return DetectTurnEndUseCase(silence_threshold_ms=500, completion_classifier=TurnCompletionClassifier(), **kwargs)
+
+
+class TestAdaptiveThreshold:
+    """Threshold learned from pauses and speech rate."""
+
+    def test_static_by_default(self):
+        use_case = _use_case()
+
+        for _ in range(20):
+            use_case.observe_pause(150)
+
+        assert use_case.silence_threshold_ms == 500
+        assert use_case.stats()["pauses_observed"] == 20
+
+    def test_short_pauses_lower_the_threshold(self):
+        use_case = _use_case(adaptive=True)
+
+        for _ in range(30):
+            use_case.observe_pause(180)
+
+        assert 250 <= use_case.silence_threshold_ms < 320  # p90 + margin, within bounds
+
+    def test_long_pauses_raise_the_threshold_up_to_max(self):
+        use_case = _use_case(adaptive=True, max_silence_ms=900)
+
+        for _ in range(30):
+            use_case.observe_pause(1500)
+
+        assert use_case.silence_threshold_ms == 900
+
+    def test_jitter_is_ignored(self):
+        use_case = _use_case(adaptive=True)
+
+        for _ in range(10):
+            use_case.observe_pause(64)
+
+        assert use_case.silence_threshold_ms == 500
+        assert use_case.stats()["pauses_observed"] == 0
+
+    def test_false_cutoff_widens_the_threshold(self):
+        use_case = _use_case(adaptive=True)
+        for _ in range(10):
+            use_case.observe_pause(300)
+        before = use_case.silence_threshold_ms
+
+        for _ in range(5):
+            use_case.observe_resumption(800)
+
+        assert use_case.silence_threshold_ms > before
+        assert use_case.false_cutoffs == 5
+
+    def test_resumption_after_max_silence_is_a_new_turn(self):
+        use_case = _use_case(adaptive=True)
+
+        use_case.observe_resumption(3000)
+
+        assert use_case.false_cutoffs == 0
+
+    def test_speech_rate_scales_threshold(self):
+        fast, slow = _use_case(adaptive=True), _use_case(adaptive=True)
+
+        fast.observe_speech(4000, words=18)  # 4.5 words/s
+        slow.observe_speech(4000, words=8)   # 2 words/s
+
+        assert fast.speech_rate == pytest.approx(4.5)
+        assert fast.silence_threshold_ms < 500 < slow.silence_threshold_ms
+
+    def test_scale_follows_threshold(self):
+        use_case = _use_case(adaptive=True)
+        for _ in range(30):
+            use_case.observe_pause(200)
+
+        assert use_case.scale(0.6) == pytest.approx(0.6 * use_case.silence_threshold_ms / 500)
+
+    def test_update_threshold_resets_base(self):
+        use_case = _use_case()
+
+        use_case.update_threshold(800)
+
+        assert use_case.scale(0.6) == pytest.approx(0.6)
+
+
+class TestEndpointingIntegration:
+    """VAD reports pauses, the aggregator scales its timers."""
+
+    @pytest.mark.asyncio
+    async def test_vad_reports_pause_inside_turn(self):
+        profile = SimpleNamespace(barge_in_enabled=True, interruption_sensitivity=None, vad_threshold=None)
+        config = SimpleNamespace(client_type="twilio", get_profile=lambda _: profile, vad_enable_confirmation=False)
+        use_case = _use_case(adaptive=True)
+        with patch.object(VADProcessor, "_init_model"):
+            vad = VADProcessor(config, detect_turn_end=use_case)
+        vad.push_frame = AsyncMock()
+
+        for confidence in [0.9] * 3 + [0.1] * 8 + [0.9]:  # 256ms pause, below the threshold
+            await vad._handle_confidence(confidence)
+
+        assert vad.speaking
+        assert use_case.stats()["pauses_observed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_aggregator_feeds_words_on_commit(self):
+        use_case = _use_case(adaptive=True)
+        aggregator = ContextAggregator(SimpleNamespace(), [], detect_turn_end=use_case)
+        aggregator.push_frame = AsyncMock()
+        use_case.observe_speech(4000)
+        aggregator.current_turn_text = " quiero una cita para mañana a las diez"
+
+        await aggregator._commit_turn()
+
+        assert use_case.speech_rate == pytest.approx(2.0)
+        assert use_case.silence_threshold_ms > 500  # Slow talker: more room
+
+    @pytest.mark.asyncio
+    async def test_factory_reads_endpointing_settings(self, monkeypatch):
+        monkeypatch.setattr(settings, "ADAPTIVE_ENDPOINTING_ENABLED", True)
+        monkeypatch.setattr(settings, "ENDPOINTING_MIN_SILENCE_MS", 300)
+        monkeypatch.setattr(settings, "ENDPOINTING_MAX_SILENCE_MS", 900)
+        recognizer = MagicMock()
+        profile = SimpleNamespace(
+            stt_language="es-MX", initial_silence_timeout_ms=None, interruption_phrases=None,
+            barge_in_enabled=True, interruption_sensitivity=None, vad_threshold=None, response_delay_seconds=0.0,
+        )
+        config = SimpleNamespace(client_type="twilio", get_profile=lambda _: profile, silence_timeout_ms=500)
+
+        pipeline = await PipelineFactory.create_pipeline(
+            config=config,
+            stt_port=SimpleNamespace(create_recognizer=lambda config: recognizer),
+            llm_port=MagicMock(),
+            tts_port=MagicMock(),
+            control_channel=None,
+            conversation_history=[],
+            initial_context_data={},
+            crm_manager=None,
+            tools={},
+            stream_id="test-call",
+            transcript_callback=AsyncMock(),
+            orchestrator_ref=MagicMock(audio_encoding="PCMU"),
+            loop=asyncio.get_running_loop(),
+        )
+        vad = next(p for p in pipeline.processors if isinstance(p, VADProcessor))
+        aggregator = next(p for p in pipeline.processors if isinstance(p, ContextAggregator))
+        await next(p for p in pipeline.processors if isinstance(p, STTProcessor)).cleanup()
+
+        use_case = vad.detect_turn_end
+        assert use_case is aggregator.detect_turn_end
+        assert use_case.adaptive
+        assert (use_case.min_silence_ms, use_case.max_silence_ms) == (300, 900)
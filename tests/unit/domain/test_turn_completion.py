@@ -0,0 +1,77 @@
+"""
+Unit tests for the local turn-completion classifier.
+
+Validates lexical and prosodic cues, the normalized-text cache and the
+DetectTurnEndUseCase / ContextAggregator integration.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from app.domain.turn_completion import TurnCompletionClassifier, normalize_utterance
+from app.domain.use_cases import DetectTurnEndUseCase
+from app.processors.logic.aggregator import ContextAggregator
+
+
+class TestTurnCompletionClassifier:
+    """Lexical + prosodic scoring."""
+
+    @pytest.mark.parametrize("text", [
+        "Quiero agendar una cita.",
+        "¿A qué hora abren?",
+        "Sí.",
+        "no gracias",
+        "That's all, thanks.",
+    ])
+    def test_complete_utterances(self, text):
+        assert TurnCompletionClassifier().predict(text).complete
+
+    @pytest.mark.parametrize("text", [
+        "Quiero agendar una cita para el",
+        "Necesito hablar con",
+        "Este...",
+        "Pues, eh",
+        "Un momento,",
+        "I was wondering if",
+    ])
+    def test_incomplete_utterances(self, text):
+        assert not TurnCompletionClassifier().predict(text).complete
+
+    def test_long_silence_raises_probability(self):
+        classifier = TurnCompletionClassifier()
+
+        short = classifier.predict("Es que yo quería", silence_ms=400)
+        long = classifier.predict("Es que yo quería", silence_ms=2000)
+
+        assert long.probability > short.probability
+
+    def test_cache_is_keyed_by_normalized_text(self):
+        classifier = TurnCompletionClassifier(cache_size=2)
+
+        classifier.predict("Quiero una cita.")
+        classifier.predict("  quiero   UNA cita. ")
+        assert classifier.stats()["cache_hits"] == 1
+
+        classifier.predict("a")
+        classifier.predict("b")
+        assert classifier.stats()["cache_size"] == 2  # LRU bound
+
+    def test_normalize_utterance_keeps_accents_and_punctuation(self):
+        assert normalize_utterance("  Sí,  CLARO. ") == "sí, claro."
+
+
+class TestSemanticTurnEnd:
+    """DetectTurnEndUseCase answers the aggregator without an LLM."""
+
+    def test_use_case_check_completion(self):
+        use_case = DetectTurnEndUseCase(silence_threshold_ms=500, completion_classifier=TurnCompletionClassifier())
+
+        assert use_case.check_completion("Para el martes a las diez.").complete
+        assert not use_case.check_completion("Para el martes a las").complete
+
+    def test_aggregator_uses_local_check(self):
+        use_case = DetectTurnEndUseCase(completion_classifier=TurnCompletionClassifier())
+        aggregator = ContextAggregator(SimpleNamespace(segmentation_strategy="semantic"), [], detect_turn_end=use_case)
+
+        assert aggregator._check_semantic_completion("Quiero una cita.") is True
+        assert aggregator._check_semantic_completion("Quiero una cita para") is False